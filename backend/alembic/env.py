@@ -140,6 +140,9 @@ def include_object(object_, name, type_, reflected, compare_to):  # noqa: ARG001
       managed by raw SQL migration ``e7a1b9c3d2f4_publication_fulltext_rag``
       and populated via the publication full-text backfill (the latter holds a
       pgvector ``vector(384)`` column SQLAlchemy does not model).
+    * ``publication_sync_jobs`` / ``publication_sync_items`` — resumable
+      full-text sync checkpoints from raw SQL migration
+      ``f3f422b00007_publication_sync_jobs``.
     * ``hpo_terms_lookup`` — populated by HPO ingestion jobs
       (``0bd1567a483c_add_phenotype_metadata_to_hpo_lookup`` and
       ``93b3e6984a6c_fix_hpo_lookup_table_repopulation``).
@@ -177,6 +180,8 @@ def include_object(object_, name, type_, reflected, compare_to):  # noqa: ARG001
         "publication_metadata",
         "publication_fulltext",
         "publication_fulltext_embeddings",
+        "publication_sync_items",
+        "publication_sync_jobs",
         "publication_type_values",
         "segregation_values",
         "sex_values",
@@ -0,0 +1,342 @@
+"""Materialized variant catalogue for GET /aggregate/all-variants.
+
+The endpoint rebuilt its variant list from published JSONB on every request
+and derived ``molecular_consequence`` per row in Python, so a consequence
+filter had to fetch the whole result set and filter and paginate it in
+Python. ``mv_variant_catalog`` holds one row per published variant with the
+aggregated display columns the endpoint serves plus the values its filters
+need — structural type, molecular consequence, protein position, per-status
+counts and search terms — so every filter and sort is indexed SQL with a real
+LIMIT/OFFSET.
+
+``hnf1b_molecular_consequence()`` is the SQL port of
+``app.phenopackets.molecular_consequence.compute_molecular_consequence``
+(VEP first, HGVS fallback); ``tests/test_variant_catalog.py`` keeps the two in
+step. The view is refreshed by the aggregation refresh scheduler like the
+other aggregation views.
+
+Revision ID: a4f422b00008
+Revises: f3f422b00007
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "a4f422b00008"
+down_revision = "f3f422b00007"
+branch_labels = None
+depends_on = None
+
+_CONSEQUENCE_FUNCTION = r"""
+CREATE OR REPLACE FUNCTION hnf1b_molecular_consequence(
+    transcript text,
+    protein text,
+    variant_type text,
+    vep_extensions jsonb
+) RETURNS text
+LANGUAGE plpgsql IMMUTABLE AS $$
+DECLARE
+    vep text;
+    p_notation text;
+    c_notation text;
+    splice text[];
+    splice_pos numeric;
+BEGIN
+    -- VEP annotation first (most accurate).
+    IF jsonb_typeof(vep_extensions) = 'array' THEN
+        SELECT ext->'value'->>'most_severe_consequence' INTO vep
+        FROM jsonb_array_elements(vep_extensions) WITH ORDINALITY AS e(ext, ord)
+        WHERE ext->>'name' = 'vep_annotation'
+          AND COALESCE(ext->'value'->>'most_severe_consequence', '') <> ''
+        ORDER BY ord
+        LIMIT 1;
+        IF vep IS NOT NULL THEN
+            RETURN CASE vep
+                WHEN 'stop_gained' THEN 'Nonsense'
+                WHEN 'frameshift_variant' THEN 'Frameshift'
+                WHEN 'stop_lost' THEN 'Stop Lost'
+                WHEN 'start_lost' THEN 'Start Lost'
+                WHEN 'splice_acceptor_variant' THEN 'Splice Acceptor'
+                WHEN 'splice_donor_variant' THEN 'Splice Donor'
+                WHEN 'missense_variant' THEN 'Missense'
+                WHEN 'inframe_deletion' THEN 'In-frame Deletion'
+                WHEN 'inframe_insertion' THEN 'In-frame Insertion'
+                WHEN 'splice_region_variant' THEN 'Splice Region'
+                WHEN 'splice_donor_5th_base_variant' THEN 'Splice Donor (5th base)'
+                WHEN 'synonymous_variant' THEN 'Synonymous'
+                WHEN 'intron_variant' THEN 'Intronic Variant'
+                WHEN '5_prime_UTR_variant' THEN '5'' UTR Variant'
+                WHEN '3_prime_UTR_variant' THEN '3'' UTR Variant'
+                WHEN 'copy_number_loss' THEN 'Copy Number Loss'
+                WHEN 'copy_number_gain' THEN 'Copy Number Gain'
+                ELSE initcap(replace(vep, '_', ' '))
+            END;
+        END IF;
+    END IF;
+
+    -- Protein-level consequence (checked before the structural type).
+    IF COALESCE(protein, '') <> '' THEN
+        p_notation := COALESCE(substring(protein FROM 'p\..+$'), protein);
+        IF strpos(lower(p_notation), 'fs') > 0 THEN
+            RETURN 'Frameshift';
+        END IF;
+        IF strpos(lower(p_notation), 'ter') > 0 OR strpos(p_notation, '*') > 0 THEN
+            RETURN 'Nonsense';
+        END IF;
+        IF p_notation ~ 'p\.?\(?[A-Z][a-z]{2}\d+[A-Z][a-z]{2}\)?'
+           AND strpos(p_notation, '=') = 0 THEN
+            RETURN 'Missense';
+        END IF;
+        IF strpos(lower(p_notation), 'del') > 0 THEN
+            RETURN 'In-frame Deletion';
+        END IF;
+        IF strpos(lower(p_notation), 'ins') > 0 THEN
+            RETURN 'In-frame Insertion';
+        END IF;
+        IF strpos(p_notation, '=') > 0 THEN
+            RETURN 'Synonymous';
+        END IF;
+    END IF;
+
+    -- Transcript-level consequence.
+    IF COALESCE(transcript, '') <> '' THEN
+        c_notation := COALESCE(substring(transcript FROM 'c\..+$'), transcript);
+        splice := regexp_match(c_notation, '([+-])(\d+)');
+        IF splice IS NOT NULL THEN
+            splice_pos := splice[2]::numeric;
+            IF splice[1] = '+' AND splice_pos BETWEEN 1 AND 6 THEN
+                RETURN 'Splice Donor';
+            END IF;
+            IF splice[1] = '-' AND splice_pos BETWEEN 1 AND 3 THEN
+                RETURN 'Splice Acceptor';
+            END IF;
+            RETURN 'Intronic Variant';
+        END IF;
+        IF left(c_notation, 2) = 'c.' THEN
+            RETURN 'Coding Sequence Variant';
+        END IF;
+    END IF;
+
+    -- Structural type last (CNVs without a protein consequence).
+    IF lower(variant_type) IN ('deletion', 'del') THEN
+        RETURN 'Copy Number Loss';
+    END IF;
+    IF lower(variant_type) IN ('duplication', 'dup') THEN
+        RETURN 'Copy Number Gain';
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+# Frozen copy of STRUCTURAL_TYPE_CASE
+# (app/phenopackets/routers/aggregations/sql_fragments/classification.py).
+_HGVS_C = """(
+            SELECT elem->>'value'
+            FROM jsonb_array_elements(vd->'expressions') elem
+            WHERE elem->>'syntax' = 'hgvs.c'
+            LIMIT 1
+        )"""
+_STRUCTURAL_TYPE = f"""COALESCE(
+    vd->'structuralType'->>'label',
+    CASE
+        WHEN {_HGVS_C} ~ 'del[A-Z]*ins' THEN 'indel'
+        WHEN {_HGVS_C} ~ 'ins' AND {_HGVS_C} !~ 'del' THEN 'insertion'
+        WHEN {_HGVS_C} ~ 'del' AND {_HGVS_C} !~ 'ins' THEN 'deletion'
+        WHEN {_HGVS_C} ~ 'dup' THEN 'duplication'
+        WHEN {_HGVS_C} ~ 'inv' THEN 'inversion'
+        WHEN vd->'vcfRecord'->>'alt' ~ '^<(DEL|DUP|INS|INV|CNV)' THEN 'CNV'
+        WHEN {_HGVS_C} ~ '>[ACGT]' THEN 'SNV'
+        WHEN vd->>'moleculeContext' = 'genomic' THEN 'SNV'
+        ELSE 'OTHER'
+    END,
+    vd->'molecularConsequences'->0->>'label'
+)"""
+
+_VCF_STRING = """NULLIF(CONCAT(
+    COALESCE(vd->'vcfRecord'->>'chrom', ''), ':',
+    COALESCE(vd->'vcfRecord'->>'pos', ''), ':',
+    COALESCE(vd->'vcfRecord'->>'ref', ''), ':',
+    COALESCE(vd->'vcfRecord'->>'alt', '')
+), ':::')"""
+
+_VARIANT_CATALOG = f"""
+CREATE MATERIALIZED VIEW mv_variant_catalog AS
+WITH occurrences AS (
+    SELECT
+        vd->>'id' AS variant_id,
+        vd->>'label' AS label,
+        vd->'geneContext'->>'symbol' AS gene_symbol,
+        vd->'geneContext'->>'valueId' AS gene_id,
+        {_STRUCTURAL_TYPE} AS structural_type,
+        gi->>'interpretationStatus' AS interpretation_status,
+        COALESCE(
+            vi->>'acmgPathogenicityClassification',
+            gi->>'interpretationStatus'
+        ) AS pathogenicity,
+        COALESCE(
+            {_VCF_STRING},
+            (
+                SELECT elem->>'value'
+                FROM jsonb_array_elements(vd->'expressions') elem
+                WHERE elem->>'syntax' IN ('vcf', 'ga4gh', 'text')
+                LIMIT 1
+            ),
+            vd->>'description'
+        ) AS hg38,
+        {_HGVS_C} AS transcript,
+        (
+            SELECT elem->>'value'
+            FROM jsonb_array_elements(vd->'expressions') elem
+            WHERE elem->>'syntax' = 'hgvs.p'
+            LIMIT 1
+        ) AS protein,
+        vd->'extensions' AS vep_extensions,
+        ARRAY[vd->>'id', vd->>'label', vd->>'description', {_VCF_STRING}]
+            || ARRAY(
+                SELECT expr->>'value'
+                FROM jsonb_array_elements(vd->'expressions') expr
+            ) AS search_terms,
+        p.id AS phenopacket_id
+    FROM phenopackets p
+    JOIN phenopacket_revisions r ON r.id = p.head_published_revision_id,
+        jsonb_array_elements(r.content_jsonb->'interpretations') interp,
+        jsonb_array_elements(interp->'diagnosis'->'genomicInterpretations') gi,
+        LATERAL (SELECT gi->'variantInterpretation' AS vi) vi_lateral,
+        LATERAL (SELECT vi_lateral.vi->'variationDescriptor' AS vd) vd_lateral
+    WHERE p.deleted_at IS NULL
+      AND p.state = 'published'
+      AND p.head_published_revision_id IS NOT NULL
+      AND p.phenopacket_id NOT LIKE 'e2e-%'
+      AND vi_lateral.vi IS NOT NULL
+      AND vd_lateral.vd IS NOT NULL
+),
+variants AS (
+    SELECT
+        variant_id,
+        MAX(label) AS label,
+        MAX(gene_symbol) AS gene_symbol,
+        MAX(gene_id) AS gene_id,
+        MAX(structural_type) AS structural_type,
+        MAX(pathogenicity) AS pathogenicity,
+        MAX(hg38) AS hg38,
+        MAX(transcript) AS transcript,
+        MAX(protein) AS protein,
+        (ARRAY_AGG(vep_extensions))[1] AS vep_extensions,
+        COUNT(DISTINCT phenopacket_id)::integer AS phenopacket_count
+    FROM occurrences
+    GROUP BY variant_id
+),
+status_counts AS (
+    SELECT
+        variant_id,
+        interpretation_status,
+        COUNT(DISTINCT phenopacket_id)::integer AS phenopacket_count,
+        MAX(pathogenicity) AS pathogenicity
+    FROM occurrences
+    WHERE interpretation_status IS NOT NULL
+    GROUP BY variant_id, interpretation_status
+),
+statuses AS (
+    SELECT
+        variant_id,
+        ARRAY_AGG(interpretation_status ORDER BY interpretation_status)
+            AS interpretation_statuses,
+        jsonb_object_agg(
+            interpretation_status,
+            jsonb_build_object(
+                'phenopacket_count', phenopacket_count,
+                'pathogenicity', pathogenicity
+            )
+        ) AS status_summary
+    FROM status_counts
+    GROUP BY variant_id
+),
+terms AS (
+    SELECT variant_id, ARRAY_AGG(DISTINCT term ORDER BY term) AS search_terms
+    FROM occurrences, unnest(search_terms) AS term
+    WHERE COALESCE(term, '') <> ''
+    GROUP BY variant_id
+)
+SELECT
+    ROW_NUMBER() OVER (
+        ORDER BY v.phenopacket_count DESC, v.gene_symbol ASC, v.variant_id ASC
+    )::integer AS simple_id,
+    v.variant_id,
+    v.label,
+    v.gene_symbol,
+    v.gene_id,
+    v.structural_type,
+    v.pathogenicity,
+    v.phenopacket_count,
+    v.hg38,
+    v.transcript,
+    v.protein,
+    hnf1b_molecular_consequence(
+        v.transcript, v.protein, v.structural_type, v.vep_extensions
+    ) AS molecular_consequence,
+    (regexp_match(v.protein, 'p\\.[A-Z][a-z]{{2}}(\\d+)'))[1]::integer
+        AS protein_position,
+    COALESCE(s.interpretation_statuses, ARRAY[]::text[]) AS interpretation_statuses,
+    COALESCE(s.status_summary, '{{}}'::jsonb) AS status_summary,
+    COALESCE(t.search_terms, ARRAY[]::text[]) AS search_terms
+FROM variants v
+LEFT JOIN statuses s ON s.variant_id = v.variant_id
+LEFT JOIN terms t ON t.variant_id = v.variant_id
+"""
+
+_INDEXES = (
+    # CONCURRENTLY needs a unique index on plain columns.
+    "CREATE UNIQUE INDEX ix_mv_variant_catalog_variant_id "
+    "ON mv_variant_catalog (variant_id)",
+    "CREATE INDEX ix_mv_variant_catalog_count "
+    "ON mv_variant_catalog (phenopacket_count DESC, variant_id)",
+    "CREATE INDEX ix_mv_variant_catalog_structural_type "
+    "ON mv_variant_catalog (structural_type)",
+    "CREATE INDEX ix_mv_variant_catalog_consequence "
+    "ON mv_variant_catalog (molecular_consequence)",
+    "CREATE INDEX ix_mv_variant_catalog_gene_symbol "
+    "ON mv_variant_catalog (gene_symbol)",
+    "CREATE INDEX ix_mv_variant_catalog_protein_position "
+    "ON mv_variant_catalog (protein_position)",
+    "CREATE INDEX ix_mv_variant_catalog_statuses "
+    "ON mv_variant_catalog USING gin (interpretation_statuses)",
+)
+
+
+def _refresh_function(views: tuple[str, ...]) -> str:
+    body = "\n".join(f"    REFRESH MATERIALIZED VIEW CONCURRENTLY {v};" for v in views)
+    return (
+        "CREATE OR REPLACE FUNCTION refresh_all_aggregation_views()\n"
+        "RETURNS void AS $$\nBEGIN\n"
+        f"{body}\n"
+        "END;\n$$ LANGUAGE plpgsql;"
+    )
+
+
+_AGGREGATION_VIEWS = (
+    "mv_feature_aggregation",
+    "mv_disease_aggregation",
+    "mv_sex_distribution",
+    "mv_summary_statistics",
+)
+
+
+def upgrade() -> None:
+    """Create the consequence function, the variant catalogue and its indexes."""
+    op.execute(_CONSEQUENCE_FUNCTION)
+    op.execute(_VARIANT_CATALOG)
+    for statement in _INDEXES:
+        op.execute(statement)
+    op.execute(_refresh_function(_AGGREGATION_VIEWS + ("mv_variant_catalog",)))
+
+
+def downgrade() -> None:
+    """Drop the variant catalogue and the consequence function."""
+    op.execute(_refresh_function(_AGGREGATION_VIEWS))
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_variant_catalog CASCADE")
+    op.execute(
+        "DROP FUNCTION IF EXISTS hnf1b_molecular_consequence(text, text, text, jsonb)"
+    )
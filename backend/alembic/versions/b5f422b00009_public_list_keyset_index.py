@@ -0,0 +1,42 @@
+"""Partial keyset index for the public phenopacket list.
+
+``GET /phenopackets/`` in cursor mode orders by ``(created_at DESC, id DESC)``
+and compares the row value against the cursor. For anonymous callers the
+visibility filter (published, not deleted, with a head revision) is constant,
+so a partial index over exactly that subset lets each page read
+``page[size] + 1`` index entries regardless of depth, without visiting the
+draft, archived and deleted rows that ``idx_phenopackets_cursor_pagination``
+also covers. Curator listings keep using that full index.
+
+The variant list pages over ``mv_variant_catalog`` using its existing
+``(phenopacket_count DESC, variant_id)`` index.
+
+Revision ID: b5f422b00009
+Revises: a4f422b00008
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "b5f422b00009"
+down_revision = "a4f422b00008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the partial (created_at DESC, id DESC) index for public reads."""
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_phenopackets_public_keyset
+        ON phenopackets (created_at DESC, id DESC)
+        WHERE deleted_at IS NULL
+          AND state = 'published'
+          AND head_published_revision_id IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    """Drop the partial public keyset index."""
+    op.execute("DROP INDEX IF EXISTS idx_phenopackets_public_keyset")
@@ -0,0 +1,68 @@
+"""Precompute a full-text search vector for published revisions.
+
+The public branch of ``PhenopacketSearchRepository`` matched anonymous queries
+with ``to_tsvector('simple', r.content_jsonb::text)`` and an ILIKE over the
+serialised JSONB, both evaluated per row at query time. Every public search
+therefore re-serialised every head-published revision and could never use an
+index.
+
+Revisions are append-only, so a revision's content and state are fixed at
+INSERT. A ``STORED`` generated column computes the vector exactly once, when a
+``published`` revision (the only kind that can become head-published) is
+written; draft/review revisions keep ``NULL`` and cost nothing. The GIN index
+is partial on the populated rows, and a trigram GIN index over the serialised
+published content backs the ILIKE substring fallback.
+
+Revision ID: d1f422b00005
+Revises: c0f422b00004
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "d1f422b00005"
+down_revision = "c0f422b00004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the generated search vector and its supporting indexes."""
+    # ALTER TABLE ... ADD COLUMN rewrites the table without firing row
+    # triggers, so the append-only guard on revisions is not tripped.
+    op.execute(
+        """
+        ALTER TABLE phenopacket_revisions
+        ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            CASE
+                WHEN state = 'published'
+                THEN to_tsvector('simple'::regconfig, content_jsonb::text)
+            END
+        ) STORED
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX idx_phenopacket_revisions_search_vector
+        ON phenopacket_revisions USING GIN (search_vector)
+        WHERE search_vector IS NOT NULL
+        """
+    )
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        """
+        CREATE INDEX idx_phenopacket_revisions_published_content_trgm
+        ON phenopacket_revisions USING GIN ((content_jsonb::text) gin_trgm_ops)
+        WHERE state = 'published'
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the derived search column and indexes; revision content is untouched."""
+    op.execute("DROP INDEX IF EXISTS idx_phenopacket_revisions_published_content_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_phenopacket_revisions_search_vector")
+    op.execute("ALTER TABLE phenopacket_revisions DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,329 @@
+"""Rebuild the aggregation materialized views over published-head snapshots.
+
+The 20260412_0004 definitions aggregated ``phenopackets.phenopacket`` — the
+mutable working copy, which carries draft content while a clone-to-draft edit
+of a published record is in flight — so PR #422 retired them from the public
+read path. These definitions read ``phenopacket_revisions.content_jsonb`` of
+``head_published_revision_id`` and apply the same synthetic-record exclusion
+as the live endpoint queries, so a fresh view returns exactly what the live
+query would.
+
+Each view now holds the columns its endpoint serves (percentages are derived
+at read time) and no ``NOW()`` column: a per-row timestamp changed every row
+on every refresh, defeating the row diff ``REFRESH ... CONCURRENTLY`` relies
+on. Freshness is tracked by the refresh scheduler instead.
+
+Revision ID: e2f422b00006
+Revises: d1f422b00005
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "e2f422b00006"
+down_revision = "d1f422b00005"
+branch_labels = None
+depends_on = None
+
+_PUBLISHED_HEADS = """
+    SELECT r.content_jsonb AS content
+    FROM phenopackets p
+    JOIN phenopacket_revisions r ON r.id = p.head_published_revision_id
+    WHERE p.deleted_at IS NULL
+      AND p.state = 'published'
+      AND p.head_published_revision_id IS NOT NULL
+      AND p.phenopacket_id NOT LIKE 'e2e-%'
+"""
+
+_LEGACY_FILTER = (
+    "deleted_at IS NULL"
+    "\n              AND state = 'published'"
+    "\n              AND head_published_revision_id IS NOT NULL"
+)
+
+_VIEWS = (
+    "mv_feature_aggregation",
+    "mv_disease_aggregation",
+    "mv_sex_distribution",
+    "mv_summary_statistics",
+)
+
+
+def _drop_views() -> None:
+    for view in _VIEWS:
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {view} CASCADE")
+
+
+def upgrade() -> None:
+    """Recreate the four aggregation views on head-published revision content."""
+    _drop_views()
+
+    op.execute(
+        f"""
+        CREATE MATERIALIZED VIEW mv_feature_aggregation AS
+        WITH heads AS ({_PUBLISHED_HEADS})
+        SELECT
+            feature->'type'->>'id' AS hpo_id,
+            MIN(feature->'type'->>'label') AS label,
+            SUM(CASE WHEN NOT COALESCE((feature->>'excluded')::boolean, false)
+                THEN 1 ELSE 0 END)::integer AS present_count,
+            SUM(CASE WHEN COALESCE((feature->>'excluded')::boolean, false)
+                THEN 1 ELSE 0 END)::integer AS absent_count,
+            (SELECT COUNT(*) FROM heads)::integer AS total_phenopackets
+        FROM heads, jsonb_array_elements(heads.content->'phenotypicFeatures') AS feature
+        GROUP BY feature->'type'->>'id'
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_mv_feature_aggregation_hpo_id "
+        "ON mv_feature_aggregation (hpo_id)"
+    )
+    op.execute(
+        "CREATE INDEX ix_mv_feature_aggregation_present_count "
+        "ON mv_feature_aggregation (present_count DESC)"
+    )
+
+    op.execute(
+        f"""
+        CREATE MATERIALIZED VIEW mv_disease_aggregation AS
+        WITH heads AS ({_PUBLISHED_HEADS})
+        SELECT
+            disease->'term'->>'id' AS disease_id,
+            disease->'term'->>'label' AS label,
+            COUNT(*)::integer AS count
+        FROM heads, jsonb_array_elements(heads.content->'diseases') AS disease
+        GROUP BY disease->'term'->>'id', disease->'term'->>'label'
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_mv_disease_aggregation_disease_id_label "
+        "ON mv_disease_aggregation (disease_id, label)"
+    )
+
+    op.execute(
+        f"""
+        CREATE MATERIALIZED VIEW mv_sex_distribution AS
+        WITH heads AS ({_PUBLISHED_HEADS})
+        SELECT
+            COALESCE(content->'subject'->>'sex', 'Unknown') AS sex,
+            COUNT(*)::integer AS count
+        FROM heads
+        GROUP BY COALESCE(content->'subject'->>'sex', 'Unknown')
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_mv_sex_distribution_sex ON mv_sex_distribution (sex)"
+    )
+
+    # One row mirroring GET /aggregate/summary field for field. CONCURRENTLY
+    # needs a unique index on plain columns; the legacy ``((1))`` expression
+    # index never qualified, so the singleton gets a real column.
+    op.execute(
+        f"""
+        CREATE MATERIALIZED VIEW mv_summary_statistics AS
+        WITH heads AS ({_PUBLISHED_HEADS})
+        SELECT
+            1 AS singleton,
+            (SELECT COUNT(*) FROM heads)::integer AS total_phenopackets,
+            (
+                SELECT COUNT(*) FROM heads
+                WHERE jsonb_array_length(content->'interpretations') > 0
+            )::integer AS with_variants,
+            (
+                SELECT COUNT(DISTINCT feature->'type'->>'id')
+                FROM heads,
+                     jsonb_array_elements(content->'phenotypicFeatures') AS feature
+                WHERE feature->'type'->>'id' IS NOT NULL
+            )::integer AS distinct_hpo_terms,
+            (
+                SELECT COUNT(DISTINCT ext_ref->>'id')
+                FROM heads,
+                     jsonb_array_elements(
+                         content->'metaData'->'externalReferences'
+                     ) AS ext_ref
+                WHERE ext_ref->>'id' LIKE 'PMID:%'
+            )::integer AS distinct_publications,
+            (
+                SELECT COUNT(DISTINCT ext_ref->>'id')
+                FROM heads,
+                     jsonb_array_elements(
+                         content->'metaData'->'externalReferences'
+                     ) AS ext_ref
+                WHERE ext_ref->>'id' IS NOT NULL
+            )::integer AS distinct_sources,
+            (
+                SELECT COUNT(
+                    DISTINCT gi->'variantInterpretation'->'variationDescriptor'->>'id'
+                )
+                FROM heads,
+                     jsonb_array_elements(content->'interpretations') AS interp,
+                     jsonb_array_elements(
+                         interp->'diagnosis'->'genomicInterpretations'
+                     ) AS gi
+                WHERE gi->'variantInterpretation'->'variationDescriptor'->>'id'
+                      IS NOT NULL
+            )::integer AS distinct_variants,
+            (
+                SELECT COUNT(*) FROM heads
+                WHERE content->'subject'->>'sex' = 'MALE'
+            )::integer AS male,
+            (
+                SELECT COUNT(*) FROM heads
+                WHERE content->'subject'->>'sex' = 'FEMALE'
+            )::integer AS female,
+            (
+                SELECT COUNT(*) FROM heads
+                WHERE content->'subject'->>'sex' IS DISTINCT FROM 'MALE'
+                  AND content->'subject'->>'sex' IS DISTINCT FROM 'FEMALE'
+            )::integer AS unknown_sex
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_mv_summary_statistics_singleton "
+        "ON mv_summary_statistics (singleton)"
+    )
+
+
+def downgrade() -> None:
+    """Restore the 20260412_0004 working-copy definitions."""
+    _drop_views()
+
+    op.execute(
+        f"""
+        CREATE MATERIALIZED VIEW mv_feature_aggregation AS
+        WITH total_phenopackets AS (
+            SELECT COUNT(*) as total
+            FROM phenopackets
+            WHERE {_LEGACY_FILTER}
+        ),
+        feature_counts AS (
+            SELECT
+                feature->'type'->>'id' as hpo_id,
+                feature->'type'->>'label' as label,
+                SUM(CASE WHEN NOT COALESCE((feature->>'excluded')::boolean, false)
+                    THEN 1 ELSE 0 END) as present_count,
+                SUM(CASE WHEN COALESCE((feature->>'excluded')::boolean, false)
+                    THEN 1 ELSE 0 END) as absent_count
+            FROM
+                phenopackets,
+                jsonb_array_elements(phenopacket->'phenotypicFeatures') as feature
+            WHERE
+                {_LEGACY_FILTER}
+            GROUP BY
+                feature->'type'->>'id',
+                feature->'type'->>'label'
+        )
+        SELECT
+            fc.hpo_id,
+            fc.label,
+            fc.present_count::integer,
+            fc.absent_count::integer,
+            (tp.total - fc.present_count - fc.absent_count)::integer as not_reported_count,
+            tp.total::integer as total_phenopackets,
+            CASE WHEN tp.total > 0
+                THEN ROUND((fc.present_count::numeric / tp.total) * 100, 2)
+                ELSE 0
+            END as present_percentage,
+            NOW() as refreshed_at
+        FROM feature_counts fc, total_phenopackets tp
+        ORDER BY fc.present_count DESC
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_mv_feature_aggregation_hpo_id_label "
+        "ON mv_feature_aggregation (hpo_id, label)"
+    )
+    op.execute(
+        "CREATE INDEX ix_mv_feature_aggregation_present_count "
+        "ON mv_feature_aggregation (present_count DESC)"
+    )
+
+    op.execute(
+        f"""
+        CREATE MATERIALIZED VIEW mv_disease_aggregation AS
+        WITH disease_counts AS (
+            SELECT
+                disease->'term'->>'id' as disease_id,
+                disease->'term'->>'label' as label,
+                COUNT(*) as count
+            FROM
+                phenopackets,
+                jsonb_array_elements(phenopacket->'diseases') as disease
+            WHERE
+                {_LEGACY_FILTER}
+            GROUP BY
+                disease->'term'->>'id',
+                disease->'term'->>'label'
+        ),
+        total_diseases AS (
+            SELECT SUM(count) as total FROM disease_counts
+        )
+        SELECT
+            dc.disease_id,
+            dc.label,
+            dc.count::integer,
+            CASE WHEN td.total > 0
+                THEN ROUND((dc.count::numeric / td.total) * 100, 2)
+                ELSE 0
+            END as percentage,
+            NOW() as refreshed_at
+        FROM disease_counts dc, total_diseases td
+        ORDER BY dc.count DESC
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_mv_disease_aggregation_disease_id_label "
+        "ON mv_disease_aggregation (disease_id, label)"
+    )
+
+    op.execute(
+        f"""
+        CREATE MATERIALIZED VIEW mv_sex_distribution AS
+        SELECT
+            subject_sex as sex,
+            COUNT(*) as count,
+            ROUND((COUNT(*)::numeric / NULLIF(SUM(COUNT(*)) OVER (), 0)) * 100, 2)
+                as percentage,
+            NOW() as refreshed_at
+        FROM phenopackets
+        WHERE {_LEGACY_FILTER}
+        GROUP BY subject_sex
+        ORDER BY count DESC
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_mv_sex_distribution_sex ON mv_sex_distribution (sex)"
+    )
+
+    op.execute(
+        f"""
+        CREATE MATERIALIZED VIEW mv_summary_statistics AS
+        SELECT
+            COUNT(*) as total_phenopackets,
+            COUNT(*) FILTER (
+                WHERE jsonb_array_length(
+                    COALESCE(phenopacket->'interpretations', '[]'::jsonb)
+                ) > 0
+            ) as with_variants,
+            COUNT(*) FILTER (
+                WHERE jsonb_array_length(
+                    COALESCE(phenopacket->'phenotypicFeatures', '[]'::jsonb)
+                ) > 0
+            ) as with_features,
+            COUNT(*) FILTER (
+                WHERE jsonb_array_length(
+                    COALESCE(phenopacket->'diseases', '[]'::jsonb)
+                ) > 0
+            ) as with_diseases,
+            COUNT(DISTINCT phenopacket->'subject'->>'id') as unique_subjects,
+            NOW() as refreshed_at
+        FROM phenopackets
+        WHERE {_LEGACY_FILTER}
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_mv_summary_statistics_singleton "
+        "ON mv_summary_statistics ((1))"
+    )
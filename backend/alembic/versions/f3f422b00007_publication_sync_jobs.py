@@ -0,0 +1,76 @@
+"""Persisted, resumable publication full-text sync jobs.
+
+``publication_sync_jobs`` holds one row per full-text sync run with its
+counters, a heartbeat (``updated_at``) and a resume cursor (the last PMID
+checkpointed). ``publication_sync_items`` records each PMID's outcome and
+the hash of the content that was stored, so a restarted run skips PMIDs it
+already finished and a later run skips rewriting publications whose upstream
+content has not changed.
+
+Both tables are managed by raw SQL (no ORM model), like the other
+publication tables.
+
+Revision ID: f3f422b00007
+Revises: e2f422b00006
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "f3f422b00007"
+down_revision = "e2f422b00006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the sync job and per-PMID checkpoint tables."""
+    op.execute("""
+        CREATE TABLE publication_sync_jobs (
+            id            BIGSERIAL    PRIMARY KEY,
+            source        VARCHAR(20)  NOT NULL,
+            status        VARCHAR(20)  NOT NULL DEFAULT 'running',
+            task_id       VARCHAR(80),
+            total         INTEGER      NOT NULL DEFAULT 0,
+            processed     INTEGER      NOT NULL DEFAULT 0,
+            unchanged     INTEGER      NOT NULL DEFAULT 0,
+            errors        INTEGER      NOT NULL DEFAULT 0,
+            cursor_pmid   VARCHAR(20),
+            error         TEXT,
+            started_at    TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+            updated_at    TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+            completed_at  TIMESTAMPTZ,
+            CONSTRAINT valid_publication_sync_job_status
+                CHECK (status IN ('running', 'completed', 'failed'))
+        );
+    """)
+    op.execute(
+        "CREATE INDEX idx_publication_sync_jobs_source_status "
+        "ON publication_sync_jobs (source, status, updated_at);"
+    )
+    op.execute("""
+        CREATE TABLE publication_sync_items (
+            job_id        BIGINT       NOT NULL
+                          REFERENCES publication_sync_jobs(id) ON DELETE CASCADE,
+            pmid          VARCHAR(20)  NOT NULL,
+            status        VARCHAR(20)  NOT NULL,
+            content_hash  VARCHAR(64),
+            error         TEXT,
+            processed_at  TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+            CONSTRAINT pk_publication_sync_items PRIMARY KEY (job_id, pmid),
+            CONSTRAINT valid_publication_sync_item_status
+                CHECK (status IN ('done', 'unchanged', 'failed'))
+        );
+    """)
+    op.execute(
+        "CREATE INDEX idx_publication_sync_items_pmid "
+        "ON publication_sync_items (pmid, processed_at DESC);"
+    )
+
+
+def downgrade() -> None:
+    """Drop the sync job tables."""
+    op.execute("DROP TABLE IF EXISTS publication_sync_items;")
+    op.execute("DROP TABLE IF EXISTS publication_sync_jobs;")
@@ -23,6 +23,9 @@ def progress_response_from_state(state: SyncTaskState) -> SyncProgressResponse:
         processed=state.processed,
         total=state.total,
         errors=state.errors,
+        skipped=state.skipped,
+        items_per_second=state.items_per_second,
+        eta_seconds=state.eta_seconds,
         started_at=state.started_at,
         completed_at=state.completed_at,
     )
@@ -57,5 +57,15 @@ class SyncProgressResponse(BaseModel):
     processed: int = Field(..., description="Items processed")
     total: int = Field(..., description="Total items")
     errors: int = Field(default=0, description="Number of errors")
+    skipped: int = Field(
+        default=0, description="Items already done by a resumed earlier run"
+    )
+    items_per_second: Optional[float] = Field(
+        default=None, description="Throughput of the current run"
+    )
+    eta_seconds: Optional[float] = Field(
+        default=None,
+        description="Estimated seconds until the remaining items are done",
+    )
     started_at: Optional[str] = Field(None, description="Task start time")
     completed_at: Optional[str] = Field(None, description="Task completion time")
@@ -1,8 +1,10 @@
 """Admin status endpoints.
 
 Read-only routes that expose system-wide counts and reference data
-health: ``/admin/status``, ``/admin/statistics``, and
-``/admin/reference/status``.
+health: ``/admin/status``, ``/admin/statistics``,
+``/admin/reference/status``, ``/admin/search-index/status``,
+``/admin/aggregation-views/status``,
+``/admin/query-embedding-cache/status`` and ``/admin/http-clients/status``.
 """
 
 from __future__ import annotations
@@ -15,8 +17,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.admin import queries
 from app.api.admin.schemas import DataSyncStatus, SystemStatusResponse
+from app.core.http_clients import http_clients
+from app.core.mv_refresh import aggregation_refresh_scheduler
 from app.database import get_db
+from app.publications.fulltext.embeddings import query_embedding_cache
 from app.reference.service import get_reference_data_status
+from app.search.mv_refresh import search_refresh_coordinator
 
 logger = logging.getLogger(__name__)
 
@@ -133,3 +139,71 @@ async def get_reference_status(
         "initialized": ref_status.has_grch38 and ref_status.has_hnf1b,
         "chr17q12_synced": ref_status.chr17q12_gene_count >= 60,
     }
+
+
+@router.get(
+    "/search-index/status",
+    summary="Get global search index refresh status",
+    description="""
+    Returns coordination metrics for the ``global_search_index``
+    materialized view: whether it is stale, the refresh lag (seconds the
+    oldest unrefreshed mutation has waited), pending dirty generations,
+    and the time and duration of the last cluster-wide refresh.
+
+    **Requires:** Admin authentication
+    """,
+)
+async def get_search_index_status():
+    """Get refresh lag and coordination metrics for the global search index."""
+    return await search_refresh_coordinator.get_status()
+
+
+@router.get(
+    "/aggregation-views/status",
+    summary="Get aggregation materialized view freshness",
+    description="""
+    Returns per-view freshness for the aggregation materialized views:
+    whether each view is stale (and therefore served by the live query),
+    its refresh lag, pending dirty generations, and the time and duration
+    of its last scheduled refresh.
+
+    **Requires:** Admin authentication
+    """,
+)
+async def get_aggregation_views_status():
+    """Get per-view freshness and refresh metrics for the aggregation views."""
+    return await aggregation_refresh_scheduler.get_status()
+
+
+@router.get(
+    "/query-embedding-cache/status",
+    summary="Get query embedding cache metrics",
+    description="""
+    Returns this worker's passage-search query vector cache metrics:
+    entries, capacity, TTL, encodes in flight, and hit, miss and
+    coalesced counters (a coalesced lookup shared another request's
+    in-flight encode).
+
+    **Requires:** Admin authentication
+    """,
+)
+async def get_query_embedding_cache_status():
+    """Get hit/miss counters for the query embedding cache."""
+    return query_embedding_cache.get_status()
+
+
+@router.get(
+    "/http-clients/status",
+    summary="Get outbound HTTP client pool metrics",
+    description="""
+    Returns this worker's shared outbound HTTP clients (Ensembl, OLS,
+    NCBI): pool limits, timeout, whether HTTP/2 is enabled, request,
+    error and in-flight counters, connections opened versus reused, and
+    p50/p95/max latency over recent requests.
+
+    **Requires:** Admin authentication
+    """,
+)
+async def get_http_clients_status():
+    """Get pool and latency metrics for the outbound HTTP clients."""
+    return http_clients.get_status()
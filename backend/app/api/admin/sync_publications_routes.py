@@ -1,7 +1,9 @@
 """Admin sync endpoints for publication metadata.
 
 Owns ``POST /admin/sync/publications`` (start a sync task) and
-``GET /admin/sync/publications/status`` (poll its progress).
+``GET /admin/sync/publications/status`` (poll its progress), plus
+``GET /admin/sync/publications/fulltext/status`` for the full-text sync
+started by ``POST /publications/sync``.
 """
 
 from __future__ import annotations
@@ -21,6 +23,7 @@ from app.api.admin.schemas import SyncProgressResponse, SyncTaskResponse
 from app.api.admin.sync_service import run_publication_sync
 from app.api.admin.task_state import TaskKind, get_sync_task_store
 from app.auth import get_current_user
+from app.core.aggregation_cache import bump_published_data_version
 from app.database import get_db
 from app.models.user import User
 
@@ -59,6 +62,7 @@ async def start_publication_sync(
         pending_count = len(all_pmids)
         if pending_count > 0:
             await queries.delete_all_publication_metadata(db)
+            await bump_published_data_version()
             logger.info(
                 "Force refresh: deleted existing metadata for %s publications",
                 pending_count,
@@ -127,3 +131,32 @@ async def get_publication_sync_status(
             detail=f"Task {task_id} not found",
         )
     return progress_response_from_state(state)
+
+
+@router.get(
+    "/sync/publications/fulltext/status",
+    response_model=SyncProgressResponse,
+    summary="Get publication full-text sync progress",
+    description="""
+    Returns the status of the publication full-text sync started by
+    ``POST /api/v2/publications/sync``, including its throughput
+    (``items_per_second``) and ``eta_seconds``. A sync resumed after a
+    worker restart reports the PMIDs it inherited as ``skipped``.
+    """,
+)
+async def get_publication_fulltext_sync_status(task_id: Optional[str] = None):
+    """Get publication full-text sync task status."""
+    store = get_sync_task_store()
+    state = (
+        await store.get(task_id)
+        if task_id is not None
+        else await store.get_latest(TaskKind.FULLTEXT)
+    )
+    if state is None:
+        if task_id is None:
+            return idle_progress_response(synced=0, total=0)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Task {task_id} not found",
+        )
+    return progress_response_from_state(state)
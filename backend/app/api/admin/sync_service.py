@@ -23,6 +23,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from app.api.admin.queries import fetch_pmids_to_sync
 from app.api.admin.task_state import SyncTaskStore
+from app.core.aggregation_cache import bump_published_data_version
 from app.core.config import settings
 from app.database import async_session_maker
 from app.phenopackets.routers.aggregations.sql_fragments import (
@@ -57,7 +58,9 @@ async def run_publication_sync(task_id: str, store: SyncTaskStore) -> None:
 
             for pmid in pmids_to_sync:
                 try:
-                    await get_publication_metadata(pmid, db, fetched_by="admin_sync")
+                    await get_publication_metadata(
+                        pmid, db, fetched_by="admin_sync", invalidate_aggregations=False
+                    )
                     await store.increment_processed(task_id)
                 except (PubMedError, SQLAlchemyError, asyncio.TimeoutError) as exc:
                     await store.increment_errors(task_id, count=1)
@@ -66,6 +69,8 @@ async def run_publication_sync(task_id: str, store: SyncTaskStore) -> None:
                 # Rate limit: NCBI E-Utils tolerates 3 req/sec for anon clients
                 await asyncio.sleep(0.35)
 
+        # One invalidation for the whole batch of stored metadata.
+        await bump_published_data_version()
         await store.complete(task_id)
         final = await store.get(task_id)
         logger.info(
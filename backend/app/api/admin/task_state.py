@@ -29,12 +29,23 @@ Task kinds
 ``TaskKind.VARIANT``     maps to the legacy ``var_sync_*`` id prefix.
 ``TaskKind.REFERENCE``   is the ``ref_init_*`` task (GRCh38 + HNF1B bootstrap).
 ``TaskKind.GENES``       is the ``genes_sync_*`` task (chr17q12 gene sync).
+``TaskKind.FULLTEXT``    is the ``pub_fulltext_*`` task (abstract/full-text
+passage sync, resumable through ``publication_sync_jobs``).
 
 Wave 4 originally collapsed REFERENCE + GENES into a single kind, which
 caused the "latest pointer" to clobber one with the other — flagged by
 the second Copilot review pass. They now live in separate buckets so
 ``/admin/sync/genes/status`` and ``/admin/sync/reference/init`` cannot
 shadow each other through the ``latest`` pointer.
+
+Throughput and ETA
+------------------
+
+Once a task is running, every counter update recomputes
+``items_per_second`` (items processed by this run since ``started_at``) and
+``eta_seconds`` for the remaining items. ``skipped`` counts items a resumed
+task inherited as already done: they are part of ``processed`` but not of the
+rate.
 """
 
 from __future__ import annotations
@@ -77,6 +88,7 @@ class TaskKind(str, Enum):
     VARIANT = "var_sync"
     REFERENCE = "ref_init"
     GENES = "genes_sync"
+    FULLTEXT = "pub_fulltext"
 
 
 @dataclass
@@ -95,6 +107,9 @@ class SyncTaskState:
     processed: int = 0
     total: int = 0
     errors: int = 0
+    skipped: int = 0
+    items_per_second: Optional[float] = None
+    eta_seconds: Optional[float] = None
     started_at: Optional[str] = None
     completed_at: Optional[str] = None
     error: Optional[str] = None
@@ -119,6 +134,9 @@ class SyncTaskState:
             processed=int(data.get("processed", 0)),
             total=int(data.get("total", 0)),
             errors=int(data.get("errors", 0)),
+            skipped=int(data.get("skipped", 0)),
+            items_per_second=data.get("items_per_second"),
+            eta_seconds=data.get("eta_seconds"),
             started_at=data.get("started_at"),
             completed_at=data.get("completed_at"),
             error=data.get("error"),
@@ -198,8 +216,9 @@ class SyncTaskStore:
         processed: Optional[int] = None,
         total: Optional[int] = None,
         errors: Optional[int] = None,
+        skipped: Optional[int] = None,
     ) -> Optional[SyncTaskState]:
-        """Update processed/total/errors counters and recompute ``progress``.
+        """Update the counters and recompute ``progress``, throughput and ETA.
 
         Any unspecified field is left untouched. Returns the updated state so
         callers can chain a save with a ``log.info`` without issuing a second
@@ -215,9 +234,9 @@ class SyncTaskStore:
             state.total = total
         if errors is not None:
             state.errors = errors
-        state.progress = (
-            (state.processed / state.total * 100) if state.total > 0 else 100.0
-        )
+        if skipped is not None:
+            state.skipped = skipped
+        self._recompute_progress(state)
         await self._save(state)
         return state
 
@@ -227,9 +246,7 @@ class SyncTaskStore:
         if state is None:
             return
         state.processed += 1
-        state.progress = (
-            (state.processed / state.total * 100) if state.total > 0 else 100.0
-        )
+        self._recompute_progress(state)
         await self._save(state)
 
     async def increment_errors(self, task_id: str, count: int = 1) -> None:
@@ -247,6 +264,7 @@ class SyncTaskStore:
             return
         state.status = TaskStatus.COMPLETED
         state.progress = 100.0
+        state.eta_seconds = 0.0
         state.completed_at = datetime.now(timezone.utc).isoformat()
         await self._save(state)
 
@@ -262,6 +280,24 @@ class SyncTaskStore:
 
     # ----------------------------------------------------------------- helpers
 
+    @staticmethod
+    def _recompute_progress(state: SyncTaskState) -> None:
+        """Derive ``progress``, ``items_per_second`` and ``eta_seconds``."""
+        state.progress = (
+            (state.processed / state.total * 100) if state.total > 0 else 100.0
+        )
+        if state.started_at is None:
+            return
+        elapsed = (
+            datetime.now(timezone.utc) - datetime.fromisoformat(state.started_at)
+        ).total_seconds()
+        done = state.processed - state.skipped
+        if elapsed <= 0 or done <= 0:
+            return
+        state.items_per_second = done / elapsed
+        remaining = max(state.total - state.processed - state.errors, 0)
+        state.eta_seconds = remaining / state.items_per_second
+
     def _generate_task_id(self, kind: TaskKind) -> str:
         """Produce a human-parseable, monotonically-ordered task id.
 
@@ -0,0 +1,192 @@
+"""Response cache for the public aggregation endpoints.
+
+Aggregations are pure functions of the published data, which only changes
+when a record is published, archived, deleted or imported. Every such change
+bumps a monotonically increasing *published data version* in the shared cache
+(Redis in production), and every cached response key embeds the version it
+was computed at. A bump therefore invalidates all cached aggregations in all
+workers at once without scanning or deleting keys; superseded entries simply
+age out via their TTL.
+
+The counter alone is not a safe HTTP validator: it restarts at 0 when the
+shared cache is flushed, and under the in-memory fallback each worker counts
+on its own. ETags therefore also embed the *published data epoch*, a random
+nonce rotated whenever the counter is found missing (see
+:func:`get_published_data_epoch`).
+
+Usage:
+    from app.core.aggregation_cache import cached_aggregation
+
+    @router.get("/summary")
+    @cached_aggregation
+    async def get_summary_statistics(db: AsyncSession = Depends(get_db)):
+        ...
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import secrets
+from typing import Any, Awaitable, Callable, Mapping, Optional, TypeVar
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.cache import CacheService
+from app.core.cache import cache as default_cache
+
+logger = logging.getLogger(__name__)
+
+PUBLISHED_DATA_VERSION_KEY = "aggregations:published_data_version"
+PUBLISHED_DATA_EPOCH_KEY = "aggregations:published_data_epoch"
+KEY_PREFIX = "aggregations:response"
+
+# Endpoint arguments that carry per-request plumbing rather than inputs to
+# the aggregation, and so never contribute to the cache key.
+_NON_KEY_ARGUMENTS = frozenset({"db", "request", "response", "user"})
+
+T = TypeVar("T")
+
+
+async def get_published_data_version(cache: CacheService = default_cache) -> int:
+    """Return the current published data version (0 before the first bump)."""
+    value = await cache.get(PUBLISHED_DATA_VERSION_KEY)
+    try:
+        return int(value) if value is not None else 0
+    except ValueError:
+        return 0
+
+
+async def bump_published_data_version(cache: CacheService = default_cache) -> int:
+    """Invalidate every cached aggregation by advancing the data version.
+
+    Call after the transaction that changed the published data commits, so a
+    concurrent request cannot recompute and cache the old data under the new
+    version.
+
+    Returns:
+        The new version.
+    """
+    version = await cache.incr(PUBLISHED_DATA_VERSION_KEY)
+    logger.debug(f"Published data version bumped to {version}")
+    return version
+
+
+async def get_published_data_epoch(cache: CacheService = default_cache) -> str:
+    """Return the nonce identifying the current lifetime of the version counter.
+
+    A missing counter means it was lost (cache flush, eviction, a fresh
+    in-memory worker), so a new epoch is drawn and the counter is recreated
+    with it. ``(epoch, version)`` therefore never repeats for different
+    published data, which makes it safe to derive ETags from. Read the epoch
+    before the version: creating the counter advances it.
+    """
+    epoch = await cache.get(PUBLISHED_DATA_EPOCH_KEY)
+    if epoch is not None and await cache.exists(PUBLISHED_DATA_VERSION_KEY):
+        return epoch
+    epoch = secrets.token_hex(8)
+    await cache.set(PUBLISHED_DATA_EPOCH_KEY, epoch)
+    await cache.incr(PUBLISHED_DATA_VERSION_KEY)
+    logger.info(f"Started published data epoch {epoch}")
+    return epoch
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an ``If-None-Match`` header against *etag*.
+
+    Used by endpoints whose ETag is derived from the published data epoch and
+    version.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def aggregation_cache_key(name: str, version: int, params: Mapping[str, Any]) -> str:
+    """Build the cache key for one aggregation result.
+
+    Args:
+        name: Stable identifier of the aggregation (module and function name).
+        version: Published data version the result is computed at.
+        params: Inputs that select the result (query parameters).
+
+    Returns:
+        ``aggregations:response:v<version>:<name>:<params digest>``
+    """
+    encoded = json.dumps(jsonable_encoder(params), sort_keys=True)
+    digest = hashlib.sha256(encoded.encode()).hexdigest()[:32]
+    return f"{KEY_PREFIX}:v{version}:{name}:{digest}"
+
+
+async def get_or_compute(
+    name: str,
+    params: Mapping[str, Any],
+    compute: Callable[[], Awaitable[T]],
+    cache: CacheService = default_cache,
+    *,
+    version: Optional[int] = None,
+) -> Any:
+    """Return a cached aggregation result, computing and storing it on a miss.
+
+    Results are stored as JSON, so a hit returns the JSON-compatible form of
+    what *compute* returned (models become dicts), which FastAPI validates
+    against the endpoint's ``response_model`` exactly as it would the models.
+
+    Args:
+        name: Stable identifier of the aggregation.
+        params: Inputs that select the result.
+        compute: Coroutine factory producing the result on a miss.
+        cache: Cache backend (default: the process-wide ``CacheService``).
+        version: Published data version to read and store at; defaults to
+            the current one. Pass the version an ETag was derived from so the
+            validator and the body cannot disagree.
+    """
+    from app.core.config import settings
+
+    config = settings.aggregation_cache
+    if not config.enabled:
+        return await compute()
+
+    if version is None:
+        version = await get_published_data_version(cache)
+    key = aggregation_cache_key(name, version, params)
+    cached = await cache.get(key)
+    if cached is not None:
+        try:
+            return json.loads(cached)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Discarding undecodable aggregation cache entry {key}: {e}")
+
+    result = await compute()
+    try:
+        payload = json.dumps(jsonable_encoder(result))
+    except (TypeError, ValueError) as e:
+        logger.warning(f"Aggregation result for {name} is not cacheable: {e}")
+        return result
+    await cache.set(key, payload, ttl=config.ttl_seconds)
+    return result
+
+
+def cached_aggregation(
+    func: Callable[..., Awaitable[Any]],
+) -> Callable[..., Awaitable[Any]]:
+    """Cache an aggregation endpoint's response per published data version.
+
+    The endpoint's keyword arguments (its query parameters) form the cache
+    key; ``db``, ``request``, ``response`` and ``user`` are ignored. Apply
+    below ``@router.get`` so FastAPI registers the wrapper, which keeps the
+    endpoint's signature for dependency injection.
+    """
+    name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        params = {
+            key: value for key, value in kwargs.items() if key not in _NON_KEY_ARGUMENTS
+        }
+        return await get_or_compute(name, params, lambda: func(*args, **kwargs))
+
+    return wrapper
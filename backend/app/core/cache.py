@@ -72,9 +72,13 @@ class InMemoryCache:
         self._counters: dict[str, tuple[int, Optional[datetime]]] = {}
 
     def get(self, key: str) -> Optional[str]:
-        """Get value from cache."""
+        """Get value from cache.
+
+        Counters created by :meth:`incr` are readable too, mirroring Redis
+        where ``INCR`` keys are ordinary string keys.
+        """
         if key not in self._cache:
-            return None
+            return self._get_counter(key)
 
         value, expires_at = self._cache[key]
 
@@ -87,6 +91,16 @@ class InMemoryCache:
         self._cache.move_to_end(key)
         return value
 
+    def _get_counter(self, key: str) -> Optional[str]:
+        """Return a live counter value as a string, or None."""
+        if key not in self._counters:
+            return None
+        count, expires_at = self._counters[key]
+        if expires_at and datetime.now() > expires_at:
+            del self._counters[key]
+            return None
+        return str(count)
+
     def set(self, key: str, value: str, ttl: Optional[int] = None) -> bool:
         """Set value in cache with optional TTL."""
         expires_at = datetime.now() + timedelta(seconds=ttl) if ttl else None
@@ -99,11 +113,12 @@ class InMemoryCache:
         return True
 
     def delete(self, key: str) -> bool:
-        """Delete key from cache."""
+        """Delete key (value or counter) from cache."""
+        deleted = self._counters.pop(key, None) is not None
         if key in self._cache:
             del self._cache[key]
             return True
-        return False
+        return deleted
 
     def incr(self, key: str, ttl: Optional[int] = None) -> int:
         """Increment counter with optional TTL (for rate limiting)."""
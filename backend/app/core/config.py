@@ -150,6 +150,36 @@ class PmcIdConverterApiConfig(BaseModel):
     email: str = "noreply@hnf1b-db.org"
 
 
+class HttpPoolConfig(BaseModel):
+    """Connection pool of one shared outbound HTTP client.
+
+    ``http2`` is opt-in: it needs the optional ``h2`` package
+    (``httpx[http2]``), which is not a project dependency, and is ignored
+    without it; the client then speaks HTTP/1.1 with keep-alive.
+    """
+
+    max_connections: int = 10
+    max_keepalive_connections: int = 5
+    keepalive_expiry_seconds: float = 30.0
+    connect_timeout_seconds: float = 5.0
+    http2: bool = False
+
+
+class HttpPoolsConfig(BaseModel):
+    """Per-upstream pools of the clients in ``app.core.http_clients``.
+
+    ``ensembl`` serves VEP, the variant recoder and the gene sync (all
+    ``rest.ensembl.org``), ``ols`` the HPO proxy and ``ncbi`` PubMed esummary.
+    """
+
+    ensembl: HttpPoolConfig = HttpPoolConfig()
+    ols: HttpPoolConfig = HttpPoolConfig()
+    # NCBI allows 3 requests/s without an API key (10 with one).
+    ncbi: HttpPoolConfig = HttpPoolConfig(
+        max_connections=4, max_keepalive_connections=2
+    )
+
+
 class ExternalApisConfig(BaseModel):
     """External API configurations."""
 
@@ -160,6 +190,7 @@ class ExternalApisConfig(BaseModel):
     pubtator3: PubTator3ApiConfig = PubTator3ApiConfig()
     europepmc: EuropePmcApiConfig = EuropePmcApiConfig()
     idconv: PmcIdConverterApiConfig = PmcIdConverterApiConfig()
+    http_pools: HttpPoolsConfig = HttpPoolsConfig()
 
 
 class DatabaseConfig(BaseModel):
@@ -179,7 +210,13 @@ class HttpCacheConfig(BaseModel):
 
 
 class MaterializedViewsConfig(BaseModel):
-    """Materialized views configuration for aggregation optimization."""
+    """Materialized views configuration for aggregation optimization.
+
+    Publish/archive/delete mark the affected views stale; endpoints use the
+    live query while a view is stale, and a background scheduler refreshes it
+    ``CONCURRENTLY`` once the marks go quiet (same debounce/max-delay scheme
+    as :class:`SearchIndexRefreshConfig`).
+    """
 
     enabled: bool = True
     auto_refresh_after_import: bool = True
@@ -188,7 +225,70 @@ class MaterializedViewsConfig(BaseModel):
         "mv_disease_aggregation",
         "mv_sex_distribution",
         "mv_summary_statistics",
+        "mv_variant_catalog",
     ]
+    # Run the per-process refresh scheduler.
+    refresh_scheduler_enabled: bool = True
+    refresh_debounce_seconds: float = 2.0
+    refresh_max_delay_seconds: float = 60.0
+    refresh_poll_interval_seconds: float = 5.0
+
+
+class SearchIndexRefreshConfig(BaseModel):
+    """Cluster-wide refresh coordination for the ``global_search_index`` MV.
+
+    Mutations only record a dirty mark; a single background worker per process
+    coalesces the marks and, holding a PostgreSQL advisory lock so at most one
+    worker in the cluster runs it, issues one ``REFRESH ... CONCURRENTLY``.
+    """
+
+    enabled: bool = True
+    # Wait this long after the latest dirty mark so bursts collapse into one
+    # refresh...
+    debounce_seconds: float = 2.0
+    # ...but never leave the index stale for longer than this.
+    max_delay_seconds: float = 30.0
+    # How often an idle worker re-checks the shared dirty state written by
+    # other processes.
+    poll_interval_seconds: float = 5.0
+
+
+class AggregationCacheConfig(BaseModel):
+    """Server-side response cache for the ``/aggregate/*`` endpoints.
+
+    Cached responses are keyed on the published data version, which publish,
+    archive, delete and import bump, so entries are invalidated exactly when
+    the published data changes. The TTL only bounds how long superseded
+    entries linger in the cache.
+    """
+
+    enabled: bool = True
+    ttl_seconds: int = 3600
+    # Recompute every survival comparison/endpoint combination in the
+    # background after a publish so /aggregate/survival-data never computes
+    # Kaplan-Meier curves on the request path.
+    survival_precompute_enabled: bool = True
+    survival_precompute_poll_seconds: float = 60.0
+
+
+class ResamplingConfig(BaseModel):
+    """Optional permutation/bootstrap statistics for small subgroups.
+
+    Resampling runs on a process pool so it never blocks the event loop.
+    ``max_resamples`` and ``timeout_seconds`` bound the work one request can
+    cause; ``seed`` makes results reproducible (and therefore cacheable).
+    """
+
+    enabled: bool = True
+    max_workers: int = Field(
+        default=2,
+        ge=0,
+        description="Process pool size; 0 runs resampling in a worker thread.",
+    )
+    default_resamples: int = Field(default=2000, ge=100)
+    max_resamples: int = Field(default=10000, ge=100)
+    timeout_seconds: float = Field(default=30.0, gt=0)
+    seed: int = 20240611
 
 
 class HPOTermsConfig(BaseModel):
@@ -302,6 +402,15 @@ class PublicationsRagConfig(BaseModel):
     allowed_licenses: List[str] = ["CC0", "CC-BY", "CC-BY-NC", "PMC-OA"]
     # Re-fetch full text/abstracts older than this (idempotent backfill).
     fulltext_staleness_days: int = 180
+    # Publications fetched concurrently by a full-text sync; the per-host
+    # rate limits (external_apis) bound the actual request rate.
+    sync_concurrency: int = Field(default=8, ge=1)
+    # A running sync job whose heartbeat is older than this is treated as
+    # orphaned by a dead worker and resumed by the next sync.
+    sync_job_stale_seconds: float = Field(default=600.0, gt=0.0)
+    # An unfinished (failed or orphaned) sync job last updated longer ago than
+    # this is abandoned and a fresh job started instead of resuming it.
+    sync_job_resume_max_age_seconds: float = Field(default=86400.0, gt=0.0)
     # Embedding model + runtime parameters.
     embedding_model: str = "BAAI/bge-small-en-v1.5"
     embedding_dim: int = 384
@@ -309,6 +418,11 @@ class PublicationsRagConfig(BaseModel):
         "Represent this sentence for searching relevant passages: "
     )
     embedding_batch_size: int = 32
+    # Micro-batching of concurrent query encodes: queries arriving within the
+    # window are encoded in one model call of at most the max size (a zero
+    # window encodes each request on its own).
+    embedding_batch_window_ms: float = Field(default=5.0, ge=0.0)
+    embedding_batch_max_size: int = Field(default=64, ge=1)
     # Reciprocal Rank Fusion constant and per-section additive rank boosts.
     # Boosts are deliberately small relative to a single RRF term (1/(k+rank)
     # ≈ 0.016 at k=60, rank 1): they are tie-breaker nudges that float
@@ -324,9 +438,31 @@ class PublicationsRagConfig(BaseModel):
     # Chunking window (token-based, section-bounded, char-offset recovery).
     chunk_max_tokens: int = 510
     chunk_overlap_tokens: int = 50
+    # Process-wide LRU of section token offsets keyed on the text's SHA-256,
+    # so re-syncs of unchanged articles skip tokenization (0 disables it).
+    tokenizer_cache_size: int = Field(default=2048, ge=0)
     # Default candidate pool sizes for the two retrieval legs before fusion.
     lexical_candidate_limit: int = 50
     dense_candidate_limit: int = 50
+    # pgvector HNSW search parameters for the dense leg, set per query:
+    # ef_search (raised to the candidate limit when lower) trades latency for
+    # recall; iterative_scan (pgvector >= 0.8: off|strict_order|relaxed_order)
+    # keeps a filtered index scan going until enough rows pass the filter.
+    # Measure with scripts/benchmark_dense_recall.py.
+    hnsw_ef_search: int = Field(default=100, ge=1, le=1000)
+    hnsw_iterative_scan: Literal["off", "strict_order", "relaxed_order"] = (
+        "strict_order"
+    )
+    # A PMID filter of at most this many PMIDs is searched exactly (scan of the
+    # filtered passages) instead of post-filtering the HNSW index.
+    dense_exact_max_pmids: int = Field(default=50, ge=0)
+    # How long a per-model "embeddings stored?" probe result is reused by the
+    # retrieval path before it is re-checked (0 disables the cache).
+    embeddings_probe_ttl_seconds: float = Field(default=60.0, ge=0.0)
+    # Process-wide LRU of encoded query vectors, keyed on (model, query):
+    # repeated queries skip the model entirely (0 entries disables it).
+    query_embedding_cache_size: int = Field(default=1024, ge=0)
+    query_embedding_cache_ttl_seconds: float = Field(default=3600.0, gt=0.0)
     # Minimum lexical relevance floor (recall fix): the OR-recall ``to_tsquery``
     # leg matches any passage sharing one English token with the query, so
     # without a floor, gibberish-plus-common-words queries surface
@@ -371,6 +507,9 @@ class YamlConfig(BaseModel):
     database: DatabaseConfig = DatabaseConfig()
     http_cache: HttpCacheConfig = HttpCacheConfig()
     materialized_views: MaterializedViewsConfig = MaterializedViewsConfig()
+    search_index_refresh: SearchIndexRefreshConfig = SearchIndexRefreshConfig()
+    aggregation_cache: AggregationCacheConfig = AggregationCacheConfig()
+    resampling: ResamplingConfig = ResamplingConfig()
     hpo_terms: HPOTermsConfig = HPOTermsConfig()
     security: SecurityConfig = SecurityConfig()
     email: EmailConfig = EmailConfig()
@@ -663,6 +802,21 @@ class Settings(BaseSettings):
         """Access materialized views configuration."""
         return self.yaml.materialized_views
 
+    @property
+    def search_index_refresh(self) -> SearchIndexRefreshConfig:
+        """Access global search index refresh configuration."""
+        return self.yaml.search_index_refresh
+
+    @property
+    def aggregation_cache(self) -> AggregationCacheConfig:
+        """Access aggregation response cache configuration."""
+        return self.yaml.aggregation_cache
+
+    @property
+    def resampling(self) -> ResamplingConfig:
+        """Access permutation/bootstrap resampling configuration."""
+        return self.yaml.resampling
+
     @property
     def hpo_terms(self) -> HPOTermsConfig:
         """Access HPO terms configuration."""
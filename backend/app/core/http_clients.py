@@ -0,0 +1,193 @@
+"""Shared, pooled HTTP clients for outbound integrations.
+
+Every outbound integration used to open a fresh ``httpx.AsyncClient`` per
+call, paying a TCP and TLS handshake for each request and never reusing a
+connection. :data:`http_clients` instead keeps one long-lived client per
+upstream host, each with its own connection pool, keep-alive, timeouts and
+(when the optional ``h2`` package is installed) HTTP/2, so bursts of VEP
+validation or annotation calls reuse warm connections.
+
+Clients are created on first use, which keeps scripts and background tasks
+working outside the app; the app lifespan closes them on shutdown. Pools are
+configured under ``external_apis.http_pools`` and request timeouts come from
+the matching ``external_apis`` entry.
+
+Each client's transport records per-upstream request counts, errors,
+in-flight requests, newly opened connections and response latency (time to
+response headers); ``GET /admin/http-clients/status`` reports them.
+
+Usage:
+    from app.core.http_clients import http_clients
+
+    response = await http_clients.get("ensembl").get(url, params=params)
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Literal, get_args
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+Upstream = Literal["ensembl", "ols", "ncbi"]
+
+# Latency percentiles are computed over this many most recent requests.
+LATENCY_WINDOW = 256
+
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _upstream_timeout(upstream: Upstream) -> float:
+    """Return the configured request timeout of *upstream* in seconds."""
+    apis = settings.external_apis
+    return {
+        "ensembl": apis.vep.timeout_seconds,
+        "ols": apis.ols.timeout_seconds,
+        "ncbi": apis.pubmed.timeout_seconds,
+    }[upstream]
+
+
+@dataclass
+class UpstreamStats:
+    """Request, connection and latency counters of one upstream client."""
+
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    connections_opened: int = 0
+    latencies_ms: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=LATENCY_WINDOW)
+    )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the counters plus latency percentiles of the recent window."""
+        latencies = sorted(self.latencies_ms)
+
+        def percentile(fraction: float) -> float | None:
+            if not latencies:
+                return None
+            return round(latencies[int(fraction * (len(latencies) - 1))], 1)
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "connections_opened": self.connections_opened,
+            # Requests served on an already open (warm) connection.
+            "connections_reused": max(self.requests - self.connections_opened, 0),
+            "latency_ms": {
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "max": percentile(1.0),
+            },
+        }
+
+
+class _InstrumentedTransport(httpx.AsyncBaseTransport):
+    """Pooled transport that records :class:`UpstreamStats` for each request."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, stats: UpstreamStats):
+        self._transport = transport
+        self._stats = stats
+
+    async def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        # httpcore reports a TCP connect only when no pooled connection is free.
+        if event_name == "connection.connect_tcp.complete":
+            self._stats.connections_opened += 1
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        stats = self._stats
+        request.extensions.setdefault("trace", self._trace)
+        stats.requests += 1
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        started = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.in_flight -= 1
+        stats.latencies_ms.append((time.perf_counter() - started) * 1000)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class HttpClientRegistry:
+    """Process-wide pooled ``httpx.AsyncClient`` per upstream host."""
+
+    def __init__(self) -> None:
+        """Start with no open clients; each is built on first use."""
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._stats: Dict[str, UpstreamStats] = {}
+
+    def get(self, upstream: Upstream) -> httpx.AsyncClient:
+        """Return the shared client for *upstream*, creating it on first use.
+
+        The client is shared: use it directly and never close it (no
+        ``async with``).
+        """
+        client = self._clients.get(upstream)
+        if client is None:
+            client = self._clients[upstream] = self._build(upstream)
+        return client
+
+    def _build(self, upstream: Upstream) -> httpx.AsyncClient:
+        pool = getattr(settings.external_apis.http_pools, upstream)
+        stats = self._stats.setdefault(upstream, UpstreamStats())
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=pool.max_connections,
+                max_keepalive_connections=pool.max_keepalive_connections,
+                keepalive_expiry=pool.keepalive_expiry_seconds,
+            ),
+            http2=pool.http2 and _HTTP2_AVAILABLE,
+        )
+        logger.debug(f"Opening shared HTTP client for {upstream}")
+        return httpx.AsyncClient(
+            transport=_InstrumentedTransport(transport, stats),
+            timeout=httpx.Timeout(
+                _upstream_timeout(upstream), connect=pool.connect_timeout_seconds
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Close every open client; later calls to :meth:`get` reopen them."""
+        clients, self._clients = self._clients, {}
+        for upstream, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:  # noqa: BLE001 - keep closing the others
+                logger.warning(f"Error closing HTTP client for {upstream}: {e}")
+
+    def get_status(self) -> Dict[str, Any]:
+        """Return pool configuration and counters for every upstream."""
+        status: Dict[str, Any] = {}
+        for upstream in get_args(Upstream):
+            pool = getattr(settings.external_apis.http_pools, upstream)
+            status[upstream] = {
+                "open": upstream in self._clients,
+                "http2": pool.http2 and _HTTP2_AVAILABLE,
+                "max_connections": pool.max_connections,
+                "max_keepalive_connections": pool.max_keepalive_connections,
+                "timeout_seconds": _upstream_timeout(upstream),
+                **self._stats.get(upstream, UpstreamStats()).snapshot(),
+            }
+        return status
+
+
+# Process-wide registry shared by every outbound integration.
+http_clients = HttpClientRegistry()
@@ -4,6 +4,12 @@ This module provides a cached check for materialized view availability,
 eliminating the per-request SQL query overhead. Views are checked once
 at application startup and cached in memory.
 
+Per-view freshness is tracked alongside availability: the aggregation refresh
+scheduler (:mod:`app.core.mv_refresh`) marks a view stale when a transition
+changes the published data it summarises and fresh once it has been
+refreshed, so ``is_available`` only routes to the live query while a view is
+known to lag the published heads.
+
 Usage:
     from app.core.mv_cache import mv_cache
 
@@ -15,7 +21,8 @@ Usage:
 """
 
 import logging
-from typing import Dict, Set
+import time
+from typing import Dict, Iterable, Optional, Set
 
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
@@ -35,6 +42,9 @@ class MaterializedViewCache:
     Attributes:
         _available_views: Set of view names confirmed to exist and have data
         _initialized: Whether the cache has been populated
+        _stale_since: Views known to lag the published data, with the epoch
+            time they were first marked stale
+        _refreshed_at: Epoch time of the last refresh seen per view
     """
 
     def __init__(self) -> None:
@@ -42,6 +52,8 @@ class MaterializedViewCache:
         self._available_views: Set[str] = set()
         self._initialized: bool = False
         self._check_results: Dict[str, bool] = {}
+        self._stale_since: Dict[str, float] = {}
+        self._refreshed_at: Dict[str, float] = {}
 
     @property
     def is_initialized(self) -> bool:
@@ -55,7 +67,7 @@ class MaterializedViewCache:
             view_name: Name of the materialized view
 
         Returns:
-            True if view exists and has data, False otherwise
+            True if view exists, has data and is not known to be stale
         """
         if not settings.materialized_views.enabled:
             return False
@@ -66,7 +78,36 @@ class MaterializedViewCache:
             )
             return False
 
-        return view_name in self._available_views
+        return view_name in self._available_views and view_name not in self._stale_since
+
+    def is_stale(self, view_name: str) -> bool:
+        """Return True while a view is known to lag the published data."""
+        return view_name in self._stale_since
+
+    def mark_stale(self, views: Iterable[str], since: Optional[float] = None) -> None:
+        """Record that views no longer match the published data.
+
+        Args:
+            views: View names whose source data changed
+            since: Epoch time of the change (default: now); an earlier mark
+                for the same view is kept
+        """
+        stamp = since if since is not None else time.time()
+        for view_name in views:
+            self._stale_since.setdefault(view_name, stamp)
+
+    def mark_fresh(self, view_name: str, refreshed_at: Optional[float] = None) -> None:
+        """Record that a view has been refreshed and can serve reads again.
+
+        A successful refresh populates the view, so it also becomes available
+        even if it was empty or missing when the cache was initialized.
+        """
+        self._stale_since.pop(view_name, None)
+        self._refreshed_at[view_name] = (
+            refreshed_at if refreshed_at is not None else time.time()
+        )
+        self._available_views.add(view_name)
+        self._check_results[view_name] = True
 
     async def initialize(self, db: AsyncSession) -> None:
         """Initialize cache by checking all configured materialized views.
@@ -134,6 +175,8 @@ class MaterializedViewCache:
         """Reset cache state (useful for testing)."""
         self._available_views.clear()
         self._check_results.clear()
+        self._stale_since.clear()
+        self._refreshed_at.clear()
         self._initialized = False
 
     def get_status(self) -> Dict[str, object]:
@@ -147,6 +190,8 @@ class MaterializedViewCache:
             "enabled": settings.materialized_views.enabled,
             "available_views": sorted(self._available_views),
             "check_results": self._check_results.copy(),
+            "stale_views": sorted(self._stale_since),
+            "refreshed_at": self._refreshed_at.copy(),
         }
 
 
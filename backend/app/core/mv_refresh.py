@@ -0,0 +1,538 @@
+"""Dependency-aware refresh scheduler for the aggregation materialized views.
+
+The aggregation views summarise head-published revision content. A state
+transition only changes what they show when it changes the published set
+(first publish, archive, delete) or the published content of a record
+(re-publish after a clone-to-draft edit), and then only for the views that
+read the changed top-level sections — see :data:`VIEW_DEPENDENCIES`.
+
+Marks follow the same scheme as the global search index coordinator (both
+build on :class:`GenerationRefresher`): per-view generation counters in the
+shared cache (Redis in production), a debounce window so bursts of publishes
+collapse into one refresh, a maximum delay so a steady trickle cannot starve
+it, and a PostgreSQL advisory lock per view so only one worker in the cluster
+refreshes it. Staleness is mirrored into
+:data:`app.core.mv_cache.mv_cache`, which routes reads of a stale view to the
+live query.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Mapping, Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.cache import CacheService
+from app.core.cache import cache as default_cache
+from app.core.mv_cache import MaterializedViewCache
+from app.core.mv_cache import mv_cache as default_mv_cache
+
+logger = logging.getLogger(__name__)
+
+# Top-level phenopacket sections each view reads. Every view also depends on
+# membership of the published set (see :func:`views_affected_by`).
+VIEW_DEPENDENCIES: dict[str, frozenset[str]] = {
+    "mv_feature_aggregation": frozenset({"phenotypicFeatures"}),
+    "mv_disease_aggregation": frozenset({"diseases"}),
+    "mv_sex_distribution": frozenset({"subject"}),
+    "mv_summary_statistics": frozenset(
+        {"subject", "phenotypicFeatures", "interpretations", "metaData"}
+    ),
+    "mv_variant_catalog": frozenset({"interpretations"}),
+}
+
+AGGREGATION_VIEWS: tuple[str, ...] = tuple(VIEW_DEPENDENCIES)
+
+
+def views_affected_by(
+    before: Optional[Mapping[str, Any]],
+    after: Optional[Mapping[str, Any]],
+) -> set[str]:
+    """Return the aggregation views whose rows change between two snapshots.
+
+    Args:
+        before: Published content visible before the change, or None if the
+            record was not public.
+        after: Published content visible after the change, or None if the
+            record is no longer public.
+
+    Returns:
+        View names to mark stale. A record entering or leaving the published
+        set affects every view; a content change affects only the views that
+        read a changed section.
+    """
+    if before is None and after is None:
+        return set()
+    if before is None or after is None:
+        return set(AGGREGATION_VIEWS)
+    changed = {
+        key for key in set(before) | set(after) if before.get(key) != after.get(key)
+    }
+    return {view for view, deps in VIEW_DEPENDENCIES.items() if deps & changed}
+
+
+def _key(view: str, suffix: str) -> str:
+    return f"mv_refresh:{view}:{suffix}"
+
+
+def as_float(value: Optional[str]) -> Optional[float]:
+    """Parse a cached epoch timestamp, tolerating missing/garbled values."""
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def as_int(value: Optional[str]) -> int:
+    """Parse a cached generation counter, treating missing values as zero."""
+    try:
+        return int(value) if value is not None else 0
+    except ValueError:
+        return 0
+
+
+def iso(epoch: Optional[float]) -> Optional[str]:
+    """Render an epoch timestamp as an ISO-8601 UTC string."""
+    if epoch is None:
+        return None
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).isoformat()
+
+
+async def try_advisory_xact_lock(db: Any, name: str) -> bool:
+    """Take the cluster-wide transaction advisory lock *name* without waiting.
+
+    The lock is released when *db*'s transaction ends (commit or rollback).
+
+    Returns:
+        True if the lock was acquired, False if another session holds it.
+    """
+    acquired = (
+        await db.execute(
+            text("SELECT pg_try_advisory_xact_lock(hashtext(:name))"),
+            {"name": name},
+        )
+    ).scalar()
+    return bool(acquired)
+
+
+class GenerationRefresher(ABC):
+    """Debounced, cluster-wide refresh of materialized views.
+
+    Base of :class:`AggregationViewRefreshScheduler` and
+    ``app.search.mv_refresh.SearchIndexRefreshCoordinator``. Each view has a
+    dirty/refreshed generation pair in the shared cache, so a mark made in
+    any worker is visible to all of them. Each process runs one background
+    loop (:meth:`start`) that refreshes a view once its marks have been quiet
+    for ``debounce_seconds`` or its oldest unrefreshed mark is
+    ``max_delay_seconds`` old. :func:`try_advisory_xact_lock` makes each
+    refresh single-flight across the cluster: workers that lose the race
+    skip, and the generation snapshot taken before the refresh means marks
+    arriving mid-refresh still trigger a follow-up.
+
+    Subclasses name their settings section and worker task, and implement
+    :meth:`_refresh_sql`, :meth:`_refresh_pending` and :meth:`_has_pending`.
+    """
+
+    #: ``settings`` section and field prefix holding the timing defaults.
+    settings_section: str = ""
+    settings_prefix: str = ""
+    #: Name of the background worker task (also used in log messages).
+    worker_name: str = "mv-refresh"
+
+    def __init__(
+        self,
+        cache: CacheService = default_cache,
+        session_factory: Optional[Callable[[], Any]] = None,
+        *,
+        debounce_seconds: Optional[float] = None,
+        max_delay_seconds: Optional[float] = None,
+        poll_interval_seconds: Optional[float] = None,
+    ) -> None:
+        """Initialize the refresher.
+
+        Args:
+            cache: Shared cache holding the per-view generations.
+            session_factory: Callable returning an ``AsyncSession`` context
+                manager; defaults to ``app.database.async_session_maker``.
+            debounce_seconds: Quiet period override (default: settings).
+            max_delay_seconds: Staleness ceiling override (default: settings).
+            poll_interval_seconds: Idle re-check override (default: settings).
+        """
+        self._cache = cache
+        self._session_factory = session_factory
+        self._debounce = debounce_seconds
+        self._max_delay = max_delay_seconds
+        self._poll_interval = poll_interval_seconds
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+        # Process-local counters, reported alongside the shared state.
+        self.lock_contended = 0
+        self.failures = 0
+
+    # -- configuration -------------------------------------------------
+
+    def _setting(self, name: str, override: Optional[float]) -> float:
+        if override is not None:
+            return override
+        from app.core.config import settings
+
+        section = getattr(settings, self.settings_section)
+        return getattr(section, self.settings_prefix + name)
+
+    @property
+    def debounce_seconds(self) -> float:
+        """Quiet period after a view's latest mark before refreshing it."""
+        return self._setting("debounce_seconds", self._debounce)
+
+    @property
+    def max_delay_seconds(self) -> float:
+        """Upper bound on how long a dirty mark may wait for a refresh."""
+        return self._setting("max_delay_seconds", self._max_delay)
+
+    @property
+    def poll_interval_seconds(self) -> float:
+        """Interval at which an idle worker re-reads the shared marks."""
+        return self._setting("poll_interval_seconds", self._poll_interval)
+
+    def _open_session(self) -> Any:
+        if self._session_factory is not None:
+            return self._session_factory()
+        # Resolved at call time so test suites that rebind the module-level
+        # session maker are honoured.
+        from app import database
+
+        return database.async_session_maker()
+
+    # -- marks ---------------------------------------------------------
+
+    async def _mark(self, view: str, now: float) -> int:
+        """Bump *view*'s dirty generation; returns the new generation."""
+        generation = await self._cache.incr(_key(view, "dirty_generation"))
+        await self._cache.set(_key(view, "last_mark"), repr(now))
+        if not await self._cache.exists(_key(view, "dirty_since")):
+            await self._cache.set(_key(view, "dirty_since"), repr(now))
+        return generation
+
+    async def _generations(self, view: str) -> tuple[int, int]:
+        dirty = as_int(await self._cache.get(_key(view, "dirty_generation")))
+        refreshed = as_int(await self._cache.get(_key(view, "refreshed_generation")))
+        return dirty, refreshed
+
+    async def _is_due(self, view: str, now: float) -> bool:
+        last_mark = as_float(await self._cache.get(_key(view, "last_mark"))) or now
+        dirty_since = as_float(await self._cache.get(_key(view, "dirty_since"))) or now
+        return (
+            now - last_mark >= self.debounce_seconds
+            or now - dirty_since >= self.max_delay_seconds
+        )
+
+    # -- refresh -------------------------------------------------------
+
+    @abstractmethod
+    async def _refresh_sql(self, db: Any, view: str) -> str:
+        """Return the ``REFRESH MATERIALIZED VIEW`` statement for *view*."""
+        pass
+
+    async def _refresh_view(self, view: str) -> bool:
+        """Refresh *view* under its advisory lock if marks are uncovered.
+
+        Returns:
+            True if this call performed the refresh.
+        """
+        started_wall = time.time()
+        started = time.perf_counter()
+        async with self._open_session() as db:
+            try:
+                if not await try_advisory_xact_lock(db, _key(view, "lock")):
+                    # Another worker is refreshing; it (or the follow-up it
+                    # schedules) will cover these marks.
+                    await db.rollback()
+                    self.lock_contended += 1
+                    return False
+                # Re-read under the lock: another worker may have covered
+                # this generation since the first read.
+                dirty, refreshed = await self._generations(view)
+                if dirty <= refreshed:
+                    await db.rollback()
+                    return False
+                await db.execute(text(await self._refresh_sql(db, view)))
+                await db.commit()
+            except SQLAlchemyError as e:
+                self.failures += 1
+                logger.error(f"Refresh of {view} failed: {e}")
+                await db.rollback()
+                return False
+
+        duration_ms = (time.perf_counter() - started) * 1000
+        covered = await self._record_refresh(view, dirty, started_wall, duration_ms)
+        self._on_refreshed(view, covered)
+        logger.info(f"Refreshed {view} (generation {dirty}) in {duration_ms:.0f} ms")
+        return True
+
+    async def _record_refresh(
+        self, view: str, generation: int, started_wall: float, duration_ms: float
+    ) -> bool:
+        """Publish the refreshed generation and re-arm lag tracking if needed.
+
+        Returns:
+            True if the refresh covered every mark; False if marks landed
+            while it ran (a follow-up is then scheduled).
+        """
+        await self._cache.set(_key(view, "refreshed_generation"), str(generation))
+        await self._cache.set(_key(view, "last_refresh"), repr(time.time()))
+        await self._cache.set(
+            _key(view, "last_refresh_duration_ms"), f"{duration_ms:.1f}"
+        )
+        await self._cache.delete(_key(view, "dirty_since"))
+        dirty, _ = await self._generations(view)
+        if dirty > generation:
+            # Marks that landed mid-refresh are not covered; their lag is
+            # measured (conservatively) from when this refresh started.
+            await self._cache.set(_key(view, "dirty_since"), repr(started_wall))
+            self._wake.set()
+            return False
+        return True
+
+    def _on_refreshed(self, view: str, covered: bool) -> None:
+        """Hook run after a successful refresh of *view*."""
+
+    # -- metrics -------------------------------------------------------
+
+    async def _view_status(self, view: str, now: float) -> dict[str, Any]:
+        """Return the shared freshness metrics of one view."""
+        dirty, refreshed = await self._generations(view)
+        stale = dirty > refreshed
+        dirty_since = as_float(await self._cache.get(_key(view, "dirty_since")))
+        lag = max(0.0, now - dirty_since) if stale and dirty_since else 0.0
+        return {
+            "stale": stale,
+            "refresh_lag_seconds": round(lag, 3),
+            "pending_generations": max(0, dirty - refreshed),
+            "dirty_generation": dirty,
+            "refreshed_generation": refreshed,
+            "dirty_since": iso(dirty_since) if stale else None,
+            "last_refresh_at": iso(
+                as_float(await self._cache.get(_key(view, "last_refresh")))
+            ),
+            "last_refresh_duration_ms": as_float(
+                await self._cache.get(_key(view, "last_refresh_duration_ms"))
+            ),
+        }
+
+    # -- background worker --------------------------------------------
+
+    @property
+    def is_running(self) -> bool:
+        """True while this process's background worker task is alive."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the per-process background worker (idempotent)."""
+        if self.is_running:
+            return
+        self._task = asyncio.create_task(self._run(), name=self.worker_name)
+
+    async def stop(self) -> None:
+        """Cancel the background worker and wait for it to exit."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    @abstractmethod
+    async def _refresh_pending(self) -> None:
+        """Refresh whatever is due (one worker-loop iteration)."""
+        pass
+
+    @abstractmethod
+    async def _has_pending(self) -> bool:
+        """Return True while any view has uncovered marks."""
+        pass
+
+    async def _run(self) -> None:
+        while True:
+            self._wake.clear()
+            timeout = self.poll_interval_seconds
+            try:
+                await self._refresh_pending()
+                # Sleep until the next debounce boundary or poll tick,
+                # waking early when this process records a new mark.
+                if await self._has_pending():
+                    timeout = min(timeout, self.debounce_seconds)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # noqa: BLE001 - the worker must survive
+                self.failures += 1
+                logger.error(f"{self.worker_name} worker error: {e}")
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+
+class AggregationViewRefreshScheduler(GenerationRefresher):
+    """Debounced, cluster-wide refresher for the aggregation views.
+
+    Each view has its own dirty/refreshed generation pair, so publishing a
+    record whose diseases changed refreshes ``mv_disease_aggregation`` and
+    ``mv_summary_statistics`` but leaves the feature and sex views alone.
+    Views are refreshed in :data:`AGGREGATION_VIEWS` order, each in its own
+    transaction under its own advisory lock so a failure or lock contention
+    on one view does not hold back the others.
+    """
+
+    settings_section = "materialized_views"
+    settings_prefix = "refresh_"
+    worker_name = "aggregation-view-refresh"
+
+    def __init__(
+        self,
+        cache: CacheService = default_cache,
+        session_factory: Optional[Callable[[], Any]] = None,
+        view_cache: MaterializedViewCache = default_mv_cache,
+        *,
+        debounce_seconds: Optional[float] = None,
+        max_delay_seconds: Optional[float] = None,
+        poll_interval_seconds: Optional[float] = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            cache: Shared cache holding the per-view generations.
+            session_factory: Callable returning an ``AsyncSession`` context
+                manager; defaults to ``app.database.async_session_maker``.
+            view_cache: Availability cache that mirrors per-view freshness.
+            debounce_seconds: Quiet period override (default: settings).
+            max_delay_seconds: Staleness ceiling override (default: settings).
+            poll_interval_seconds: Idle re-check override (default: settings).
+        """
+        super().__init__(
+            cache,
+            session_factory,
+            debounce_seconds=debounce_seconds,
+            max_delay_seconds=max_delay_seconds,
+            poll_interval_seconds=poll_interval_seconds,
+        )
+        self._view_cache = view_cache
+        self.refreshes: dict[str, int] = {view: 0 for view in AGGREGATION_VIEWS}
+
+    # -- stale marks ---------------------------------------------------
+
+    async def mark_stale(self, views: Iterable[str]) -> None:
+        """Record that views lag the published data and wake the worker.
+
+        Call after the transaction that changed the published data commits.
+        Unknown view names are ignored.
+        """
+        now = time.time()
+        marked = [view for view in views if view in VIEW_DEPENDENCIES]
+        for view in marked:
+            await self._mark(view, now)
+        if marked:
+            self._view_cache.mark_stale(marked, since=now)
+            self._wake.set()
+
+    async def is_stale(self, view: str) -> bool:
+        """Return True while marks exist that no refresh of *view* has covered.
+
+        Also syncs the answer into the availability cache, so marks and
+        refreshes made by other workers are picked up by this process.
+        """
+        dirty, refreshed = await self._generations(view)
+        if dirty > refreshed:
+            since = as_float(await self._cache.get(_key(view, "dirty_since")))
+            self._view_cache.mark_stale([view], since=since)
+            return True
+        if self._view_cache.is_stale(view):
+            last = as_float(await self._cache.get(_key(view, "last_refresh")))
+            self._view_cache.mark_fresh(view, refreshed_at=last)
+        return False
+
+    # -- refresh -------------------------------------------------------
+
+    async def refresh_due(self, *, force: bool = False) -> list[str]:
+        """Refresh every stale view whose debounce window has closed.
+
+        Args:
+            force: Skip the debounce window (still requires a stale mark and
+                the per-view advisory lock).
+
+        Returns:
+            Names of the views this call refreshed.
+        """
+        refreshed: list[str] = []
+        for view in AGGREGATION_VIEWS:
+            if not await self.is_stale(view):
+                continue
+            if not force and not await self._is_due(view, time.time()):
+                continue
+            if await self._refresh_view(view):
+                refreshed.append(view)
+        return refreshed
+
+    async def _refresh_sql(self, db: Any, view: str) -> str:
+        # CONCURRENTLY needs a populated view; a view created WITH NO DATA
+        # gets one blocking refresh first.
+        populated = (
+            await db.execute(
+                text("SELECT ispopulated FROM pg_matviews WHERE matviewname = :view"),
+                {"view": view},
+            )
+        ).scalar()
+        keyword = "CONCURRENTLY " if populated else ""
+        return f"REFRESH MATERIALIZED VIEW {keyword}{view}"
+
+    def _on_refreshed(self, view: str, covered: bool) -> None:
+        # Uncovered marks keep the view on the live path until the follow-up.
+        if covered:
+            self._view_cache.mark_fresh(view, refreshed_at=time.time())
+        self.refreshes[view] += 1
+
+    # -- metrics -------------------------------------------------------
+
+    async def get_status(self) -> dict[str, Any]:
+        """Return per-view freshness and refresh metrics for monitoring."""
+        now = time.time()
+        views: dict[str, Any] = {}
+        for view in AGGREGATION_VIEWS:
+            status = await self._view_status(view, now)
+            views[view] = {
+                "stale": status["stale"],
+                "serving": "live" if status["stale"] else "materialized_view",
+                "refresh_lag_seconds": status["refresh_lag_seconds"],
+                "pending_generations": status["pending_generations"],
+                "last_refresh_at": status["last_refresh_at"],
+                "last_refresh_duration_ms": status["last_refresh_duration_ms"],
+                "process_refreshes": self.refreshes[view],
+            }
+        return {
+            "views": views,
+            "worker_running": self.is_running,
+            "process_lock_contended": self.lock_contended,
+            "process_failures": self.failures,
+        }
+
+    # -- background worker --------------------------------------------
+
+    async def _refresh_pending(self) -> None:
+        await self.refresh_due()
+
+    async def _has_pending(self) -> bool:
+        stale = False
+        for view in AGGREGATION_VIEWS:
+            stale = await self.is_stale(view) or stale
+        return stale
+
+
+# Process-wide scheduler; the app lifespan starts its worker.
+aggregation_refresh_scheduler = AggregationViewRefreshScheduler()
@@ -15,6 +15,7 @@ from pydantic import BaseModel
 
 from app.core.cache import cache
 from app.core.config import settings
+from app.core.http_clients import http_clients
 
 logger = logging.getLogger(__name__)
 
@@ -89,48 +90,47 @@ async def search_hpo_terms(
 
     # Get config values
     ols_base = settings.external_apis.ols.base_url
-    ols_timeout = settings.external_apis.ols.timeout_seconds
     cache_ttl = settings.external_apis.ols.cache_ttl_seconds
 
     try:
-        async with httpx.AsyncClient(timeout=ols_timeout) as client:
-            # Using OLS API for HPO term search
-            response = await client.get(
-                f"{ols_base}/search",
-                params={
-                    "q": q,
-                    "ontology": "hp",
-                    "rows": max_results,
-                    "local": "true",
-                    "fieldList": "id,label,description,synonym",
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            # Transform OLS response to match expected format
-            if "response" in data and "docs" in data["response"]:
-                terms = []
-                for doc in data["response"]["docs"]:
-                    # Only include actual HPO terms (starting with HP)
-                    obo_id = doc.get("obo_id", "")
-                    if obo_id.startswith("HP:"):
-                        terms.append(
-                            {
-                                "id": obo_id,
-                                "name": doc.get("label", ""),
-                                "definition": doc.get("description", [""])[0]
-                                if doc.get("description")
-                                else "",
-                                "synonyms": doc.get("synonym", []),
-                            }
-                        )
-                data = {"terms": terms}
-
-            # Cache the result in Redis (with TTL for automatic expiration)
-            await cache.set_json(cache_key, data, ttl=cache_ttl)
-
-            return data
+        client = http_clients.get("ols")
+        # Using OLS API for HPO term search
+        response = await client.get(
+            f"{ols_base}/search",
+            params={
+                "q": q,
+                "ontology": "hp",
+                "rows": max_results,
+                "local": "true",
+                "fieldList": "id,label,description,synonym",
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        # Transform OLS response to match expected format
+        if "response" in data and "docs" in data["response"]:
+            terms = []
+            for doc in data["response"]["docs"]:
+                # Only include actual HPO terms (starting with HP)
+                obo_id = doc.get("obo_id", "")
+                if obo_id.startswith("HP:"):
+                    terms.append(
+                        {
+                            "id": obo_id,
+                            "name": doc.get("label", ""),
+                            "definition": doc.get("description", [""])[0]
+                            if doc.get("description")
+                            else "",
+                            "synonyms": doc.get("synonym", []),
+                        }
+                    )
+            data = {"terms": terms}
+
+        # Cache the result in Redis (with TTL for automatic expiration)
+        await cache.set_json(cache_key, data, ttl=cache_ttl)
+
+        return data
 
     except httpx.TimeoutException as e:
         raise HTTPException(status_code=504, detail="HPO API request timed out") from e
@@ -159,19 +159,18 @@ async def get_hpo_term(term_id: str):
 
     # Get config values
     ols_base = settings.external_apis.ols.base_url
-    ols_timeout = settings.external_apis.ols.timeout_seconds
 
     try:
-        async with httpx.AsyncClient(timeout=ols_timeout) as client:
-            # Using OLS API to get term details
-            response = await client.get(
-                f"{ols_base}/ontologies/hp/terms",
-                params={
-                    "iri": f"http://purl.obolibrary.org/obo/{term_id.replace(':', '_')}"
-                },
-            )
-            response.raise_for_status()
-            return response.json()
+        client = http_clients.get("ols")
+        # Using OLS API to get term details
+        response = await client.get(
+            f"{ols_base}/ontologies/hp/terms",
+            params={
+                "iri": f"http://purl.obolibrary.org/obo/{term_id.replace(':', '_')}"
+            },
+        )
+        response.raise_for_status()
+        return response.json()
 
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
@@ -205,36 +204,35 @@ async def autocomplete_hpo_terms(
     """
     # Get config values
     ols_base = settings.external_apis.ols.base_url
-    ols_timeout = settings.external_apis.ols.timeout_seconds
 
     try:
-        async with httpx.AsyncClient(timeout=ols_timeout) as client:
-            response = await client.get(
-                f"{ols_base}/search",
-                params={"q": q, "ontology": "hp", "rows": limit, "local": "true"},
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            # Transform OLS response for autocomplete
-            if "response" in data and "docs" in data["response"]:
-                results = []
-                for doc in data["response"]["docs"]:
-                    obo_id = doc.get("obo_id", "")
-                    if obo_id.startswith("HP:"):
-                        results.append(
-                            {
-                                "id": obo_id,
-                                "label": doc.get("label", ""),
-                                "definition": (
-                                    doc.get("description", [""])[0][:200]
-                                    if doc.get("description")
-                                    else ""
-                                ),
-                            }
-                        )
-                return results
-            return []
+        client = http_clients.get("ols")
+        response = await client.get(
+            f"{ols_base}/search",
+            params={"q": q, "ontology": "hp", "rows": limit, "local": "true"},
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        # Transform OLS response for autocomplete
+        if "response" in data and "docs" in data["response"]:
+            results = []
+            for doc in data["response"]["docs"]:
+                obo_id = doc.get("obo_id", "")
+                if obo_id.startswith("HP:"):
+                    results.append(
+                        {
+                            "id": obo_id,
+                            "label": doc.get("label", ""),
+                            "definition": (
+                                doc.get("description", [""])[0][:200]
+                                if doc.get("description")
+                                else ""
+                            ),
+                        }
+                    )
+            return results
+        return []
 
     except (httpx.HTTPError, json.JSONDecodeError, ValueError, KeyError) as e:
         logger.error(f"Error in HPO autocomplete: {e}")
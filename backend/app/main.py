@@ -15,16 +15,23 @@ from app.comments.routers import router as comments_router
 from app.core.cache import cache, close_cache, init_cache
 from app.core.config import settings
 from app.core.exceptions import register_exception_handlers
+from app.core.http_clients import http_clients
 from app.core.mv_cache import init_mv_cache
+from app.core.mv_refresh import aggregation_refresh_scheduler
 from app.core.request_id import RequestIdMiddleware
 from app.core.security_headers import SecurityHeadersMiddleware
 from app.core.version import APP_VERSION, PHENOPACKET_SCHEMA_VERSION
 from app.database import async_session_maker, engine
 from app.ontology import routers as ontology_router
 from app.phenopackets import clinical_endpoints
+from app.phenopackets.resampling import resampling_executor
 from app.phenopackets.routers import router as phenopackets_router
+from app.phenopackets.routers.aggregations.survival.precompute import (
+    survival_precomputer,
+)
 from app.publications import endpoints as publication_endpoints
 from app.reference import router as reference_router
+from app.search.mv_refresh import search_refresh_coordinator
 from app.search.routers import router as search_router
 from app.seo import router as seo_router
 from app.users.mentionable import router as users_mentionable_router
@@ -40,6 +47,12 @@ async def lifespan(app: FastAPI):
     Initializes:
     - Redis cache connection (with in-memory fallback)
     - Materialized view availability cache (O(1) lookups)
+    - Coordinated global search index refresh worker
+    - Aggregation materialized view refresh scheduler
+    - Survival analysis precompute worker
+
+    Shared outbound HTTP clients (``app.core.http_clients``) are opened on
+    first use and closed on shutdown.
     """
     # Application startup
     await init_cache()  # Initialize Redis cache
@@ -48,8 +61,24 @@ async def lifespan(app: FastAPI):
     async with async_session_maker() as db:
         await init_mv_cache(db)
 
+    # One refresh worker per process; the advisory lock keeps refreshes
+    # single-flight across the cluster.
+    if settings.search_index_refresh.enabled:
+        search_refresh_coordinator.start()
+    mv_settings = settings.materialized_views
+    if mv_settings.enabled and mv_settings.refresh_scheduler_enabled:
+        aggregation_refresh_scheduler.start()
+    cache_settings = settings.aggregation_cache
+    if cache_settings.enabled and cache_settings.survival_precompute_enabled:
+        survival_precomputer.start()
+
     yield
     # Cleanup on shutdown
+    await survival_precomputer.stop()
+    resampling_executor.shutdown()
+    await aggregation_refresh_scheduler.stop()
+    await search_refresh_coordinator.stop()
+    await http_clients.aclose()  # Close pooled outbound HTTP clients
     await close_cache()  # Close Redis connection
     await engine.dispose()
 
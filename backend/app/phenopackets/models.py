@@ -340,6 +340,20 @@ class PhenopacketRevision(Base):
         nullable=False,
     )
 
+    # Public full-text vector, computed by PostgreSQL once at INSERT for
+    # published revisions only (NULL otherwise). Revisions are append-only, so
+    # the stored value can never go stale. Backs anonymous phenopacket search;
+    # deferred so ordinary revision loads don't pull the vector over the wire.
+    search_vector: Mapped[Optional[Any]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "CASE WHEN state = 'published' "
+            "THEN to_tsvector('simple'::regconfig, content_jsonb::text) END",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
     actor: Mapped["User"] = relationship("User", foreign_keys=[actor_id], viewonly=True)
 
     # Kept as a transient compatibility shim for legacy ORM call sites while
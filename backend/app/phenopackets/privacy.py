@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any
 
 
@@ -145,12 +146,20 @@ _TOP_LEVEL_KEYS = {
 }
 
 
+_NON_ALNUM = re.compile(r"[^a-z0-9]")
+_RESTRICTED_NORMALIZED_KEYS = frozenset(
+    _NON_ALNUM.sub("", restricted) for restricted in _RESTRICTED_LOCAL_KEYS
+)
+
+
+@lru_cache(maxsize=4096)
 def _forbidden_key(key: str) -> bool:
-    """Return whether key represents local restricted provenance or PII."""
-    normalized = re.sub(r"[^a-z0-9]", "", key.lower())
-    return normalized in {
-        re.sub(r"[^a-z0-9]", "", restricted) for restricted in _RESTRICTED_LOCAL_KEYS
-    }
+    """Return whether key represents local restricted provenance or PII.
+
+    Documents reuse a small vocabulary of keys, so the normalized lookup is
+    memoized; list pages redact many documents per request.
+    """
+    return _NON_ALNUM.sub("", key.lower()) in _RESTRICTED_NORMALIZED_KEYS
 
 
 def _redact(value: Any, *, top_level: bool = False) -> Any:
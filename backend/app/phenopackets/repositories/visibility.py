@@ -10,13 +10,17 @@ Invariants enforced:
   ``head_published_revision_id``.
 - I7: soft-deleted rows are excluded from all public reads; archived
   rows are visible to curators but not to the public.
-- I1: ``resolve_public_content`` always dereferences
-  ``head_published_revision_id`` so that a clone-to-draft edit does not
-  accidentally expose the curator's working copy to anonymous callers.
+- I1: ``resolve_public_content`` / ``resolve_public_contents`` always
+  dereference ``head_published_revision_id`` so that a clone-to-draft edit
+  does not accidentally expose the curator's working copy to anonymous
+  callers.
 """
 
 from __future__ import annotations
 
+import uuid
+from typing import Sequence
+
 from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -125,6 +129,47 @@ async def resolve_public_content(
     return redact_public_document(rev.content_jsonb)
 
 
+async def resolve_public_contents(
+    db: AsyncSession,
+    pps: Sequence[Phenopacket],
+) -> dict[uuid.UUID, dict]:
+    """Bulk form of :func:`resolve_public_content` for list-style reads.
+
+    Loads the head-published revisions of every record in ``pps`` with a
+    single ``WHERE id IN (...)`` query and redacts them in one pass, so a
+    page costs one round-trip instead of one per row.
+
+    Returns:
+        Mapping of ``Phenopacket.id`` to its redacted public content.
+        Records whose ``head_published_revision_id`` is ``NULL`` are absent.
+    """
+    head_ids = {
+        pp.head_published_revision_id
+        for pp in pps
+        if pp.head_published_revision_id is not None
+    }
+    if not head_ids:
+        return {}
+
+    # Select the two columns only: the ORM entities (and their identity-map
+    # bookkeeping) are not needed to serve public content.
+    rows = (
+        await db.execute(
+            select(PhenopacketRevision.id, PhenopacketRevision.content_jsonb).where(
+                PhenopacketRevision.id.in_(head_ids)
+            )
+        )
+    ).all()
+    content_by_revision = {
+        revision_id: redact_public_document(content) for revision_id, content in rows
+    }
+    return {
+        pp.id: content_by_revision[pp.head_published_revision_id]
+        for pp in pps
+        if pp.head_published_revision_id in content_by_revision
+    }
+
+
 def resolve_curator_content(pp: Phenopacket) -> dict:
     """Return the curator-visible content for a phenopacket.
 
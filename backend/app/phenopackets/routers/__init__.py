@@ -6,6 +6,7 @@ organization. Each router focuses on a specific domain of functionality.
 Routers:
 - crud          : Basic CRUD operations (list, get, create, update, delete)
 - crud_related  : Related lookups (/audit, /by-variant, /by-publication)
+- crud_export   : Streaming NDJSON export of the published cohort
 - crud_timeline : Phenotype timeline view
 - aggregations  : Statistical aggregations and summaries
 - comparisons   : Statistical comparisons between variant type groups
@@ -17,6 +18,7 @@ from fastapi import APIRouter
 from .aggregations import router as aggregations_router
 from .comparisons import router as comparisons_router
 from .crud import router as crud_router
+from .crud_export import router as crud_export_router
 from .crud_related import router as crud_related_router
 from .crud_timeline import router as crud_timeline_router
 from .curation import router as curation_router
@@ -30,13 +32,15 @@ router = APIRouter(prefix="/phenopackets")
 # registered before crud_router's catch-all /{phenopacket_id} route.
 # crud_related and crud_timeline also need to be registered before
 # crud_router's /{phenopacket_id} so their more specific /{id}/audit
-# and /{id}/timeline paths are reached first.
+# and /{id}/timeline paths are reached first, and crud_export so that
+# /export is not captured by the catch-all /{phenopacket_id} GET.
 # transitions_router must also precede crud_router so that
 # /{phenopacket_id}/transitions and /{phenopacket_id}/revisions are
 # matched before the catch-all /{phenopacket_id} GET.
 router.include_router(search_router)
 router.include_router(crud_related_router)
 router.include_router(crud_timeline_router)
+router.include_router(crud_export_router)
 router.include_router(transitions_router)
 router.include_router(curation_router)
 router.include_router(crud_router)
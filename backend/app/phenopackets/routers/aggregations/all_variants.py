@@ -4,16 +4,17 @@ Provides comprehensive variant search with filtering, pagination, and sorting.
 Extracted from the monolithic aggregations.py for better maintainability.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dependencies import get_optional_user
+from app.core.aggregation_cache import get_or_compute
 from app.database import get_db
 from app.middleware.rate_limiter import check_rate_limit, get_client_ip
-from app.models.json_api import JsonApiResponse
+from app.models.json_api import JsonApiCursorResponse, JsonApiResponse
 from app.models.user import User
 from app.phenopackets.molecular_consequence import compute_molecular_consequence
 from app.phenopackets.variant_search_validation import (
@@ -30,8 +31,15 @@ from app.phenopackets.variant_vocab import (
     VariantType,
 )
 from app.utils.audit_logger import log_variant_search
-from app.utils.pagination import build_offset_response
+from app.utils.pagination import (
+    build_cursor_response,
+    build_offset_response,
+    decode_cursor,
+    encode_cursor,
+)
 
+from .common import check_materialized_view_exists
+from .variant_catalog import VARIANT_CATALOG_VIEW, VariantCatalogQueryBuilder
 from .variant_query_builder import VariantQueryBuilder
 
 router = APIRouter()
@@ -46,6 +54,9 @@ DOMAIN_BOUNDARIES = {
     ProteinDomain.TRANSACTIVATION.value: (314, 557),
 }
 
+# Default order; keyset (cursor) pagination walks this order only.
+DEFAULT_ORDER_BY = "phenopacket_count DESC, variant_id ASC"
+
 # Map frontend field names to SQL column names for sorting
 SORT_FIELD_MAP = {
     "simple_id": "simple_id",
@@ -59,7 +70,95 @@ SORT_FIELD_MAP = {
 }
 
 
-@router.get("/all-variants", response_model=JsonApiResponse)
+def _variant_row(row: Any, molecular_consequence: Optional[str]) -> Dict[str, Any]:
+    """Serialize one variant row for the all-variants response."""
+    return {
+        "simple_id": f"Var{row.simple_id}",
+        "variant_id": row.variant_id,
+        "label": row.label,
+        "gene_symbol": row.gene_symbol,
+        "gene_id": row.gene_id,
+        "structural_type": row.structural_type,
+        "pathogenicity": row.pathogenicity,
+        "phenopacket_count": row.phenopacket_count,
+        "hg38": row.hg38,
+        "transcript": row.transcript,
+        "protein": row.protein,
+        "molecular_consequence": molecular_consequence,
+    }
+
+
+def _encode_variant_cursor(variant: Dict[str, Any]) -> str:
+    """Encode the keyset position of a variant row in the default order."""
+    return encode_cursor(
+        {
+            "phenopacket_count": variant["phenopacket_count"],
+            "variant_id": variant["variant_id"],
+        }
+    )
+
+
+def _decode_variant_cursor(token: str) -> Tuple[int, str]:
+    """Decode a variant cursor into ``(phenopacket_count, variant_id)``.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    data = decode_cursor(token)
+    try:
+        return int(data["phenopacket_count"]), str(data["variant_id"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid cursor format: {e}"
+        ) from e
+
+
+def _keyset_slice(
+    variants: List[Dict[str, Any]],
+    cursor: Optional[Tuple[int, str]],
+    backward: bool,
+    page_size: int,
+) -> List[Dict[str, Any]]:
+    """Select up to ``page_size + 1`` rows past a cursor, in walking order.
+
+    ``variants`` is the full list in the default order. Mirrors the SQL
+    keyset of :meth:`VariantCatalogQueryBuilder.with_keyset` for the live
+    fallback: rows after the cursor, or the rows before it nearest first.
+    The cursor row is located by id so the database collation decides the
+    order, with a value comparison when the row has since disappeared.
+    """
+    if cursor is None:
+        remaining = [] if backward else variants
+    else:
+        count, variant_id = cursor
+        index = next(
+            (i for i, v in enumerate(variants) if v["variant_id"] == variant_id),
+            None,
+        )
+        if index is not None:
+            remaining = variants[:index] if backward else variants[index + 1 :]
+        elif backward:
+            remaining = [
+                v
+                for v in variants
+                if v["phenopacket_count"] > count
+                or (v["phenopacket_count"] == count and v["variant_id"] < variant_id)
+            ]
+        else:
+            remaining = [
+                v
+                for v in variants
+                if v["phenopacket_count"] < count
+                or (v["phenopacket_count"] == count and v["variant_id"] > variant_id)
+            ]
+    if backward:
+        return list(reversed(remaining))[: page_size + 1]
+    return remaining[: page_size + 1]
+
+
+@router.get(
+    "/all-variants", response_model=Union[JsonApiResponse, JsonApiCursorResponse]
+)
 async def aggregate_all_variants(
     request: Request,
     response: Response,
@@ -92,12 +191,25 @@ async def aggregate_all_variants(
     sort: Optional[str] = Query(
         None, description="Sort field with optional '-' prefix for descending"
     ),
+    page_after: Optional[str] = Query(
+        None,
+        alias="page[after]",
+        description="Cursor from meta.page.endCursor (empty for the first page)",
+    ),
+    page_before: Optional[str] = Query(
+        None,
+        alias="page[before]",
+        description="Cursor from meta.page.startCursor",
+    ),
     db: AsyncSession = Depends(get_db),
     user: Optional[User] = Depends(get_optional_user),
 ):
-    """Search and filter variants with offset pagination.
+    """Search and filter variants with offset or cursor pagination.
 
-    Uses page[number] and page[size] for direct page access.
+    Uses page[number] and page[size] for direct page access. page[after] /
+    page[before] switch to keyset pagination over the default order
+    (individual count, then variant id); pass an empty page[after] for the
+    first page. Cursor pagination cannot be combined with ``sort``.
 
     **Search Fields:**
     - Transcript (c. notation): e.g., "c.1654-2A>T"
@@ -135,29 +247,21 @@ async def aggregate_all_variants(
     classification_param = classification_value or pathogenicity
     validated_classification = validate_classification(classification_param)
 
-    # Build query using fluent builder pattern
-    builder = VariantQueryBuilder()
-
-    if validated_query:
-        builder.with_text_search(validated_query)
-    if validated_variant_type:
-        builder.with_variant_type(validated_variant_type)
-    if validated_classification:
-        builder.with_classification(validated_classification)
-    if validated_gene:
-        builder.with_gene_filter(validated_gene)
-    # NOTE: ``consequence`` is intentionally NOT pushed into the SQL builder.
-    # The displayed ``molecular_consequence`` is derived at serialization time by
-    # ``compute_molecular_consequence`` (VEP-first, HGVS fallback). The builder's
-    # ``with_consequence`` keys (lof/missense/splicing/...) are a separate,
-    # lower-fidelity SQL heuristic whose categories do not match the display
-    # vocabulary (Missense/Frameshift/Splice Donor/...), so filtering there
-    # silently disagreed with the value shown to the user. Instead we post-filter
-    # the computed consequence below so every returned row matches the request and
-    # ``meta.page.totalRecords`` reflects the true filtered count.
-    if domain_value and domain_value in DOMAIN_BOUNDARIES:
-        start_pos, end_pos = DOMAIN_BOUNDARIES[domain_value]
-        builder.with_domain_filter(start_pos, end_pos)
+    # Build query using fluent builder pattern. Both builders share the
+    # filter interface; only the catalogue can filter on ``consequence``.
+    def _apply_filters(builder: Any) -> Any:
+        if validated_query:
+            builder.with_text_search(validated_query)
+        if validated_variant_type:
+            builder.with_variant_type(validated_variant_type)
+        if validated_classification:
+            builder.with_classification(validated_classification)
+        if validated_gene:
+            builder.with_gene_filter(validated_gene)
+        if domain_value and domain_value in DOMAIN_BOUNDARIES:
+            start_pos, end_pos = DOMAIN_BOUNDARIES[domain_value]
+            builder.with_domain_filter(start_pos, end_pos)
+        return builder
 
     # Build ORDER BY clause
     sort_field = "phenopacket_count"
@@ -175,67 +279,178 @@ async def aggregate_all_variants(
 
     offset = (page_number - 1) * page_size
 
-    # When a molecular-consequence filter is active we cannot paginate in SQL,
-    # because the consequence is computed in Python at serialization time. We
-    # therefore fetch the full ordered result set (the variant dataset is small,
-    # ~200 rows), compute the consequence per row, post-filter, then paginate the
-    # filtered list in Python so ``meta.page.totalRecords`` and the returned page
-    # both reflect the true filtered count. Without a consequence filter we keep
-    # the original SQL LIMIT/OFFSET fast path unchanged.
-    if validated_consequence:
-        query_sql, params = builder.build(
-            order_by=order_by,
-            limit=10000,
-            offset=0,
-        )
-    else:
+    # Keyset pagination walks the default order only.
+    cursor_mode = page_after is not None or page_before is not None
+    is_backward = page_before is not None
+    cursor: Optional[Tuple[int, str]] = None
+    if cursor_mode:
+        if sort:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    "Cursor pagination (page[after]/page[before]) supports only "
+                    "the default order; use page[number] to paginate a sorted list"
+                ),
+            )
+        token = page_before if is_backward else page_after
+        if token:
+            cursor = _decode_variant_cursor(token)
+
+    filter_params = {
+        "query": validated_query,
+        "variant_type": validated_variant_type,
+        "classification": validated_classification,
+        "gene": validated_gene,
+        "consequence": validated_consequence,
+        "domain": domain_value,
+    }
+
+    async def _search() -> Dict[str, Any]:
+        if await check_materialized_view_exists(db, VARIANT_CATALOG_VIEW):
+            return await _search_catalog()
+        return await _search_live()
+
+    # Fast path: ``mv_variant_catalog`` stores the displayed molecular
+    # consequence (precomputed in SQL by ``hnf1b_molecular_consequence``), so
+    # every filter, the sort and LIMIT/OFFSET or the keyset run in SQL, and the
+    # total comes from the cached per-filter counter.
+    def _catalog_builder() -> VariantCatalogQueryBuilder:
+        catalog_builder = _apply_filters(VariantCatalogQueryBuilder())
+        if validated_consequence:
+            catalog_builder.with_consequence(validated_consequence)
+        return catalog_builder
+
+    async def _search_catalog() -> Dict[str, Any]:
+        catalog_builder = _catalog_builder()
+        if cursor_mode:
+            if cursor is not None:
+                catalog_builder.with_keyset(*cursor, backward=is_backward)
+            query_sql, params = catalog_builder.build(
+                order_by=(
+                    "phenopacket_count ASC, variant_id DESC"
+                    if is_backward
+                    else DEFAULT_ORDER_BY
+                ),
+                limit=page_size + 1,
+                offset=0,
+            )
+        else:
+            query_sql, params = catalog_builder.build(
+                order_by=order_by,
+                limit=page_size,
+                offset=offset,
+            )
+        result = await db.execute(text(query_sql), params)
+        variants = [
+            _variant_row(row, row.molecular_consequence) for row in result.fetchall()
+        ]
+        return {"variants": variants, "total_count": await _total()}
+
+    async def _count_catalog() -> int:
+        count_sql, params = _catalog_builder().build_count()
+        result = await db.execute(text(count_sql), params)
+        return int(result.scalar() or 0)
+
+    # Live fallback while the catalogue is stale or unavailable.
+    # NOTE: ``consequence`` is intentionally NOT pushed into the live SQL
+    # builder. The displayed ``molecular_consequence`` is derived at
+    # serialization time by ``compute_molecular_consequence`` (VEP-first, HGVS
+    # fallback). The builder's ``with_consequence`` keys
+    # (lof/missense/splicing/...) are a separate, lower-fidelity SQL heuristic
+    # whose categories do not match the display vocabulary
+    # (Missense/Frameshift/Splice Donor/...), so filtering there silently
+    # disagreed with the value shown to the user. Instead, with a consequence
+    # filter (or in cursor mode) we fetch the full ordered result set (the
+    # variant dataset is small), post-filter the computed consequence and
+    # paginate in Python so ``meta.page.totalRecords`` reflects the true
+    # filtered count. Otherwise we keep the SQL LIMIT/OFFSET path.
+    async def _fetch_live(
+        live_order_by: str, limit: int, page_offset: int
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        builder = _apply_filters(VariantQueryBuilder())
         query_sql, params = builder.build(
-            order_by=order_by,
-            limit=page_size,
-            offset=offset,
+            order_by=live_order_by,
+            limit=limit,
+            offset=page_offset,
         )
-    result = await db.execute(text(query_sql), params)
-    rows = list(result.fetchall())
-
-    # Build response rows (with computed molecular_consequence).
-    all_variants = [
-        {
-            "simple_id": f"Var{row.simple_id}",
-            "variant_id": row.variant_id,
-            "label": row.label,
-            "gene_symbol": row.gene_symbol,
-            "gene_id": row.gene_id,
-            "structural_type": row.structural_type,
-            "pathogenicity": row.pathogenicity,
-            "phenopacket_count": row.phenopacket_count,
-            "hg38": row.hg38,
-            "transcript": row.transcript,
-            "protein": row.protein,
-            "molecular_consequence": compute_molecular_consequence(
-                transcript=row.transcript,
-                protein=row.protein,
-                variant_type=row.structural_type,
-                vep_extensions=row.vep_extensions if row.vep_extensions else None,
-            ),
-        }
-        for row in rows
-    ]
+        result = await db.execute(text(query_sql), params)
+        rows = list(result.fetchall())
 
-    if validated_consequence:
-        # Post-filter on the displayed value so the contract holds: every
-        # returned row's molecular_consequence equals the requested value.
         all_variants = [
-            v
-            for v in all_variants
-            if v["molecular_consequence"] == validated_consequence
+            _variant_row(
+                row,
+                compute_molecular_consequence(
+                    transcript=row.transcript,
+                    protein=row.protein,
+                    variant_type=row.structural_type,
+                    vep_extensions=row.vep_extensions if row.vep_extensions else None,
+                ),
+            )
+            for row in rows
         ]
-        total_count = len(all_variants)
-        # Paginate the filtered list in Python (SQL already applied ORDER BY).
-        variants = all_variants[offset : offset + page_size]
-    else:
+        if validated_consequence:
+            # Post-filter on the displayed value so the contract holds: every
+            # returned row's molecular_consequence equals the requested value.
+            all_variants = [
+                v
+                for v in all_variants
+                if v["molecular_consequence"] == validated_consequence
+            ]
+            return all_variants, len(all_variants)
         # Total comes from the SQL window function (same for all rows).
-        total_count = rows[0].total_count if rows else 0
-        variants = all_variants
+        return all_variants, rows[0].total_count if rows else 0
+
+    async def _search_live() -> Dict[str, Any]:
+        if cursor_mode:
+            all_variants, _ = await _fetch_live(DEFAULT_ORDER_BY, 10000, 0)
+            variants = _keyset_slice(all_variants, cursor, is_backward, page_size)
+            return {"variants": variants, "total_count": await _total()}
+        if validated_consequence:
+            all_variants, total_count = await _fetch_live(order_by, 10000, 0)
+            # Paginate the filtered list in Python (SQL already applied ORDER BY).
+            variants = all_variants[offset : offset + page_size]
+        else:
+            variants, total_count = await _fetch_live(order_by, page_size, offset)
+        return {"variants": variants, "total_count": total_count}
+
+    async def _count_live() -> int:
+        _, total_count = await _fetch_live(DEFAULT_ORDER_BY, 10000, 0)
+        return total_count
+
+    # The total depends only on the filters and the published data, so it is
+    # counted once per publish and shared by every page of a listing.
+    async def _total() -> int:
+        async def _count() -> int:
+            if await check_materialized_view_exists(db, VARIANT_CATALOG_VIEW):
+                return await _count_catalog()
+            return await _count_live()
+
+        return int(await get_or_compute("all_variants.total", filter_params, _count))
+
+    # The page depends only on the validated inputs and the published data,
+    # so it is shared across requests until the next publish; rate limiting,
+    # audit logging and link building stay per request.
+    page = await get_or_compute(
+        "all_variants.search",
+        {
+            **filter_params,
+            "order_by": order_by,
+            "page_number": page_number,
+            "page_size": page_size,
+            "page_after": page_after,
+            "page_before": page_before,
+        },
+        _search,
+    )
+    variants = page["variants"]
+    total_count = page["total_count"]
+    has_more = False
+    if cursor_mode:
+        # Pages are fetched in walking order with one extra row.
+        has_more = len(variants) > page_size
+        variants = variants[:page_size]
+        if is_backward:
+            variants = list(reversed(variants))
 
     # Audit logging (GDPR compliance)
     log_variant_search(
@@ -265,8 +480,27 @@ async def aggregate_all_variants(
     if domain_value:
         filters["domain"] = domain_value
 
-    # Build JSON:API offset response
     base_url = str(request.url.path)
+    if cursor_mode:
+        # Same has_next/has_prev rules as the phenopacket search cursor paging
+        if is_backward:
+            has_next, has_prev = True, has_more
+        else:
+            has_next, has_prev = has_more, bool(page_after)
+        return build_cursor_response(
+            data=variants,
+            page_size=page_size,
+            has_next=has_next,
+            has_prev=has_prev,
+            start_cursor=_encode_variant_cursor(variants[0]) if variants else None,
+            end_cursor=_encode_variant_cursor(variants[-1]) if variants else None,
+            base_url=base_url,
+            filters=filters,
+            total=total_count,
+            cursor_opt_in=True,
+        )
+
+    # Build JSON:API offset response
     return build_offset_response(
         data=variants,
         current_page=page_number,
@@ -12,8 +12,10 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.aggregation_cache import cached_aggregation
 from app.core.config import settings
 from app.core.mv_cache import mv_cache
+from app.core.mv_refresh import aggregation_refresh_scheduler
 from app.database import get_db
 from app.phenopackets.models import (
     AggregationResult,
@@ -45,16 +47,19 @@ __all__ = [
     "Dict",
     "List",
     # Shared helpers
+    "cached_aggregation",
     "check_materialized_view_exists",
     "calculate_percentages",
 ]
 
 
 async def check_materialized_view_exists(db: AsyncSession, view_name: str) -> bool:
-    """Check if a materialized view is available (O(1) cached lookup).
+    """Check if a materialized view can serve the current published data.
 
-    This function now uses the startup-initialized MV cache instead of
-    per-request SQL queries. The db parameter is kept for backward
+    Uses the startup-initialized MV cache instead of per-request SQL queries,
+    after syncing the view's freshness from the shared refresh marks so a
+    publish handled by another worker routes this one to the live query until
+    the view has been refreshed. The db parameter is kept for backward
     compatibility but is no longer used.
 
     Args:
@@ -62,8 +67,11 @@ async def check_materialized_view_exists(db: AsyncSession, view_name: str) -> bo
         view_name: Name of the materialized view
 
     Returns:
-        True if view exists and has data, False otherwise
+        True if view exists, has data and is not known to be stale
     """
+    if not settings.materialized_views.enabled:
+        return False
+    await aggregation_refresh_scheduler.is_stale(view_name)
     return mv_cache.is_available(view_name)
 
 
@@ -11,7 +11,9 @@ from .common import (
     APIRouter,
     AsyncSession,
     Depends,
+    cached_aggregation,
     calculate_percentages,
+    check_materialized_view_exists,
     get_db,
     logger,
     text,
@@ -19,34 +21,41 @@ from .common import (
 
 router = APIRouter()
 
+_LIVE_SEX_DISTRIBUTION_QUERY = """
+SELECT
+    COALESCE(r.content_jsonb->'subject'->>'sex', 'Unknown') as sex,
+    COUNT(*) as count
+FROM
+    phenopackets p
+    JOIN phenopacket_revisions r ON r.id = p.head_published_revision_id
+WHERE
+    p.deleted_at IS NULL
+    AND p.state = 'published'
+    AND p.head_published_revision_id IS NOT NULL
+    AND p.phenopacket_id NOT LIKE 'e2e-%'
+GROUP BY
+    COALESCE(r.content_jsonb->'subject'->>'sex', 'Unknown')
+ORDER BY
+    count DESC
+"""
+
 
 @router.get("/sex-distribution", response_model=List[AggregationResult])
+@cached_aggregation
 async def aggregate_sex_distribution(
     db: AsyncSession = Depends(get_db),
 ):
     """Get sex distribution of subjects.
 
-    Always reads published-head snapshots. Legacy materialized views are based
-    on mutable working copies and are therefore not public-safe.
-    """
-    logger.debug("Reading published-head sex distribution")
-    query = """
-    SELECT
-        COALESCE(r.content_jsonb->'subject'->>'sex', 'Unknown') as sex,
-        COUNT(*) as count
-    FROM
-        phenopackets p
-        JOIN phenopacket_revisions r ON r.id = p.head_published_revision_id
-    WHERE
-        p.deleted_at IS NULL
-        AND p.state = 'published'
-        AND p.head_published_revision_id IS NOT NULL
-        AND p.phenopacket_id NOT LIKE 'e2e-%'
-    GROUP BY
-        COALESCE(r.content_jsonb->'subject'->>'sex', 'Unknown')
-    ORDER BY
-        count DESC
+    Reads ``mv_sex_distribution`` (built over published-head snapshots) while
+    it is fresh, and the equivalent live published-head query otherwise.
     """
+    if await check_materialized_view_exists(db, "mv_sex_distribution"):
+        logger.debug("Using materialized view for sex distribution")
+        query = "SELECT sex, count FROM mv_sex_distribution ORDER BY count DESC"
+    else:
+        logger.debug("Reading published-head sex distribution")
+        query = _LIVE_SEX_DISTRIBUTION_QUERY
 
     result = await db.execute(text(query))
     rows = result.mappings().all()
@@ -65,6 +74,7 @@ async def aggregate_sex_distribution(
 
 
 @router.get("/age-of-onset", response_model=List[AggregationResult])
+@cached_aggregation
 async def aggregate_age_of_onset(
     db: AsyncSession = Depends(get_db),
 ):
@@ -11,7 +11,9 @@ from .common import (
     APIRouter,
     AsyncSession,
     Depends,
+    cached_aggregation,
     calculate_percentages,
+    check_materialized_view_exists,
     get_db,
     logger,
     settings,
@@ -22,16 +24,25 @@ router = APIRouter()
 
 
 @router.get("/by-disease", response_model=List[AggregationResult])
+@cached_aggregation
 async def aggregate_by_disease(
     db: AsyncSession = Depends(get_db),
 ):
     """Aggregate phenopackets by disease.
 
-    Always reads published-head snapshots. Legacy materialized views are based
-    on mutable working copies and are therefore not public-safe.
+    Reads ``mv_disease_aggregation`` (built over published-head snapshots)
+    while it is fresh, and the equivalent live published-head query otherwise.
     """
-    logger.debug("Reading published-head disease aggregation")
-    query = """
+    if await check_materialized_view_exists(db, "mv_disease_aggregation"):
+        logger.debug("Using materialized view for disease aggregation")
+        query = """
+    SELECT disease_id, label, count
+    FROM mv_disease_aggregation
+    ORDER BY count DESC
+    """
+    else:
+        logger.debug("Reading published-head disease aggregation")
+        query = """
     SELECT
         disease->'term'->>'id' as disease_id,
         disease->'term'->>'label' as label,
@@ -70,6 +81,7 @@ async def aggregate_by_disease(
 
 
 @router.get("/kidney-stages", response_model=List[AggregationResult])
+@cached_aggregation
 async def aggregate_kidney_stages(
     db: AsyncSession = Depends(get_db),
 ):
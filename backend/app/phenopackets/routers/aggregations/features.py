@@ -3,14 +3,16 @@
 Aggregates phenopackets by phenotypic features (HPO terms).
 """
 
-from typing import List
+from typing import Any, List, Sequence
 
 from .common import (
     AggregationResult,
     APIRouter,
     AsyncSession,
     Depends,
+    cached_aggregation,
     calculate_percentages,
+    check_materialized_view_exists,
     get_db,
     logger,
     text,
@@ -20,6 +22,7 @@ router = APIRouter()
 
 
 @router.get("/by-feature", response_model=List[AggregationResult])
+@cached_aggregation
 async def aggregate_by_feature(
     db: AsyncSession = Depends(get_db),
 ):
@@ -32,9 +35,23 @@ async def aggregate_by_feature(
 
     The main 'count' field represents present_count for backwards compatibility.
 
-    Always reads published-head snapshots. Legacy materialized views are based
-    on mutable working copies and are therefore not public-safe.
+    Reads ``mv_feature_aggregation`` (built over published-head snapshots)
+    while it is fresh, and the equivalent live published-head queries
+    otherwise.
     """
+    if await check_materialized_view_exists(db, "mv_feature_aggregation"):
+        logger.debug("Using materialized view for feature aggregation")
+        result = await db.execute(
+            text(
+                "SELECT hpo_id, label, present_count, absent_count, "
+                "total_phenopackets FROM mv_feature_aggregation "
+                "ORDER BY present_count DESC"
+            )
+        )
+        rows = result.mappings().all()
+        total_phenopackets = int(rows[0]["total_phenopackets"]) if rows else 0
+        return _feature_results(rows, total_phenopackets)
+
     logger.debug("Reading published-head feature aggregation")
 
     # First, get total number of published phenopackets (public filter: I3 + I7)
@@ -78,8 +95,13 @@ async def aggregate_by_feature(
     """
 
     result = await db.execute(text(query))
-    rows = result.mappings().all()
+    return _feature_results(result.mappings().all(), total_phenopackets)
+
 
+def _feature_results(
+    rows: Sequence[Any], total_phenopackets: int
+) -> List[AggregationResult]:
+    """Shape per-HPO present/absent counts into ``AggregationResult`` rows."""
     # Calculate total for percentage (sum of all present counts)
     total = sum(int(row["present_count"]) for row in rows)
     rows_with_pct = calculate_percentages(rows, total=total, count_key="present_count")
@@ -10,6 +10,7 @@ from .common import (
     APIRouter,
     AsyncSession,
     Depends,
+    cached_aggregation,
     calculate_percentages,
     get_db,
     text,
@@ -19,6 +20,7 @@ router = APIRouter()
 
 
 @router.get("/publication-types", response_model=List[AggregationResult])
+@cached_aggregation
 async def aggregate_publication_types(
     db: AsyncSession = Depends(get_db),
 ):
@@ -71,6 +73,7 @@ async def aggregate_publication_types(
 
 
 @router.get("/publications-timeline", response_model=List[Dict])
+@cached_aggregation
 async def get_publications_timeline(
     db: AsyncSession = Depends(get_db),
 ):
@@ -146,6 +149,7 @@ async def get_publications_timeline(
 
 
 @router.get("/publications-by-type", response_model=List[Dict])
+@cached_aggregation
 async def get_publications_by_type(
     db: AsyncSession = Depends(get_db),
 ):
@@ -207,6 +211,7 @@ async def get_publications_by_type(
 
 
 @router.get("/publications-timeline-data", response_model=List[Dict])
+@cached_aggregation
 async def get_publications_timeline_data(
     db: AsyncSession = Depends(get_db),
 ):
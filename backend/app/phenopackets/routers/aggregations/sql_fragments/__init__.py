@@ -14,7 +14,7 @@ The public import path is unchanged::
 Submodules:
 
 - ``paths``          — JSONB path constants (``VD_ID``, ``VD_EXTENSIONS``, ...)
-- ``classification`` — variant-type classification CASE expressions
+- ``classification`` — variant-type and disease-subtype CASE expressions
 - ``ctes``           — common table expressions (``UNIQUE_VARIANTS_CTE``, ...)
 - ``protein_domain`` — HNF1B protein-domain classification helpers
 """
@@ -24,6 +24,7 @@ from .classification import (
     VALID_STRUCTURAL_TYPES,
     VARIANT_TYPE_CASE,
     VARIANT_TYPE_CLASSIFICATION_SQL,
+    get_disease_subtype_case_sql,
     get_structural_type_filter,
     get_variant_type_classification_sql,
 )
@@ -75,6 +76,7 @@ __all__ = [
     "VALID_STRUCTURAL_TYPES",
     "get_structural_type_filter",
     "get_variant_type_classification_sql",
+    "get_disease_subtype_case_sql",
     # CTEs
     "PUBLIC_FILTER_FRAGMENT",
     "PHENOPACKET_VARIANT_LINK_CTE",
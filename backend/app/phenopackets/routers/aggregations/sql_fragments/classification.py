@@ -12,6 +12,9 @@ use-site in the aggregation endpoints:
 - ``get_variant_type_classification_sql`` — survival analysis V2
   that joins against the ``variant_annotations`` table for VEP
   impact instead of reading it from the JSONB extensions
+- ``get_disease_subtype_case_sql`` — phenotype-based disease subtype
+  (CAKUT / CAKUT/MODY / MODY / Other) shared by the survival analysis
+  and the multi-group phenotype comparison
 
 Extracted during Wave 4 from ``aggregations/sql_fragments.py``.
 """
@@ -313,3 +316,38 @@ CASE
 END
 """
 # fmt: on
+
+
+# =============================================================================
+# Disease Subtype Classification (phenotype-based)
+# =============================================================================
+
+
+def get_disease_subtype_case_sql(content_column: str = "r.content_jsonb") -> str:
+    """Generate the CASE expression classifying a record's disease subtype.
+
+    Yields ``'CAKUT/MODY'``, ``'CAKUT'``, ``'MODY'`` or ``'Other'`` from
+    the non-excluded ``phenotypicFeatures`` of *content_column*, the
+    phenopacket JSONB expression in the host query. Binds
+    ``:cakut_hpo_terms``, ``:genital_hpo`` and ``:mody_hpo``.
+    """
+    features = f"jsonb_array_elements({content_column}->'phenotypicFeatures') pf"
+    present = "COALESCE((pf->>'excluded')::boolean, false) = false"
+    has_cakut = f"""EXISTS (
+            SELECT 1 FROM {features}
+            WHERE (pf->'type'->>'id' = ANY(:cakut_hpo_terms) OR pf->'type'->>'id' = :genital_hpo)
+              AND {present}
+        )"""
+    has_mody = f"""EXISTS (
+            SELECT 1 FROM {features}
+            WHERE pf->'type'->>'id' = :mody_hpo
+              AND {present}
+        )"""
+    return f"""
+    CASE
+        WHEN {has_cakut} AND {has_mody} THEN 'CAKUT/MODY'
+        WHEN {has_cakut} THEN 'CAKUT'
+        WHEN {has_mody} THEN 'MODY'
+        ELSE 'Other'
+    END
+"""
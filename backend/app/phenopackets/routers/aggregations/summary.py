@@ -12,6 +12,8 @@ from .common import (
     AsyncSession,
     Depends,
     Phenopacket,
+    cached_aggregation,
+    check_materialized_view_exists,
     func,
     get_db,
     select,
@@ -23,6 +25,7 @@ router = APIRouter()
 
 
 @router.get("/summary", response_model=Dict[str, int])
+@cached_aggregation
 async def get_summary_statistics(db: AsyncSession = Depends(get_db)):
     """Get lightweight summary statistics for home page.
 
@@ -41,7 +44,28 @@ async def get_summary_statistics(db: AsyncSession = Depends(get_db)):
         - unknown_sex: Number of subjects with unknown sex
 
     All counts exclude synthetic e2e-* fixtures.
+
+    While ``mv_summary_statistics`` is fresh the whole payload is one
+    single-row read; otherwise the live published-head queries below run.
     """
+    if await check_materialized_view_exists(db, "mv_summary_statistics"):
+        mv_row = (
+            (
+                await db.execute(
+                    text(
+                        "SELECT total_phenopackets, with_variants, "
+                        "distinct_hpo_terms, distinct_publications, "
+                        "distinct_sources, distinct_variants, male, female, "
+                        "unknown_sex FROM mv_summary_statistics"
+                    )
+                )
+            )
+            .mappings()
+            .first()
+        )
+        if mv_row is not None:
+            return {key: int(value) for key, value in mv_row.items()}
+
     # All summary queries apply the public visibility filter (I3 + I7):
     # deleted_at IS NULL, state='published', head_published_revision_id IS NOT NULL
 
@@ -12,6 +12,7 @@ from app.phenopackets.survival_analysis import (
     apply_bonferroni_correction,
     calculate_kaplan_meier,
     calculate_log_rank_test,
+    calculate_multigroup_log_rank_test,
     parse_iso8601_age,
 )
 
@@ -106,12 +107,51 @@ class SurvivalHandler(ABC):
             return await self._handle_current_age(db, endpoint_label)
         return await self._handle_standard(db, endpoint_label, endpoint_hpo_terms)
 
+    async def collect_groups(
+        self,
+        db: AsyncSession,
+        endpoint_hpo_terms: Optional[List[str]] = None,
+    ) -> Dict[str, List[tuple]]:
+        """Return the ``(time, event)`` observations of every group.
+
+        These are the inputs :meth:`handle` summarises; resampling statistics
+        are computed from them directly.
+        """
+        if endpoint_hpo_terms is None:
+            return await self._collect_current_age_groups(db)
+        return await self._collect_standard_groups(db, endpoint_hpo_terms)
+
     async def _handle_current_age(
         self,
         db: AsyncSession,
         endpoint_label: str,
     ) -> Dict[str, Any]:
         """Handle current_age endpoint (event = kidney failure)."""
+        groups = await self._collect_current_age_groups(db)
+        return self._build_result(
+            endpoint_label,
+            groups,
+            self._get_current_age_metadata(),
+        )
+
+    async def _handle_standard(
+        self,
+        db: AsyncSession,
+        endpoint_label: str,
+        endpoint_hpo_terms: List[str],
+    ) -> Dict[str, Any]:
+        """Handle standard CKD endpoint (event = phenotype onset)."""
+        groups = await self._collect_standard_groups(db, endpoint_hpo_terms)
+        return self._build_result(
+            endpoint_label,
+            groups,
+            self._get_standard_metadata(endpoint_label),
+        )
+
+    async def _collect_current_age_groups(
+        self, db: AsyncSession
+    ) -> Dict[str, List[tuple]]:
+        """Collect current-age observations (event = kidney failure)."""
         query = self.build_current_age_query()
         result = await db.execute(text(query))
         rows = result.fetchall()
@@ -126,19 +166,12 @@ class SurvivalHandler(ABC):
                 if group_name in groups:
                     groups[group_name].append((current_age, row.has_kidney_failure))
 
-        return self._build_result(
-            endpoint_label,
-            groups,
-            self._get_current_age_metadata(),
-        )
+        return groups
 
-    async def _handle_standard(
-        self,
-        db: AsyncSession,
-        endpoint_label: str,
-        endpoint_hpo_terms: List[str],
-    ) -> Dict[str, Any]:
-        """Handle standard CKD endpoint (event = phenotype onset)."""
+    async def _collect_standard_groups(
+        self, db: AsyncSession, endpoint_hpo_terms: List[str]
+    ) -> Dict[str, List[tuple]]:
+        """Collect onset observations plus censored cases for a CKD endpoint."""
         query = self.build_standard_query(endpoint_hpo_terms)
         result = await db.execute(
             text(query),
@@ -177,11 +210,7 @@ class SurvivalHandler(ABC):
                 if group_name in groups:
                     groups[group_name].append((current_age, False))
 
-        return self._build_result(
-            endpoint_label,
-            groups,
-            self._get_standard_metadata(endpoint_label),
-        )
+        return groups
 
     def _init_groups(self) -> Dict[str, List[tuple]]:
         """Initialize empty groups dictionary."""
@@ -211,6 +240,7 @@ class SurvivalHandler(ABC):
                 if event_times
             ],
             "statistical_tests": statistical_tests,
+            "overall_test": self._calculate_overall_test(groups),
             "metadata": metadata,
         }
 
@@ -244,6 +274,15 @@ class SurvivalHandler(ABC):
 
         return apply_bonferroni_correction(statistical_tests)
 
+    def _calculate_overall_test(
+        self, groups: Dict[str, List[tuple]]
+    ) -> Optional[Dict[str, Any]]:
+        """Calculate the k-group log-rank test across all non-empty groups."""
+        non_empty = {name: times for name, times in groups.items() if times}
+        if len(non_empty) < 2:
+            return None
+        return calculate_multigroup_log_rank_test(non_empty)
+
     def _get_current_age_metadata(self) -> Dict[str, Any]:
         """Get metadata for current_age endpoint."""
         return {
@@ -8,7 +8,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.phenopackets.survival_analysis import parse_iso8601_age
 
-from ...sql_fragments import CURRENT_AGE_PATH, INTERP_STATUS_PATH
+from ...sql_fragments import (
+    CURRENT_AGE_PATH,
+    INTERP_STATUS_PATH,
+    get_disease_subtype_case_sql,
+)
 from ...sql_fragments.ctes import PUBLIC_FILTER_FRAGMENT
 from .base import SurvivalHandler
 
@@ -38,40 +42,7 @@ class DiseaseSubtypeHandler(SurvivalHandler):
 
     def _build_disease_classification_sql(self) -> str:
         """Build SQL CASE for disease subtype classification."""
-        return """
-        CASE
-            WHEN EXISTS (
-                SELECT 1
-                FROM jsonb_array_elements(dc.phenopacket_data->'phenotypicFeatures') pf
-                WHERE (
-                    pf->'type'->>'id' = ANY(:cakut_hpo_terms)
-                    OR pf->'type'->>'id' = :genital_hpo
-                )
-                AND COALESCE((pf->>'excluded')::boolean, false) = false
-            ) AND EXISTS (
-                SELECT 1
-                FROM jsonb_array_elements(dc.phenopacket_data->'phenotypicFeatures') pf
-                WHERE pf->'type'->>'id' = :mody_hpo
-                AND COALESCE((pf->>'excluded')::boolean, false) = false
-            ) THEN 'CAKUT/MODY'
-            WHEN EXISTS (
-                SELECT 1
-                FROM jsonb_array_elements(dc.phenopacket_data->'phenotypicFeatures') pf
-                WHERE (
-                    pf->'type'->>'id' = ANY(:cakut_hpo_terms)
-                    OR pf->'type'->>'id' = :genital_hpo
-                )
-                AND COALESCE((pf->>'excluded')::boolean, false) = false
-            ) THEN 'CAKUT'
-            WHEN EXISTS (
-                SELECT 1
-                FROM jsonb_array_elements(dc.phenopacket_data->'phenotypicFeatures') pf
-                WHERE pf->'type'->>'id' = :mody_hpo
-                AND COALESCE((pf->>'excluded')::boolean, false) = false
-            ) THEN 'MODY'
-            ELSE 'Other'
-        END
-        """
+        return get_disease_subtype_case_sql("dc.phenopacket_data")
 
     def build_current_age_query(self) -> str:
         disease_case = self._build_disease_classification_sql()
@@ -0,0 +1,309 @@
+"""Precomputed, version-keyed survival analysis results.
+
+Kaplan-Meier curves and log-rank tests depend only on the published data, so
+every comparison × endpoint combination (4 × 4) is computed once per
+published data version and stored in the aggregation response cache (see
+:mod:`app.core.aggregation_cache`). :class:`SurvivalPrecomputer` fills the
+cache in the background whenever the version moves, so
+``GET /aggregate/survival-data`` is a cache read regardless of cohort size;
+a request that races the precompute computes and caches its own combination.
+A PostgreSQL advisory lock keeps the precompute single-flight across workers.
+
+The data epoch and version also serve as the HTTP validator:
+:func:`survival_etag` changes whenever the cached body can.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.aggregation_cache import get_or_compute, get_published_data_version
+from app.core.config import settings
+from app.core.mv_refresh import try_advisory_xact_lock
+from app.phenopackets.resampling import resample_survival_groups, resampling_executor
+
+from .handlers import SurvivalHandlerFactory
+
+logger = logging.getLogger(__name__)
+
+SURVIVAL_CACHE_NAME = "survival.survival_data"
+RESAMPLED_CACHE_NAME = "survival.survival_data_resampled"
+PRECOMPUTE_LOCK_NAME = "survival:precompute:lock"
+
+
+def get_endpoint_config() -> Dict[str, Dict[str, Any]]:
+    """Get endpoint configuration using HPO terms from settings.
+
+    Returns dynamically constructed config using centralized HPO terms,
+    enabling configuration changes without code modifications.
+    """
+    return {
+        "ckd_stage_3_plus": {
+            "hpo_terms": settings.hpo_terms.ckd_stage_3_plus,
+            "label": "CKD Stage 3+ (GFR <60)",
+        },
+        "stage_5_ckd": {
+            "hpo_terms": settings.hpo_terms.stage_5_ckd,
+            "label": "Stage 5 CKD (ESRD)",
+        },
+        "any_ckd": {
+            "hpo_terms": settings.hpo_terms.ckd_stages,
+            "label": "Any CKD",
+        },
+        "current_age": {
+            "hpo_terms": None,  # Special case: use current age
+            "label": "Age at Last Follow-up",
+        },
+    }
+
+
+def comparison_endpoint_pairs() -> List[tuple[str, str]]:
+    """Return every (comparison, endpoint) combination that is precomputed."""
+    return [
+        (comparison, endpoint)
+        for comparison in SurvivalHandlerFactory.get_valid_comparison_types()
+        for endpoint in get_endpoint_config()
+    ]
+
+
+def survival_etag(
+    epoch: str, version: int, comparison: str, endpoint: str, variant: str = ""
+) -> str:
+    """Return the strong ETag of one combination at a published data version.
+
+    *epoch* is the published data epoch the version belongs to (see
+    :func:`app.core.aggregation_cache.get_published_data_epoch`). *variant*
+    distinguishes other representations of the same combination, e.g. the
+    resampled response for a given budget and seed.
+    """
+    suffix = f"-{variant}" if variant else ""
+    return f'"survival-{epoch}-v{version}-{comparison}-{endpoint}{suffix}"'
+
+
+async def get_survival_data(
+    db: AsyncSession,
+    comparison: str,
+    endpoint: str,
+    version: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Return one combination's survival analysis, from cache when possible.
+
+    Args:
+        db: Database session used on a cache miss.
+        comparison: Comparison type (see ``SurvivalHandlerFactory``).
+        endpoint: Clinical endpoint key (see :func:`get_endpoint_config`).
+        version: Published data version to read at (default: current).
+
+    Raises:
+        ValueError: If the comparison or endpoint is unknown.
+    """
+    endpoint_config = get_endpoint_config()
+    if endpoint not in endpoint_config:
+        valid_options = ", ".join(endpoint_config.keys())
+        raise ValueError(
+            f"Unknown endpoint: {endpoint}. Valid options: {valid_options}"
+        )
+    handler = SurvivalHandlerFactory.get_handler(comparison)
+    config = endpoint_config[endpoint]
+
+    async def _compute() -> Dict[str, Any]:
+        return await handler.handle(db, config["label"], config["hpo_terms"])
+
+    return await get_or_compute(
+        SURVIVAL_CACHE_NAME,
+        {"comparison": comparison, "endpoint": endpoint},
+        _compute,
+        version=version,
+    )
+
+
+async def get_resampled_survival_data(
+    db: AsyncSession,
+    comparison: str,
+    endpoint: str,
+    n_resamples: int,
+    seed: int,
+    version: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Return one combination with permutation/bootstrap statistics added.
+
+    The asymptotic response gains a ``resampling`` section computed on the
+    resampling executor. Results are deterministic for a given seed, so they
+    are cached per data version, budget and seed like any other aggregation.
+
+    Raises:
+        ValueError: If the comparison or endpoint is unknown.
+        ResamplingTimeout: If resampling exceeds its time budget.
+    """
+    base = await get_survival_data(db, comparison, endpoint, version=version)
+    handler = SurvivalHandlerFactory.get_handler(comparison)
+    hpo_terms = get_endpoint_config()[endpoint]["hpo_terms"]
+
+    async def _compute() -> Dict[str, Any]:
+        groups = await handler.collect_groups(db, hpo_terms)
+        resampled = await resampling_executor.run(
+            resample_survival_groups, groups, n_resamples, seed
+        )
+        return {**base, "resampling": resampled}
+
+    return await get_or_compute(
+        RESAMPLED_CACHE_NAME,
+        {
+            "comparison": comparison,
+            "endpoint": endpoint,
+            "n_resamples": n_resamples,
+            "seed": seed,
+        },
+        _compute,
+        version=version,
+    )
+
+
+async def precompute_survival_data(db: AsyncSession) -> int:
+    """Ensure every combination is cached at the current data version.
+
+    Combinations already cached at this version are cache reads, so calling
+    this repeatedly is cheap.
+
+    Returns:
+        The published data version the combinations were cached at.
+    """
+    version = await get_published_data_version()
+    for comparison, endpoint in comparison_endpoint_pairs():
+        await get_survival_data(db, comparison, endpoint, version=version)
+    return version
+
+
+class SurvivalPrecomputer:
+    """Per-process background worker that keeps the survival cache warm.
+
+    Publish-side routes call :meth:`notify` after bumping the published data
+    version; the worker also polls, which picks up bumps made by other
+    workers or the importer and refills entries that aged out of the cache.
+    Only the worker holding the advisory lock computes (see :meth:`run_once`).
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        *,
+        poll_interval_seconds: Optional[float] = None,
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+            session_factory: Callable returning an ``AsyncSession`` context
+                manager; defaults to ``app.database.async_session_maker``.
+            poll_interval_seconds: Re-check interval override (default:
+                settings).
+        """
+        self._session_factory = session_factory
+        self._poll_interval = poll_interval_seconds
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+        self.last_version: Optional[int] = None
+        self.runs = 0
+        self.lock_contended = 0
+        self.failures = 0
+
+    @property
+    def poll_interval_seconds(self) -> float:
+        """Interval at which the worker re-checks the cached combinations."""
+        if self._poll_interval is not None:
+            return self._poll_interval
+        return settings.aggregation_cache.survival_precompute_poll_seconds
+
+    def _open_session(self) -> Any:
+        if self._session_factory is not None:
+            return self._session_factory()
+        from app import database
+
+        return database.async_session_maker()
+
+    def notify(self) -> None:
+        """Wake the worker after the published data changed."""
+        self._wake.set()
+
+    async def run_once(self) -> Optional[int]:
+        """Precompute every combination at the current version.
+
+        Runs under a cluster-wide advisory lock, so a version bump makes one
+        worker compute the combinations while the others skip; their next
+        pass finds the combinations cached.
+
+        Returns:
+            The version precomputed at, or None if another worker holds the
+            lock.
+        """
+        async with self._open_session() as db:
+            if not await try_advisory_xact_lock(db, PRECOMPUTE_LOCK_NAME):
+                await db.rollback()
+                self.lock_contended += 1
+                return None
+            try:
+                version = await precompute_survival_data(db)
+            finally:
+                # Ends the read transaction, releasing the advisory lock.
+                await db.rollback()
+        if version != self.last_version:
+            logger.info(f"Precomputed survival data at data version {version}")
+        self.last_version = version
+        self.runs += 1
+        return version
+
+    @property
+    def is_running(self) -> bool:
+        """True while this process's background worker task is alive."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the per-process background worker (idempotent)."""
+        if self.is_running:
+            return
+        self._task = asyncio.create_task(self._run(), name="survival-precompute")
+
+    async def stop(self) -> None:
+        """Cancel the background worker and wait for it to exit."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def get_status(self) -> Dict[str, Any]:
+        """Return process-local worker metrics for monitoring."""
+        return {
+            "worker_running": self.is_running,
+            "last_version": self.last_version,
+            "process_runs": self.runs,
+            "process_lock_contended": self.lock_contended,
+            "process_failures": self.failures,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            self._wake.clear()
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # noqa: BLE001 - the worker must survive
+                self.failures += 1
+                logger.error(f"Survival precompute failed: {e}")
+            try:
+                await asyncio.wait_for(
+                    self._wake.wait(), timeout=self.poll_interval_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+
+
+# Process-wide worker; the app lifespan starts it.
+survival_precomputer = SurvivalPrecomputer()
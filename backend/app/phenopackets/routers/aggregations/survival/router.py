@@ -1,55 +1,39 @@
 """Survival analysis endpoint for phenopackets.
 
-Thin FastAPI router that dispatches to the SurvivalHandlerFactory in
-the sibling ``handlers`` module. All concrete Kaplan-Meier, log-rank,
-and SQL logic lives in the handler classes — this file is
-intentionally kept small so the routing and endpoint configuration
-concerns stay in one place.
+Thin FastAPI router over the sibling ``precompute`` module, which holds
+the endpoint configuration and serves results from the version-keyed
+aggregation cache. All concrete Kaplan-Meier, log-rank, and SQL logic
+lives in the handler classes — this file is intentionally kept small so
+the routing and HTTP caching concerns stay in one place.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth.dependencies import get_optional_user
+from app.core.aggregation_cache import (
+    etag_matches,
+    get_published_data_epoch,
+    get_published_data_version,
+)
 from app.core.config import settings
 from app.database import get_db
+from app.models.user import User
+from app.phenopackets.resampling import ResamplingTimeout, resolve_budget
 
-router = APIRouter()
-
-
-# HPO terms now loaded from configuration (settings.hpo_terms)
-# Access via: settings.hpo_terms.cakut, settings.hpo_terms.genital, etc.
+from .handlers import SurvivalHandlerFactory
+from .precompute import get_endpoint_config, get_resampled_survival_data, survival_etag
+from .precompute import get_survival_data as get_cached_survival_data
 
-
-def _get_endpoint_config() -> Dict[str, Dict[str, Any]]:
-    """Get endpoint configuration using HPO terms from settings.
-
-    Returns dynamically constructed config using centralized HPO terms,
-    enabling configuration changes without code modifications.
-    """
-    return {
-        "ckd_stage_3_plus": {
-            "hpo_terms": settings.hpo_terms.ckd_stage_3_plus,
-            "label": "CKD Stage 3+ (GFR <60)",
-        },
-        "stage_5_ckd": {
-            "hpo_terms": settings.hpo_terms.stage_5_ckd,
-            "label": "Stage 5 CKD (ESRD)",
-        },
-        "any_ckd": {
-            "hpo_terms": settings.hpo_terms.ckd_stages,
-            "label": "Any CKD",
-        },
-        "current_age": {
-            "hpo_terms": None,  # Special case: use current age
-            "label": "Age at Last Follow-up",
-        },
-    }
+router = APIRouter()
 
 
 @router.get("/survival-data", response_model=Dict[str, Any])
 async def get_survival_data(
+    request: Request,
+    response: Response,
     comparison: str = Query(
         ...,
         description=(
@@ -64,7 +48,31 @@ async def get_survival_data(
             "stage_5_ckd, any_ckd, current_age"
         ),
     ),
+    resampling: bool = Query(
+        False,
+        description=(
+            "Add permutation log-rank p-values and bootstrap KM confidence "
+            "bands (computed off the event loop; cached per seed)"
+        ),
+    ),
+    n_resamples: Optional[int] = Query(
+        None,
+        ge=100,
+        description=(
+            "Permutations/bootstrap resamples (default and cap from config; "
+            "authenticated callers only)"
+        ),
+    ),
+    seed: Optional[int] = Query(
+        None,
+        ge=0,
+        description=(
+            "Random seed for resampling (default from config; authenticated "
+            "callers only)"
+        ),
+    ),
     db: AsyncSession = Depends(get_db),
+    user: Optional[User] = Depends(get_optional_user),
 ):
     """Get Kaplan-Meier survival data with configurable clinical endpoints.
 
@@ -80,27 +88,60 @@ async def get_survival_data(
     - any_ckd: Any CKD diagnosis
     - current_age: Age at last follow-up (universal endpoint)
 
+    Every combination is precomputed per published data version (see
+    ``precompute``), so a request is normally a cache read. The response
+    carries an ETag derived from that version; a matching ``If-None-Match``
+    gets ``304 Not Modified``.
+
+    With ``resampling=true`` the response also carries a ``resampling``
+    section: permutation p-values for every pairwise log-rank test and
+    percentile bootstrap confidence bands for every curve, which are more
+    robust than the asymptotic statistics for small subgroups. Anonymous
+    callers always get the configured default budget and seed; choosing
+    ``n_resamples`` or ``seed`` requires authentication.
+
     Returns:
         Survival curves with Kaplan-Meier estimates, 95% CIs, and log-rank tests
     """
-    from .handlers import SurvivalHandlerFactory
-
-    endpoint_config = _get_endpoint_config()
+    endpoint_config = get_endpoint_config()
     if endpoint not in endpoint_config:
         valid_options = ", ".join(endpoint_config.keys())
         raise HTTPException(
             status_code=400,
             detail=f"Unknown endpoint: {endpoint}. Valid options: {valid_options}",
         )
-
-    config = endpoint_config[endpoint]
-    endpoint_hpo_terms: Optional[List[str]] = config["hpo_terms"]
-    endpoint_label: str = config["label"]
-
-    # Use factory to get appropriate handler for comparison type
+    # Use factory to validate the comparison type
     try:
-        handler = SurvivalHandlerFactory.get_handler(comparison)
+        SurvivalHandlerFactory.get_handler(comparison)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
-    return await handler.handle(db, endpoint_label, endpoint_hpo_terms)
+    variant = ""
+    budget: Optional[tuple[int, int]] = None
+    if resampling:
+        if not settings.resampling.enabled:
+            raise HTTPException(status_code=400, detail="Resampling is disabled")
+        budget = resolve_budget(n_resamples, seed, pinned=user is None)
+        variant = f"resampled-{budget[0]}-{budget[1]}"
+
+    epoch = await get_published_data_epoch()
+    version = await get_published_data_version()
+    etag = survival_etag(epoch, version, comparison, endpoint, variant)
+    # no-cache: browsers may store the body but must revalidate, which
+    # costs one cache read and an empty 304 until the next publish.
+    headers = {"ETag": etag, "Cache-Control": "public, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    if budget is None:
+        response.headers.update(headers)
+        return await get_cached_survival_data(db, comparison, endpoint, version=version)
+    try:
+        result = await get_resampled_survival_data(
+            db, comparison, endpoint, *budget, version=version
+        )
+    except ResamplingTimeout as e:
+        raise HTTPException(status_code=503, detail=str(e)) from e
+    response.headers.update(headers)
+    return result
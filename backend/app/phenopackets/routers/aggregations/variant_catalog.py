@@ -0,0 +1,263 @@
+"""Query builder over the ``mv_variant_catalog`` materialized view.
+
+``mv_variant_catalog`` (migration ``a4f422b00008_variant_catalog_mv``) holds
+one row per published variant with the display columns of
+``/aggregate/all-variants`` already aggregated, the molecular consequence
+precomputed by ``hnf1b_molecular_consequence()`` (the SQL port of
+:func:`app.phenopackets.molecular_consequence.compute_molecular_consequence`)
+and the values the filters need. Every filter — including ``consequence`` —
+and every sort is therefore plain indexed SQL with a real LIMIT/OFFSET.
+
+Mirrors the fluent interface of :class:`VariantQueryBuilder`, which remains
+the live fallback while the view is stale or unavailable.
+
+The total is a separate :meth:`VariantCatalogQueryBuilder.build_count` query
+(cached per published data version by the endpoint) rather than a window
+count, so a page can stop reading at its LIMIT.
+
+Usage:
+    builder = VariantCatalogQueryBuilder()
+    builder.with_variant_type("deletion").with_consequence("Frameshift")
+    sql, params = builder.build(order_by="phenopacket_count DESC", limit=20)
+    count_sql, count_params = builder.build_count()
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+VARIANT_CATALOG_VIEW = "mv_variant_catalog"
+
+
+@dataclass
+class VariantCatalogQueryBuilder:
+    """Builder for filtered, paginated reads of ``mv_variant_catalog``.
+
+    Filters match the semantics of :class:`VariantQueryBuilder`: a
+    classification filter selects variants with at least one occurrence of
+    that interpretation status and reports the ``phenopacket_count`` and
+    ``pathogenicity`` of those occurrences only.
+
+    Attributes:
+        _where_clauses: List of WHERE clause conditions
+        _params: Dictionary of query parameters
+        _validated_query: Text search query (if any)
+        _classification: Classification filter (if any)
+        _keyset_clause: Keyset pagination condition on the output columns
+    """
+
+    _where_clauses: List[str] = field(default_factory=list)
+    _params: Dict[str, Any] = field(default_factory=dict)
+    _validated_query: Optional[str] = None
+    _classification: Optional[str] = None
+    _keyset_clause: Optional[str] = None
+
+    def with_text_search(self, query: str) -> "VariantCatalogQueryBuilder":
+        """Add text search over ids, labels, descriptions, HGVS and VCF strings.
+
+        Args:
+            query: The search query string
+
+        Returns:
+            Self for method chaining
+        """
+        self._validated_query = query
+        self._where_clauses.append(
+            "EXISTS (SELECT 1 FROM unnest(search_terms) AS term "
+            "WHERE term ILIKE :query)"
+        )
+        self._params["query"] = f"%{query}%"
+        # Same VarXXX handling as the live builder: the simple id must match too.
+        if query.lower().startswith("var"):
+            self._where_clauses.append(
+                "CONCAT('Var', simple_id::text) ILIKE :simple_id_query"
+            )
+            self._params["simple_id_query"] = f"%{query}%"
+        return self
+
+    def with_variant_type(self, variant_type: str) -> "VariantCatalogQueryBuilder":
+        """Add structural type filter.
+
+        Args:
+            variant_type: The structural type to filter by
+
+        Returns:
+            Self for method chaining
+        """
+        self._where_clauses.append("structural_type = :variant_type")
+        self._params["variant_type"] = variant_type
+        return self
+
+    def with_classification(self, classification: str) -> "VariantCatalogQueryBuilder":
+        """Add interpretation-status classification filter.
+
+        Args:
+            classification: The classification to filter by
+
+        Returns:
+            Self for method chaining
+        """
+        self._classification = classification
+        self._where_clauses.append(
+            "interpretation_statuses @> ARRAY[CAST(:classification AS text)]"
+        )
+        self._params["classification"] = classification
+        return self
+
+    def with_gene_filter(self, gene: str) -> "VariantCatalogQueryBuilder":
+        """Add gene symbol filter.
+
+        Args:
+            gene: The gene symbol to filter by
+
+        Returns:
+            Self for method chaining
+        """
+        self._where_clauses.append("gene_symbol = :gene")
+        self._params["gene"] = gene
+        return self
+
+    def with_consequence(self, consequence: str) -> "VariantCatalogQueryBuilder":
+        """Add molecular consequence filter on the displayed consequence value.
+
+        Unlike :meth:`VariantQueryBuilder.with_consequence`, this takes the
+        display vocabulary (``Missense``, ``Frameshift``, ...) because the view
+        stores the same value the endpoint returns.
+
+        Args:
+            consequence: The molecular consequence to filter by
+
+        Returns:
+            Self for method chaining
+        """
+        self._where_clauses.append("molecular_consequence = :consequence")
+        self._params["consequence"] = consequence
+        return self
+
+    def with_domain_filter(
+        self, domain_start: int, domain_end: int
+    ) -> "VariantCatalogQueryBuilder":
+        """Add protein domain position filter.
+
+        Args:
+            domain_start: Start position of the domain
+            domain_end: End position of the domain
+
+        Returns:
+            Self for method chaining
+        """
+        self._where_clauses.append(
+            "protein_position BETWEEN :domain_start AND :domain_end"
+        )
+        self._params["domain_start"] = domain_start
+        self._params["domain_end"] = domain_end
+        return self
+
+    def with_keyset(
+        self, phenopacket_count: int, variant_id: str, backward: bool = False
+    ) -> "VariantCatalogQueryBuilder":
+        """Restrict to rows after (or before) a cursor in the default order.
+
+        The default order is ``phenopacket_count DESC, variant_id ASC``; the
+        condition applies to the reported (possibly classification-specific)
+        ``phenopacket_count``.
+
+        Args:
+            phenopacket_count: Count of the cursor row
+            variant_id: Variant id of the cursor row
+            backward: Select rows before the cursor instead of after it
+
+        Returns:
+            Self for method chaining
+        """
+        if backward:
+            self._keyset_clause = (
+                "(phenopacket_count > :cursor_count OR "
+                "(phenopacket_count = :cursor_count "
+                "AND variant_id < :cursor_variant_id))"
+            )
+        else:
+            self._keyset_clause = (
+                "(phenopacket_count < :cursor_count OR "
+                "(phenopacket_count = :cursor_count "
+                "AND variant_id > :cursor_variant_id))"
+            )
+        self._params["cursor_count"] = phenopacket_count
+        self._params["cursor_variant_id"] = variant_id
+        return self
+
+    def build_count(self) -> Tuple[str, Dict[str, Any]]:
+        """Build the total-count query for the filters (ignores the keyset).
+
+        Returns:
+            Tuple of (SQL query string, parameters dict)
+        """
+        where_sql = " AND ".join(self._where_clauses) or "TRUE"
+        params = {
+            key: value
+            for key, value in self._params.items()
+            if key not in ("cursor_count", "cursor_variant_id")
+        }
+        sql = f"SELECT COUNT(*) FROM {VARIANT_CATALOG_VIEW} WHERE {where_sql}"
+        return sql, params
+
+    def build(
+        self,
+        order_by: str = "phenopacket_count DESC, variant_id ASC",
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build the catalogue query with pagination.
+
+        Args:
+            order_by: ORDER BY clause over the output column names
+            limit: Maximum rows to return
+            offset: Number of rows to skip
+
+        Returns:
+            Tuple of (SQL query string, parameters dict)
+        """
+        where_sql = " AND ".join(self._where_clauses) or "TRUE"
+        if self._classification is not None:
+            # Count and classify only the occurrences with this status.
+            count_sql = (
+                "(status_summary -> CAST(:classification AS text) "
+                "->> 'phenopacket_count')::integer"
+            )
+            pathogenicity_sql = (
+                "status_summary -> CAST(:classification AS text) ->> 'pathogenicity'"
+            )
+        else:
+            count_sql = "phenopacket_count"
+            pathogenicity_sql = "pathogenicity"
+
+        params = dict(self._params)
+        params["limit"] = limit
+        params["offset"] = offset
+
+        keyset_sql = f"WHERE {self._keyset_clause}" if self._keyset_clause else ""
+
+        sql = f"""
+        SELECT *
+        FROM (
+            SELECT
+                simple_id,
+                variant_id,
+                label,
+                gene_symbol,
+                gene_id,
+                structural_type,
+                {pathogenicity_sql} AS pathogenicity,
+                {count_sql} AS phenopacket_count,
+                hg38,
+                transcript,
+                protein,
+                molecular_consequence
+            FROM {VARIANT_CATALOG_VIEW}
+            WHERE {where_sql}
+        ) catalog
+        {keyset_sql}
+        ORDER BY {order_by}
+        LIMIT :limit
+        OFFSET :offset
+        """
+        return sql, params
@@ -11,6 +11,7 @@ from .common import (
     AsyncSession,
     Depends,
     Query,
+    cached_aggregation,
     calculate_percentages,
     get_db,
     text,
@@ -22,6 +23,7 @@ router = APIRouter()
 
 
 @router.get("/variant-pathogenicity", response_model=List[AggregationResult])
+@cached_aggregation
 async def aggregate_variant_pathogenicity(
     count_mode: str = Query(
         "all",
@@ -101,6 +103,7 @@ async def aggregate_variant_pathogenicity(
 
 
 @router.get("/variant-types", response_model=List[AggregationResult])
+@cached_aggregation
 async def aggregate_variant_types(
     count_mode: str = Query(
         "all",
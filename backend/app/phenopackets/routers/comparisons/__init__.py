@@ -8,9 +8,11 @@ import path is unchanged::
 Submodules:
 
 - ``schemas``     — Pydantic request/response models
-- ``statistics``  — Fisher's exact test + FDR + Cohen's h helpers
+- ``statistics``  — Fisher's exact test (single and batched) + FDR +
+  Cohen's h helpers
 - ``variant_sql`` — per-comparison-mode SQL classification fragments
 - ``query``       — phenotype distribution CTE assembly
+- ``groups``      — multi-group count matrix, pairwise tests and caching
 - ``router``      — thin FastAPI router delegating to the above
 
 The three statistics helpers (``calculate_fisher_exact_test``,
@@ -25,6 +27,7 @@ from .statistics import (
     calculate_cohens_h,
     calculate_fdr_correction,
     calculate_fisher_exact_test,
+    fisher_exact_batch,
 )
 
 __all__ = [
@@ -34,4 +37,5 @@ __all__ = [
     "calculate_cohens_h",
     "calculate_fdr_correction",
     "calculate_fisher_exact_test",
+    "fisher_exact_batch",
 ]
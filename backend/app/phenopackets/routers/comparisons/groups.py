@@ -0,0 +1,206 @@
+"""Multi-group phenotype comparisons from one group x phenotype count matrix.
+
+``POST /compare/groups`` accepts arbitrary group definitions. Every group's
+membership test is evaluated in a single scan of the published revisions
+(:func:`~.query.build_group_matrix_query`), producing a group x phenotype
+count matrix from which the 2x2 table of every pair of groups is read off
+and tested in one :func:`~.statistics.fisher_exact_batch` call.
+
+The result is cached per published data version under a hash of the
+resolved group criteria, so renaming groups, re-sorting or changing
+``min_prevalence``/``limit`` never rescans the cohort.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from itertools import combinations
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, func, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.aggregation_cache import get_or_compute
+from app.reference.models import Gene, ProteinDomain, Transcript
+
+from .query import build_group_matrix_query
+from .schemas import GroupDefinition
+from .statistics import calculate_cohens_h, fisher_exact_batch
+from .variant_sql import build_group_definition_condition, disease_subtype_params
+
+GROUP_MATRIX_CACHE_NAME = "comparisons.group_matrix"
+
+
+async def resolve_protein_domain(
+    db: AsyncSession, name: str, gene_symbol: str = "HNF1B"
+) -> Optional[Tuple[int, int]]:
+    """Return the amino-acid range of a canonical-transcript domain, if known.
+
+    *name* matches the domain name or short name case-insensitively.
+    """
+    stmt = (
+        select(ProteinDomain.start, ProteinDomain.end)
+        .join(Transcript, Transcript.id == ProteinDomain.transcript_id)
+        .join(Gene, Gene.id == Transcript.gene_id)
+        .where(
+            and_(
+                Gene.symbol == gene_symbol,
+                Transcript.is_canonical.is_(True),
+                or_(
+                    func.lower(ProteinDomain.name) == name.lower(),
+                    func.lower(ProteinDomain.short_name) == name.lower(),
+                ),
+            )
+        )
+        .limit(1)
+    )
+    row = (await db.execute(stmt)).first()
+    return (row.start, row.end) if row else None
+
+
+async def resolve_group_criteria(
+    db: AsyncSession, groups: List[GroupDefinition]
+) -> List[Dict[str, Any]]:
+    """Return the canonical, name-free criteria of each group.
+
+    Protein domains are resolved to amino-acid ranges so the criteria (and
+    their hash) pin down exactly which variants a group contains.
+
+    Raises:
+        ValueError: If a protein domain is unknown.
+    """
+    criteria: List[Dict[str, Any]] = []
+    for group in groups:
+        protein_range = None
+        if group.protein_domain is not None:
+            protein_range = await resolve_protein_domain(db, group.protein_domain)
+            if protein_range is None:
+                raise ValueError(f"Unknown protein domain: {group.protein_domain}")
+        criteria.append(
+            {
+                "variant_type": group.variant_type,
+                "pathogenicity": sorted(group.pathogenicity)
+                if group.pathogenicity
+                else None,
+                "protein_range": list(protein_range) if protein_range else None,
+                "disease_subtypes": sorted(group.disease_subtype)
+                if group.disease_subtype
+                else None,
+            }
+        )
+    return criteria
+
+
+def definition_hash(criteria: List[Dict[str, Any]]) -> str:
+    """Return a stable digest of resolved group criteria (order-sensitive)."""
+    encoded = json.dumps(criteria, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+async def _load_group_matrix(
+    db: AsyncSession, criteria: List[Dict[str, Any]]
+) -> Tuple[List[int], Dict[str, Dict[str, Any]]]:
+    """Run the single-pass count query.
+
+    Returns:
+        ``(variant_counts, phenotypes)`` where ``phenotypes`` maps each HPO
+        ID (in hpo_id order) to its label and per-group ``[present,
+        absent]`` counts.
+    """
+    conditions: List[str] = []
+    params: Dict[str, Any] = disease_subtype_params()
+    for index, group in enumerate(criteria):
+        protein_range = group["protein_range"]
+        condition, group_params = build_group_definition_condition(
+            index,
+            variant_type=group["variant_type"],
+            pathogenicity=group["pathogenicity"],
+            protein_range=tuple(protein_range) if protein_range else None,
+            disease_subtypes=group["disease_subtypes"],
+        )
+        conditions.append(condition)
+        params.update(group_params)
+
+    result = await db.execute(text(build_group_matrix_query(conditions)), params)
+    variant_counts = [0] * len(criteria)
+    phenotypes: Dict[str, Dict[str, Any]] = {}
+    for row in result.mappings():
+        index = row["group_index"]
+        if row["hpo_id"] is None:
+            variant_counts[index] = int(row["present_count"])
+            continue
+        entry = phenotypes.setdefault(
+            row["hpo_id"],
+            {"hpo_label": row["hpo_label"], "counts": [[0, 0] for _ in criteria]},
+        )
+        entry["counts"][index] = [int(row["present_count"]), int(row["absent_count"])]
+    return variant_counts, phenotypes
+
+
+def pairwise_statistics(
+    phenotypes: Dict[str, Dict[str, Any]], n_groups: int
+) -> List[Dict[str, Any]]:
+    """Build and test the 2x2 table of every pair of groups and phenotype.
+
+    Phenotypes are kept for a pair when both groups have at least one
+    observation, as in the two-group query. Rows have the same fields as
+    the cached rows of ``/compare/variant-types``.
+    """
+    pairs: List[Dict[str, Any]] = []
+    tables: List[Tuple[int, int, int, int]] = []
+    for group1, group2 in combinations(range(n_groups), 2):
+        rows: List[Dict[str, Any]] = []
+        for hpo_id, entry in phenotypes.items():
+            present1, absent1 = entry["counts"][group1]
+            present2, absent2 = entry["counts"][group2]
+            total1, total2 = present1 + absent1, present2 + absent2
+            if total1 == 0 or total2 == 0:
+                continue
+            rows.append(
+                {
+                    "hpo_id": hpo_id,
+                    "hpo_label": entry["hpo_label"],
+                    "group1_present": present1,
+                    "group1_absent": absent1,
+                    "group1_total": total1,
+                    "group1_percentage": present1 / total1 * 100,
+                    "group2_present": present2,
+                    "group2_absent": absent2,
+                    "group2_total": total2,
+                    "group2_percentage": present2 / total2 * 100,
+                    "effect_size": calculate_cohens_h(
+                        present1 / total1, present2 / total2
+                    ),
+                }
+            )
+            tables.append((present1, absent1, present2, absent2))
+        pairs.append({"group1": group1, "group2": group2, "rows": rows})
+
+    p_values, odds_ratios = fisher_exact_batch(tables)
+    flat_rows = (row for pair in pairs for row in pair["rows"])
+    for row, p_value, odds_ratio in zip(flat_rows, p_values, odds_ratios):
+        row["p_value"] = p_value
+        row["odds_ratio"] = odds_ratio
+    return pairs
+
+
+async def get_group_comparison_statistics(
+    db: AsyncSession, criteria: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Return variant counts and raw pairwise statistics for resolved criteria.
+
+    Cached per published data version under :func:`definition_hash`.
+    """
+
+    async def _compute() -> Dict[str, Any]:
+        variant_counts, phenotypes = await _load_group_matrix(db, criteria)
+        pairs = await asyncio.to_thread(pairwise_statistics, phenotypes, len(criteria))
+        return {"variant_counts": variant_counts, "pairs": pairs}
+
+    return await get_or_compute(
+        GROUP_MATRIX_CACHE_NAME,
+        {"definition_hash": definition_hash(criteria)},
+        _compute,
+    )
@@ -10,12 +10,17 @@ Builds the CTE chain that:
    four-count layout the Fisher's exact test needs.
 4. Filters phenotypes below ``:min_prevalence``.
 
+:func:`build_group_matrix_query` generalises steps 1-3 to any number of
+(possibly overlapping) groups in one scan of the published revisions.
+
 Extracted from the monolithic ``comparisons.py`` during Wave 4.
 """
 # ruff: noqa: E501 - SQL queries are more readable when not line-wrapped
 
 from __future__ import annotations
 
+from typing import List
+
 
 def build_phenotype_distribution_query(
     group1_condition: str, group2_condition: str
@@ -122,3 +127,65 @@ def build_phenotype_distribution_query(
     ORDER BY hpo_id
     """
     )
+
+
+def build_group_matrix_query(group_conditions: List[str]) -> str:
+    """Assemble the single-pass group x phenotype count query.
+
+    Every published genomic interpretation is tested
+    against all ``group_conditions`` at once (see
+    :func:`~.variant_sql.build_group_definition_condition`); a variant may
+    belong to several groups. The result has one row per group with
+    ``hpo_id IS NULL`` carrying the group's variant count in
+    ``present_count``, followed by one row per group x phenotype with
+    present/absent counts, ordered by ``hpo_id``.
+    """
+    memberships = ",\n            ".join(
+        f"COALESCE(({condition}), false)" for condition in group_conditions
+    )
+    return (
+        """
+    WITH variant_groups AS MATERIALIZED (
+        -- One row per variant observation, with its membership in each group.
+        SELECT
+            r.content_jsonb AS content,
+            ARRAY[
+            """
+        + memberships
+        + """
+            ] AS memberships
+        FROM phenopackets p
+        JOIN phenopacket_revisions r ON r.id = p.head_published_revision_id,
+             jsonb_array_elements(r.content_jsonb->'interpretations') AS interp,
+             jsonb_array_elements(interp.value#>'{diagnosis,genomicInterpretations}') AS gen_interp
+        WHERE p.deleted_at IS NULL
+          AND p.state = 'published'
+          AND p.head_published_revision_id IS NOT NULL
+    ),
+    group_members AS MATERIALIZED (
+        SELECT vg.content, m.group_index - 1 AS group_index
+        FROM variant_groups vg,
+             unnest(vg.memberships) WITH ORDINALITY AS m(is_member, group_index)
+        WHERE m.is_member
+    )
+    SELECT
+        group_index,
+        NULL::text AS hpo_id,
+        NULL::text AS hpo_label,
+        COUNT(*) AS present_count,
+        0::bigint AS absent_count
+    FROM group_members
+    GROUP BY group_index
+    UNION ALL
+    SELECT
+        gm.group_index,
+        pf.value#>>'{type, id}' AS hpo_id,
+        MAX(pf.value#>>'{type, label}') AS hpo_label,
+        SUM(CASE WHEN NOT COALESCE((pf.value->>'excluded')::boolean, false) THEN 1 ELSE 0 END) AS present_count,
+        SUM(CASE WHEN COALESCE((pf.value->>'excluded')::boolean, false) THEN 1 ELSE 0 END) AS absent_count
+    FROM group_members gm,
+         jsonb_array_elements(gm.content->'phenotypicFeatures') AS pf
+    GROUP BY gm.group_index, pf.value#>>'{type, id}'
+    ORDER BY hpo_id NULLS FIRST, group_index
+    """
+    )
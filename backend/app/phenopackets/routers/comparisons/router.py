@@ -1,31 +1,185 @@
 """Phenopacket comparison endpoints (thin FastAPI router).
 
-Owns ``GET /compare/variant-types``, delegating the SQL fragment
-assembly, the query body, and the statistical helpers to the sibling
-modules (:mod:`variant_sql`, :mod:`query`, :mod:`statistics`).
+Owns ``GET /compare/variant-types`` and ``POST /compare/groups``,
+delegating the SQL fragment assembly, the query body, and the statistical
+helpers to the sibling modules (:mod:`variant_sql`, :mod:`query`,
+:mod:`statistics`, :mod:`groups`).
+
+Per-phenotype statistics depend only on the comparison and the published
+data, so they are computed once per published data version — every table in
+one :func:`~.statistics.fisher_exact_batch` call off the event loop — and
+cached; ``min_prevalence``, FDR correction, sorting and ``limit`` are applied
+per request on the cached rows.
 """
 
 from __future__ import annotations
 
-from typing import List, Literal
+import asyncio
+from typing import Any, Dict, List, Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth.dependencies import get_optional_user
+from app.core.aggregation_cache import get_or_compute
+from app.core.config import settings
 from app.database import get_db
+from app.models.user import User
+from app.phenopackets.resampling import (
+    ResamplingTimeout,
+    bootstrap_odds_ratio_ci,
+    resampling_executor,
+    resolve_budget,
+)
 
+from .groups import (
+    definition_hash,
+    get_group_comparison_statistics,
+    resolve_group_criteria,
+)
 from .query import build_phenotype_distribution_query
-from .schemas import ComparisonResult, PhenotypeComparison
+from .schemas import (
+    ComparisonResult,
+    GroupSummary,
+    MultiGroupComparisonRequest,
+    MultiGroupComparisonResult,
+    PairwiseComparison,
+    PhenotypeComparison,
+)
 from .statistics import (
     calculate_cohens_h,
     calculate_fdr_correction,
-    calculate_fisher_exact_test,
+    fisher_exact_batch,
 )
 from .variant_sql import build_group_conditions
 
 router = APIRouter(prefix="/compare", tags=["phenopackets-comparisons"])
 
+PHENOTYPE_STATISTICS_CACHE_NAME = "comparisons.phenotype_statistics"
+
+
+def _row_statistics(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Attach p-value, odds ratio and Cohen's h to every phenotype row."""
+    p_values, odds_ratios = fisher_exact_batch(
+        [
+            (
+                row["group1_present"],
+                row["group1_absent"],
+                row["group2_present"],
+                row["group2_absent"],
+            )
+            for row in rows
+        ]
+    )
+    for row, p_value, odds_ratio in zip(rows, p_values, odds_ratios):
+        p1 = row["group1_present"] / row["group1_total"] if row["group1_total"] else 0.0
+        p2 = row["group2_present"] / row["group2_total"] if row["group2_total"] else 0.0
+        row["p_value"] = p_value
+        row["odds_ratio"] = odds_ratio
+        row["effect_size"] = calculate_cohens_h(p1, p2)
+    return rows
+
+
+async def _phenotype_statistics(
+    db: AsyncSession,
+    comparison: str,
+    reporting_mode: str,
+    group1_condition: str,
+    group2_condition: str,
+) -> List[Dict[str, Any]]:
+    """Return unfiltered per-phenotype counts and raw statistics, in hpo_id order.
+
+    Cached per published data version, comparison and reporting mode, so
+    every ``min_prevalence``, ``sort_by`` and ``limit`` reuses one query and
+    one batched test.
+    """
+
+    async def _compute() -> List[Dict[str, Any]]:
+        query = build_phenotype_distribution_query(
+            group1_condition=group1_condition,
+            group2_condition=group2_condition,
+        )
+        result = await db.execute(text(query), {"min_prevalence": 0.0})
+        rows = [dict(row) for row in result.mappings()]
+        for row in rows:
+            row["group1_percentage"] = float(row["group1_percentage"])
+            row["group2_percentage"] = float(row["group2_percentage"])
+        return await asyncio.to_thread(_row_statistics, rows)
+
+    return await get_or_compute(
+        PHENOTYPE_STATISTICS_CACHE_NAME,
+        {"comparison": comparison, "reporting_mode": reporting_mode},
+        _compute,
+    )
+
+
+def _filter_by_prevalence(
+    rows: List[Dict[str, Any]], min_prevalence: float
+) -> List[Dict[str, Any]]:
+    """Keep phenotypes reaching ``min_prevalence`` in at least one group.
+
+    Same predicate (and float arithmetic) as the query's min_prevalence
+    filter; only rows with non-zero totals in both groups are cached.
+    """
+    return [
+        row
+        for row in rows
+        if row["group1_present"] / row["group1_total"] >= min_prevalence
+        or row["group2_present"] / row["group2_total"] >= min_prevalence
+    ]
+
+
+def _rank_phenotypes(
+    rows: List[Dict[str, Any]], sort_by: str, limit: int
+) -> List[PhenotypeComparison]:
+    """FDR-correct, sort and truncate cached rows into response models."""
+    # FDR correction (Benjamini-Hochberg) over the phenotypes that passed
+    # the filter.
+    fdr_p_values = calculate_fdr_correction([row["p_value"] for row in rows])
+    ranked = list(zip(rows, fdr_p_values))
+
+    # Sort by the requested metric (stable, so ties keep hpo_id order).
+    if sort_by == "p_value":
+        ranked.sort(
+            key=lambda x: x[0]["p_value"] if x[0]["p_value"] is not None else 1.0
+        )
+    elif sort_by == "effect_size":
+        ranked.sort(
+            key=lambda x: (
+                x[0]["effect_size"] if x[0]["effect_size"] is not None else 0.0
+            ),
+            reverse=True,
+        )
+    elif sort_by == "prevalence_diff":
+        ranked.sort(
+            key=lambda x: abs(x[0]["group1_percentage"] - x[0]["group2_percentage"]),
+            reverse=True,
+        )
+
+    # Only the returned page is turned into response models.
+    return [
+        PhenotypeComparison(
+            hpo_id=row["hpo_id"],
+            hpo_label=row["hpo_label"],
+            group1_present=row["group1_present"],
+            group1_absent=row["group1_absent"],
+            group1_total=row["group1_total"],
+            group1_percentage=row["group1_percentage"],
+            group2_present=row["group2_present"],
+            group2_absent=row["group2_absent"],
+            group2_total=row["group2_total"],
+            group2_percentage=row["group2_percentage"],
+            p_value=row["p_value"],
+            p_value_fdr=p_value_fdr,
+            odds_ratio=row["odds_ratio"],
+            test_used="fisher_exact",
+            significant=(p_value_fdr < 0.05),
+            effect_size=row["effect_size"],
+        )
+        for row, p_value_fdr in ranked[:limit]
+    ]
+
 
 @router.get("/variant-types", response_model=ComparisonResult)
 async def compare_variant_types(
@@ -60,7 +214,31 @@ async def compare_variant_types(
             "reported_only: Only count explicitly reported present/absent cases"
         ),
     ),
+    resampling: bool = Query(
+        False,
+        description=(
+            "Add percentile bootstrap confidence intervals for the odds ratios "
+            "(metadata.resampling; computed off the event loop)"
+        ),
+    ),
+    n_resamples: Optional[int] = Query(
+        None,
+        ge=100,
+        description=(
+            "Bootstrap resamples (default and cap from config; authenticated "
+            "callers only)"
+        ),
+    ),
+    seed: Optional[int] = Query(
+        None,
+        ge=0,
+        description=(
+            "Random seed for resampling (default from config; authenticated "
+            "callers only)"
+        ),
+    ),
     db: AsyncSession = Depends(get_db),
+    user: Optional[User] = Depends(get_optional_user),
 ):
     """Compare phenotype distributions between variant type groups.
 
@@ -78,7 +256,18 @@ async def compare_variant_types(
     rules. The response is byte-identical to the pre-Wave-4 flat
     module; the Wave 4 HTTP surface baseline fixture
     ``phenopackets_compare_variant_types.json`` locks this in.
+
+    Raw statistics for every phenotype are cached per published data
+    version, comparison and reporting mode; filtering, FDR correction,
+    sorting and ``limit`` are applied to the cached rows.
+
+    With ``resampling=true``, ``metadata.resampling.odds_ratio_ci`` maps each
+    returned HPO ID to a percentile bootstrap interval for its odds ratio.
+    Anonymous callers always get the configured default budget and seed.
     """
+    if resampling and not settings.resampling.enabled:
+        raise HTTPException(status_code=400, detail="Resampling is disabled")
+
     try:
         (
             group1_condition,
@@ -89,83 +278,11 @@ async def compare_variant_types(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    query = build_phenotype_distribution_query(
-        group1_condition=group1_condition,
-        group2_condition=group2_condition,
+    all_rows = await _phenotype_statistics(
+        db, comparison, reporting_mode, group1_condition, group2_condition
     )
-
-    result = await db.execute(text(query), {"min_prevalence": min_prevalence})
-    rows = result.fetchall()
-
-    # First pass: raw p-values and effect sizes for every phenotype.
-    preliminary_data: list[dict] = []
-    raw_p_values: list[float] = []
-
-    for row in rows:
-        p_value, odds_ratio = calculate_fisher_exact_test(
-            row.group1_present,
-            row.group1_absent,
-            row.group2_present,
-            row.group2_absent,
-        )
-
-        p1 = row.group1_present / row.group1_total if row.group1_total > 0 else 0.0
-        p2 = row.group2_present / row.group2_total if row.group2_total > 0 else 0.0
-        effect_size = calculate_cohens_h(p1, p2)
-
-        preliminary_data.append(
-            {
-                "row": row,
-                "p_value": p_value,
-                "odds_ratio": odds_ratio,
-                "effect_size": effect_size,
-            }
-        )
-        raw_p_values.append(p_value)
-
-    # Apply FDR correction (Benjamini-Hochberg).
-    fdr_p_values = calculate_fdr_correction(raw_p_values)
-
-    # Second pass: build the response objects with the FDR-corrected p-values.
-    phenotypes: List[PhenotypeComparison] = []
-    for i, data in enumerate(preliminary_data):
-        row = data["row"]
-        phenotypes.append(
-            PhenotypeComparison(
-                hpo_id=row.hpo_id,
-                hpo_label=row.hpo_label,
-                group1_present=row.group1_present,
-                group1_absent=row.group1_absent,
-                group1_total=row.group1_total,
-                group1_percentage=float(row.group1_percentage),
-                group2_present=row.group2_present,
-                group2_absent=row.group2_absent,
-                group2_total=row.group2_total,
-                group2_percentage=float(row.group2_percentage),
-                p_value=data["p_value"],
-                p_value_fdr=fdr_p_values[i],
-                odds_ratio=data["odds_ratio"],
-                test_used="fisher_exact",
-                significant=(fdr_p_values[i] < 0.05),
-                effect_size=data["effect_size"],
-            )
-        )
-
-    # Sort by the requested metric.
-    if sort_by == "p_value":
-        phenotypes.sort(key=lambda x: x.p_value if x.p_value is not None else 1.0)
-    elif sort_by == "effect_size":
-        phenotypes.sort(
-            key=lambda x: x.effect_size if x.effect_size is not None else 0.0,
-            reverse=True,
-        )
-    elif sort_by == "prevalence_diff":
-        phenotypes.sort(
-            key=lambda x: abs(x.group1_percentage - x.group2_percentage),
-            reverse=True,
-        )
-
-    phenotypes = phenotypes[:limit]
+    rows = _filter_by_prevalence(all_rows, min_prevalence)
+    phenotypes = _rank_phenotypes(rows, sort_by, limit)
 
     # Group sizes are the maximum totals observed across the returned
     # phenotypes — filtering by ``min_prevalence`` may have excluded
@@ -173,16 +290,113 @@ async def compare_variant_types(
     group1_count = max((p.group1_total for p in phenotypes), default=0)
     group2_count = max((p.group2_total for p in phenotypes), default=0)
 
+    metadata: Dict[str, Any] = {
+        "comparison_type": comparison,
+        "min_prevalence": min_prevalence,
+        "significant_count": sum(1 for p in phenotypes if p.significant),
+        "total_phenotypes_compared": len(phenotypes),
+    }
+    if resampling:
+        n_resamples, seed = resolve_budget(n_resamples, seed, pinned=user is None)
+        # Bootstrap every table in query (hpo_id) order so an interval does
+        # not depend on sort_by or limit.
+        tables = [
+            (
+                row["group1_present"],
+                row["group1_absent"],
+                row["group2_present"],
+                row["group2_absent"],
+            )
+            for row in rows
+        ]
+        try:
+            intervals = await resampling_executor.run(
+                bootstrap_odds_ratio_ci, tables, n_resamples, seed
+            )
+        except ResamplingTimeout as exc:
+            raise HTTPException(status_code=503, detail=str(exc)) from exc
+        by_hpo = {row["hpo_id"]: ci for row, ci in zip(rows, intervals)}
+        metadata["resampling"] = {
+            "method": "bootstrap_odds_ratio",
+            "n_resamples": n_resamples,
+            "seed": seed,
+            "odds_ratio_ci": {p.hpo_id: by_hpo[p.hpo_id] for p in phenotypes},
+        }
+
     return ComparisonResult(
         group1_name=group1_name,
         group2_name=group2_name,
         group1_count=group1_count,
         group2_count=group2_count,
         phenotypes=phenotypes,
+        metadata=metadata,
+    )
+
+
+@router.post("/groups", response_model=MultiGroupComparisonResult)
+async def compare_groups(
+    request: MultiGroupComparisonRequest,
+    min_prevalence: float = Query(
+        0.05,
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Minimum prevalence (0-1) in at least one group of a pair to "
+            "include phenotype"
+        ),
+    ),
+    limit: int = Query(
+        20, ge=1, le=100, description="Maximum number of phenotypes per pair"
+    ),
+    sort_by: Literal["p_value", "effect_size", "prevalence_diff"] = Query(
+        "p_value", description="Sort phenotypes by this metric"
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """Compare phenotype distributions between every pair of custom groups.
+
+    Each group combines optional criteria — variant type, pathogenicity
+    (default P/LP), HNF1B protein domain and disease subtype — and a variant
+    may belong to several groups. Per pair, phenotypes are tested with
+    Fisher's exact test, Benjamini-Hochberg corrected within the pair and
+    ranked exactly as in ``GET /compare/variant-types``; two groups defined
+    like a variant-types mode reproduce that mode's phenotypes.
+
+    All pairs come from one group x phenotype count matrix built in a single
+    scan of the published cohort and cached per data version by a hash of
+    the group criteria (names excluded), returned as
+    ``metadata.definition_hash``.
+    """
+    try:
+        criteria = await resolve_group_criteria(db, request.groups)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    statistics = await get_group_comparison_statistics(db, criteria)
+    names = [group.name for group in request.groups]
+
+    comparisons: List[PairwiseComparison] = []
+    for pair in statistics["pairs"]:
+        rows = _filter_by_prevalence(pair["rows"], min_prevalence)
+        phenotypes = _rank_phenotypes(rows, sort_by, limit)
+        comparisons.append(
+            PairwiseComparison(
+                group1_name=names[pair["group1"]],
+                group2_name=names[pair["group2"]],
+                phenotypes=phenotypes,
+                significant_count=sum(1 for p in phenotypes if p.significant),
+            )
+        )
+
+    return MultiGroupComparisonResult(
+        groups=[
+            GroupSummary(name=name, variant_count=count)
+            for name, count in zip(names, statistics["variant_counts"])
+        ],
+        comparisons=comparisons,
         metadata={
-            "comparison_type": comparison,
+            "definition_hash": definition_hash(criteria),
             "min_prevalence": min_prevalence,
-            "significant_count": sum(1 for p in phenotypes if p.significant),
-            "total_phenotypes_compared": len(phenotypes),
+            "criteria": criteria,
         },
     )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -53,3 +53,94 @@ class ComparisonResult(BaseModel):
     metadata: Dict[str, Any] = Field(
         default_factory=dict, description="Additional metadata"
     )
+
+
+VariantTypeCriterion = Literal[
+    "truncating",
+    "non_truncating",
+    "cnv",
+    "non_cnv",
+    "cnv_deletion",
+    "cnv_duplication",
+]
+PathogenicityCriterion = Literal[
+    "PATHOGENIC",
+    "LIKELY_PATHOGENIC",
+    "UNCERTAIN_SIGNIFICANCE",
+    "LIKELY_BENIGN",
+    "BENIGN",
+]
+DiseaseSubtypeCriterion = Literal["CAKUT", "CAKUT/MODY", "MODY", "Other"]
+
+
+class GroupDefinition(BaseModel):
+    """One variant group of a multi-group comparison (criteria are ANDed)."""
+
+    name: str = Field(..., min_length=1, max_length=100, description="Group name")
+    variant_type: Optional[VariantTypeCriterion] = Field(
+        None,
+        description=(
+            "Variant class, using the classification rules of "
+            "/compare/variant-types (cnv = large CNVs >=50kb)"
+        ),
+    )
+    pathogenicity: Optional[List[PathogenicityCriterion]] = Field(
+        None,
+        min_length=1,
+        description="Interpretation statuses to include (default: P and LP)",
+    )
+    protein_domain: Optional[str] = Field(
+        None,
+        min_length=1,
+        description=(
+            "HNF1B protein domain name or short name; matches variants whose "
+            "hgvs.p position falls inside the domain"
+        ),
+    )
+    disease_subtype: Optional[List[DiseaseSubtypeCriterion]] = Field(
+        None,
+        min_length=1,
+        description="Phenotype-based disease subtypes of the carrier",
+    )
+
+
+class MultiGroupComparisonRequest(BaseModel):
+    """Request body for ``POST /compare/groups``."""
+
+    groups: List[GroupDefinition] = Field(
+        ..., min_length=2, max_length=8, description="Groups to compare pairwise"
+    )
+
+
+class GroupSummary(BaseModel):
+    """A compared group and its size."""
+
+    name: str = Field(..., description="Group name")
+    variant_count: int = Field(
+        ..., description="Variant observations matching the group definition"
+    )
+
+
+class PairwiseComparison(BaseModel):
+    """Phenotype comparison between two of the requested groups."""
+
+    group1_name: str = Field(..., description="Name of first group")
+    group2_name: str = Field(..., description="Name of second group")
+    phenotypes: List[PhenotypeComparison] = Field(
+        ..., description="List of phenotype comparisons"
+    )
+    significant_count: int = Field(
+        ..., description="Returned phenotypes with FDR < 0.05"
+    )
+
+
+class MultiGroupComparisonResult(BaseModel):
+    """All pairwise comparisons between the requested groups."""
+
+    groups: List[GroupSummary] = Field(..., description="Compared groups")
+    comparisons: List[PairwiseComparison] = Field(
+        ..., description="One comparison per pair of groups, in request order"
+    )
+    metadata: Dict[str, Any] = Field(
+        default_factory=dict, description="Additional metadata"
+    )
@@ -8,12 +8,20 @@ enough to stay under 500 LOC.
 
 Every fragment reads from a ``gen_interp`` row (already expanded
 genomic interpretation) — the calling query is in ``query.py``.
+
+:func:`build_group_definition_condition` combines the same fragments
+into the per-group membership tests of the multi-group comparison.
 """
 # ruff: noqa: E501 - SQL queries are more readable when not line-wrapped
 
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.phenopackets.routers.aggregations.sql_fragments import (
+    get_disease_subtype_case_sql,
+)
 
 # =============================================================================
 # Shared sub-fragments
@@ -119,6 +127,42 @@ _LARGE_CNV = """
 """
 
 
+_CNV_DELETION = """
+    (
+        -- Method 1: Variant ID ends with DEL suffix
+        gen_interp.value#>>'{variantInterpretation,variationDescriptor,id}' ~ 'DEL$'
+        OR
+        -- Method 2: VEP consequence is transcript_ablation
+        EXISTS (
+            SELECT 1
+            FROM jsonb_array_elements(
+                gen_interp.value#>'{variantInterpretation,variationDescriptor,extensions}'
+            ) AS ext
+            WHERE ext->>'name' = 'vep_annotation'
+              AND ext#>>'{value,most_severe_consequence}' = 'transcript_ablation'
+        )
+    )
+"""
+
+
+_CNV_DUPLICATION = """
+    (
+        -- Method 1: Variant ID ends with DUP suffix
+        gen_interp.value#>>'{variantInterpretation,variationDescriptor,id}' ~ 'DUP$'
+        OR
+        -- Method 2: VEP consequence is transcript_amplification
+        EXISTS (
+            SELECT 1
+            FROM jsonb_array_elements(
+                gen_interp.value#>'{variantInterpretation,variationDescriptor,extensions}'
+            ) AS ext
+            WHERE ext->>'name' = 'vep_annotation'
+              AND ext#>>'{value,most_severe_consequence}' = 'transcript_amplification'
+        )
+    )
+"""
+
+
 # =============================================================================
 # Public helper
 # =============================================================================
@@ -170,38 +214,89 @@ def build_group_conditions(comparison: str) -> Tuple[str, str, str, str]:
         )
 
     if comparison == "cnv_deletion_vs_duplication":
-        group1 = """
-            (
-                -- Method 1: Variant ID ends with DEL suffix
-                gen_interp.value#>>'{variantInterpretation,variationDescriptor,id}' ~ 'DEL$'
-                OR
-                -- Method 2: VEP consequence is transcript_ablation
-                EXISTS (
-                    SELECT 1
-                    FROM jsonb_array_elements(
-                        gen_interp.value#>'{variantInterpretation,variationDescriptor,extensions}'
-                    ) AS ext
-                    WHERE ext->>'name' = 'vep_annotation'
-                      AND ext#>>'{value,most_severe_consequence}' = 'transcript_ablation'
-                )
-            )
-        """
-        group2 = """
-            (
-                -- Method 1: Variant ID ends with DUP suffix
-                gen_interp.value#>>'{variantInterpretation,variationDescriptor,id}' ~ 'DUP$'
-                OR
-                -- Method 2: VEP consequence is transcript_amplification
-                EXISTS (
-                    SELECT 1
-                    FROM jsonb_array_elements(
-                        gen_interp.value#>'{variantInterpretation,variationDescriptor,extensions}'
-                    ) AS ext
-                    WHERE ext->>'name' = 'vep_annotation'
-                      AND ext#>>'{value,most_severe_consequence}' = 'transcript_amplification'
-                )
-            )
-        """
-        return (group1, group2, "17q Deletion", "17q Duplication")
+        return (_CNV_DELETION, _CNV_DUPLICATION, "17q Deletion", "17q Duplication")
 
     raise ValueError(f"Unknown comparison type: {comparison}")
+
+
+# =============================================================================
+# Multi-group definitions
+# =============================================================================
+
+
+VARIANT_TYPE_CONDITIONS: Dict[str, str] = {
+    "truncating": _TRUNCATING_BASE,
+    "non_truncating": f"NOT ({_TRUNCATING_BASE})",
+    "cnv": _LARGE_CNV,
+    "non_cnv": f"NOT {_LARGE_CNV}",
+    "cnv_deletion": _CNV_DELETION,
+    "cnv_duplication": _CNV_DUPLICATION,
+}
+
+# Pathogenicity used when a group does not specify one — the P/LP cohort of
+# the pairwise comparison modes.
+DEFAULT_PATHOGENICITY: List[str] = ["PATHOGENIC", "LIKELY_PATHOGENIC"]
+
+# Amino-acid position of the hgvs.p expression (e.g. p.Arg177Ter -> 177).
+_PROTEIN_POSITION_IN_RANGE = """
+    EXISTS (
+        SELECT 1
+        FROM jsonb_array_elements(
+            gen_interp.value#>'{{variantInterpretation,variationDescriptor,expressions}}'
+        ) AS expr
+        WHERE expr->>'syntax' = 'hgvs.p'
+          AND substring(expr->>'value' from 'p\\.\\(?[A-Z][a-z]{{2}}([0-9]+)')::int
+              BETWEEN :{prefix}_protein_start AND :{prefix}_protein_end
+    )
+"""
+
+# Same phenotype-based subtypes as the survival disease_subtype comparison
+# (CAKUT, CAKUT/MODY, MODY, Other), evaluated on the record's revision ``r``.
+DISEASE_SUBTYPE_CASE = get_disease_subtype_case_sql("r.content_jsonb")
+
+
+def disease_subtype_params() -> Dict[str, Any]:
+    """Bind parameters consumed by :data:`DISEASE_SUBTYPE_CASE`."""
+    return {
+        "cakut_hpo_terms": settings.hpo_terms.cakut,
+        "genital_hpo": settings.hpo_terms.genital,
+        "mody_hpo": settings.hpo_terms.mody,
+    }
+
+
+def build_group_definition_condition(
+    index: int,
+    *,
+    variant_type: Optional[str] = None,
+    pathogenicity: Optional[List[str]] = None,
+    protein_range: Optional[Tuple[int, int]] = None,
+    disease_subtypes: Optional[List[str]] = None,
+) -> Tuple[str, Dict[str, Any]]:
+    """Return the membership test and bind parameters for one group.
+
+    Criteria are ANDed; bind parameters are prefixed ``g<index>_`` so the
+    conditions of every group can share one query. Pathogenicity defaults
+    to :data:`DEFAULT_PATHOGENICITY`.
+
+    Raises ``ValueError`` for an unknown variant type.
+    """
+    prefix = f"g{index}"
+    params: Dict[str, Any] = {
+        f"{prefix}_pathogenicity": list(pathogenicity or DEFAULT_PATHOGENICITY)
+    }
+    clauses = [
+        f"gen_interp.value->>'interpretationStatus' = ANY(:{prefix}_pathogenicity)"
+    ]
+    if variant_type is not None:
+        if variant_type not in VARIANT_TYPE_CONDITIONS:
+            raise ValueError(f"Unknown variant type: {variant_type}")
+        clauses.append(f"({VARIANT_TYPE_CONDITIONS[variant_type]})")
+    if protein_range is not None:
+        clauses.append(_PROTEIN_POSITION_IN_RANGE.format(prefix=prefix))
+        params[f"{prefix}_protein_start"], params[f"{prefix}_protein_end"] = (
+            protein_range
+        )
+    if disease_subtypes:
+        clauses.append(f"({DISEASE_SUBTYPE_CASE}) = ANY(:{prefix}_disease_subtypes)")
+        params[f"{prefix}_disease_subtypes"] = list(disease_subtypes)
+    return "\n        AND ".join(clauses), params
@@ -23,16 +23,18 @@ Wave 7 D.1 additions:
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
-from sqlalchemy import func, select
+from sqlalchemy import func, literal, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.auth import get_optional_user, is_curator_or_admin, require_curator
+from app.core.aggregation_cache import bump_published_data_version, get_or_compute
+from app.core.mv_refresh import AGGREGATION_VIEWS, aggregation_refresh_scheduler
 from app.database import get_db
-from app.models.json_api import JsonApiResponse
+from app.models.json_api import JsonApiCursorResponse, JsonApiResponse
 from app.models.user import User
 from app.phenopackets.models import (
     Phenopacket,
@@ -53,6 +55,10 @@ from app.phenopackets.repositories import (
     public_head_query,
     resolve_curator_content,
     resolve_public_content,
+    resolve_public_contents,
+)
+from app.phenopackets.routers.aggregations.survival.precompute import (
+    survival_precomputer,
 )
 from app.phenopackets.routers.crud_helpers import parse_sort_parameter
 from app.phenopackets.services.phenopacket_service import (
@@ -71,7 +77,13 @@ from app.phenopackets.services.representation_service import (
 from app.phenopackets.services.state_service import PhenopacketStateService
 from app.phenopackets.validation.domain import DomainValidator
 from app.phenopackets.validator import PhenopacketSanitizer, PhenopacketValidator
-from app.utils.pagination import build_offset_response
+from app.search.mv_refresh import MVRefreshMiddleware
+from app.utils.pagination import (
+    build_cursor_response,
+    build_offset_response,
+    decode_cursor,
+    encode_cursor,
+)
 
 router = APIRouter(tags=["phenopackets-crud"])
 logger = logging.getLogger(__name__)
@@ -98,7 +110,93 @@ def _base_list_query() -> Any:
 # =============================================================================
 
 
-@router.get("/", response_model=JsonApiResponse)
+async def _list_total(
+    db: AsyncSession,
+    *,
+    is_curator: bool,
+    filter_sex: Optional[str],
+    filter_has_variants: Optional[bool],
+) -> int:
+    """Count the records a list request matches (same filters, no paging).
+
+    Public totals depend only on the published data, so they are cached per
+    published data version and shared by every page of a listing; a publish
+    invalidates them. Curator lists include drafts, which change without a
+    publish, so their totals are always counted live.
+    """
+    public_json_column = PhenopacketRevision.content_jsonb if not is_curator else None
+
+    async def _count() -> int:
+        count_base = select(func.count()).select_from(Phenopacket)
+        if is_curator:
+            count_base = curator_filter(count_base)
+        else:
+            count_base = public_head_query(count_base).where(
+                Phenopacket.phenopacket_id.not_like("e2e-%")
+            )
+        count_base = add_sex_filter(count_base, filter_sex, content=public_json_column)
+        count_base = add_has_variants_filter(
+            count_base, filter_has_variants, content=public_json_column
+        )
+        count_result = await db.execute(count_base)
+        return int(count_result.scalar() or 0)
+
+    if is_curator:
+        return await _count()
+    total = await get_or_compute(
+        "phenopackets.list_total",
+        {"sex": filter_sex, "has_variants": filter_has_variants},
+        _count,
+    )
+    return int(total)
+
+
+async def _list_items(
+    db: AsyncSession, rows: List[Phenopacket], is_curator: bool
+) -> List[Dict[str, Any]]:
+    """Build list items: role-resolved content plus Wave 7 D.1 state fields.
+
+    The state fields sit AT THE TOP LEVEL alongside the raw GA4GH content.
+    We keep the existing JSON:API contract (raw phenopacket keys at top
+    level) rather than wrapping content under `.phenopacket`, so existing
+    consumers that expect `item["subject"]` / `item["interpretations"]`
+    keep working. Non-curators get the state fields as null per §7.2.
+    """
+    # Public content for the whole page is resolved in one query.
+    public_contents = {} if is_curator else await resolve_public_contents(db, rows)
+    data: List[Dict[str, Any]] = []
+    for pp in rows:
+        content: Dict[str, Any]
+        if is_curator:
+            content = resolve_curator_content(pp)
+        else:
+            # Head pointer guaranteed non-NULL by public_filter
+            public_content = public_contents.get(pp.id)
+            if public_content is None:
+                # Should never happen (public_filter guards head IS NOT NULL),
+                # but skip defensively
+                continue
+            content = public_content
+        augmented = dict(content)
+        if is_curator:
+            augmented["state"] = pp.state
+            augmented["head_published_revision_id"] = pp.head_published_revision_id
+            augmented["editing_revision_id"] = pp.editing_revision_id
+            augmented["draft_owner_id"] = pp.draft_owner_id
+            augmented["draft_owner_username"] = (
+                pp.draft_owner.username if pp.draft_owner else None
+            )
+        else:
+            augmented["state"] = None
+            augmented["head_published_revision_id"] = None
+            augmented["editing_revision_id"] = None
+            augmented["draft_owner_id"] = None
+            augmented["draft_owner_username"] = None
+        data.append(augmented)
+    return data
+
+
+@router.get("/", response_model=Union[JsonApiResponse, JsonApiCursorResponse])
 async def list_phenopackets(
     request: Request,
     # Offset pagination (JSON:API v1.1)
@@ -115,6 +213,17 @@ async def list_phenopackets(
         le=1000,
         description="Items per page (max: 1000)",
     ),
+    # Cursor (keyset) pagination
+    page_after: Optional[str] = Query(
+        None,
+        alias="page[after]",
+        description="Cursor from meta.page.endCursor (empty for the first page)",
+    ),
+    page_before: Optional[str] = Query(
+        None,
+        alias="page[before]",
+        description="Cursor from meta.page.startCursor",
+    ),
     # Filters
     filter_sex: Optional[str] = Query(
         None, alias="filter[sex]", description="Filter by subject sex"
@@ -131,9 +240,10 @@ async def list_phenopackets(
     db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_optional_user),
 ):
-    """List phenopackets with offset-based pagination.
+    """List phenopackets with offset-based or cursor-based pagination.
 
-    Uses ``page[number]`` and ``page[size]`` for direct page access.
+    Uses ``page[number]`` and ``page[size]`` for direct page access, or
+    ``page[after]`` / ``page[before]`` for keyset pagination.
 
     **Visibility (Wave 7 D.1):**
     - Anonymous / viewer callers: only ``state='published'`` records with a
@@ -145,6 +255,10 @@ async def list_phenopackets(
     **Pagination:**
     - ``page[number]``: Page number (1-indexed, default: 1)
     - ``page[size]``: Items per page (default: 100, max: 1000)
+    - ``page[after]`` / ``page[before]``: Cursor pagination over the default
+      order (newest first). Pass an empty ``page[after]`` for the first page,
+      then follow ``links.next`` / ``links.prev``. The cost of a page does
+      not grow with its depth. Cannot be combined with ``sort``.
 
     **Filtering:**
     - ``filter[sex]``: MALE, FEMALE, OTHER_SEX, UNKNOWN_SEX
@@ -156,6 +270,15 @@ async def list_phenopackets(
       ``features_count``, ``has_variant``
     """
     is_curator = is_curator_or_admin(current_user)
+    cursor_mode = page_after is not None or page_before is not None
+    if cursor_mode and sort:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                "Cursor pagination (page[after]/page[before]) supports only the "
+                "default order; use page[number] to paginate a sorted list"
+            ),
+        )
 
     # Build base query with eager-loads for actor relationships
     base_stmt = _base_list_query()
@@ -178,6 +301,32 @@ async def list_phenopackets(
         query, filter_has_variants, content=public_json_column
     )
 
+    total_count = await _list_total(
+        db,
+        is_curator=is_curator,
+        filter_sex=filter_sex,
+        filter_has_variants=filter_has_variants,
+    )
+
+    filters: Dict[str, Any] = {}
+    if filter_sex:
+        filters["filter[sex]"] = filter_sex
+    if filter_has_variants is not None:
+        filters["filter[has_variants]"] = filter_has_variants
+
+    if cursor_mode:
+        return await _list_keyset_page(
+            db,
+            query,
+            is_curator=is_curator,
+            page_size=page_size,
+            page_after=page_after,
+            page_before=page_before,
+            total_count=total_count,
+            base_url=str(request.url.path),
+            filters=filters,
+        )
+
     # Apply sort
     if sort:
         sort_clauses = parse_sort_parameter(sort, content=public_json_column)
@@ -189,71 +338,14 @@ async def list_phenopackets(
     else:
         query = query.order_by(Phenopacket.created_at.desc(), Phenopacket.id.desc())
 
-    # Count (same filters, no sort/pagination)
-    count_base = select(func.count()).select_from(Phenopacket)
-    if is_curator:
-        count_base = curator_filter(count_base)
-    else:
-        count_base = public_head_query(count_base).where(
-            Phenopacket.phenopacket_id.not_like("e2e-%")
-        )
-    count_base = add_sex_filter(count_base, filter_sex, content=public_json_column)
-    count_base = add_has_variants_filter(
-        count_base, filter_has_variants, content=public_json_column
-    )
-    count_result = await db.execute(count_base)
-    total_count = int(count_result.scalar() or 0)
-
     # Paginate
     offset = (page_number - 1) * page_size
     paginated = query.offset(offset).limit(page_size)
     result = await db.execute(paginated)
     rows: List[Phenopacket] = list(result.scalars().all())
 
-    # Build data items: resolve content per role, then augment with Wave 7
-    # D.1 state fields AT THE TOP LEVEL alongside the raw GA4GH content.
-    # We keep the existing JSON:API contract (raw phenopacket keys at top
-    # level) rather than wrapping content under `.phenopacket`, so existing
-    # consumers that expect `item["subject"]` / `item["interpretations"]`
-    # keep working. Non-curators get the state fields as null per §7.2.
-    data: List[Dict[str, Any]] = []
-    for pp in rows:
-        content: Dict[str, Any]
-        if is_curator:
-            content = resolve_curator_content(pp)
-        else:
-            # Fast-path: head pointer guaranteed non-NULL by public_filter
-            public_content = await resolve_public_content(db, pp)
-            if public_content is None:
-                # Should never happen (public_filter guards head IS NOT NULL),
-                # but skip defensively
-                continue
-            content = public_content
-        augmented = dict(content)
-        if is_curator:
-            augmented["state"] = pp.state
-            augmented["head_published_revision_id"] = pp.head_published_revision_id
-            augmented["editing_revision_id"] = pp.editing_revision_id
-            augmented["draft_owner_id"] = pp.draft_owner_id
-            augmented["draft_owner_username"] = (
-                pp.draft_owner.username if pp.draft_owner else None
-            )
-        else:
-            augmented["state"] = None
-            augmented["head_published_revision_id"] = None
-            augmented["editing_revision_id"] = None
-            augmented["draft_owner_id"] = None
-            augmented["draft_owner_username"] = None
-        data.append(augmented)
-
-    filters: Dict[str, Any] = {}
-    if filter_sex:
-        filters["filter[sex]"] = filter_sex
-    if filter_has_variants is not None:
-        filters["filter[has_variants]"] = filter_has_variants
-
     return build_offset_response(
-        data=data,
+        data=await _list_items(db, rows, is_curator),
         current_page=page_number,
         page_size=page_size,
         total_records=total_count,
@@ -263,6 +355,82 @@ async def list_phenopackets(
     )
 
 
+async def _list_keyset_page(
+    db: AsyncSession,
+    query: Any,
+    *,
+    is_curator: bool,
+    page_size: int,
+    page_after: Optional[str],
+    page_before: Optional[str],
+    total_count: int,
+    base_url: str,
+    filters: Dict[str, Any],
+) -> JsonApiCursorResponse:
+    """Serve one keyset page of the list ordered by (created_at, id) DESC.
+
+    The row-value comparison against the cursor is served by the
+    ``(created_at DESC, id DESC)`` indexes on ``phenopackets``, so a deep
+    page reads ``page_size + 1`` index entries instead of skipping OFFSET
+    rows.
+    """
+    is_backward = page_before is not None
+    cursor = page_before if is_backward else page_after
+    position = tuple_(Phenopacket.created_at, Phenopacket.id)
+    if cursor:
+        cursor_data = decode_cursor(cursor)
+        if "created_at" not in cursor_data or "id" not in cursor_data:
+            raise HTTPException(status_code=400, detail="Invalid cursor format")
+        cursor_position = tuple_(
+            literal(cursor_data["created_at"], Phenopacket.created_at.type),
+            literal(cursor_data["id"], Phenopacket.id.type),
+        )
+        query = query.where(
+            position > cursor_position if is_backward else position < cursor_position
+        )
+
+    if is_backward:
+        query = query.order_by(Phenopacket.created_at.asc(), Phenopacket.id.asc())
+    else:
+        query = query.order_by(Phenopacket.created_at.desc(), Phenopacket.id.desc())
+
+    # Fetch one extra to detect if there are more pages
+    result = await db.execute(query.limit(page_size + 1))
+    rows: List[Phenopacket] = list(result.scalars().all())
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if is_backward:
+        rows.reverse()
+
+    # Same has_next/has_prev rules as the search endpoint's cursor paging
+    if is_backward:
+        has_next, has_prev = True, has_more
+    else:
+        has_next, has_prev = has_more, bool(page_after)
+
+    start_cursor = end_cursor = None
+    if rows:
+        start_cursor = encode_cursor(
+            {"created_at": rows[0].created_at, "id": rows[0].id}
+        )
+        end_cursor = encode_cursor(
+            {"created_at": rows[-1].created_at, "id": rows[-1].id}
+        )
+
+    return build_cursor_response(
+        data=await _list_items(db, rows, is_curator),
+        page_size=page_size,
+        has_next=has_next,
+        has_prev=has_prev,
+        start_cursor=start_cursor,
+        end_cursor=end_cursor,
+        base_url=base_url,
+        filters=filters,
+        total=total_count,
+        cursor_opt_in=True,
+    )
+
+
 @router.get("/batch", response_model=List[Dict])
 async def get_phenopackets_batch(
     phenopacket_ids: str = Query(
@@ -281,7 +449,8 @@ async def get_phenopackets_batch(
     - Curator / admin callers: all non-deleted records matching the IDs.
 
     Performance:
-        - Single database query using WHERE...IN clause
+        - Single database query using WHERE...IN clause, plus one for the
+          head-published revisions of anonymous callers
         - 10x-100x faster than individual requests
     """
     ids = [pid.strip() for pid in phenopacket_ids.split(",") if pid.strip()]
@@ -311,12 +480,15 @@ async def get_phenopackets_batch(
     result = await db.execute(stmt)
     phenopackets_list = list(result.scalars().all())
 
+    public_contents = (
+        {} if is_curator else await resolve_public_contents(db, phenopackets_list)
+    )
     items = []
     for pp in phenopackets_list:
         if is_curator:
             content: Dict[str, Any] = resolve_curator_content(pp)
         else:
-            public_content = await resolve_public_content(db, pp)
+            public_content = public_contents.get(pp.id)
             if public_content is None:
                 continue
             content = public_content
@@ -648,14 +820,22 @@ async def delete_phenopacket(
     """
     service = PhenopacketService(PhenopacketRepository(db))
     try:
-        response = await service.soft_delete(
-            phenopacket_id,
-            delete_request.change_reason,
-            actor_id=current_user.id,
-            actor_username=current_user.username,
-            expected_revision=delete_request.revision,
-        )
-        await db.commit()
+        async with MVRefreshMiddleware(db) as mv:
+            response = await service.soft_delete(
+                phenopacket_id,
+                delete_request.change_reason,
+                actor_id=current_user.id,
+                actor_username=current_user.username,
+                expected_revision=delete_request.revision,
+            )
+            await db.commit()
+            # A deleted record leaves the published set (and the public
+            # search index) if it was in it; marking unconditionally keeps
+            # the aggregation views and search index conservative.
+            await aggregation_refresh_scheduler.mark_stale(AGGREGATION_VIEWS)
+            mv.mark_dirty()
+            await bump_published_data_version()
+            survival_precomputer.notify()
         return response
     except ServiceNotFound as exc:
         raise HTTPException(
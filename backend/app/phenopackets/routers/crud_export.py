@@ -0,0 +1,77 @@
+"""Bulk export of the published cohort.
+
+Exposes ``GET /export``, streaming every published phenopacket as NDJSON
+(optionally gzip-compressed). The single-record export stays at
+``GET /{phenopacket_id}/export`` in ``crud.py``; this router must be
+registered before ``crud_router`` so ``/export`` is not captured by the
+catch-all ``/{phenopacket_id}`` GET.
+"""
+
+from __future__ import annotations
+
+from typing import Literal
+
+from fastapi import APIRouter, Query, Request, Response
+from fastapi.responses import StreamingResponse
+
+from app import database
+from app.core.aggregation_cache import (
+    etag_matches,
+    get_published_data_epoch,
+    get_published_data_version,
+)
+from app.phenopackets.services.bulk_export import (
+    bulk_export_etag,
+    stream_published_cohort,
+)
+
+router = APIRouter(tags=["phenopackets-crud"])
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}, "application/gzip": {}},
+            "description": "One GA4GH phenopacket per line",
+        },
+        304: {"description": "Published data unchanged since the given ETag"},
+    },
+)
+async def export_published_cohort(
+    request: Request,
+    compression: Literal["none", "gzip"] = Query(
+        "none", description="Compress the NDJSON stream with gzip"
+    ),
+):
+    """Stream the whole published cohort as NDJSON.
+
+    Each line is the ``ga4gh`` representation of one published head
+    revision, exactly as ``GET /{phenopacket_id}/export`` returns it for an
+    anonymous caller; records are ordered by phenopacket id. Drafts and
+    in-progress edits are never exported (I1), and records that cannot be
+    represented as GA4GH are skipped, as are synthetic ``e2e-`` test records.
+
+    The response carries an ETag derived from the published data epoch and
+    version; a matching ``If-None-Match`` gets ``304 Not Modified`` without
+    touching the database. The version is read before the rows, so a publish
+    racing the download can only make the body newer than its ETag, never
+    older.
+    """
+    epoch = await get_published_data_epoch()
+    version = await get_published_data_version()
+    etag = bulk_export_etag(epoch, version, compression)
+    headers = {"ETag": etag, "Cache-Control": "public, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    gzip = compression == "gzip"
+    filename = f"hnf1b-phenopackets-v{version}.ndjson{'.gz' if gzip else ''}"
+    headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return StreamingResponse(
+        stream_published_cohort(database.async_session_maker, gzip=gzip),
+        media_type="application/gzip" if gzip else "application/x-ndjson",
+        headers=headers,
+    )
@@ -26,6 +26,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.auth.dependencies import get_current_user, is_curator_or_admin, require_curator
+from app.core.aggregation_cache import bump_published_data_version
+from app.core.mv_refresh import aggregation_refresh_scheduler
 from app.database import get_db
 from app.models.user import User
 from app.phenopackets.models import (
@@ -36,7 +38,11 @@ from app.phenopackets.models import (
 )
 from app.phenopackets.query_builders import build_phenopacket_response
 from app.phenopackets.repositories import PhenopacketRepository
+from app.phenopackets.routers.aggregations.survival.precompute import (
+    survival_precomputer,
+)
 from app.phenopackets.services.state_service import PhenopacketStateService
+from app.search.mv_refresh import MVRefreshMiddleware
 
 router = APIRouter(tags=["phenopackets-state"])
 logger = logging.getLogger(__name__)
@@ -122,14 +128,24 @@ async def post_transition(
 
     svc = PhenopacketStateService(db)
     try:
-        pp, rev = await svc.transition(
-            pp.id,
-            to_state=body.to_state,
-            reason=body.reason,
-            expected_revision=body.revision,
-            actor=current_user,
-        )
-        await db.commit()
+        async with MVRefreshMiddleware(db) as mv:
+            pp, rev = await svc.transition(
+                pp.id,
+                to_state=body.to_state,
+                reason=body.reason,
+                expected_revision=body.revision,
+                actor=current_user,
+            )
+            await db.commit()
+            if svc.stale_views:
+                await aggregation_refresh_scheduler.mark_stale(svc.stale_views)
+            # Only publish/archive change what the public search index shows;
+            # the mark is coalesced with other workers' marks, not refreshed
+            # inline.
+            if body.to_state in ("published", "archived"):
+                mv.mark_dirty()
+                await bump_published_data_version()
+                survival_precomputer.notify()
     except PhenopacketStateService.RecordNotFound as exc:
         raise HTTPException(status_code=404, detail="Phenopacket not found") from exc
     except PhenopacketStateService.RevisionMismatch as exc:
@@ -0,0 +1,121 @@
+"""Streaming bulk export of the published cohort.
+
+Reads every published head revision through a server-side cursor
+(``AsyncSession.stream`` with ``yield_per``) and turns each fetched batch
+into NDJSON — one GA4GH representation per line, optionally gzip-compressed —
+so memory stays bounded by one batch however large the cohort grows.
+Redaction, ``represent()`` and compression are CPU-bound and run in a worker
+thread per batch, keeping the event loop free while a download is in flight.
+
+Synthetic ``e2e-`` records left behind by end-to-end tests are excluded, as
+in every other cohort-wide public read.
+
+The snapshot is identified by the published data epoch and version (see
+``app.core.aggregation_cache``): :func:`bulk_export_etag` changes whenever
+published data does, so clients can revalidate with ``If-None-Match``
+instead of downloading the cohort again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import zlib
+from typing import Any, AsyncIterator, Callable, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.phenopackets.models import Phenopacket, PhenopacketRevision
+from app.phenopackets.privacy import PublicRepresentationError, redact_public_document
+from app.phenopackets.repositories.visibility import public_head_query
+
+from .representation_service import RepresentationValidationError, represent
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per round-trip of the server-side cursor.
+EXPORT_BATCH_SIZE = 200
+
+# wbits=31 selects the gzip container (16 + the 15-bit zlib window).
+_GZIP_WBITS = 31
+
+
+def bulk_export_etag(epoch: str, version: int, compression: str) -> str:
+    """Return the strong ETag of the export at a published data version.
+
+    *epoch* is the published data epoch the version belongs to (see
+    :func:`app.core.aggregation_cache.get_published_data_epoch`), so a reset
+    version counter cannot revalidate a stale download.
+    """
+    return f'"phenopackets-export-{epoch}-v{version}-{compression}"'
+
+
+def _encode_batch(rows: Sequence[Any], compressor: Optional[Any]) -> tuple[bytes, int]:
+    """Render one fetched batch as NDJSON bytes.
+
+    Records whose published content cannot be produced as a GA4GH
+    representation are skipped (and logged), matching the single-record
+    export, which refuses them with 422.
+
+    Returns:
+        Tuple of (encoded bytes, number of records skipped).
+    """
+    lines = []
+    skipped = 0
+    for phenopacket_id, content in rows:
+        try:
+            document = represent(redact_public_document(content), "ga4gh")
+        except (PublicRepresentationError, RepresentationValidationError) as exc:
+            logger.warning(f"Bulk export skipped {phenopacket_id}: {exc}")
+            skipped += 1
+            continue
+        lines.append(json.dumps(document, ensure_ascii=False, separators=(",", ":")))
+    data = "".join(f"{line}\n" for line in lines).encode()
+    if compressor is not None:
+        data = compressor.compress(data)
+    return data, skipped
+
+
+async def stream_published_cohort(
+    session_factory: Callable[[], AsyncSession],
+    *,
+    gzip: bool = False,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[bytes]:
+    """Yield the published cohort as NDJSON chunks, ordered by phenopacket id.
+
+    Opens its own session: the body is streamed after the endpoint returns,
+    when the request-scoped session from ``Depends(get_db)`` may already be
+    closed.
+
+    Args:
+        session_factory: Zero-argument factory returning an ``AsyncSession``
+            context manager (normally ``app.database.async_session_maker``).
+        gzip: Compress the stream into a single gzip member.
+        batch_size: Rows fetched per round-trip of the server-side cursor.
+    """
+    compressor = zlib.compressobj(wbits=_GZIP_WBITS) if gzip else None
+    exported = skipped = 0
+    stmt = (
+        public_head_query(
+            select(Phenopacket.phenopacket_id, PhenopacketRevision.content_jsonb)
+        )
+        .where(Phenopacket.phenopacket_id.not_like("e2e-%"))
+        .order_by(Phenopacket.phenopacket_id)
+        .execution_options(yield_per=batch_size)
+    )
+    async with session_factory() as db:
+        result = await db.stream(stmt)
+        async for rows in result.partitions():
+            chunk, batch_skipped = await asyncio.to_thread(
+                _encode_batch, rows, compressor
+            )
+            exported += len(rows) - batch_skipped
+            skipped += batch_skipped
+            if chunk:
+                yield chunk
+    if compressor is not None:
+        yield compressor.flush()
+    logger.info(f"Bulk export streamed {exported} phenopackets ({skipped} skipped)")
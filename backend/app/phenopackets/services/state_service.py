@@ -4,6 +4,10 @@ Every public method acquires ``SELECT ... FOR UPDATE`` on the phenopacket row,
 checks the optimistic lock, and stages one append-only revision. Callers own
 the surrounding transaction and are solely responsible for committing.
 
+Transitions that change what the public sees accumulate the aggregation views
+they make stale in :attr:`PhenopacketStateService.stale_views`; callers hand
+them to the refresh scheduler once the transaction has committed.
+
 Spec reference:
   .planning/specs/2026-04-12-wave-7-d1-state-machine-design.md §6.
 """
@@ -21,6 +25,7 @@ from sqlalchemy import select
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.mv_refresh import views_affected_by
 from app.models.user import User
 from app.phenopackets.models import Phenopacket, PhenopacketRevision
 from app.phenopackets.services.transitions import (
@@ -61,6 +66,8 @@ class PhenopacketStateService:
     def __init__(self, db: AsyncSession) -> None:
         """Initialise with an async database session."""
         self.db = db
+        # Aggregation views made stale by transitions staged on this session.
+        self.stale_views: set[str] = set()
 
     @staticmethod
     def _canonicalize_for_persistence(
@@ -425,6 +432,9 @@ class PhenopacketStateService:
         advancement is gated by I8: only for never-published records OR on archive.
         """
         from_state = await self._effective_state(pp)
+        was_public = (
+            pp.state == "published" and pp.head_published_revision_id is not None
+        )
 
         # Compute the patch against the *previous transition's* content, not the
         # latest draft-in-progress row. After a clone + in-place save the latest
@@ -463,6 +473,8 @@ class PhenopacketStateService:
             # archive is terminal: clear both owner and edit pointer
             pp.draft_owner_id = None
             pp.editing_revision_id = None
+            if was_public:
+                self.stale_views |= views_affected_by(pp.phenopacket, None)
         else:
             # Update editing_revision_id to track the in-flight snapshot.
             # draft_owner_id is preserved through submit / withdraw / resubmit
@@ -500,6 +512,11 @@ class PhenopacketStateService:
         published_content = self._canonicalize_for_persistence(
             approved.content_jsonb, publish=True
         )
+        previous_head = (
+            await self.db.get(PhenopacketRevision, pp.head_published_revision_id)
+            if pp.head_published_revision_id is not None
+            else None
+        )
         published = await self._append_revision(
             pp,
             state="published",
@@ -518,4 +535,8 @@ class PhenopacketStateService:
         pp.editing_revision_id = None  # cleared on publish (§6.2 step 10)
         pp.draft_owner_id = None  # I5: cleared on publish
 
+        self.stale_views |= views_affected_by(
+            previous_head.content_jsonb if previous_head is not None else None,
+            published_content,
+        )
         return pp, published
@@ -10,7 +10,11 @@ Implementation Notes:
 - Ties handled naturally by KM formula (events at same time processed together)
 - Confidence intervals use log-log transformation (matches R's survfit default)
 - Variance uses Greenwood's formula
-- Log-rank test uses Mantel-Haenszel method (matches R's survdiff)
+- Log-rank test uses Mantel-Haenszel method (matches R's survdiff), for two
+  groups or for all k groups at once
+- Estimators are evaluated on NumPy arrays (sorted unique times, cumulative
+  at-risk/event counts), with in-order accumulation so results are identical
+  to the former per-time-point loops
 - p-values calculated using scipy's chi-square distribution (matches R's pchisq)
 
 Note on tie methods:
@@ -19,9 +23,10 @@ Note on tie methods:
 - Both R's survfit() and this implementation use the standard product-limit formula.
 """
 
-import math
 import re
-from typing import Optional
+from typing import Mapping, Optional, Sequence
+
+import numpy as np
 
 
 def parse_iso8601_age(iso8601_duration: Optional[str]) -> Optional[float]:
@@ -112,6 +117,39 @@ def parse_onset_ontology(ontology_class: dict) -> Optional[float]:
     return onset_mapping.get(hpo_id)
 
 
+def _as_arrays(
+    event_times: Sequence[tuple[float, bool]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Split ``(time, event)`` tuples into a float time and a bool event array."""
+    if not event_times:
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=bool)
+    times, events = zip(*event_times)
+    return np.asarray(times, dtype=np.float64), np.asarray(events, dtype=bool)
+
+
+def _risk_table(
+    times: np.ndarray, events: np.ndarray, grid: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Count subjects at risk and events at each time of a sorted *grid*.
+
+    Every time in *times* must occur in *grid*. At-risk counts are
+    ``#{t_i >= t}``, i.e. subjects with an event or censoring at ``t`` are
+    still at risk at ``t``.
+    """
+    at_risk = len(times) - np.searchsorted(np.sort(times), grid, side="left")
+    n_events = np.bincount(np.searchsorted(grid, times[events]), minlength=len(grid))
+    return at_risk.astype(np.int64), n_events.astype(np.int64)
+
+
+def _sequential_sum(values: np.ndarray) -> float:
+    """Sum left to right, as a Python accumulation loop would.
+
+    ``np.sum`` uses pairwise summation, which rounds differently; summing in
+    order keeps results bit-identical to the reference implementation.
+    """
+    return float(np.cumsum(values)[-1]) if len(values) else 0.0
+
+
 def calculate_kaplan_meier(event_times: list[tuple[float, bool]]) -> list[dict]:
     """Calculate Kaplan-Meier survival estimates with 95% confidence intervals.
 
@@ -123,6 +161,10 @@ def calculate_kaplan_meier(event_times: list[tuple[float, bool]]) -> list[dict]:
     - Confidence intervals use log-log transformation
     - Variance uses Greenwood's formula
 
+    The estimator is evaluated on arrays: sorted unique times, at-risk and
+    event counts per time, and cumulative products/sums in time order, so the
+    cost is one sort plus linear passes regardless of ties.
+
     Args:
         event_times: List of (time, event_occurred) tuples
             - time: Age at event or censoring (years)
@@ -154,109 +196,97 @@ def calculate_kaplan_meier(event_times: list[tuple[float, bool]]) -> list[dict]:
     if not event_times:
         return []
 
-    # Sort by time
-    sorted_data = sorted(event_times, key=lambda x: x[0])
-
-    # Group by unique time points
-    time_groups: dict[float, dict[str, int]] = {}
-    for time, event in sorted_data:
-        if time not in time_groups:
-            time_groups[time] = {"events": 0, "censored": 0}
-        if event:
-            time_groups[time]["events"] += 1
-        else:
-            time_groups[time]["censored"] += 1
-
-    # Calculate survival probability at each time point
-    result = []
-    n_at_risk = len(event_times)
-    survival_prob = 1.0
-    greenwood_sum = 0.0  # Cumulative sum for Greenwood's formula
+    times, events = _as_arrays(event_times)
+    unique_times, counts = np.unique(times, return_counts=True)
+    at_risk, d = _risk_table(times, events, unique_times)
+    censored = counts - d
+
+    # Product-limit estimator: S(t) = S(t-1) * (n - d) / n. Times without
+    # events contribute a factor of exactly 1.
+    has_events = d > 0
+    factors = np.ones(len(unique_times))
+    factors[has_events] = (at_risk[has_events] - d[has_events]) / at_risk[has_events]
+    survival = np.cumprod(factors)
+
+    # Greenwood's variance formula:
+    # Var(S(t)) = S(t)^2 * sum(d_i / (n_i * (n_i - d_i)))
+    greenwood_terms = np.zeros(len(unique_times))
+    finite = has_events & (at_risk > d)
+    greenwood_terms[finite] = d[finite] / (
+        at_risk[finite] * (at_risk[finite] - d[finite])
+    )
+    greenwood = np.cumsum(greenwood_terms)
+
+    # 95% CI using the log-log transformation (R survfit default,
+    # conf.type = "log-log"). Points with S(t) == 1 keep [1, 1].
+    ci_lower = np.ones(len(unique_times))
+    ci_upper = np.ones(len(unique_times))
+
+    # Survival has reached 0 (the final at-risk subject had an event). The
+    # log-log CI is undefined here, and leaving the initialized [1, 1] would
+    # ship an interval that does NOT contain its own point estimate (a
+    # degenerate last-event artifact). Collapse the interval to the estimate
+    # instead — [0, 0] — so the CI always contains S(t). (R's survfit returns
+    # NA; we keep a numeric bound so the API/chart contract stays float-only
+    # and the band converges cleanly to the endpoint.)
+    exhausted = survival <= 0
+    ci_lower[exhausted] = 0.0
+    ci_upper[exhausted] = 0.0
+
+    interior = (survival > 0) & (survival < 1) & (greenwood > 0)
+    if interior.any():
+        s = survival[interior]
+        se = s * np.sqrt(greenwood[interior])  # Standard error
+        z = 1.96  # 95% CI
+
+        log_s = np.log(s)
+        log_log_s = np.log(-log_s)
+        se_log_log = se / (s * np.abs(log_s))
+        with np.errstate(over="ignore"):
+            exp_upper_ll = np.exp(log_log_s + z * se_log_log)
+            exp_lower_ll = np.exp(log_log_s - z * se_log_log)
+            # Note: swap for correct bounds due to log-log transform
+            lower = np.clip(np.exp(-exp_upper_ll), 0.0, 1.0)
+            upper = np.clip(np.exp(-exp_lower_ll), 0.0, 1.0)
+        # Where the transform overflows, fall back to the widest interval.
+        overflow = ~(np.isfinite(exp_upper_ll) & np.isfinite(exp_lower_ll))
+        lower[overflow] = 0.0
+        upper[overflow] = 1.0
+        ci_lower[interior] = lower
+        ci_upper[interior] = upper
 
     # Start at time 0
-    result.append(
+    result = [
         {
             "time": 0.0,
             "survival_probability": 1.0,
             "ci_lower": 1.0,
             "ci_upper": 1.0,
-            "at_risk": n_at_risk,
+            "at_risk": len(event_times),
             "events": 0,
             "censored": 0,
         }
-    )
-
-    for time in sorted(time_groups.keys()):
-        group = time_groups[time]
-        d = group["events"]  # Number of events (deaths) at this time
-        censored = group["censored"]
-        n = n_at_risk  # Number at risk at this time
-
-        # Update survival probability using product-limit formula
-        # S(t) = S(t-1) * (n - d) / n
-        # This is the standard Kaplan-Meier estimator
-        if d > 0:
-            survival_prob *= (n - d) / n
-
-            # Greenwood's variance formula:
-            # Var(S(t)) = S(t)^2 * sum(d_i / (n_i * (n_i - d_i)))
-            if n > d:
-                greenwood_sum += d / (n * (n - d))
-
-        # Calculate 95% confidence interval using log-log transformation
-        # This matches R's survfit() default: conf.type = "log-log"
-        ci_lower = 1.0
-        ci_upper = 1.0
-
-        if survival_prob <= 0:
-            # Survival has reached 0 (the final at-risk subject had an event). The
-            # log-log CI is undefined here, and leaving the initialized [1, 1]
-            # would ship an interval that does NOT contain its own point estimate
-            # (a degenerate last-event artifact). Collapse the interval to the
-            # estimate instead — [0, 0] — so the CI always contains S(t). (R's
-            # survfit returns NA; we keep a numeric bound so the API/chart contract
-            # stays float-only and the band converges cleanly to the endpoint.)
-            ci_lower = 0.0
-            ci_upper = 0.0
-        elif survival_prob < 1 and greenwood_sum > 0:
-            se = survival_prob * math.sqrt(greenwood_sum)  # Standard error
-            z = 1.96  # 95% CI
-
-            # Log-log transformation for better CI at extreme probabilities
-            try:
-                log_log_s = math.log(-math.log(survival_prob))
-                se_log_log = se / (survival_prob * abs(math.log(survival_prob)))
-
-                ci_lower_ll = log_log_s - z * se_log_log
-                ci_upper_ll = log_log_s + z * se_log_log
-
-                # Note: swap for correct bounds due to log-log transform
-                ci_lower = math.exp(-math.exp(ci_upper_ll))
-                ci_upper = math.exp(-math.exp(ci_lower_ll))
-
-                # Clip to valid probability range
-                ci_lower = max(0.0, min(1.0, ci_lower))
-                ci_upper = max(0.0, min(1.0, ci_upper))
-            except (ValueError, OverflowError):
-                # Handle edge cases where log fails
-                ci_lower = 0.0
-                ci_upper = 1.0
-
+    ]
+    for time, prob, lo, hi, n, n_events, n_censored in zip(
+        unique_times.tolist(),
+        survival.tolist(),
+        ci_lower.tolist(),
+        ci_upper.tolist(),
+        at_risk.tolist(),
+        d.tolist(),
+        censored.tolist(),
+    ):
         result.append(
             {
                 "time": round(time, 2),
-                "survival_probability": round(survival_prob, 4),
-                "ci_lower": round(ci_lower, 4),
-                "ci_upper": round(ci_upper, 4),
+                "survival_probability": round(prob, 4),
+                "ci_lower": round(lo, 4),
+                "ci_upper": round(hi, 4),
                 "at_risk": n,
-                "events": d,
-                "censored": censored,
+                "events": n_events,
+                "censored": n_censored,
             }
         )
-
-        # Update number at risk for next time point
-        n_at_risk -= d + censored
-
     return result
 
 
@@ -283,53 +313,30 @@ def calculate_log_rank_test(
     """
     from scipy.stats import chi2
 
-    # Combine all unique event times
-    all_times = set()
-    for time, _ in group1_times + group2_times:
-        all_times.add(time)
-
-    observed_minus_expected = 0.0
-    variance = 0.0
-
-    # Create lookup for events at each time
-    g1_events = {
-        t: sum(1 for time, event in group1_times if time == t and event)
-        for t in all_times
-    }
-    g2_events = {
-        t: sum(1 for time, event in group2_times if time == t and event)
-        for t in all_times
-    }
-
-    for time in sorted(all_times):
-        # Number still at risk at this time
-        n1_risk = sum(1 for t, _ in group1_times if t >= time)
-        n2_risk = sum(1 for t, _ in group2_times if t >= time)
-        n_total = n1_risk + n2_risk
-
-        if n_total == 0:
-            continue
+    t1, e1 = _as_arrays(group1_times)
+    t2, e2 = _as_arrays(group2_times)
+    all_times = np.unique(np.concatenate((t1, t2)))
 
-        # Observed events
-        d1 = g1_events[time]
-        d2 = g2_events[time]
-        d_total = d1 + d2
+    n1_risk, d1 = _risk_table(t1, e1, all_times)
+    n2_risk, d2 = _risk_table(t2, e2, all_times)
+    n_total = n1_risk + n2_risk
+    d_total = d1 + d2
 
-        if d_total == 0:
-            continue
+    # Only times with at least one event contribute.
+    informative = d_total > 0
+    n1_risk, n2_risk = n1_risk[informative], n2_risk[informative]
+    n_total, d_total = n_total[informative], d_total[informative]
 
-        # Expected events in group 1
-        expected_d1 = (n1_risk / n_total) * d_total
+    # Observed minus expected events in group 1
+    expected_d1 = (n1_risk / n_total) * d_total
+    observed_minus_expected = _sequential_sum(d1[informative] - expected_d1)
 
-        # Update test statistic components
-        observed_minus_expected += d1 - expected_d1
-
-        # Variance component (hypergeometric variance)
-        if n_total > 1:
-            var_component = (n1_risk * n2_risk * d_total * (n_total - d_total)) / (
-                n_total * n_total * (n_total - 1)
-            )
-            variance += var_component
+    # Variance components (hypergeometric variance), defined where n > 1
+    multi = n_total > 1
+    var_components = (
+        n1_risk[multi] * n2_risk[multi] * d_total[multi] * (n_total - d_total)[multi]
+    ) / (n_total[multi] * n_total[multi] * (n_total[multi] - 1))
+    variance = _sequential_sum(var_components)
 
     # Calculate chi-square statistic
     if variance > 0:
@@ -352,6 +359,96 @@ def calculate_log_rank_test(
     }
 
 
+def calculate_multigroup_log_rank_test(
+    groups: Mapping[str, Sequence[tuple[float, bool]]],
+) -> dict:
+    """Test whether k survival curves differ, in a single pass over all groups.
+
+    Computes the k-sample log-rank (Mantel-Haenszel) statistic the way R's
+    ``survdiff()`` does: observed minus expected events per group, the
+    hypergeometric covariance matrix, and a chi-square statistic on k - 1
+    degrees of freedom. Groups with no expected events are dropped, as in R.
+    For two groups the statistic equals :func:`calculate_log_rank_test`.
+
+    Args:
+        groups: Group name -> event times [(time, event), ...]
+
+    Returns:
+        Dictionary with test results:
+        {
+            "statistic": float,   # Chi-square test statistic
+            "df": int,            # Degrees of freedom
+            "p_value": float,
+            "significant": bool,  # True if p < 0.05
+            "observed": {group: int},
+            "expected": {group: float},
+        }
+    """
+    from scipy.stats import chi2
+
+    names = list(groups)
+    arrays = [_as_arrays(groups[name]) for name in names]
+    all_times = np.unique(
+        np.concatenate([times for times, _ in arrays] or [np.empty(0)])
+    )
+
+    tables = [_risk_table(times, events, all_times) for times, events in arrays]
+    n_risk = np.array([n for n, _ in tables], dtype=np.float64).reshape(
+        len(names), len(all_times)
+    )
+    n_events = np.array([d for _, d in tables], dtype=np.float64).reshape(
+        len(names), len(all_times)
+    )
+    n_total = n_risk.sum(axis=0)
+    d_total = n_events.sum(axis=0)
+
+    informative = d_total > 0
+    n_risk, n_events = n_risk[:, informative], n_events[:, informative]
+    n_total, d_total = n_total[informative], d_total[informative]
+
+    observed = n_events.sum(axis=1)
+    expected = (n_risk * (d_total / n_total)).sum(axis=1)
+
+    # Cov(O_j, O_l) = sum_t w_t * n_jt * (n_t * [j == l] - n_lt), with
+    # w_t = d_t * (n_t - d_t) / (n_t^2 * (n_t - 1)) where n_t > 1.
+    weights = np.zeros_like(n_total)
+    multi = n_total > 1
+    weights[multi] = (d_total[multi] * (n_total[multi] - d_total[multi])) / (
+        n_total[multi] ** 2 * (n_total[multi] - 1)
+    )
+    weighted = n_risk * weights
+    covariance = np.diag((weighted * n_total).sum(axis=1)) - weighted @ n_risk.T
+
+    # Like survdiff, drop groups with no expected events, then one more group
+    # to make the covariance matrix non-singular.
+    keep = expected > 0
+    df = int(keep.sum()) - 1
+    chi_square = 0.0
+    if df >= 1:
+        diff = (observed - expected)[keep][1:]
+        cov = covariance[np.ix_(keep, keep)][1:, 1:]
+        try:
+            solved = np.linalg.solve(cov, diff)
+        except np.linalg.LinAlgError:
+            solved = np.linalg.pinv(cov) @ diff
+        chi_square = max(0.0, float(diff @ solved))
+    df = max(df, 0)
+
+    if chi_square == 0:
+        p_value = 1.0
+    else:
+        p_value = float(chi2.sf(chi_square, df=df))
+
+    return {
+        "statistic": round(chi_square, 4),
+        "df": df,
+        "p_value": round(p_value, 4),
+        "significant": p_value < 0.05,
+        "observed": {name: int(o) for name, o in zip(names, observed.tolist())},
+        "expected": {name: round(e, 4) for name, e in zip(names, expected.tolist())},
+    }
+
+
 def apply_bonferroni_correction(statistical_tests: list[dict]) -> list[dict]:
     """Apply Bonferroni correction to pairwise statistical tests.
 
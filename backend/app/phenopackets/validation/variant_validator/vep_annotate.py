@@ -16,6 +16,8 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
+from app.core.http_clients import http_clients
+
 # Cache + settings are looked up dynamically through the package
 # namespace so that the regression test suite can mock them with
 # ``patch("app.phenopackets.validation.variant_validator.cache")``
@@ -60,20 +62,18 @@ class VEPAnnotator:
         """
         try:
             vep_base_url = _vv_pkg.settings.external_apis.vep.base_url
-            vep_timeout = _vv_pkg.settings.external_apis.vep.timeout_seconds
             vep_url = f"{vep_base_url}/vep/human/hgvs/{hgvs_notation}"
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    vep_url,
-                    headers={"Content-Type": "application/json"},
-                    timeout=vep_timeout,
-                )
-                if response.status_code == 200:
-                    vep_data = response.json()
-                    return True, vep_data[0] if vep_data else None, []
-                if response.status_code == 400:
-                    return False, None, get_notation_suggestions(hgvs_notation)
-                return False, None, ["VEP service temporarily unavailable"]
+            client = http_clients.get("ensembl")
+            response = await client.get(
+                vep_url,
+                headers={"Content-Type": "application/json"},
+            )
+            if response.status_code == 200:
+                vep_data = response.json()
+                return True, vep_data[0] if vep_data else None, []
+            if response.status_code == 400:
+                return False, None, get_notation_suggestions(hgvs_notation)
+            return False, None, ["VEP service temporarily unavailable"]
         except (
             httpx.HTTPError,
             httpx.TimeoutException,
@@ -110,7 +110,6 @@ class VEPAnnotator:
 
         is_vcf = is_vcf_format(variant)
         vep_base_url = _vv_pkg.settings.external_apis.vep.base_url
-        vep_timeout = _vv_pkg.settings.external_apis.vep.timeout_seconds
 
         if is_vcf:
             vep_input = vcf_to_vep_format(variant)
@@ -138,67 +137,65 @@ class VEPAnnotator:
 
         for attempt in range(self._max_retries):
             try:
-                async with httpx.AsyncClient() as client:
-                    if method == "POST":
-                        response = await client.post(
-                            endpoint,
-                            json=json_data,
-                            params=params,
-                            headers={"Content-Type": "application/json"},
-                            timeout=vep_timeout,
-                        )
-                    else:
-                        response = await client.get(
-                            endpoint,
-                            params=params,
-                            headers={"Content-Type": "application/json"},
-                            timeout=vep_timeout,
+                client = http_clients.get("ensembl")
+                if method == "POST":
+                    response = await client.post(
+                        endpoint,
+                        json=json_data,
+                        params=params,
+                        headers={"Content-Type": "application/json"},
+                    )
+                else:
+                    response = await client.get(
+                        endpoint,
+                        params=params,
+                        headers={"Content-Type": "application/json"},
+                    )
+
+                check_rate_limit_headers(response.headers)
+
+                if response.status_code == 200:
+                    result = response.json()
+                    annotation = result[0] if isinstance(result, list) else result
+                    if _vv_pkg.settings.external_apis.vep.cache_enabled:
+                        await _vv_pkg.cache.set_json(
+                            cache_key, annotation, ttl=self._cache_ttl
                         )
+                    logger.info("VEP annotation successful for %s", variant)
+                    return annotation
 
-                    check_rate_limit_headers(response.headers)
-
-                    if response.status_code == 200:
-                        result = response.json()
-                        annotation = result[0] if isinstance(result, list) else result
-                        if _vv_pkg.settings.external_apis.vep.cache_enabled:
-                            await _vv_pkg.cache.set_json(
-                                cache_key, annotation, ttl=self._cache_ttl
-                            )
-                        logger.info("VEP annotation successful for %s", variant)
-                        return annotation
-
-                    if response.status_code == 429:
-                        retry_after = int(response.headers.get("Retry-After", 60))
-                        logger.warning("Rate limited, waiting %ss", retry_after)
-                        await asyncio.sleep(retry_after)
-                        continue
+                if response.status_code == 429:
+                    retry_after = int(response.headers.get("Retry-After", 60))
+                    logger.warning("Rate limited, waiting %ss", retry_after)
+                    await asyncio.sleep(retry_after)
+                    continue
+
+                if response.status_code == 400:
+                    logger.error("Invalid variant format: %s", variant)
+                    return None
 
-                    if response.status_code == 400:
-                        logger.error("Invalid variant format: %s", variant)
-                        return None
-
-                    if response.status_code in (500, 502, 503, 504):
-                        if attempt < self._max_retries - 1:
-                            backoff_time = self._backoff_factor**attempt
-                            logger.warning(
-                                "VEP API error %s, retrying in %ss (attempt %s/%s)",
-                                response.status_code,
-                                backoff_time,
-                                attempt + 1,
-                                self._max_retries,
-                            )
-                            await asyncio.sleep(backoff_time)
-                            continue
-                        logger.error(
-                            "VEP API error %s after %s retries",
+                if response.status_code in (500, 502, 503, 504):
+                    if attempt < self._max_retries - 1:
+                        backoff_time = self._backoff_factor**attempt
+                        logger.warning(
+                            "VEP API error %s, retrying in %ss (attempt %s/%s)",
                             response.status_code,
+                            backoff_time,
+                            attempt + 1,
                             self._max_retries,
                         )
-                        return None
-
-                    logger.error("Unexpected VEP API error %s", response.status_code)
+                        await asyncio.sleep(backoff_time)
+                        continue
+                    logger.error(
+                        "VEP API error %s after %s retries",
+                        response.status_code,
+                        self._max_retries,
+                    )
                     return None
 
+                logger.error("Unexpected VEP API error %s", response.status_code)
+                return None
+
             except httpx.TimeoutException:
                 if attempt < self._max_retries - 1:
                     backoff_time = self._backoff_factor**attempt
@@ -19,6 +19,8 @@ from typing import Any, Dict, List, Optional
 
 import httpx
 
+from app.core.http_clients import http_clients
+
 # Cache + settings are looked up dynamically through the package
 # namespace so that the regression test suite can mock them with
 # ``patch("app.phenopackets.validation.variant_validator.cache")``.
@@ -69,7 +71,6 @@ class VEPRecoder:
         await self._rate_limiter.acquire()
 
         vep_base_url = _vv_pkg.settings.external_apis.vep.base_url
-        vep_timeout = _vv_pkg.settings.external_apis.vep.timeout_seconds
 
         if is_vcf_format(variant):
             annotation = await self._annotator.annotate(variant)
@@ -91,65 +92,62 @@ class VEPRecoder:
 
         for attempt in range(self._max_retries):
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(
-                        endpoint,
-                        params=params,
-                        headers={"Content-Type": "application/json"},
-                        timeout=vep_timeout,
-                    )
-                    check_rate_limit_headers(response.headers)
-
-                    if response.status_code == 200:
-                        result = response.json()
-                        if not result or not isinstance(result, list):
-                            logger.error(
-                                "Invalid VEP recoder response for: %s", variant
-                            )
-                            return None
-                        recoded = result[0] if result else None
-                        if not recoded:
-                            logger.error("Empty VEP recoder response for: %s", variant)
-                            return None
-                        if _vv_pkg.settings.external_apis.vep.cache_enabled:
-                            await _vv_pkg.cache.set_json(
-                                cache_key, recoded, ttl=self._cache_ttl
-                            )
-                        logger.info("VEP recode successful for %s", variant)
-                        return recoded
-
-                    if response.status_code == 429:
-                        retry_after = int(response.headers.get("Retry-After", 60))
-                        logger.warning("Rate limited, waiting %ss", retry_after)
-                        await asyncio.sleep(retry_after)
-                        continue
+                client = http_clients.get("ensembl")
+                response = await client.get(
+                    endpoint,
+                    params=params,
+                    headers={"Content-Type": "application/json"},
+                )
+                check_rate_limit_headers(response.headers)
 
-                    if response.status_code == 400:
-                        logger.error("Invalid variant format for recoding: %s", variant)
+                if response.status_code == 200:
+                    result = response.json()
+                    if not result or not isinstance(result, list):
+                        logger.error("Invalid VEP recoder response for: %s", variant)
+                        return None
+                    recoded = result[0] if result else None
+                    if not recoded:
+                        logger.error("Empty VEP recoder response for: %s", variant)
                         return None
+                    if _vv_pkg.settings.external_apis.vep.cache_enabled:
+                        await _vv_pkg.cache.set_json(
+                            cache_key, recoded, ttl=self._cache_ttl
+                        )
+                    logger.info("VEP recode successful for %s", variant)
+                    return recoded
+
+                if response.status_code == 429:
+                    retry_after = int(response.headers.get("Retry-After", 60))
+                    logger.warning("Rate limited, waiting %ss", retry_after)
+                    await asyncio.sleep(retry_after)
+                    continue
 
-                    if response.status_code in (500, 502, 503, 504):
-                        if attempt < self._max_retries - 1:
-                            backoff_time = self._backoff_factor**attempt
-                            logger.warning(
-                                "VEP recoder API error %s, retrying in %ss",
-                                response.status_code,
-                                backoff_time,
-                            )
-                            await asyncio.sleep(backoff_time)
-                            continue
-                        logger.error(
-                            "VEP recoder API error %s after retries",
+                if response.status_code == 400:
+                    logger.error("Invalid variant format for recoding: %s", variant)
+                    return None
+
+                if response.status_code in (500, 502, 503, 504):
+                    if attempt < self._max_retries - 1:
+                        backoff_time = self._backoff_factor**attempt
+                        logger.warning(
+                            "VEP recoder API error %s, retrying in %ss",
                             response.status_code,
+                            backoff_time,
                         )
-                        return None
-
+                        await asyncio.sleep(backoff_time)
+                        continue
                     logger.error(
-                        "Unexpected VEP recoder API error %s",
+                        "VEP recoder API error %s after retries",
                         response.status_code,
                     )
                     return None
 
+                logger.error(
+                    "Unexpected VEP recoder API error %s",
+                    response.status_code,
+                )
+                return None
+
             except httpx.TimeoutException:
                 if attempt < self._max_retries - 1:
                     backoff_time = self._backoff_factor**attempt
@@ -261,7 +259,6 @@ class VEPRecoder:
         await self._rate_limiter.acquire()
 
         vep_base_url = _vv_pkg.settings.external_apis.vep.base_url
-        vep_timeout = _vv_pkg.settings.external_apis.vep.timeout_seconds
 
         endpoint = f"{vep_base_url}/variant_recoder/homo_sapiens"
         params: Dict[str, Any] = {
@@ -273,74 +270,71 @@ class VEPRecoder:
 
         for attempt in range(self._max_retries):
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        endpoint,
-                        json={"ids": uncached_variants},
-                        params=params,
-                        headers={"Content-Type": "application/json"},
-                        timeout=vep_timeout,
+                client = http_clients.get("ensembl")
+                response = await client.post(
+                    endpoint,
+                    json={"ids": uncached_variants},
+                    params=params,
+                    headers={"Content-Type": "application/json"},
+                )
+                check_rate_limit_headers(response.headers)
+
+                if response.status_code == 200:
+                    api_results = response.json()
+                    for item in api_results:
+                        input_variant = item.get("input")
+                        if input_variant:
+                            if _vv_pkg.settings.external_apis.vep.cache_enabled:
+                                cache_key = f"vep:recode:{input_variant}"
+                                await _vv_pkg.cache.set_json(
+                                    cache_key, item, ttl=self._cache_ttl
+                                )
+                            results[input_variant] = item
+                    for v in uncached_variants:
+                        results.setdefault(v, None)
+                    success_count = len([r for r in results.values() if r])
+                    logger.info(
+                        "Batch recoded %s/%s variants",
+                        success_count,
+                        len(uncached_variants),
                     )
-                    check_rate_limit_headers(response.headers)
-
-                    if response.status_code == 200:
-                        api_results = response.json()
-                        for item in api_results:
-                            input_variant = item.get("input")
-                            if input_variant:
-                                if _vv_pkg.settings.external_apis.vep.cache_enabled:
-                                    cache_key = f"vep:recode:{input_variant}"
-                                    await _vv_pkg.cache.set_json(
-                                        cache_key, item, ttl=self._cache_ttl
-                                    )
-                                results[input_variant] = item
-                        for v in uncached_variants:
-                            results.setdefault(v, None)
-                        success_count = len([r for r in results.values() if r])
-                        logger.info(
-                            "Batch recoded %s/%s variants",
-                            success_count,
-                            len(uncached_variants),
-                        )
-                        return results
+                    return results
 
-                    if response.status_code == 429:
-                        retry_after = int(response.headers.get("Retry-After", 60))
-                        logger.warning("Rate limited, waiting %ss", retry_after)
-                        await asyncio.sleep(retry_after)
-                        continue
+                if response.status_code == 429:
+                    retry_after = int(response.headers.get("Retry-After", 60))
+                    logger.warning("Rate limited, waiting %ss", retry_after)
+                    await asyncio.sleep(retry_after)
+                    continue
 
-                    if response.status_code == 400:
-                        logger.error("Invalid variants in batch: %s", uncached_variants)
-                        for v in uncached_variants:
-                            results[v] = None
-                        return results
-
-                    if response.status_code in (500, 502, 503, 504):
-                        if attempt < self._max_retries - 1:
-                            backoff_time = self._backoff_factor**attempt
-                            logger.warning(
-                                "VEP recoder API error %s, retrying in %ss",
-                                response.status_code,
-                                backoff_time,
-                            )
-                            await asyncio.sleep(backoff_time)
-                            continue
-                        logger.error(
-                            "VEP recoder batch failed after retries: %s",
+                if response.status_code == 400:
+                    logger.error("Invalid variants in batch: %s", uncached_variants)
+                    for v in uncached_variants:
+                        results[v] = None
+                    return results
+
+                if response.status_code in (500, 502, 503, 504):
+                    if attempt < self._max_retries - 1:
+                        backoff_time = self._backoff_factor**attempt
+                        logger.warning(
+                            "VEP recoder API error %s, retrying in %ss",
                             response.status_code,
+                            backoff_time,
                         )
-                        for v in uncached_variants:
-                            results[v] = None
-                        return results
-
+                        await asyncio.sleep(backoff_time)
+                        continue
                     logger.error(
-                        "Unexpected VEP recoder error: %s", response.status_code
+                        "VEP recoder batch failed after retries: %s",
+                        response.status_code,
                     )
                     for v in uncached_variants:
                         results[v] = None
                     return results
 
+                logger.error("Unexpected VEP recoder error: %s", response.status_code)
+                for v in uncached_variants:
+                    results[v] = None
+                return results
+
             except httpx.TimeoutException:
                 if attempt < self._max_retries - 1:
                     backoff_time = self._backoff_factor**attempt
@@ -12,7 +12,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.database import get_db
 from app.publications.fulltext.embeddings import (
+    CachedQueryEmbeddingProvider,
     EmbeddingProvider,
+    MicroBatchingEmbeddingProvider,
     get_embedding_provider,
 )
 from app.publications.fulltext.retrieval import (
@@ -29,7 +31,9 @@ router = APIRouter(tags=["publications"])
 
 # Lazily-built, process-wide embedding provider. Building it loads the model
 # (seconds), so we cache the single instance. ``None`` means the optional
-# embedding backend is not installed and the dense leg is disabled.
+# embedding backend is not installed and the dense leg is disabled. Query
+# encodes go through the shared query vector cache, and its misses are
+# micro-batched across concurrent requests.
 _PROVIDER_CACHE: dict[str, Optional[EmbeddingProvider]] = {}
 
 
@@ -37,12 +41,17 @@ def _shared_provider() -> Optional[EmbeddingProvider]:
     """Return the cached embedding provider, or ``None`` when unavailable."""
     if "provider" not in _PROVIDER_CACHE:
         rag = settings.publications_rag
-        _PROVIDER_CACHE["provider"] = get_embedding_provider(
+        provider = get_embedding_provider(
             model_name=rag.embedding_model,
             query_prefix=rag.embedding_query_prefix,
             batch_size=rag.embedding_batch_size,
             dim=rag.embedding_dim,
         )
+        _PROVIDER_CACHE["provider"] = (
+            CachedQueryEmbeddingProvider(MicroBatchingEmbeddingProvider(provider))
+            if provider is not None
+            else None
+        )
     return _PROVIDER_CACHE["provider"]
 
 
@@ -158,6 +158,9 @@ class SyncResponse(BaseModel):
 
     status: str = Field(..., description="Status of the operation")
     message: str = Field(..., description="Human-readable message")
+    task_id: Optional[str] = Field(
+        None, description="Admin task id for progress polling"
+    )
     total_pmids: Optional[int] = Field(None, description="Total PMIDs to sync")
     already_stored: Optional[int] = Field(None, description="PMIDs already stored")
     to_fetch: Optional[int] = Field(None, description="PMIDs to fetch from PubMed")
@@ -5,15 +5,20 @@
 from __future__ import annotations
 
 import logging
+from typing import Optional
 
 import aiohttp
 from fastapi import APIRouter, BackgroundTasks, Depends
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.admin.task_state import SyncTaskStore, TaskKind, get_sync_task_store
 from app.auth import require_admin
+from app.core.aggregation_cache import bump_published_data_version
 from app.core.config import settings
 from app.database import async_session_maker, get_db
+from app.publications.fulltext import sync_jobs
+from app.publications.fulltext.orchestrator import SyncCounts
 from app.publications.fulltext.orchestrator import (
     sync_publications as run_publication_sync,
 )
@@ -26,7 +31,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(tags=["publications"])
 
 
-async def _sync_publications_background() -> None:
+async def _sync_publications_background(task_id: str, store: SyncTaskStore) -> None:
     """Background task to sync publication abstracts + open-access full text.
 
     Opens its own database session via ``async_session_maker`` — the
@@ -34,46 +39,102 @@ async def _sync_publications_background() -> None:
     ``BackgroundTasks`` fires, so reusing it would fail on the first query.
 
     1. Get all unique PMIDs referenced by published phenopackets.
-    2. Ensure base citation metadata (title/authors/...) via the PubMed service.
-    3. Fetch abstracts (efetch) + license-gated open-access full text, chunk
-       into passages, and persist — with per-PMID error isolation.
+    2. Open a persisted sync job, resuming one a dead worker left unfinished.
+    3. Ensure base citation metadata (title/authors/...) via the PubMed service.
+    4. Fetch abstracts (efetch) + license-gated open-access full text, chunk
+       into passages, and persist — with per-PMID error isolation and a
+       checkpoint per PMID. Progress, throughput and ETA go to the admin task
+       store under ``task_id``.
     """
     logger.info("Starting background publication full-text sync")
 
     async with async_session_maker() as db:
-        query = text("""
-            SELECT DISTINCT REPLACE(ext_ref->>'id', 'PMID:', '') as pmid
-            FROM phenopackets,
-                 jsonb_array_elements(phenopacket->'metaData'->'externalReferences') as ext_ref
-            WHERE ext_ref->>'id' LIKE 'PMID:%'
-              AND deleted_at IS NULL
-        """)
-        result = await db.execute(query)
-        all_pmids = [row.pmid for row in result.fetchall()]
-        logger.info("Found %s unique PMIDs in phenopackets", len(all_pmids))
+        job: Optional[sync_jobs.SyncJob] = None
 
         async def _ensure_metadata(pmid: str) -> None:
             # Populate title/authors/journal/year/doi via the existing PubMed
             # (esummary) service; process_publication then fills abstract +
             # coverage. Cached PMIDs are not re-fetched.
-            await get_publication_metadata(pmid, db, fetched_by="sync")
+            await get_publication_metadata(
+                pmid, db, fetched_by="sync", invalidate_aggregations=False
+            )
+
+        async def _report(counts: SyncCounts) -> None:
+            await store.update_counts(
+                task_id,
+                processed=counts.resumed + counts.processed,
+                errors=counts.errors,
+                skipped=counts.resumed,
+            )
+
+        try:
+            await store.mark_running(task_id)
+            query = text("""
+                SELECT DISTINCT REPLACE(ext_ref->>'id', 'PMID:', '') as pmid
+                FROM phenopackets,
+                     jsonb_array_elements(phenopacket->'metaData'->'externalReferences') as ext_ref
+                WHERE ext_ref->>'id' LIKE 'PMID:%'
+                  AND deleted_at IS NULL
+            """)
+            result = await db.execute(query)
+            all_pmids = sorted(
+                (row.pmid for row in result.fetchall()),
+                key=lambda p: int(p) if p.isdigit() else 0,
+            )
+            logger.info("Found %s unique PMIDs in phenopackets", len(all_pmids))
 
-        async with aiohttp.ClientSession() as session:
-            counts = await run_publication_sync(
+            job = await sync_jobs.open_sync_job(
                 db,
-                all_pmids,
-                session=session,
-                allowed_licenses=settings.publications_rag.allowed_licenses,
-                chunk_max_tokens=settings.publications_rag.chunk_max_tokens,
-                chunk_overlap_tokens=settings.publications_rag.chunk_overlap_tokens,
-                abstract_api_key=settings.PUBMED_API_KEY,
-                ensure_metadata=_ensure_metadata,
+                source="admin",
+                total=len(all_pmids),
+                task_id=task_id,
+                stale_after_seconds=settings.publications_rag.sync_job_stale_seconds,
+                max_resume_age_seconds=(
+                    settings.publications_rag.sync_job_resume_max_age_seconds
+                ),
             )
+            await store.update_counts(task_id, processed=0, total=len(all_pmids))
+
+            async with aiohttp.ClientSession() as session:
+                counts = await run_publication_sync(
+                    db,
+                    all_pmids,
+                    session=session,
+                    allowed_licenses=settings.publications_rag.allowed_licenses,
+                    chunk_max_tokens=settings.publications_rag.chunk_max_tokens,
+                    chunk_overlap_tokens=settings.publications_rag.chunk_overlap_tokens,
+                    abstract_api_key=settings.PUBMED_API_KEY,
+                    ensure_metadata=_ensure_metadata,
+                    job=job,
+                    on_progress=_report,
+                )
+        except Exception as exc:  # noqa: BLE001 - leave the job resumable
+            # End-of-task failure handler: the job (if one was opened) is
+            # marked failed so the next sync resumes it instead of starting
+            # over, and the task never stays stuck in "running".
+            await db.rollback()
+            if job is not None:
+                await sync_jobs.finish_sync_job(db, job, error=str(exc))
+            await store.fail(task_id, str(exc))
+            logger.error("Publication full-text sync failed: %s", exc)
+            return
+        finally:
+            # Metadata stored by this run (even a failed one) feeds the
+            # publication aggregations; invalidate them once per run.
+            if job is not None:
+                await bump_published_data_version()
+
+        await sync_jobs.finish_sync_job(db, job)
+        await _report(counts)
+        await store.complete(task_id)
 
         logger.info(
             "Publication full-text sync complete",
             extra={
+                "job_id": job.id,
+                "resumed": counts.resumed,
                 "processed": counts.processed,
+                "unchanged": counts.unchanged,
                 "abstracts_fetched": counts.abstracts_fetched,
                 "full_text_fetched": counts.full_text_fetched,
                 "license_skipped": counts.license_skipped,
@@ -96,9 +157,13 @@ async def _sync_publications_background() -> None:
     2. Filter out already-stored entries
     3. Queue background task to fetch remaining from PubMed
     4. Respects PubMed rate limits (3 req/sec without API key)
+    5. Checkpoints every PMID, so a sync interrupted by a worker restart
+       resumes where it stopped and unchanged publications are not rewritten
 
     **Note:** This is an async operation. The endpoint returns immediately
-    and fetching continues in the background.
+    and fetching continues in the background. Progress, throughput and ETA
+    are available from ``GET /api/v2/admin/sync/publications/fulltext/status``
+    with the returned ``task_id``.
     """,
     dependencies=[Depends(require_admin)],
 )
@@ -126,15 +191,23 @@ async def sync_publications(
 
     to_fetch = max(0, total_pmids - already_stored)
 
-    background_tasks.add_task(_sync_publications_background)
+    store = get_sync_task_store()
+    state = await store.create(TaskKind.FULLTEXT, total=total_pmids)
+    background_tasks.add_task(_sync_publications_background, state.task_id, store)
 
     logger.info(
         "Publication sync initiated",
-        extra={"total": total_pmids, "stored": already_stored, "to_fetch": to_fetch},
+        extra={
+            "task_id": state.task_id,
+            "total": total_pmids,
+            "stored": already_stored,
+            "to_fetch": to_fetch,
+        },
     )
 
     return SyncResponse(
         status="sync_started",
+        task_id=state.task_id,
         message=f"Background sync initiated for {to_fetch} publications",
         total_pmids=total_pmids,
         already_stored=already_stored,
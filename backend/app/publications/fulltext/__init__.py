@@ -17,6 +17,7 @@ Module map:
 - :mod:`.types`           — shared dataclasses and the canonical section taxonomy.
 - :mod:`.abstract_client` — NCBI efetch abstract fetch + XML parsing.
 - :mod:`.fulltext_client` — PMCID resolution, PubTator BioC / EuropePMC fetch + parse.
+- :mod:`.rate_limit`      — shared per-host token buckets for the fetch clients.
 - :mod:`.coverage`        — license gate + coverage tiering.
 - :mod:`.chunking`        — 510/50 section-bounded token windows + offset recovery.
 - :mod:`.embeddings`      — embedding provider protocol + Fake/ST impls.
@@ -12,6 +12,7 @@ The async wrapper performs I/O and is integration-tested by the orchestrator.
 
 from __future__ import annotations
 
+import asyncio
 import html
 import logging
 from typing import TYPE_CHECKING, Optional, Union
@@ -25,6 +26,8 @@ if TYPE_CHECKING:
 
     import aiohttp
 
+    from app.publications.fulltext.rate_limit import TokenBucket
+
 logger = logging.getLogger(__name__)
 
 #: Blank-line separator between abstract blocks (kept out of docstrings to
@@ -161,6 +164,7 @@ async def fetch_abstracts(
     api_key: Optional[str] = None,
     batch_size: int = 100,
     timeout: float = 30.0,
+    limiter: Optional[TokenBucket] = None,
 ) -> dict[str, AbstractResult]:
     """Fetch and parse PubMed abstracts in batched efetch POST requests.
 
@@ -171,6 +175,7 @@ async def fetch_abstracts(
         api_key: Optional NCBI API key added to the request parameters.
         batch_size: Maximum number of PMIDs sent per request.
         timeout: Per-request timeout in seconds.
+        limiter: Optional host rate limiter acquired before each request.
 
     Returns:
         A mapping from normalized PMID to its
@@ -195,6 +200,8 @@ async def fetch_abstracts(
         }
         if api_key:
             params["api_key"] = api_key
+        if limiter is not None:
+            await limiter.acquire()
         async with session.post(
             base_url,
             data=params,
@@ -212,5 +219,5 @@ async def fetch_abstracts(
                 )
                 continue
             xml = await response.text()
-        merged.update(parse_efetch_xml(xml))
+        merged.update(await asyncio.to_thread(parse_efetch_xml, xml))
     return merged
@@ -0,0 +1,242 @@
+"""Offline recall/latency benchmark for the pgvector HNSW dense leg.
+
+Builds a synthetic corpus of :class:`FakeEmbeddingProvider` vectors in a
+temporary table with the same HNSW index as ``publication_fulltext_embeddings``,
+computes exact (brute-force) nearest neighbours for a set of queries, and then
+reports recall@k and latency percentiles of the HNSW scan for each
+``ef_search`` value, optionally under a selective filter (answered with the
+configured ``hnsw_iterative_scan``). Nothing is committed: the temporary table
+and every setting are discarded by a rollback at the end.
+
+Driven by ``scripts/benchmark_dense_recall.py``; the pure helpers
+(:func:`recall_at_k`, :func:`percentile`) are unit-tested on their own.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.publications.fulltext.embeddings import FakeEmbeddingProvider
+from app.publications.fulltext.persistence import to_vector_literal
+from app.publications.fulltext.retrieval import set_hnsw_search_params
+
+_TABLE = "ann_benchmark_vectors"
+
+
+@dataclass
+class AnnBenchmarkResult:
+    """Recall and latency of one search configuration.
+
+    Attributes:
+        ef_search: HNSW ``ef_search``, or ``None`` for the exact baseline.
+        filtered: Whether queries were restricted to one filter group.
+        k: Neighbours requested per query.
+        recall_at_k: Mean fraction of the exact top-k found.
+        p50_ms: Median query latency in milliseconds.
+        p95_ms: 95th percentile query latency in milliseconds.
+        p99_ms: 99th percentile query latency in milliseconds.
+    """
+
+    ef_search: Optional[int]
+    filtered: bool
+    k: int
+    recall_at_k: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+def recall_at_k(found: Sequence[int], exact: Sequence[int], k: int) -> float:
+    """Return the fraction of the exact top-``k`` ids present in ``found[:k]``.
+
+    Args:
+        found: Ids returned by the approximate search, best-first.
+        exact: Ids returned by exact search, best-first.
+        k: Cut-off.
+
+    Returns:
+        Recall in ``[0, 1]``; ``1.0`` when the exact result is empty.
+    """
+    truth = set(exact[:k])
+    if not truth:
+        return 1.0
+    return len(truth.intersection(found[:k])) / len(truth)
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Return the ``q``-th percentile of ``samples`` (nearest-rank method).
+
+    Args:
+        samples: Observations.
+        q: Percentile in ``(0, 100]``.
+
+    Returns:
+        The percentile, or ``0.0`` for no samples.
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+async def _seed_corpus(
+    db: AsyncSession,
+    provider: FakeEmbeddingProvider,
+    *,
+    corpus_size: int,
+    filter_groups: int,
+    m: int,
+    ef_construction: int,
+) -> None:
+    """Create the temporary vector table, fill it and build its HNSW index."""
+    await db.execute(
+        text(
+            f"CREATE TEMPORARY TABLE {_TABLE} "
+            "(id INTEGER PRIMARY KEY, grp INTEGER NOT NULL, "
+            f"embedding vector({provider.dim}) NOT NULL)"
+        )
+    )
+    batch = 1000
+    for start in range(0, corpus_size, batch):
+        ids = list(range(start, min(start + batch, corpus_size)))
+        vectors = await provider.embed([f"benchmark passage {i}" for i in ids])
+        await db.execute(
+            text(
+                f"INSERT INTO {_TABLE} (id, grp, embedding) "
+                "SELECT u.id, mod(u.id, :groups), CAST(u.embedding AS vector) "
+                "FROM unnest(CAST(:ids AS integer[]), CAST(:vectors AS text[])) "
+                "AS u(id, embedding)"
+            ),
+            {
+                "ids": ids,
+                "vectors": [to_vector_literal(v) for v in vectors],
+                "groups": max(filter_groups, 1),
+            },
+        )
+    await db.execute(
+        text(
+            f"CREATE INDEX ON {_TABLE} USING hnsw (embedding vector_cosine_ops) "
+            f"WITH (m = {int(m)}, ef_construction = {int(ef_construction)})"
+        )
+    )
+    await db.execute(text(f"ANALYZE {_TABLE}"))
+
+
+async def _timed_search(
+    db: AsyncSession,
+    qvecs: Sequence[str],
+    *,
+    k: int,
+    filtered: bool,
+) -> tuple[list[list[int]], list[float]]:
+    """Run one top-``k`` query per vector; return ids and latencies (ms)."""
+    where = "WHERE grp = 0 " if filtered else ""
+    stmt = text(
+        f"SELECT id FROM {_TABLE} {where}"
+        "ORDER BY embedding <=> CAST(:qvec AS vector) LIMIT :k"
+    )
+    ids: list[list[int]] = []
+    latencies: list[float] = []
+    for qvec in qvecs:
+        started = time.perf_counter()
+        result = await db.execute(stmt, {"qvec": qvec, "k": k})
+        ids.append([row.id for row in result.fetchall()])
+        latencies.append((time.perf_counter() - started) * 1000)
+    return ids, latencies
+
+
+def _summarize(
+    ef_search: Optional[int],
+    filtered: bool,
+    k: int,
+    found: list[list[int]],
+    exact: list[list[int]],
+    latencies: list[float],
+) -> AnnBenchmarkResult:
+    recalls = [recall_at_k(f, e, k) for f, e in zip(found, exact)]
+    return AnnBenchmarkResult(
+        ef_search=ef_search,
+        filtered=filtered,
+        k=k,
+        recall_at_k=sum(recalls) / len(recalls) if recalls else 1.0,
+        p50_ms=percentile(latencies, 50),
+        p95_ms=percentile(latencies, 95),
+        p99_ms=percentile(latencies, 99),
+    )
+
+
+async def run_ann_benchmark(
+    db: AsyncSession,
+    *,
+    corpus_size: int = 5000,
+    query_count: int = 100,
+    k: int = 10,
+    ef_search_values: Sequence[int] = (40, 100, 200),
+    filter_groups: int = 0,
+    iterative_scan: str = "strict_order",
+    dim: int = 384,
+    m: int = 16,
+    ef_construction: int = 64,
+) -> list[AnnBenchmarkResult]:
+    """Benchmark HNSW recall@k and latency against exact search.
+
+    Args:
+        db: The async session; its transaction is rolled back on return.
+        corpus_size: Synthetic vectors to index.
+        query_count: Queries to run per configuration.
+        k: Neighbours per query.
+        ef_search_values: HNSW ``ef_search`` settings to measure.
+        filter_groups: When positive, rows are split into this many groups
+            and every configuration is also measured restricted to one group
+            (selectivity ``1 / filter_groups``).
+        iterative_scan: ``hnsw.iterative_scan`` mode for the filtered runs.
+        dim: Vector dimensionality.
+        m: HNSW ``m`` build parameter (pgvector default 16).
+        ef_construction: HNSW ``ef_construction`` (pgvector default 64).
+
+    Returns:
+        One exact baseline row and one row per ``ef_search`` value, for the
+        unfiltered and (when ``filter_groups > 0``) the filtered case.
+    """
+    provider = FakeEmbeddingProvider(dim=dim)
+    query_vectors = await provider.embed(
+        [f"benchmark query {i}" for i in range(query_count)], is_query=True
+    )
+    qvecs = [to_vector_literal(v) for v in query_vectors]
+    results: list[AnnBenchmarkResult] = []
+    try:
+        await _seed_corpus(
+            db,
+            provider,
+            corpus_size=corpus_size,
+            filter_groups=filter_groups,
+            m=m,
+            ef_construction=ef_construction,
+        )
+        for filtered in (False, True) if filter_groups > 0 else (False,):
+            await db.execute(text("SELECT set_config('enable_indexscan', 'off', true)"))
+            exact, latencies = await _timed_search(db, qvecs, k=k, filtered=filtered)
+            results.append(_summarize(None, filtered, k, exact, exact, latencies))
+            await db.execute(text("SELECT set_config('enable_indexscan', 'on', true)"))
+            for ef_search in ef_search_values:
+                await set_hnsw_search_params(
+                    db,
+                    ef_search=ef_search,
+                    iterative_scan=iterative_scan if filtered else "off",
+                )
+                found, latencies = await _timed_search(
+                    db, qvecs, k=k, filtered=filtered
+                )
+                results.append(
+                    _summarize(ef_search, filtered, k, found, exact, latencies)
+                )
+    finally:
+        await db.rollback()
+    return results
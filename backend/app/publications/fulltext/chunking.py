@@ -10,12 +10,23 @@ text is never re-detokenized. The real BGE tokenizer is used only when the
 optional ``tokenizers`` / ``transformers`` libraries are importable; otherwise
 a deterministic regex tokenizer is used. Because the corpus is small and lexical
 full-text search dominates retrieval, the regex fallback is fully sufficient.
+
+:func:`chunk_sections` chunks all sections of an article from one batched
+tokenizer call (a single fast-tokenizer invocation on the BGE path), and every
+overlapping window of a section slices the same offset list.
+:class:`CachingTokenizer` keeps those offsets in a bounded LRU keyed on the
+SHA-256 of the text, so re-syncing an unchanged article skips tokenization;
+:func:`get_cached_tokenizer` returns the process-wide instance.
 """
 
 from __future__ import annotations
 
+import hashlib
 import re
-from typing import Protocol
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Protocol, Sequence
 
 from app.publications.fulltext.types import Chunk
 
@@ -62,6 +73,17 @@ class _RegexTokenizer:
         """
         return [(m.start(), m.end()) for m in _TOKEN_RE.finditer(text)]
 
+    def offsets_batch(self, texts: Sequence[str]) -> list[list[tuple[int, int]]]:
+        """Return token character spans for each of ``texts``.
+
+        Args:
+            texts: The texts to tokenize.
+
+        Returns:
+            One span list per text, in input order.
+        """
+        return [self.offsets(text) for text in texts]
+
 
 class _BgeTokenizer:
     """Wraps a HuggingFace fast tokenizer and exposes character offsets.
@@ -97,6 +119,131 @@ class _BgeTokenizer:
         mapping = encoding["offset_mapping"]
         return [(int(start), int(end)) for start, end in mapping if end > start]
 
+    def offsets_batch(self, texts: Sequence[str]) -> list[list[tuple[int, int]]]:
+        """Return token character spans for each of ``texts`` in one call.
+
+        A fast tokenizer encodes a batch in parallel in native code, so an
+        article's sections cost one call instead of one per section.
+
+        Args:
+            texts: The texts to tokenize.
+
+        Returns:
+            One span list per text, in input order, special tokens removed.
+        """
+        if not texts:
+            return []
+        encoding = self._tokenizer(  # type: ignore[operator]
+            list(texts),
+            add_special_tokens=False,
+            return_offsets_mapping=True,
+        )
+        return [
+            [(int(start), int(end)) for start, end in mapping if end > start]
+            for mapping in encoding["offset_mapping"]
+        ]
+
+
+def batch_offsets(
+    tokenizer: TokenCounter, texts: Sequence[str]
+) -> list[list[tuple[int, int]]]:
+    """Tokenize ``texts`` in one batched call when the tokenizer supports it.
+
+    Args:
+        tokenizer: Any :class:`TokenCounter`; one exposing ``offsets_batch``
+            is called once, others once per text.
+        texts: The texts to tokenize.
+
+    Returns:
+        One span list per text, in input order.
+    """
+    offsets_batch = getattr(tokenizer, "offsets_batch", None)
+    if offsets_batch is not None:
+        return offsets_batch(texts)
+    return [tokenizer.offsets(text) for text in texts]
+
+
+class CachingTokenizer:
+    """Bounded, thread-safe LRU of token offsets in front of a tokenizer.
+
+    Entries are keyed on the SHA-256 of the text and hold the offsets as a
+    flat unsigned-int array (start, end, start, end, ...), several times
+    smaller than a list of tuples. Misses in a batch are tokenized together in
+    one ``offsets_batch`` call. Hit and miss counters are kept for monitoring.
+    """
+
+    def __init__(self, tokenizer: TokenCounter, *, max_entries: int = 2048) -> None:
+        """Wrap ``tokenizer``.
+
+        Args:
+            tokenizer: The tokenizer whose results are cached.
+            max_entries: Maximum cached texts; ``0`` disables caching.
+        """
+        self._tokenizer = tokenizer
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, array] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def offsets(self, text: str) -> list[tuple[int, int]]:
+        """Return token character spans for ``text``, from the cache if present."""
+        return self.offsets_batch([text])[0]
+
+    def offsets_batch(self, texts: Sequence[str]) -> list[list[tuple[int, int]]]:
+        """Return token character spans for each of ``texts``.
+
+        Args:
+            texts: The texts to tokenize.
+
+        Returns:
+            One span list per text, in input order.
+        """
+        keys = [hashlib.sha256(text.encode("utf-8")).hexdigest() for text in texts]
+        found: dict[str, array] = {}
+        with self._lock:
+            for key in keys:
+                packed = self._entries.get(key)
+                if packed is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = packed
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                missing.setdefault(key, text)
+        with self._lock:
+            self.hits += len(texts) - len(missing)
+            self.misses += len(missing)
+        if missing:
+            computed = batch_offsets(self._tokenizer, list(missing.values()))
+            with self._lock:
+                for key, spans in zip(missing, computed):
+                    packed = array("I", [offset for span in spans for offset in span])
+                    found[key] = packed
+                    if self.max_entries > 0:
+                        self._entries[key] = packed
+                        self._entries.move_to_end(key)
+                while len(self._entries) > max(self.max_entries, 0):
+                    self._entries.popitem(last=False)
+        return [list(zip(found[key][0::2], found[key][1::2])) for key in keys]
+
+    def clear(self) -> None:
+        """Drop every cached entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_status(self) -> dict[str, Any]:
+        """Return size, capacity and hit/miss counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
 
 def get_tokenizer() -> TokenCounter:
     """Return the active tokenizer, preferring BGE when its libs are present.
@@ -123,6 +270,80 @@ def get_tokenizer() -> TokenCounter:
         return _RegexTokenizer()
 
 
+_cached_tokenizer: CachingTokenizer | None = None
+_cached_tokenizer_lock = threading.Lock()
+
+
+def get_cached_tokenizer(max_entries: int = 2048) -> CachingTokenizer:
+    """Return the process-wide :class:`CachingTokenizer` over :func:`get_tokenizer`.
+
+    The underlying tokenizer is loaded once; later calls reuse it and its
+    cache, updating the capacity to ``max_entries``.
+
+    Args:
+        max_entries: Maximum cached texts; ``0`` disables caching.
+
+    Returns:
+        The shared caching tokenizer.
+    """
+    global _cached_tokenizer
+    with _cached_tokenizer_lock:
+        if _cached_tokenizer is None:
+            _cached_tokenizer = CachingTokenizer(
+                get_tokenizer(), max_entries=max_entries
+            )
+        else:
+            _cached_tokenizer.max_entries = max_entries
+        return _cached_tokenizer
+
+
+def _check_window(max_tokens: int, overlap_tokens: int) -> int:
+    """Validate the window parameters and return the step between windows."""
+    if max_tokens < 1:
+        raise ValueError("max_tokens must be >= 1")
+    if overlap_tokens < 0:
+        raise ValueError("overlap_tokens must be >= 0")
+    step = max_tokens - overlap_tokens
+    if step < 1:
+        raise ValueError("step (max_tokens - overlap_tokens) must be >= 1")
+    return step
+
+
+def _window_chunks(
+    section: str,
+    text: str,
+    spans: Sequence[tuple[int, int]],
+    *,
+    max_tokens: int,
+    step: int,
+) -> list[Chunk]:
+    """Group ``spans`` into overlapping windows and recover each chunk's text."""
+    chunks: list[Chunk] = []
+    idx = 0
+    for start in range(0, len(spans), step):
+        window = spans[start : start + max_tokens]
+        if not window:
+            break
+        first_start = window[0][0]
+        last_end = window[-1][1]
+        substring = text[first_start:last_end]
+        chunks.append(
+            Chunk(
+                section=section,
+                idx=idx,
+                text=substring,
+                char_count=len(substring),
+                token_count=len(window),
+            )
+        )
+        idx += 1
+        # The final window has been emitted once it reaches the last token.
+        if start + max_tokens >= len(spans):
+            break
+
+    return chunks
+
+
 def chunk_section(
     section: str,
     text: str,
@@ -158,43 +379,59 @@ def chunk_section(
         ValueError: If ``max_tokens`` is below 1, ``overlap_tokens`` is
             negative, or the resulting step is below 1.
     """
-    if max_tokens < 1:
-        raise ValueError("max_tokens must be >= 1")
-    if overlap_tokens < 0:
-        raise ValueError("overlap_tokens must be >= 0")
-    step = max_tokens - overlap_tokens
-    if step < 1:
-        raise ValueError("step (max_tokens - overlap_tokens) must be >= 1")
+    step = _check_window(max_tokens, overlap_tokens)
 
     if not text.strip():
         return []
 
     active = tokenizer if tokenizer is not None else get_tokenizer()
     spans = active.offsets(text)
-    if not spans:
-        return []
+    return _window_chunks(section, text, spans, max_tokens=max_tokens, step=step)
 
-    chunks: list[Chunk] = []
-    idx = 0
-    for start in range(0, len(spans), step):
-        window = spans[start : start + max_tokens]
-        if not window:
-            break
-        first_start = window[0][0]
-        last_end = window[-1][1]
-        substring = text[first_start:last_end]
-        chunks.append(
-            Chunk(
-                section=section,
-                idx=idx,
-                text=substring,
-                char_count=len(substring),
-                token_count=len(window),
-            )
-        )
-        idx += 1
-        # The final window has been emitted once it reaches the last token.
-        if start + max_tokens >= len(spans):
-            break
 
-    return chunks
+def chunk_sections(
+    sections: Sequence[tuple[str, str]],
+    *,
+    max_tokens: int = 510,
+    overlap_tokens: int = 50,
+    tokenizer: TokenCounter | None = None,
+) -> list[list[Chunk]]:
+    """Chunk several sections of one article from a single batched tokenization.
+
+    Equivalent to calling :func:`chunk_section` on each ``(section, text)``
+    pair, but all non-blank texts are tokenized in one :func:`batch_offsets`
+    call.
+
+    Args:
+        sections: Ordered ``(section_label, text)`` pairs.
+        max_tokens: Maximum tokens per chunk window. Must be at least 1.
+        overlap_tokens: Tokens shared between consecutive windows.
+        tokenizer: Tokenizer to use; defaults to :func:`get_tokenizer`.
+
+    Returns:
+        One chunk list per input section, in input order.
+
+    Raises:
+        ValueError: On invalid window parameters (see :func:`chunk_section`).
+    """
+    step = _check_window(max_tokens, overlap_tokens)
+    filled = [i for i, (_, text) in enumerate(sections) if text.strip()]
+    if not filled:
+        return [[] for _ in sections]
+
+    active = tokenizer if tokenizer is not None else get_tokenizer()
+    spans_by_index = dict(
+        zip(filled, batch_offsets(active, [sections[i][1] for i in filled]))
+    )
+    return [
+        _window_chunks(
+            section,
+            text,
+            spans_by_index[i],
+            max_tokens=max_tokens,
+            step=step,
+        )
+        if i in spans_by_index
+        else []
+        for i, (section, text) in enumerate(sections)
+    ]
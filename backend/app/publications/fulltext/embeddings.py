@@ -10,6 +10,13 @@ The fake provider never requires ``numpy``, ``torch``, or
 ``sentence-transformers`` so the unit tests run in any environment, while
 :func:`get_embedding_provider` quietly returns ``None`` when the optional
 model stack is not installed.
+
+Query vectors are reused through :class:`QueryEmbeddingCache`: a bounded,
+TTL-limited LRU keyed on ``(model_name, query)`` that also coalesces
+concurrent encodes of the same query into one model call.
+:class:`CachedQueryEmbeddingProvider` puts it in front of any provider, and
+:class:`MicroBatchingEmbeddingProvider` merges the remaining concurrent query
+encodes into shared model batches.
 """
 
 from __future__ import annotations
@@ -19,7 +26,9 @@ import hashlib
 import importlib.util
 import math
 import random
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -243,6 +252,350 @@ class SentenceTransformerEmbeddingProvider:
         return [[float(value) for value in vector] for vector in encoded]
 
 
+class QueryEmbeddingCache:
+    """Bounded LRU of query vectors with a TTL and in-flight coalescing.
+
+    Entries are keyed on ``(model_name, text)`` so providers for different
+    models never share vectors. A query that is already being encoded is
+    not encoded again: later callers await the first caller's result.
+    Hit, miss and coalesced counters are kept for monitoring. Settings are
+    read lazily so this module stays importable without app configuration.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = None,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Capacity override (default: settings); ``0``
+                disables caching but still coalesces concurrent encodes.
+            ttl_seconds: Entry lifetime override (default: settings).
+        """
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, str], tuple[float, list[float]]] = (
+            OrderedDict()
+        )
+        self._in_flight: dict[tuple[str, str], asyncio.Future[list[float]]] = {}
+        self._encodes: set[asyncio.Task[None]] = set()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @property
+    def max_entries(self) -> int:
+        """Maximum number of cached vectors."""
+        if self._max_entries is not None:
+            return self._max_entries
+        from app.core.config import settings
+
+        return settings.publications_rag.query_embedding_cache_size
+
+    @property
+    def ttl_seconds(self) -> float:
+        """Seconds a cached vector stays valid."""
+        if self._ttl_seconds is not None:
+            return self._ttl_seconds
+        from app.core.config import settings
+
+        return settings.publications_rag.query_embedding_cache_ttl_seconds
+
+    def _lookup(self, key: tuple[str, str]) -> list[float] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, vector = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return vector
+
+    def _store(self, key: tuple[str, str], vector: list[float]) -> None:
+        capacity = self.max_entries
+        if capacity <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, vector)
+        self._entries.move_to_end(key)
+        while len(self._entries) > capacity:
+            self._entries.popitem(last=False)
+
+    async def get_many(
+        self, provider: EmbeddingProvider, texts: Sequence[str]
+    ) -> list[list[float]]:
+        """Return query vectors for ``texts``, encoding only unseen ones.
+
+        Misses are encoded in a single ``provider.embed(..., is_query=True)``
+        call; duplicates within ``texts`` and queries another caller is
+        already encoding are not sent to the model again. The encode runs
+        detached from the caller, so cancelling one caller leaves the others
+        waiting on the same query unaffected.
+
+        Args:
+            provider: The provider that encodes cache misses.
+            texts: The query texts, in order.
+
+        Returns:
+            One vector per input text, in input order. Each is a fresh list
+            the caller may modify.
+        """
+        model = provider.model_name
+        resolved: dict[str, list[float]] = {}
+        waiting: dict[str, asyncio.Future[list[float]]] = {}
+        owned: dict[str, asyncio.Future[list[float]]] = {}
+        loop = asyncio.get_running_loop()
+        for text in dict.fromkeys(texts):
+            key = (model, text)
+            vector = self._lookup(key)
+            if vector is not None:
+                self.hits += 1
+                resolved[text] = vector
+            elif key in self._in_flight:
+                self.coalesced += 1
+                waiting[text] = self._in_flight[key]
+            else:
+                self.misses += 1
+                owned[text] = self._in_flight[key] = loop.create_future()
+
+        if owned:
+            # Encode in a detached task: cancelling this caller must not
+            # fail the callers coalesced onto the same futures.
+            task = asyncio.create_task(self._encode(provider, owned))
+            self._encodes.add(task)
+            task.add_done_callback(self._encodes.discard)
+
+        for text, future in (owned | waiting).items():
+            resolved[text] = await asyncio.shield(future)
+        return [list(resolved[text]) for text in texts]
+
+    async def _encode(
+        self,
+        provider: EmbeddingProvider,
+        owned: dict[str, asyncio.Future[list[float]]],
+    ) -> None:
+        """Encode the owned misses and resolve their in-flight futures."""
+        model = provider.model_name
+        try:
+            vectors = await provider.embed(list(owned), is_query=True)
+        except BaseException as exc:
+            for text, future in owned.items():
+                self._in_flight.pop((model, text), None)
+                if future.done():
+                    continue
+                if isinstance(exc, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(exc)
+                    # Mark retrieved: callers may all have gone away.
+                    future.exception()
+            if not isinstance(exc, Exception):
+                raise
+            return
+        for (text, future), vector in zip(owned.items(), vectors):
+            self._in_flight.pop((model, text), None)
+            self._store((model, text), vector)
+            if not future.done():
+                future.set_result(vector)
+
+    def clear(self) -> None:
+        """Drop every cached vector and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.coalesced = 0
+
+    def get_status(self) -> dict[str, Any]:
+        """Return process-local cache metrics for monitoring."""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "in_flight": len(self._in_flight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_ratio": (self.hits + self.coalesced) / lookups if lookups else None,
+        }
+
+
+# Process-wide query vector cache shared by every cached provider.
+query_embedding_cache = QueryEmbeddingCache()
+
+
+class CachedQueryEmbeddingProvider:
+    """Provider wrapper that serves query embeds from a query vector cache.
+
+    Passage (``is_query=False``) embeds are passed straight through, since
+    backfill texts are rarely repeated and would only evict queries.
+    """
+
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        cache: QueryEmbeddingCache | None = None,
+    ) -> None:
+        """Wrap ``provider``.
+
+        Args:
+            provider: The provider that encodes cache misses.
+            cache: Cache to use (default: :data:`query_embedding_cache`).
+        """
+        self._provider = provider
+        self._cache = cache if cache is not None else query_embedding_cache
+
+    @property
+    def dim(self) -> int:
+        """Return the wrapped provider's dimensionality."""
+        return self._provider.dim
+
+    @property
+    def model_name(self) -> str:
+        """Return the wrapped provider's model identifier."""
+        return self._provider.model_name
+
+    async def embed(
+        self, texts: Sequence[str], *, is_query: bool = False
+    ) -> list[list[float]]:
+        """Embed ``texts``, reusing cached vectors for queries.
+
+        Args:
+            texts: The texts to embed, in order.
+            is_query: Whether the texts are search queries; only queries
+                are cached.
+
+        Returns:
+            One vector per input text, in input order.
+        """
+        if not is_query:
+            return await self._provider.embed(texts, is_query=False)
+        return await self._cache.get_many(self._provider, texts)
+
+
+class MicroBatchingEmbeddingProvider:
+    """Provider wrapper that merges concurrent query encodes into batches.
+
+    Query texts arriving within ``window_seconds`` of the first pending one
+    are sent to the wrapped provider as a single ``embed`` call (flushed
+    early once ``max_batch_size`` texts are pending) and the vectors are
+    fanned back out to the callers. One forward pass over a batch is much
+    cheaper on CPU than many single-text passes competing for the cores.
+    Passage embeds are already batched by the backfill and pass straight
+    through.
+    """
+
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        *,
+        window_seconds: float | None = None,
+        max_batch_size: int | None = None,
+    ) -> None:
+        """Wrap ``provider``.
+
+        Args:
+            provider: The provider that encodes each batch.
+            window_seconds: Gathering window override (default: settings);
+                ``0`` disables batching.
+            max_batch_size: Batch size override (default: settings).
+        """
+        self._provider = provider
+        self._window_seconds = window_seconds
+        self._max_batch_size = max_batch_size
+        self._pending: list[tuple[str, asyncio.Future[list[float]]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+        self.batches = 0
+        self.encoded = 0
+
+    @property
+    def window_seconds(self) -> float:
+        """Seconds a pending query waits for others to join its batch."""
+        if self._window_seconds is not None:
+            return self._window_seconds
+        from app.core.config import settings
+
+        return settings.publications_rag.embedding_batch_window_ms / 1000.0
+
+    @property
+    def max_batch_size(self) -> int:
+        """Pending query count that flushes a batch before the window ends."""
+        if self._max_batch_size is not None:
+            return self._max_batch_size
+        from app.core.config import settings
+
+        return settings.publications_rag.embedding_batch_max_size
+
+    @property
+    def dim(self) -> int:
+        """Return the wrapped provider's dimensionality."""
+        return self._provider.dim
+
+    @property
+    def model_name(self) -> str:
+        """Return the wrapped provider's model identifier."""
+        return self._provider.model_name
+
+    async def embed(
+        self, texts: Sequence[str], *, is_query: bool = False
+    ) -> list[list[float]]:
+        """Embed ``texts``, batching queries with concurrent callers.
+
+        Args:
+            texts: The texts to embed, in order.
+            is_query: Whether the texts are search queries; only queries
+                are micro-batched.
+
+        Returns:
+            One vector per input text, in input order.
+        """
+        if not is_query or not texts or self.window_seconds <= 0:
+            return await self._provider.embed(texts, is_query=is_query)
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in texts]
+        self._pending.extend(zip(texts, futures))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_seconds, self._flush)
+        return list(await asyncio.gather(*futures))
+
+    def _flush(self) -> None:
+        """Start encoding every pending query as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._encode_batch(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _encode_batch(
+        self, batch: list[tuple[str, asyncio.Future[list[float]]]]
+    ) -> None:
+        """Encode one batch and resolve each caller's future."""
+        unique = list(dict.fromkeys(text for text, _ in batch))
+        try:
+            vectors = await self._provider.embed(unique, is_query=True)
+        except Exception as exc:  # noqa: BLE001 - handed to every caller
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+                    # Mark retrieved: a caller awaiting several texts only
+                    # re-raises the first failure.
+                    future.exception()
+            return
+        self.batches += 1
+        self.encoded += len(unique)
+        by_text = dict(zip(unique, vectors))
+        for text, future in batch:
+            if not future.done():
+                future.set_result(list(by_text[text]))
+
+
 def get_embedding_provider(
     *,
     model_name: str = "BAAI/bge-small-en-v1.5",
@@ -12,7 +12,9 @@ caller (``coverage.py``) maps them onto the canonical taxonomy.
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Iterable
+from typing import TYPE_CHECKING
 
 from lxml import etree  # type: ignore[import-untyped]
 
@@ -22,6 +24,9 @@ from app.publications.fulltext.types import (
     RawSection,
 )
 
+if TYPE_CHECKING:
+    from app.publications.fulltext.rate_limit import TokenBucket
+
 # --- JATS section heuristics ----------------------------------------------
 
 #: Ordered substring heuristics mapping a JATS section title (lower-cased) or
@@ -290,6 +295,7 @@ async def resolve_pmcids(
     email: str,
     batch_size: int = 200,
     timeout: float = 30.0,
+    limiter: TokenBucket | None = None,
 ) -> dict[str, str | None]:
     """Resolve bare PMIDs to PMCIDs via the NCBI PMC ID converter.
 
@@ -303,6 +309,7 @@ async def resolve_pmcids(
         email: The ``email`` query parameter (NCBI etiquette).
         batch_size: Maximum number of ids per request.
         timeout: Per-request timeout in seconds.
+        limiter: Optional host rate limiter acquired before each request.
 
     Returns:
         A merged mapping from bare PMID to PMCID (or ``None`` when unresolved).
@@ -317,6 +324,8 @@ async def resolve_pmcids(
             "tool": tool,
             "email": email,
         }
+        if limiter is not None:
+            await limiter.acquire()
         async with session.get(base_url, params=params, timeout=timeout) as resp:
             data = await resp.json()
         out.update(parse_idconv(data))
@@ -329,6 +338,7 @@ async def fetch_bioc(
     session,
     base_url: str,
     timeout: float = 60.0,
+    limiter: TokenBucket | None = None,
 ) -> FullTextResult | None:
     """Fetch and parse full-text BioC for a single PMID.
 
@@ -337,6 +347,7 @@ async def fetch_bioc(
         session: An injected :class:`aiohttp.ClientSession`.
         base_url: The PubTator3 BioC endpoint URL.
         timeout: Request timeout in seconds.
+        limiter: Optional host rate limiter acquired before the request.
 
     Returns:
         A :class:`FullTextResult`, or ``None`` when the response is unusable or
@@ -344,12 +355,15 @@ async def fetch_bioc(
     """
     digits = str(pmid).replace("PMID:", "")
     params = {"pmids": digits, "full": "true"}
+    if limiter is not None:
+        await limiter.acquire()
     async with session.get(base_url, params=params, timeout=timeout) as resp:
         if resp.status != 200:
             return None
         data = await resp.json()
     try:
-        result = parse_bioc(data)
+        # Parsing a full-text document is CPU-bound; keep it off the loop.
+        result = await asyncio.to_thread(parse_bioc, data)
     except (KeyError, IndexError, TypeError):
         return None
     if not result.sections:
@@ -363,6 +377,7 @@ async def fetch_europepmc_core(
     session,
     base_url: str,
     timeout: float = 30.0,
+    limiter: TokenBucket | None = None,
 ) -> tuple[bool, str | None]:
     """Fetch the EuropePMC ``core`` record for a PMID and parse OA + license.
 
@@ -371,6 +386,7 @@ async def fetch_europepmc_core(
         session: An injected :class:`aiohttp.ClientSession`.
         base_url: The EuropePMC REST base URL (``/search`` is appended).
         timeout: Request timeout in seconds.
+        limiter: Optional host rate limiter acquired before the request.
 
     Returns:
         A ``(is_open_access, raw_license)`` tuple; ``(False, None)`` on misses.
@@ -382,6 +398,8 @@ async def fetch_europepmc_core(
         "format": "json",
     }
     url = f"{base_url}/search"
+    if limiter is not None:
+        await limiter.acquire()
     async with session.get(url, params=params, timeout=timeout) as resp:
         if resp.status != 200:
             return (False, None)
@@ -396,6 +414,7 @@ async def fetch_jats(
     session,
     base_url: str,
     timeout: float = 30.0,
+    limiter: TokenBucket | None = None,
 ) -> tuple[RawSection, ...]:
     """Fetch and parse EuropePMC JATS ``fullTextXML`` for a record.
 
@@ -405,16 +424,19 @@ async def fetch_jats(
         session: An injected :class:`aiohttp.ClientSession`.
         base_url: The EuropePMC REST base URL.
         timeout: Request timeout in seconds.
+        limiter: Optional host rate limiter acquired before the request.
 
     Returns:
         Ordered :class:`RawSection` objects, or an empty tuple on any failure.
     """
     url = f"{base_url}/{source}/{pmcid_or_id}/fullTextXML"
     try:
+        if limiter is not None:
+            await limiter.acquire()
         async with session.get(url, timeout=timeout) as resp:
             if resp.status != 200:
                 return ()
             xml = await resp.read()
     except Exception:
         return ()
-    return parse_jats(xml)
+    return await asyncio.to_thread(parse_jats, xml)
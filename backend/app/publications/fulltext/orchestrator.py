@@ -4,29 +4,44 @@ Ties the leaf modules together into the unit of work shared by the admin sync
 endpoint and the one-off backfill script. Fetching is injected via
 :class:`PublicationFetchers` so the orchestration logic (the license gate,
 chunking, sequencing, and persistence) is tested with in-memory fakes and no
-network. :func:`build_fetchers` wires the real clients over an aiohttp session.
+network. :func:`build_fetchers` wires the real clients over an aiohttp session,
+behind the shared per-host rate limiters of :mod:`.rate_limit`.
+
+A publication is processed in three stages: :func:`fetch_publication` (I/O),
+:func:`prepare_publication` (license gate and chunking, CPU-bound) and
+:func:`persist_publication` (one transaction). :func:`sync_publications` runs
+them as a pipeline: abstracts and PMCIDs are looked up in batches, many
+publications are fetched at once and chunked on worker threads (one batched
+tokenizer call per article, cached by text hash), and a single writer persists
+them in order, so a resync is bound by the upstream rate limits rather than by
+per-publication latency. Given a :class:`~.sync_jobs.SyncJob`, the writer
+checkpoints every PMID, so an interrupted run resumes where it stopped and
+publications whose content hash is unchanged are not rewritten.
 
 Also exposes :func:`backfill_embeddings`, the async batched driver that embeds
 passages whose stored ``text_hash`` is stale (used only when the optional
-embedding provider is available).
+embedding provider is available). It pipelines encoding of the next batch with
+the bulk write of the current one and reports its throughput.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Awaitable, Callable, Optional, Sequence
+from typing import AsyncGenerator, Awaitable, Callable, Optional, Sequence
 
 import aiohttp
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.publications.fulltext import persistence
+from app.publications.fulltext import persistence, sync_jobs
 from app.publications.fulltext.abstract_client import fetch_abstracts
 from app.publications.fulltext.chunking import (
     TokenCounter,
-    chunk_section,
+    chunk_sections,
+    get_cached_tokenizer,
     get_tokenizer,
 )
 from app.publications.fulltext.coverage import classify_coverage
@@ -40,8 +55,11 @@ from app.publications.fulltext.fulltext_client import (
     fetch_jats,
     resolve_pmcids,
 )
+from app.publications.fulltext.rate_limit import host_rate_limiter
+from app.publications.fulltext.retrieval import invalidate_embeddings_probe
 from app.publications.fulltext.types import (
     AbstractResult,
+    CoverageDecision,
     FullTextResult,
     PassageRow,
     RawSection,
@@ -81,10 +99,13 @@ class PublicationFetchers:
     Attributes:
         fetch_abstract: ``pmid -> AbstractResult | None``.
         fetch_fulltext: ``pmid -> FullTextResult | None`` with license/OA merged.
+        prefetch: Optional ``pmids -> None`` that looks up data for several
+            publications in batched requests ahead of the per-PMID fetches.
     """
 
     fetch_abstract: Callable[[str], Awaitable[Optional[AbstractResult]]]
     fetch_fulltext: Callable[[str], Awaitable[Optional[FullTextResult]]]
+    prefetch: Optional[Callable[[Sequence[str]], Awaitable[None]]] = None
 
 
 def build_fetchers(
@@ -94,6 +115,11 @@ def build_fetchers(
 ) -> PublicationFetchers:
     """Wire real external clients into a :class:`PublicationFetchers`.
 
+    Every request waits on its host's shared token bucket. ``prefetch``
+    fetches abstracts and resolves PMCIDs for a window of PMIDs in batched
+    requests; the per-PMID fetchers consume those results and fall back to
+    single-PMID requests for anything the batch did not return.
+
     Args:
         session: A shared aiohttp client session.
         abstract_api_key: Optional NCBI API key for higher efetch rate limits.
@@ -105,46 +131,95 @@ def build_fetchers(
     from app.core.config import settings
 
     apis = settings.external_apis
-
-    async def _fetch_abstract(pmid: str) -> Optional[AbstractResult]:
-        results = await fetch_abstracts(
-            [pmid],
+    ncbi_limits = settings.rate_limiting.pubmed
+    ncbi_rate = (
+        ncbi_limits.requests_per_second_with_key
+        if abstract_api_key
+        else ncbi_limits.requests_per_second_without_key
+    )
+    efetch_limiter = host_rate_limiter(apis.efetch.base_url, ncbi_rate)
+    idconv_limiter = host_rate_limiter(apis.idconv.base_url, ncbi_rate)
+    pubtator_limiter = host_rate_limiter(
+        apis.pubtator3.base_url, apis.pubtator3.requests_per_second
+    )
+    europepmc_limiter = host_rate_limiter(
+        apis.europepmc.base_url, apis.europepmc.requests_per_second
+    )
+    # Batched lookups made by ``prefetch``, keyed on bare PMID and consumed
+    # once by the per-PMID fetchers.
+    abstracts: dict[str, AbstractResult] = {}
+    pmcids: dict[str, Optional[str]] = {}
+
+    async def _fetch_abstracts(bare: list[str]) -> dict[str, AbstractResult]:
+        return await fetch_abstracts(
+            bare,
             session=session,
             base_url=apis.efetch.base_url,
             api_key=abstract_api_key,
             batch_size=apis.efetch.batch_size,
             timeout=apis.efetch.timeout_seconds,
+            limiter=efetch_limiter,
         )
-        return results.get(f"PMID:{pmid.replace('PMID:', '')}")
 
-    async def _resolve_one_pmcid(pmid: str) -> Optional[str]:
-        resolved = await resolve_pmcids(
-            [pmid.replace("PMID:", "")],
+    async def _resolve_pmcids(bare: list[str]) -> dict[str, Optional[str]]:
+        return await resolve_pmcids(
+            bare,
             session=session,
             base_url=apis.idconv.base_url,
             tool=apis.idconv.tool,
             email=apis.idconv.email,
             batch_size=apis.idconv.batch_size,
             timeout=apis.idconv.timeout_seconds,
+            limiter=idconv_limiter,
         )
-        return resolved.get(pmid.replace("PMID:", ""))
 
-    async def _fetch_fulltext(pmid: str) -> Optional[FullTextResult]:
-        bioc = await fetch_bioc(
-            pmid,
-            session=session,
-            base_url=apis.pubtator3.base_url,
-            timeout=apis.pubtator3.timeout_seconds,
+    async def _prefetch(pmids: Sequence[str]) -> None:
+        bare = [pmid.replace("PMID:", "") for pmid in pmids]
+        found_abstracts, found_pmcids = await asyncio.gather(
+            _fetch_abstracts(bare), _resolve_pmcids(bare), return_exceptions=True
         )
-        is_oa, raw_license = await fetch_europepmc_core(
-            pmid,
-            session=session,
-            base_url=apis.europepmc.base_url,
-            timeout=apis.europepmc.timeout_seconds,
+        if isinstance(found_abstracts, BaseException):
+            logger.warning("batched abstract fetch failed: %s", found_abstracts)
+        else:
+            abstracts.update(
+                (pmid.replace("PMID:", ""), result)
+                for pmid, result in found_abstracts.items()
+            )
+        if isinstance(found_pmcids, BaseException):
+            logger.warning("batched PMCID resolution failed: %s", found_pmcids)
+        else:
+            pmcids.update(found_pmcids)
+
+    async def _fetch_abstract(pmid: str) -> Optional[AbstractResult]:
+        bare = pmid.replace("PMID:", "")
+        if bare in abstracts:
+            return abstracts.pop(bare)
+        results = await _fetch_abstracts([bare])
+        return results.get(f"PMID:{bare}")
+
+    async def _fetch_fulltext(pmid: str) -> Optional[FullTextResult]:
+        bare = pmid.replace("PMID:", "")
+        prefetched = bare in pmcids
+        prefetched_pmcid = pmcids.pop(bare, None)
+        bioc, (is_oa, raw_license) = await asyncio.gather(
+            fetch_bioc(
+                pmid,
+                session=session,
+                base_url=apis.pubtator3.base_url,
+                timeout=apis.pubtator3.timeout_seconds,
+                limiter=pubtator_limiter,
+            ),
+            fetch_europepmc_core(
+                pmid,
+                session=session,
+                base_url=apis.europepmc.base_url,
+                timeout=apis.europepmc.timeout_seconds,
+                limiter=europepmc_limiter,
+            ),
         )
         if bioc is not None and bioc.sections:
             return FullTextResult(
-                pmid=f"PMID:{pmid.replace('PMID:', '')}",
+                pmid=f"PMID:{bare}",
                 pmcid=bioc.pmcid,
                 license=raw_license,
                 is_open_access=is_oa,
@@ -153,7 +228,13 @@ def build_fetchers(
             )
         # Fallback: JATS via EuropePMC when PubTator had no body but the record
         # is open access and we can resolve a PMCID.
-        pmcid = (bioc.pmcid if bioc else None) or await _resolve_one_pmcid(pmid)
+        pmcid = bioc.pmcid if bioc else None
+        if not pmcid:
+            pmcid = (
+                prefetched_pmcid
+                if prefetched
+                else (await _resolve_pmcids([bare])).get(bare)
+            )
         if pmcid and is_oa:
             jats = await fetch_jats(
                 pmcid,
@@ -161,10 +242,11 @@ def build_fetchers(
                 session=session,
                 base_url=apis.europepmc.base_url,
                 timeout=apis.europepmc.timeout_seconds,
+                limiter=europepmc_limiter,
             )
             if jats:
                 return FullTextResult(
-                    pmid=f"PMID:{pmid.replace('PMID:', '')}",
+                    pmid=f"PMID:{bare}",
                     pmcid=pmcid,
                     license=raw_license,
                     is_open_access=is_oa,
@@ -173,7 +255,7 @@ def build_fetchers(
                 )
         # No body anywhere — still surface pmcid/license/OA so metadata records them.
         return FullTextResult(
-            pmid=f"PMID:{pmid.replace('PMID:', '')}",
+            pmid=f"PMID:{bare}",
             pmcid=pmcid,
             license=raw_license,
             is_open_access=is_oa,
@@ -182,7 +264,9 @@ def build_fetchers(
         )
 
     return PublicationFetchers(
-        fetch_abstract=_fetch_abstract, fetch_fulltext=_fetch_fulltext
+        fetch_abstract=_fetch_abstract,
+        fetch_fulltext=_fetch_fulltext,
+        prefetch=_prefetch,
     )
 
 
@@ -197,7 +281,8 @@ def build_passage_rows(
     """Chunk license-permitted sections into ordered, persistable passage rows.
 
     Each :class:`~app.publications.fulltext.types.RawSection` is chunked
-    independently (never crossing the section boundary). A per-section index
+    independently (never crossing the section boundary), with all sections
+    tokenized in one batched call. A per-section index
     makes ``passage_id`` unique within ``(pmid, section)`` even when several raw
     blocks share a section label, while ``seq`` gives a stable global order.
 
@@ -215,14 +300,14 @@ def build_passage_rows(
     rows: list[PassageRow] = []
     per_section_idx: dict[str, int] = {}
     seq = 0
-    for raw in sections:
-        for chunk in chunk_section(
-            raw.section,
-            raw.text,
-            max_tokens=max_tokens,
-            overlap_tokens=overlap_tokens,
-            tokenizer=active,
-        ):
+    chunked = chunk_sections(
+        [(raw.section, raw.text) for raw in sections],
+        max_tokens=max_tokens,
+        overlap_tokens=overlap_tokens,
+        tokenizer=active,
+    )
+    for raw, chunks in zip(sections, chunked):
+        for chunk in chunks:
             idx = per_section_idx.get(raw.section, 0)
             per_section_idx[raw.section] = idx + 1
             rows.append(
@@ -241,54 +326,84 @@ def build_passage_rows(
     return rows
 
 
-async def process_publication(
-    db: AsyncSession,
+@dataclass
+class PreparedPublication:
+    """A publication's fetched content after the license gate and chunking.
+
+    Attributes:
+        outcome: The outcome so far; ``passages_written`` is set on persist.
+        abstract: Abstract text to store, or ``None``.
+        decision: The license gate / coverage decision.
+        passages: Ordered passage rows to store.
+        content_hash: Digest of the content to store (see
+            :func:`~.sync_jobs.content_hash`).
+    """
+
+    outcome: PubOutcome
+    abstract: Optional[str]
+    decision: CoverageDecision
+    passages: list[PassageRow]
+    content_hash: str = ""
+
+
+async def fetch_publication(
+    pmid: str, fetchers: PublicationFetchers
+) -> tuple[Optional[str], Optional[FullTextResult]]:
+    """Fetch one publication's abstract and full text concurrently.
+
+    A network error on either leg degrades that leg to "unavailable" rather
+    than aborting, so the publication simply lands in a lower coverage tier.
+
+    Returns:
+        ``(abstract_text, fulltext)``, either of which may be ``None``.
+    """
+    normalized = f"PMID:{pmid.replace('PMID:', '')}"
+
+    async def _abstract() -> Optional[str]:
+        try:
+            result = await fetchers.fetch_abstract(pmid)
+        except Exception as exc:  # noqa: BLE001 - degrade, don't abort the batch
+            logger.warning("abstract fetch failed for %s: %s", normalized, exc)
+            return None
+        return result.text if result else None
+
+    async def _fulltext() -> Optional[FullTextResult]:
+        try:
+            return await fetchers.fetch_fulltext(pmid)
+        except Exception as exc:  # noqa: BLE001 - degrade to abstract/title tier
+            logger.warning("full-text fetch failed for %s: %s", normalized, exc)
+            return None
+
+    abstract_text, fulltext = await asyncio.gather(_abstract(), _fulltext())
+    return abstract_text, fulltext
+
+
+def prepare_publication(
     pmid: str,
+    abstract_text: Optional[str],
+    fulltext: Optional[FullTextResult],
     *,
-    fetchers: PublicationFetchers,
     allowed_licenses: Sequence[str],
     chunk_max_tokens: int = 510,
     chunk_overlap_tokens: int = 50,
     tokenizer: Optional[TokenCounter] = None,
-    ensure_metadata: bool = True,
-) -> PubOutcome:
-    """Fetch, license-gate, chunk, and persist one publication's content.
-
-    Resilient to fetch failures: a network error on the abstract or full-text
-    leg degrades that leg to "unavailable" rather than aborting (the publication
-    simply lands in a lower coverage tier). Database errors propagate so the
-    caller can isolate them per-PMID and continue the batch.
+) -> PreparedPublication:
+    """License-gate and chunk fetched content (pure, CPU-bound, no I/O).
 
     Args:
-        db: The async session (committed once here, atomically per publication).
         pmid: PMID (prefixed or bare).
-        fetchers: Injected external fetchers.
+        abstract_text: Fetched abstract, or ``None``.
+        fulltext: Fetched full text, or ``None``.
         allowed_licenses: License allow-set for the gate.
         chunk_max_tokens: Chunk window size.
         chunk_overlap_tokens: Chunk window overlap.
         tokenizer: Tokenizer override (defaults to the active tokenizer).
-        ensure_metadata: When ``True``, insert a placeholder metadata row if the
-            publication has none (so the FK + update always succeed).
 
     Returns:
-        A :class:`PubOutcome` summarizing what was stored.
+        The :class:`PreparedPublication` to persist.
     """
     normalized = f"PMID:{pmid.replace('PMID:', '')}"
     outcome = PubOutcome(pmid=normalized)
-
-    abstract_text: Optional[str] = None
-    try:
-        abstract_result = await fetchers.fetch_abstract(pmid)
-        abstract_text = abstract_result.text if abstract_result else None
-    except Exception as exc:  # noqa: BLE001 - degrade, don't abort the batch
-        logger.warning("abstract fetch failed for %s: %s", normalized, exc)
-
-    fulltext: Optional[FullTextResult] = None
-    try:
-        fulltext = await fetchers.fetch_fulltext(pmid)
-    except Exception as exc:  # noqa: BLE001 - degrade to abstract/title tier
-        logger.warning("full-text fetch failed for %s: %s", normalized, exc)
-
     decision = classify_coverage(
         abstract=abstract_text, fulltext=fulltext, allowed_licenses=allowed_licenses
     )
@@ -343,25 +458,102 @@ async def process_publication(
                 source=source,
             )
         )
+    return PreparedPublication(
+        outcome=outcome,
+        abstract=abstract_text,
+        decision=decision,
+        passages=passages,
+        content_hash=sync_jobs.content_hash(
+            abstract=abstract_text,
+            coverage=decision.coverage,
+            license=decision.license,
+            pmcid=decision.pmcid,
+            passages=[(p.passage_id, p.section, p.source, p.text) for p in passages],
+        ),
+    )
+
+
+async def persist_publication(
+    db: AsyncSession,
+    prepared: PreparedPublication,
+    *,
+    ensure_metadata: bool = True,
+) -> PubOutcome:
+    """Store a prepared publication's coverage and passages in one commit.
+
+    Args:
+        db: The async session (committed once here).
+        prepared: Output of :func:`prepare_publication`.
+        ensure_metadata: When ``True``, insert a placeholder metadata row if the
+            publication has none (so the FK + update always succeed).
 
+    Returns:
+        The publication's :class:`PubOutcome`.
+    """
+    outcome = prepared.outcome
+    decision = prepared.decision
     if ensure_metadata:
-        await persistence.ensure_metadata_row(db, normalized)
+        await persistence.ensure_metadata_row(db, outcome.pmid)
     await persistence.update_metadata_coverage(
         db,
-        normalized,
-        abstract=abstract_text,
+        outcome.pmid,
+        abstract=prepared.abstract,
         coverage=decision.coverage,
         license=decision.license,
         pmcid=decision.pmcid,
         fulltext_fetched_at=datetime.now(timezone.utc),
     )
     outcome.passages_written = await persistence.replace_passages(
-        db, normalized, passages
+        db, outcome.pmid, prepared.passages
     )
     await db.commit()
     return outcome
 
 
+async def process_publication(
+    db: AsyncSession,
+    pmid: str,
+    *,
+    fetchers: PublicationFetchers,
+    allowed_licenses: Sequence[str],
+    chunk_max_tokens: int = 510,
+    chunk_overlap_tokens: int = 50,
+    tokenizer: Optional[TokenCounter] = None,
+    ensure_metadata: bool = True,
+) -> PubOutcome:
+    """Fetch, license-gate, chunk, and persist one publication's content.
+
+    Resilient to fetch failures (see :func:`fetch_publication`). Database
+    errors propagate so the caller can isolate them per-PMID and continue the
+    batch.
+
+    Args:
+        db: The async session (committed once here, atomically per publication).
+        pmid: PMID (prefixed or bare).
+        fetchers: Injected external fetchers.
+        allowed_licenses: License allow-set for the gate.
+        chunk_max_tokens: Chunk window size.
+        chunk_overlap_tokens: Chunk window overlap.
+        tokenizer: Tokenizer override (defaults to the active tokenizer).
+        ensure_metadata: When ``True``, insert a placeholder metadata row if the
+            publication has none (so the FK + update always succeed).
+
+    Returns:
+        A :class:`PubOutcome` summarizing what was stored.
+    """
+    abstract_text, fulltext = await fetch_publication(pmid, fetchers)
+    prepared = prepare_publication(
+        pmid,
+        abstract_text,
+        fulltext,
+        allowed_licenses=allowed_licenses,
+        chunk_max_tokens=chunk_max_tokens,
+        chunk_overlap_tokens=chunk_overlap_tokens,
+        tokenizer=tokenizer,
+    )
+    return await persist_publication(db, prepared, ensure_metadata=ensure_metadata)
+
+
 @dataclass
 class SyncCounts:
     """Aggregate counts for a batch publication sync.
@@ -372,6 +564,10 @@ class SyncCounts:
         full_text_fetched: Publications that gained license-permitted passages.
         license_skipped: Publications whose body text was dropped by the gate.
         errors: Publications that raised during processing.
+        unchanged: Processed publications whose content hash matched the last
+            stored one, so only their fetch timestamp was updated.
+        resumed: Publications skipped because the resumed job already
+            finished them (not included in ``processed``).
     """
 
     processed: int = 0
@@ -379,6 +575,8 @@ class SyncCounts:
     full_text_fetched: int = 0
     license_skipped: int = 0
     errors: int = 0
+    unchanged: int = 0
+    resumed: int = 0
 
 
 async def sync_publications(
@@ -391,16 +589,29 @@ async def sync_publications(
     chunk_overlap_tokens: int = 50,
     abstract_api_key: Optional[str] = None,
     ensure_metadata: Optional[Callable[[str], Awaitable[None]]] = None,
-    rate_limit_delay: float = 0.35,
+    concurrency: Optional[int] = None,
+    prefetch_batch_size: int = 100,
+    job: Optional[sync_jobs.SyncJob] = None,
+    skip_unchanged: bool = True,
+    on_progress: Optional[Callable[[SyncCounts], Awaitable[None]]] = None,
 ) -> SyncCounts:
-    """Process a batch of PMIDs with per-PMID error isolation and rate limiting.
+    """Process a batch of PMIDs as a pipeline with per-PMID error isolation.
 
     Shared by the admin sync endpoint's background task and the one-off backfill
-    script. Each publication is processed independently: a failure is counted,
-    the session is rolled back, and the batch continues.
+    script. PMIDs are taken in windows of ``prefetch_batch_size`` whose
+    abstracts and PMCIDs are looked up in batched requests; up to
+    ``concurrency`` publications are fetched at once (each request waiting on
+    its host's rate limiter) and chunked on worker threads, while a single
+    writer persists them in input order on ``db``. A failure is counted, the
+    session is rolled back, and the batch continues.
+
+    With a ``job``, PMIDs the job already finished are skipped and every
+    outcome is checkpointed on it; with ``skip_unchanged`` as well, a
+    publication whose prepared content hashes to the last stored value only has
+    its fetch timestamp updated.
 
     Args:
-        db: The async session.
+        db: The async session (used only by the writer).
         pmids: PMIDs to process (prefixed or bare).
         session: A shared aiohttp client session for external fetches.
         allowed_licenses: License allow-set for the gate.
@@ -410,86 +621,277 @@ async def sync_publications(
         ensure_metadata: Optional best-effort coroutine that ensures base
             citation metadata (title/authors/...) exists for a PMID before its
             abstract/full-text columns are updated.
-        rate_limit_delay: Seconds to sleep between publications (politeness).
+        concurrency: Publications fetched at once (default: settings).
+        prefetch_batch_size: PMIDs per batched abstract/PMCID lookup.
+        job: Optional open sync job to resume from and checkpoint on.
+        skip_unchanged: Skip rewriting publications with an unchanged content
+            hash (only with a ``job``).
+        on_progress: Optional coroutine called with the running counts after
+            each publication is written.
 
     Returns:
         Aggregate :class:`SyncCounts` for the batch.
     """
-    fetchers = build_fetchers(session, abstract_api_key=abstract_api_key)
+    from app.core.config import settings
+
     counts = SyncCounts()
-    for pmid in pmids:
-        try:
-            if ensure_metadata is not None:
-                try:
-                    await ensure_metadata(pmid)
-                except Exception as exc:  # noqa: BLE001 - placeholder row covers this
-                    logger.warning("base metadata ensure failed for %s: %s", pmid, exc)
-            outcome = await process_publication(
-                db,
-                pmid,
-                fetchers=fetchers,
-                allowed_licenses=allowed_licenses,
-                chunk_max_tokens=chunk_max_tokens,
-                chunk_overlap_tokens=chunk_overlap_tokens,
+    previous_hashes: dict[str, str] = {}
+    if job is not None:
+        pending = [p for p in pmids if _normalize(p) not in job.finished]
+        counts.resumed = len(pmids) - len(pending)
+        pmids = pending
+        if skip_unchanged:
+            previous_hashes = await sync_jobs.latest_content_hashes(
+                db, [_normalize(p) for p in pmids]
             )
-            counts.processed += 1
-            counts.abstracts_fetched += int(outcome.abstract_fetched)
-            counts.full_text_fetched += int(outcome.full_text_fetched)
-            counts.license_skipped += int(outcome.license_skipped)
-        except Exception as exc:  # noqa: BLE001 - isolate per-PMID, continue batch
-            counts.errors += 1
-            await db.rollback()
-            logger.warning("publication sync failed for %s: %s", pmid, exc)
-        if rate_limit_delay:
-            await asyncio.sleep(rate_limit_delay)
+
+    fetchers = build_fetchers(session, abstract_api_key=abstract_api_key)
+    workers = concurrency or settings.publications_rag.sync_concurrency
+    # Shared across runs: re-syncing an unchanged article reuses its offsets.
+    tokenizer = await asyncio.to_thread(
+        get_cached_tokenizer, settings.publications_rag.tokenizer_cache_size
+    )
+    fetch_slots = asyncio.Semaphore(workers)
+    # Bounded hand-off from the fetch stage to the writer: the producer stops
+    # spawning fetches when the writer falls behind.
+    ready: asyncio.Queue[Optional[tuple[str, asyncio.Task[PreparedPublication]]]] = (
+        asyncio.Queue(maxsize=2 * workers)
+    )
+
+    async def _prepare(pmid: str) -> PreparedPublication:
+        async with fetch_slots:
+            abstract_text, fulltext = await fetch_publication(pmid, fetchers)
+        return await asyncio.to_thread(
+            prepare_publication,
+            pmid,
+            abstract_text,
+            fulltext,
+            allowed_licenses=allowed_licenses,
+            chunk_max_tokens=chunk_max_tokens,
+            chunk_overlap_tokens=chunk_overlap_tokens,
+            tokenizer=tokenizer,
+        )
+
+    async def _produce() -> None:
+        step = max(prefetch_batch_size, 1)
+        for start in range(0, len(pmids), step):
+            window = pmids[start : start + step]
+            if fetchers.prefetch is not None:
+                try:
+                    await fetchers.prefetch(window)
+                except Exception as exc:  # noqa: BLE001 - per-PMID fetch fallback
+                    logger.warning("publication prefetch failed: %s", exc)
+            for pmid in window:
+                task = asyncio.create_task(_prepare(pmid))
+                try:
+                    await ready.put((pmid, task))
+                except asyncio.CancelledError:
+                    task.cancel()
+                    raise
+        await ready.put(None)
+
+    producer = asyncio.create_task(_produce())
+    try:
+        while (item := await ready.get()) is not None:
+            pmid, task = item
+            try:
+                prepared = await task
+                outcome = prepared.outcome
+                if previous_hashes.get(outcome.pmid) == prepared.content_hash:
+                    await persistence.touch_fulltext_fetched_at(db, outcome.pmid)
+                    await db.commit()
+                    counts.unchanged += 1
+                    item_status = sync_jobs.ITEM_UNCHANGED
+                else:
+                    if ensure_metadata is not None:
+                        try:
+                            await ensure_metadata(pmid)
+                        except Exception as exc:  # noqa: BLE001 - placeholder row
+                            logger.warning(
+                                "base metadata ensure failed for %s: %s", pmid, exc
+                            )
+                    outcome = await persist_publication(db, prepared)
+                    item_status = sync_jobs.ITEM_DONE
+                counts.processed += 1
+                counts.abstracts_fetched += int(outcome.abstract_fetched)
+                counts.full_text_fetched += int(outcome.full_text_fetched)
+                counts.license_skipped += int(outcome.license_skipped)
+                if job is not None:
+                    await sync_jobs.record_item(
+                        db,
+                        job,
+                        outcome.pmid,
+                        status=item_status,
+                        content_hash=prepared.content_hash,
+                    )
+            except Exception as exc:  # noqa: BLE001 - isolate per-PMID, continue batch
+                counts.errors += 1
+                await db.rollback()
+                logger.warning("publication sync failed for %s: %s", pmid, exc)
+                if job is not None:
+                    await _record_failure(db, job, pmid, exc)
+            if on_progress is not None:
+                await on_progress(counts)
+        await producer
+    finally:
+        producer.cancel()
+        while not ready.empty():
+            queued = ready.get_nowait()
+            if queued is not None:
+                queued[1].cancel()
     return counts
 
 
+def _normalize(pmid: str) -> str:
+    return f"PMID:{pmid.replace('PMID:', '')}"
+
+
+async def _record_failure(
+    db: AsyncSession, job: sync_jobs.SyncJob, pmid: str, exc: Exception
+) -> None:
+    """Checkpoint a failed PMID; a checkpoint write failure is only logged."""
+    try:
+        await sync_jobs.record_item(
+            db, job, _normalize(pmid), status=sync_jobs.ITEM_FAILED, error=str(exc)
+        )
+    except Exception as record_exc:  # noqa: BLE001 - the PMID is retried on resume
+        await db.rollback()
+        logger.warning("could not checkpoint failed %s: %s", pmid, record_exc)
+
+
+@dataclass
+class EmbeddingBackfillCounts:
+    """Aggregate counts for an embedding backfill run.
+
+    Attributes:
+        embedded: Passages embedded and written.
+        batches: Batches written (one upsert statement and commit each).
+        elapsed_seconds: Wall-clock duration of the run.
+    """
+
+    embedded: int = 0
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def passages_per_second(self) -> float:
+        """Return the end-to-end embedding throughput of the run."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.embedded / self.elapsed_seconds
+
+
+async def _stale_passage_batches(
+    db: AsyncSession,
+    *,
+    model_name: str,
+    batch_size: int,
+    max_passages: Optional[int],
+    page_size: int,
+) -> AsyncGenerator[list[persistence.PendingPassage], None]:
+    """Yield batches of passages whose stored ``text_hash`` is stale.
+
+    Walks the passage table once in keyset order, so the cost of a run is
+    linear in the corpus however many batches it writes.
+    """
+    after: Optional[tuple[str, str]] = None
+    batch: list[persistence.PendingPassage] = []
+    taken = 0
+    while max_passages is None or taken < max_passages:
+        page = await persistence.fetch_passage_page(
+            db, model_name=model_name, after=after, limit=page_size
+        )
+        if not page:
+            break
+        after = (page[-1].pmid, page[-1].passage_id)
+        for passage in page:
+            if passage.stored_hash == hash_text(passage.text):
+                continue
+            batch.append(passage)
+            taken += 1
+            if len(batch) == batch_size or taken == max_passages:
+                yield batch
+                batch = []
+            if taken == max_passages:
+                break
+    if batch:
+        yield batch
+
+
 async def backfill_embeddings(
     db: AsyncSession,
     provider: EmbeddingProvider,
     *,
     batch_size: int = 32,
     max_passages: Optional[int] = None,
-) -> int:
+    page_size: int = 1000,
+) -> EmbeddingBackfillCounts:
     """Embed passages whose stored ``text_hash`` is stale, in batches.
 
     Skips passages already embedded with a matching ``text_hash`` for the
-    provider's model, so re-runs are idempotent and cheap.
+    provider's model, so re-runs are idempotent and cheap. Each batch is
+    written with one multi-row upsert and committed; encoding of the next
+    batch runs concurrently with the read and write of the current one.
 
     Args:
         db: The async session (committed per batch).
         provider: The embedding provider.
         batch_size: Number of passages embedded and committed per batch.
         max_passages: Optional cap on total passages embedded this run.
+        page_size: Passages read per keyset page while scanning for stale
+            embeddings.
 
     Returns:
-        The number of passages embedded.
+        :class:`EmbeddingBackfillCounts` including the passages/second rate.
     """
     model_name = provider.model_name
-    embedded = 0
-    while True:
-        remaining = batch_size
-        if max_passages is not None:
-            remaining = min(batch_size, max_passages - embedded)
-            if remaining <= 0:
-                break
-        batch = await persistence.fetch_passages_needing_embedding(
-            db, model_name=model_name, text_hash_of=hash_text, limit=remaining
+    counts = EmbeddingBackfillCounts()
+    started = time.perf_counter()
+    batches = _stale_passage_batches(
+        db,
+        model_name=model_name,
+        batch_size=batch_size,
+        max_passages=max_passages,
+        page_size=page_size,
+    )
+
+    def _encode(
+        batch: list[persistence.PendingPassage],
+    ) -> asyncio.Task[list[list[float]]]:
+        return asyncio.create_task(
+            provider.embed([passage.text for passage in batch], is_query=False)
         )
-        if not batch:
-            break
-        vectors = await provider.embed([text for _, _, text in batch], is_query=False)
-        for (passage_id, pmid, passage_text), vector in zip(batch, vectors):
-            await persistence.upsert_embedding(
+
+    batch = await anext(batches, None)
+    encoding = _encode(batch) if batch else None
+    try:
+        while batch is not None and encoding is not None:
+            next_batch = await anext(batches, None)
+            vectors = await encoding
+            encoding = _encode(next_batch) if next_batch else None
+            await persistence.bulk_upsert_embeddings(
                 db,
-                passage_id=passage_id,
-                pmid=pmid,
                 model_name=model_name,
-                embedding=vector,
-                text_hash=hash_text(passage_text),
+                rows=[
+                    (passage.passage_id, passage.pmid, vector, hash_text(passage.text))
+                    for passage, vector in zip(batch, vectors)
+                ],
             )
-        await db.commit()
-        embedded += len(batch)
-        logger.info("embedded %s passages (model=%s)", embedded, model_name)
-    return embedded
+            await db.commit()
+            invalidate_embeddings_probe(model_name)
+            counts.embedded += len(batch)
+            counts.batches += 1
+            counts.elapsed_seconds = time.perf_counter() - started
+            logger.info(
+                "embedded %s passages (model=%s, %.1f passages/s)",
+                counts.embedded,
+                model_name,
+                counts.passages_per_second,
+            )
+            batch = next_batch
+    finally:
+        if encoding is not None and not encoding.done():
+            encoding.cancel()
+        await batches.aclose()
+    counts.elapsed_seconds = time.perf_counter() - started
+    return counts
@@ -8,12 +8,14 @@ metadata, passages, and embeddings move atomically).
 
 pgvector has no asyncpg type codec here, so embedding vectors are bound as their
 canonical text literal (``"[v1,v2,...]"``) and cast with ``::vector`` in SQL.
+Bulk writes bind a ``text[]`` of literals and cast each ``unnest``-ed element,
+so a whole batch is one statement and one round trip.
 """
 
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Callable, Optional, Sequence
+from typing import NamedTuple, Optional, Sequence
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -100,6 +102,28 @@ async def update_metadata_coverage(
     )
 
 
+async def touch_fulltext_fetched_at(
+    db: AsyncSession, pmid: str, *, fetched_at: Optional[datetime] = None
+) -> None:
+    """Stamp a re-fetch whose content was unchanged, leaving the content as is.
+
+    Args:
+        db: The async session.
+        pmid: PMID (prefixed or bare).
+        fetched_at: Timestamp of this fetch; defaults to ``now(UTC)``.
+    """
+    await db.execute(
+        text(
+            "UPDATE publication_metadata SET fulltext_fetched_at = :fetched_at "
+            "WHERE pmid = :pmid"
+        ),
+        {
+            "pmid": _normalize_pmid(pmid),
+            "fetched_at": fetched_at or datetime.now(timezone.utc),
+        },
+    )
+
+
 async def replace_passages(
     db: AsyncSession, pmid: str, passages: Sequence[PassageRow]
 ) -> int:
@@ -151,47 +175,101 @@ async def replace_passages(
     return len(passages)
 
 
-async def fetch_passages_needing_embedding(
+class PendingPassage(NamedTuple):
+    """A passage row with the text hash of its stored embedding, if any."""
+
+    passage_id: str
+    pmid: str
+    text: str
+    stored_hash: Optional[str]
+
+
+async def fetch_passage_page(
     db: AsyncSession,
     *,
     model_name: str,
-    text_hash_of: Callable[[str], str],
+    after: Optional[tuple[str, str]] = None,
     limit: int = 500,
-) -> list[tuple[str, str, str]]:
-    """Return passages that lack a current embedding for *model_name*.
+) -> list[PendingPassage]:
+    """Return the next page of passages with their stored embedding hash.
 
-    A passage needs (re)embedding when no embedding row exists for it under
-    *model_name*, or the stored ``text_hash`` differs from the current text's
-    hash. The hash comparison is done in Python via *text_hash_of* so the
-    hashing stays consistent with the embedding provider layer.
+    Pages are keyset-ordered on the primary key ``(pmid, passage_id)``, so a
+    full walk reads every passage exactly once regardless of how many
+    embeddings are written in between.
 
     Args:
         db: The async session.
         model_name: The embedding model identifier.
-        text_hash_of: Callable mapping passage text to its SHA-256 hex digest.
-        limit: Maximum number of passages to return.
+        after: The ``(pmid, passage_id)`` of the last row of the previous
+            page, or ``None`` for the first page.
+        limit: Maximum number of rows to return.
 
     Returns:
-        A list of ``(passage_id, pmid, text)`` tuples to embed.
+        Up to *limit* :class:`PendingPassage` rows; the caller decides which
+        are stale.
     """
+    after_pmid, after_passage_id = after or ("", "")
     result = await db.execute(
         text(
             "SELECT f.passage_id, f.pmid, f.text, e.text_hash AS stored_hash "
             "FROM publication_fulltext f "
             "LEFT JOIN publication_fulltext_embeddings e "
             "  ON e.passage_id = f.passage_id AND e.model_name = :model "
-            "ORDER BY f.pmid, f.seq"
+            "WHERE (f.pmid, f.passage_id) > (:after_pmid, :after_passage_id) "
+            "ORDER BY f.pmid, f.passage_id "
+            "LIMIT :limit"
         ),
-        {"model": model_name},
+        {
+            "model": model_name,
+            "after_pmid": after_pmid,
+            "after_passage_id": after_passage_id,
+            "limit": limit,
+        },
+    )
+    return [PendingPassage(*row) for row in result.fetchall()]
+
+
+async def bulk_upsert_embeddings(
+    db: AsyncSession,
+    *,
+    model_name: str,
+    rows: Sequence[tuple[str, str, Sequence[float], str]],
+) -> int:
+    """Insert or update many passage embeddings in one statement.
+
+    Args:
+        db: The async session.
+        model_name: The embedding model identifier (part of the PK).
+        rows: ``(passage_id, pmid, embedding, text_hash)`` tuples; passage
+            IDs must be unique within the call.
+
+    Returns:
+        The number of rows written.
+    """
+    if not rows:
+        return 0
+    await db.execute(
+        text(
+            "INSERT INTO publication_fulltext_embeddings "
+            "(passage_id, pmid, model_name, embedding, text_hash, created_at) "
+            "SELECT u.passage_id, u.pmid, :model, CAST(u.embedding AS vector), "
+            "       u.text_hash, now() "
+            "FROM unnest(CAST(:passage_ids AS text[]), CAST(:pmids AS text[]), "
+            "            CAST(:embeddings AS text[]), CAST(:text_hashes AS text[])) "
+            "  AS u(passage_id, pmid, embedding, text_hash) "
+            "ON CONFLICT (passage_id, model_name) DO UPDATE SET "
+            "  embedding = EXCLUDED.embedding, text_hash = EXCLUDED.text_hash, "
+            "  created_at = EXCLUDED.created_at"
+        ),
+        {
+            "model": model_name,
+            "passage_ids": [passage_id for passage_id, _, _, _ in rows],
+            "pmids": [_normalize_pmid(pmid) for _, pmid, _, _ in rows],
+            "embeddings": [to_vector_literal(vector) for _, _, vector, _ in rows],
+            "text_hashes": [text_hash for _, _, _, text_hash in rows],
+        },
     )
-    out: list[tuple[str, str, str]] = []
-    for row in result.fetchall():
-        if row.stored_hash == text_hash_of(row.text):
-            continue
-        out.append((row.passage_id, row.pmid, row.text))
-        if len(out) >= limit:
-            break
-    return out
+    return len(rows)
 
 
 async def upsert_embedding(
@@ -0,0 +1,78 @@
+"""Per-host token-bucket rate limiting for the publication fetch clients.
+
+Every request to an upstream host (NCBI efetch, the PMC ID converter,
+PubTator3, EuropePMC) first takes a token from that host's bucket, so any
+number of concurrent fetches share one request rate per host. Buckets are
+process-wide: two overlapping sync runs still respect the upstream limits
+together.
+
+Reservations are made synchronously (a bucket may go into debt and the caller
+sleeps it off), so a bucket needs no lock and can be shared across event loops.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Token bucket admitting ``requests_per_second`` with a small burst.
+
+    Callers are admitted in arrival order: each reservation pushes the next
+    free slot further out, and the caller sleeps until its own slot.
+    """
+
+    def __init__(self, requests_per_second: float, burst: float = 1.0) -> None:
+        """Create a full bucket.
+
+        Args:
+            requests_per_second: Sustained request rate; ``<= 0`` disables
+                the limit.
+            burst: Requests that may be made back-to-back after an idle
+                period.
+        """
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take a token and return how long to wait before using it."""
+        if self.requests_per_second <= 0:
+            return 0.0
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst,
+            self._tokens + (now - self._updated) * self.requests_per_second,
+        )
+        self._updated = now
+        self._tokens -= 1.0
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.requests_per_second
+
+    async def acquire(self) -> None:
+        """Wait until a request may be made."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+_BUCKETS: dict[str, TokenBucket] = {}
+
+
+def host_rate_limiter(url: str, requests_per_second: float) -> TokenBucket:
+    """Return the shared bucket for ``url``'s host at the given rate.
+
+    The bucket is created on first use; a later call with a different rate
+    (e.g. once an NCBI API key is configured) retunes it in place.
+    """
+    host = urlsplit(url).netloc.lower()
+    bucket = _BUCKETS.get(host)
+    if bucket is None:
+        bucket = _BUCKETS[host] = TokenBucket(requests_per_second)
+    else:
+        bucket.requests_per_second = requests_per_second
+    return bucket
@@ -8,6 +8,20 @@ Reciprocal Rank Fusion (:func:`app.publications.fulltext.rrf.rrf_fuse`) plus
 per-section boosts. ``rerank`` selects the strategy and degrades gracefully to
 lexical when semantics are unavailable.
 
+The legs run concurrently: the lexical query runs on the caller's session
+while the query embedding is computed and the dense query runs on its own
+pooled session, so latency is roughly that of the slower leg. Dense candidates
+carry their full passage rows, and the per-model embeddings-present probe is
+cached for ``embeddings_probe_ttl_seconds``.
+
+The dense leg sets the HNSW search parameters per query (``hnsw.ef_search``,
+at least the candidate limit, and ``hnsw.iterative_scan`` when a filter is
+active, so a filtered scan keeps searching until it has enough matches). A
+PMID filter narrow enough (``dense_exact_max_pmids``) is answered by an exact
+scan of the filtered passages instead, which is both cheaper and lossless.
+:mod:`app.publications.fulltext.ann_benchmark` measures recall against exact
+search for a given setting.
+
 All SQL is parameterized; the free-text query reaches Postgres only through
 ``phraseto_tsquery`` / ``websearch_to_tsquery`` / a sanitized alnum
 ``to_tsquery`` string, never via string interpolation.
@@ -15,8 +29,10 @@ All SQL is parameterized; the free-text query reaches Postgres only through
 
 from __future__ import annotations
 
+import asyncio
 import re
-from typing import Any, Mapping, Optional, Sequence
+import time
+from typing import Any, Callable, Mapping, Optional, Sequence
 
 from sqlalchemy import bindparam, text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -39,6 +55,9 @@ _CHARS_PER_WORD = 6
 #: the char budget while the ``MaxWords >= MinWords`` invariant always holds.
 _SNIPPET_WORD_MARGIN = 5
 
+#: model name -> (embeddings present, ``time.monotonic()`` of the check).
+_embeddings_present_cache: dict[str, tuple[bool, float]] = {}
+
 
 def _or_query(query: str) -> str:
     """Return a sanitized ``to_tsquery`` OR-string of alnum terms (may be empty)."""
@@ -111,6 +130,32 @@ async def _lexical_candidates(
     return list(result.fetchall())
 
 
+async def set_hnsw_search_params(
+    db: AsyncSession, *, ef_search: int, iterative_scan: str = "off"
+) -> None:
+    """Set pgvector HNSW search parameters for the current transaction.
+
+    Args:
+        db: The async session (inside the transaction that runs the query).
+        ef_search: Size of the dynamic candidate list (clamped to 1..1000).
+        iterative_scan: ``off``, ``strict_order`` or ``relaxed_order``; only
+            sent to Postgres when not ``off`` (needs pgvector >= 0.8).
+    """
+    settings_sql = ["set_config('hnsw.ef_search', :ef_search, true)"]
+    params = {"ef_search": str(min(max(ef_search, 1), 1000))}
+    if iterative_scan != "off":
+        settings_sql.append("set_config('hnsw.iterative_scan', :iterative_scan, true)")
+        params["iterative_scan"] = iterative_scan
+    await db.execute(text(f"SELECT {', '.join(settings_sql)}"), params)
+
+
+def _use_exact_dense_search(pmids: Optional[Sequence[str]]) -> bool:
+    """Return whether the PMID filter is narrow enough for an exact scan."""
+    if not pmids:
+        return False
+    return len(pmids) <= settings.publications_rag.dense_exact_max_pmids
+
+
 async def _dense_candidates(
     db: AsyncSession,
     qvec: Sequence[float],
@@ -119,28 +164,56 @@ async def _dense_candidates(
     pmids: Optional[Sequence[str]],
     sections: Optional[Sequence[str]],
     limit: int,
+    ef_search: Optional[int] = None,
 ) -> list[Any]:
-    """Return rows (passage_id, section) ordered by cosine distance (best-first).
+    """Return passage rows ordered by cosine distance (best-first).
 
-    The ``section`` is returned alongside so section boosts can be applied to
-    dense-only passages too (those not present in the lexical leg), before the
-    full passage rows are materialized.
+    Rows carry the same columns as the lexical leg, so dense-only passages
+    (those not present in the lexical leg) need no follow-up fetch and their
+    ``section`` is available for boosts.
+
+    A narrow PMID filter is searched exactly: the filtered rows are
+    materialized first, so the planner cannot post-filter an HNSW scan.
+    Otherwise the HNSW parameters are set for this transaction; under
+    ``relaxed_order`` iterative scans the index may return rows slightly out
+    of order, so they are re-sorted by distance.
     """
+    cfg = settings.publications_rag
     params: dict[str, Any] = {
         "model": model_name,
         "qvec": to_vector_literal(qvec),
         "dense_limit": limit,
     }
     filter_sql, params = _apply_filters(params, pmids, sections)
-    sql = (
-        "SELECT e.passage_id, f.section "
+    columns = (
+        "f.pmid, f.passage_id, f.section, f.seq, f.text, "
+        "f.char_count, f.token_count, f.source"
+    )
+    candidates = (
+        f"SELECT {columns}, e.embedding <=> CAST(:qvec AS vector) AS distance "
         "FROM publication_fulltext_embeddings e "
         "JOIN publication_fulltext f "
         "  ON f.pmid = e.pmid AND f.passage_id = e.passage_id "
-        f"WHERE e.model_name = :model{filter_sql} "
-        "ORDER BY e.embedding <=> CAST(:qvec AS vector) "
-        "LIMIT :dense_limit"
+        f"WHERE e.model_name = :model{filter_sql}"
     )
+    if _use_exact_dense_search(pmids):
+        sql = (
+            f"WITH cand AS MATERIALIZED ({candidates}) "
+            "SELECT * FROM cand ORDER BY distance LIMIT :dense_limit"
+        )
+    else:
+        iterative_scan = cfg.hnsw_iterative_scan if (pmids or sections) else "off"
+        await set_hnsw_search_params(
+            db,
+            ef_search=max(ef_search or cfg.hnsw_ef_search, limit),
+            iterative_scan=iterative_scan,
+        )
+        sql = f"{candidates} ORDER BY distance LIMIT :dense_limit"
+        if iterative_scan == "relaxed_order":
+            sql = (
+                f"WITH cand AS MATERIALIZED ({sql}) "
+                "SELECT * FROM cand ORDER BY distance"
+            )
     stmt = _with_filter_bindparams(text(sql), pmids, sections)
     result = await db.execute(stmt, params)
     return list(result.fetchall())
@@ -174,8 +247,35 @@ def _with_filter_bindparams(
     return stmt.bindparams(*expanding) if expanding else stmt
 
 
+def invalidate_embeddings_probe(model_name: Optional[str] = None) -> None:
+    """Forget cached embeddings-present probes (all models when ``None``).
+
+    Called after embeddings are written or removed in this process; other
+    processes pick the change up when their cached probe expires.
+    """
+    if model_name is None:
+        _embeddings_present_cache.clear()
+    else:
+        _embeddings_present_cache.pop(model_name, None)
+
+
+def _cached_embeddings_present(model_name: str) -> Optional[bool]:
+    """Return the cached probe result for *model_name* if still fresh."""
+    cached = _embeddings_present_cache.get(model_name)
+    if cached is None:
+        return None
+    present, checked_at = cached
+    ttl = settings.publications_rag.embeddings_probe_ttl_seconds
+    if time.monotonic() - checked_at >= ttl:
+        return None
+    return present
+
+
 async def _embeddings_present(db: AsyncSession, model_name: str) -> bool:
-    """Return whether any embedding row exists for *model_name*."""
+    """Return whether any embedding row exists for *model_name* (cached)."""
+    cached = _cached_embeddings_present(model_name)
+    if cached is not None:
+        return cached
     result = await db.execute(
         text(
             "SELECT 1 FROM publication_fulltext_embeddings "
@@ -183,21 +283,62 @@ async def _embeddings_present(db: AsyncSession, model_name: str) -> bool:
         ),
         {"model": model_name},
     )
-    return result.first() is not None
+    present = result.first() is not None
+    _embeddings_present_cache[model_name] = (present, time.monotonic())
+    return present
 
 
-async def _fetch_missing_rows(
-    db: AsyncSession, passage_ids: Sequence[str]
-) -> dict[str, Any]:
-    """Fetch full passage rows for *passage_ids* (for dense-only candidates)."""
-    if not passage_ids:
-        return {}
-    stmt = text(
-        "SELECT pmid, passage_id, section, seq, text, char_count, "
-        "token_count, source FROM publication_fulltext WHERE passage_id IN :ids"
-    ).bindparams(bindparam("ids", expanding=True))
-    result = await db.execute(stmt, {"ids": list(passage_ids)})
-    return {row.passage_id: row for row in result.fetchall()}
+def _open_session(session_factory: Optional[Callable[[], Any]]) -> Any:
+    """Open a session for the dense leg (default: the app's pooled factory)."""
+    if session_factory is not None:
+        return session_factory()
+    from app import database
+
+    return database.async_session_maker()
+
+
+async def _dense_leg(
+    provider: Optional[EmbeddingProvider],
+    query: str,
+    *,
+    model_name: str,
+    pmids: Optional[Sequence[str]],
+    sections: Optional[Sequence[str]],
+    limit: int,
+    session_factory: Optional[Callable[[], Any]],
+    ef_search: Optional[int] = None,
+) -> tuple[bool, Optional[Sequence[float]], list[Any]]:
+    """Probe, embed the query and run the dense query on a separate session.
+
+    The query embedding starts alongside the presence probe unless the probe
+    is already known (from cache) to be negative.
+
+    Returns:
+        ``(embeddings_present, query_vector, dense_rows)``; the vector is
+        ``None`` and the rows empty when the dense leg cannot run.
+    """
+    embedding: Optional[asyncio.Task[list[list[float]]]] = None
+    if provider is not None and _cached_embeddings_present(model_name) is not False:
+        embedding = asyncio.create_task(provider.embed([query], is_query=True))
+    try:
+        async with _open_session(session_factory) as dense_db:
+            has_embeddings = await _embeddings_present(dense_db, model_name)
+            if embedding is None or not has_embeddings:
+                return has_embeddings, None, []
+            qvec = (await embedding)[0]
+            rows = await _dense_candidates(
+                dense_db,
+                qvec,
+                model_name=model_name,
+                pmids=pmids,
+                sections=sections,
+                limit=limit,
+                ef_search=ef_search,
+            )
+            return True, qvec, rows
+    finally:
+        if embedding is not None and not embedding.done():
+            embedding.cancel()
 
 
 async def _apply_brief_snippets(
@@ -261,6 +402,8 @@ async def search_passages(
     lexical_candidate_limit: Optional[int] = None,
     dense_candidate_limit: Optional[int] = None,
     model_name: Optional[str] = None,
+    dense_session_factory: Optional[Callable[[], Any]] = None,
+    ef_search: Optional[int] = None,
 ) -> RetrievalResult:
     """Retrieve ranked passages for *query* via hybrid lexical + semantic search.
 
@@ -286,6 +429,11 @@ async def search_passages(
         lexical_candidate_limit: Lexical candidate pool size (defaults to config).
         dense_candidate_limit: Dense candidate pool size (defaults to config).
         model_name: Embedding model name for the dense leg (defaults to config).
+        dense_session_factory: Callable returning an ``AsyncSession`` context
+            manager for the concurrently-run dense leg; defaults to
+            ``app.database.async_session_maker``.
+        ef_search: HNSW ``ef_search`` for this query's dense leg (defaults to
+            config; never below the dense candidate limit).
 
     Returns:
         A :class:`RetrievalResult` with ranked passages and ``_meta`` diagnostics.
@@ -314,9 +462,36 @@ async def search_passages(
 
     notes: list[str] = []
 
-    lexical_rows = await _lexical_candidates(
-        db, query, pmids=pmids, sections=sections, limit=lex_limit
+    # --- run both legs concurrently ---
+    want_dense = rerank == "rrf"
+    lexical_task = asyncio.create_task(
+        _lexical_candidates(db, query, pmids=pmids, sections=sections, limit=lex_limit)
+    )
+    dense_task = (
+        asyncio.create_task(
+            _dense_leg(
+                provider,
+                query,
+                model_name=model_name,
+                pmids=pmids,
+                sections=sections,
+                limit=dense_limit,
+                session_factory=dense_session_factory,
+                ef_search=ef_search,
+            )
+        )
+        if want_dense
+        else None
     )
+    try:
+        lexical_rows = await lexical_task
+        dense_outcome = await dense_task if dense_task is not None else None
+    except BaseException:
+        for task in (lexical_task, dense_task):
+            if task is not None and not task.done():
+                task.cancel()
+        raise
+
     lexical_ids = [r.passage_id for r in lexical_rows]
     rows_by_id: dict[str, Any] = {r.passage_id: r for r in lexical_rows}
     lexical_rank = {pid: i + 1 for i, pid in enumerate(lexical_ids)}
@@ -333,19 +508,17 @@ async def search_passages(
     embeddings_available = False
 
     # Section lookup for boosts — seeded from the lexical leg and extended with
-    # the dense leg below so dense-ONLY passages are boosted too (the dense query
-    # returns each candidate's section for exactly this reason).
+    # the dense leg below so dense-ONLY passages are boosted too.
     section_by_id: dict[str, str] = {r.passage_id: r.section for r in lexical_rows}
 
-    want_dense = rerank == "rrf"
-    if want_dense:
-        # Probe BOTH causes independently so the notes can distinguish
+    if dense_outcome is not None:
+        # Both causes are probed independently so the notes can distinguish
         # provider-missing / embeddings-missing / both. The presence probe is a
-        # cheap ``LIMIT 1`` existence check; without it the provider-missing
-        # branch would mask whether embeddings ALSO exist, leaving an operator
-        # unable to tell what to fix.
+        # cheap (cached) ``LIMIT 1`` existence check; without it the
+        # provider-missing branch would mask whether embeddings ALSO exist,
+        # leaving an operator unable to tell what to fix.
         has_provider = provider is not None
-        has_embeddings = await _embeddings_present(db, model_name)
+        has_embeddings, qvec, dense_rows = dense_outcome
         embeddings_available = has_provider and has_embeddings
         if not embeddings_available:
             rerank_used = "lexical"
@@ -358,21 +531,13 @@ async def search_passages(
                 # is there, so the fix is "install the embedding stack", not
                 # "backfill embeddings".
                 notes.append("dense disabled: embeddings present, provider missing")
-    if want_dense and embeddings_available:
-        qvec = (await provider.embed([query], is_query=True))[0]  # type: ignore[union-attr]
-        embedding_dim = len(qvec)
-        dense_rows = await _dense_candidates(
-            db,
-            qvec,
-            model_name=model_name,
-            pmids=pmids,
-            sections=sections,
-            limit=dense_limit,
-        )
-        dense_ids = [r.passage_id for r in dense_rows]
-        dense_rank = {pid: i + 1 for i, pid in enumerate(dense_ids)}
-        for r in dense_rows:
-            section_by_id.setdefault(r.passage_id, r.section)
+        else:
+            embedding_dim = len(qvec) if qvec is not None else None
+            dense_ids = [r.passage_id for r in dense_rows]
+            dense_rank = {pid: i + 1 for i, pid in enumerate(dense_ids)}
+            for r in dense_rows:
+                section_by_id.setdefault(r.passage_id, r.section)
+                rows_by_id.setdefault(r.passage_id, r)
 
     # --- fuse ---
     if rerank_used == "off":
@@ -389,10 +554,6 @@ async def search_passages(
         ordered_ids = [pid for pid, _ in fused]
         scores = dict(fused)
 
-    # Materialize rows for any dense-only ids not already loaded.
-    missing = [pid for pid in ordered_ids if pid not in rows_by_id]
-    rows_by_id.update(await _fetch_missing_rows(db, missing))
-
     # --- assemble, applying limit + (full-mode) char budget ---
     passages: list[RetrievedPassage] = []
     used_chars = 0
@@ -0,0 +1,307 @@
+"""Persisted checkpoints for resumable publication full-text syncs.
+
+Raw-SQL helpers over ``publication_sync_jobs`` / ``publication_sync_items``
+(migration ``f3f422b00007_publication_sync_jobs``). A sync run opens a job with
+:func:`open_sync_job`, which resumes the latest unfinished job for the same
+source when its worker is gone (the job failed, or its heartbeat is older than
+``stale_after_seconds``) and it was updated within ``max_resume_age_seconds``.
+Each PMID's outcome is recorded with :func:`record_item`, which also advances
+the job's counters, resume cursor and heartbeat, so a restarted run skips the
+PMIDs its predecessor finished.
+
+Every stored item carries the hash of the content that was persisted;
+:func:`latest_content_hashes` returns them so a later run can skip rewriting
+publications whose upstream content has not changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+ITEM_DONE = "done"
+ITEM_UNCHANGED = "unchanged"
+ITEM_FAILED = "failed"
+
+
+@dataclass
+class SyncJob:
+    """An open publication sync job.
+
+    Attributes:
+        id: Primary key of the ``publication_sync_jobs`` row.
+        source: Who runs the job (``"admin"`` or ``"backfill"``).
+        resumed: Whether an earlier, interrupted job was picked up.
+        cursor_pmid: Last PMID checkpointed by the job, if any.
+        finished: Normalized PMIDs already done or unchanged in this job.
+        started_at: When the job was first started.
+    """
+
+    id: int
+    source: str
+    resumed: bool = False
+    cursor_pmid: Optional[str] = None
+    finished: set[str] = field(default_factory=set)
+    started_at: Optional[datetime] = None
+
+
+def content_hash(
+    *,
+    abstract: Optional[str],
+    coverage: str,
+    license: Optional[str],
+    pmcid: Optional[str],
+    passages: Sequence[tuple[str, str, str, str]],
+) -> str:
+    """Return the SHA-256 digest of the content a sync would store for a PMID.
+
+    Args:
+        abstract: Abstract text, or ``None``.
+        coverage: Coverage tier.
+        license: Normalized license, or ``None``.
+        pmcid: PMCID, or ``None``.
+        passages: Ordered ``(passage_id, section, source, text)`` tuples.
+
+    Returns:
+        The 64-character lowercase hexadecimal digest.
+    """
+    payload = json.dumps(
+        [abstract, coverage, license, pmcid, [list(p) for p in passages]],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+async def open_sync_job(
+    db: AsyncSession,
+    *,
+    source: str,
+    total: int,
+    task_id: Optional[str] = None,
+    resume: bool = True,
+    stale_after_seconds: float = 600.0,
+    max_resume_age_seconds: float = 86400.0,
+) -> SyncJob:
+    """Resume the latest interrupted job for ``source`` or start a new one.
+
+    A ``running`` job whose heartbeat is recent belongs to a live worker and is
+    left alone; a new job is started next to it. A ``failed`` or orphaned job
+    last updated more than ``max_resume_age_seconds`` ago is abandoned rather
+    than resumed, since its checkpoints describe a long-gone corpus. Commits
+    the session.
+
+    Args:
+        db: The async session.
+        source: Job source label.
+        total: PMIDs in the current run.
+        task_id: Optional admin task id to associate with the job.
+        resume: When ``False``, always start a new job.
+        stale_after_seconds: Heartbeat age after which a ``running`` job is
+            considered orphaned by a dead worker.
+        max_resume_age_seconds: Age of the last update beyond which an
+            unfinished job is no longer resumed.
+
+    Returns:
+        The open :class:`SyncJob`.
+    """
+    row = None
+    if resume:
+        row = (
+            await db.execute(
+                text("""
+                    UPDATE publication_sync_jobs
+                    SET status = 'running', total = :total,
+                        task_id = COALESCE(:task_id, task_id),
+                        error = NULL, updated_at = NOW()
+                    WHERE id = (
+                        SELECT id FROM publication_sync_jobs
+                        WHERE source = :source
+                          AND (status = 'failed' OR (
+                              status = 'running'
+                              AND updated_at < NOW() - make_interval(
+                                  secs => CAST(:stale AS DOUBLE PRECISION)
+                              )
+                          ))
+                          AND updated_at >= NOW() - make_interval(
+                              secs => CAST(:max_age AS DOUBLE PRECISION)
+                          )
+                        ORDER BY updated_at DESC
+                        LIMIT 1
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    RETURNING id, cursor_pmid, started_at
+                """),
+                {
+                    "source": source,
+                    "total": total,
+                    "task_id": task_id,
+                    "stale": stale_after_seconds,
+                    "max_age": max_resume_age_seconds,
+                },
+            )
+        ).first()
+
+    if row is not None:
+        finished = await db.execute(
+            text(
+                "SELECT pmid FROM publication_sync_items "
+                "WHERE job_id = :job_id AND status IN ('done', 'unchanged')"
+            ),
+            {"job_id": row.id},
+        )
+        job = SyncJob(
+            id=row.id,
+            source=source,
+            resumed=True,
+            cursor_pmid=row.cursor_pmid,
+            finished={r.pmid for r in finished.fetchall()},
+            started_at=row.started_at,
+        )
+        logger.info(
+            "resuming publication sync job %s at %s (%s PMIDs already done)",
+            job.id,
+            job.cursor_pmid,
+            len(job.finished),
+        )
+    else:
+        row = (
+            await db.execute(
+                text(
+                    "INSERT INTO publication_sync_jobs (source, task_id, total) "
+                    "VALUES (:source, :task_id, :total) RETURNING id, started_at"
+                ),
+                {"source": source, "task_id": task_id, "total": total},
+            )
+        ).one()
+        job = SyncJob(id=row.id, source=source, started_at=row.started_at)
+    await db.commit()
+    return job
+
+
+async def record_item(
+    db: AsyncSession,
+    job: SyncJob,
+    pmid: str,
+    *,
+    status: str,
+    content_hash: Optional[str] = None,
+    error: Optional[str] = None,
+) -> None:
+    """Checkpoint one PMID's outcome and advance the job. Commits the session.
+
+    Args:
+        db: The async session.
+        job: The open job.
+        pmid: Normalized PMID.
+        status: ``"done"``, ``"unchanged"`` or ``"failed"``.
+        content_hash: Hash of the stored content (see :func:`content_hash`).
+        error: Error message for a failed item.
+    """
+    await db.execute(
+        text("""
+            INSERT INTO publication_sync_items
+                (job_id, pmid, status, content_hash, error)
+            VALUES (:job_id, :pmid, :status, :content_hash, :error)
+            ON CONFLICT (job_id, pmid) DO UPDATE SET
+                status = EXCLUDED.status,
+                content_hash = EXCLUDED.content_hash,
+                error = EXCLUDED.error,
+                processed_at = NOW()
+        """),
+        {
+            "job_id": job.id,
+            "pmid": pmid,
+            "status": status,
+            "content_hash": content_hash,
+            "error": error,
+        },
+    )
+    await db.execute(
+        text("""
+            UPDATE publication_sync_jobs
+            SET processed = processed + :processed,
+                unchanged = unchanged + :unchanged,
+                errors = errors + :errors,
+                cursor_pmid = :pmid,
+                updated_at = NOW()
+            WHERE id = :job_id
+        """),
+        {
+            "job_id": job.id,
+            "pmid": pmid,
+            "processed": int(status != ITEM_FAILED),
+            "unchanged": int(status == ITEM_UNCHANGED),
+            "errors": int(status == ITEM_FAILED),
+        },
+    )
+    await db.commit()
+    job.cursor_pmid = pmid
+    if status != ITEM_FAILED:
+        job.finished.add(pmid)
+
+
+async def finish_sync_job(
+    db: AsyncSession, job: SyncJob, *, error: Optional[str] = None
+) -> None:
+    """Mark a job completed, or failed (resumable) when ``error`` is given.
+
+    Commits the session.
+    """
+    await db.execute(
+        text("""
+            UPDATE publication_sync_jobs
+            SET status = :status, error = :error, updated_at = NOW(),
+                completed_at = :completed_at
+            WHERE id = :job_id
+        """),
+        {
+            "job_id": job.id,
+            "status": "failed" if error else "completed",
+            "error": error,
+            "completed_at": None if error else datetime.now(timezone.utc),
+        },
+    )
+    await db.commit()
+
+
+async def latest_content_hashes(
+    db: AsyncSession, pmids: Sequence[str]
+) -> dict[str, str]:
+    """Return the most recently stored content hash per normalized PMID.
+
+    Only publications whose full text is still recorded as fetched count, so a
+    PMID whose metadata was deleted (e.g. by a forced refresh) is rewritten.
+
+    Args:
+        db: The async session.
+        pmids: Normalized PMIDs to look up.
+
+    Returns:
+        ``{pmid: content_hash}`` for PMIDs with a stored hash.
+    """
+    if not pmids:
+        return {}
+    result = await db.execute(
+        text("""
+            SELECT DISTINCT ON (i.pmid) i.pmid, i.content_hash
+            FROM publication_sync_items i
+            JOIN publication_metadata pm
+              ON pm.pmid = i.pmid AND pm.fulltext_fetched_at IS NOT NULL
+            WHERE i.pmid = ANY(:pmids)
+              AND i.status IN ('done', 'unchanged')
+              AND i.content_hash IS NOT NULL
+            ORDER BY i.pmid, i.processed_at DESC
+        """),
+        {"pmids": list(pmids)},
+    )
+    return {row.pmid: row.content_hash for row in result.fetchall()}
@@ -12,17 +12,18 @@ Note:
     PMID validation uses centralized patterns from app.core.patterns.
 """
 
-import asyncio
 import json
 import logging
 from datetime import datetime, timezone
 from typing import Optional
 
-import aiohttp
+import httpx
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.aggregation_cache import bump_published_data_version
 from app.core.config import settings
+from app.core.http_clients import http_clients
 from app.core.patterns import normalize_pmid
 
 logger = logging.getLogger(__name__)
@@ -118,7 +119,11 @@ def validate_pmid(pmid: str) -> str:
 
 
 async def get_publication_metadata(
-    pmid: str, db: AsyncSession, fetched_by: Optional[str] = "system"
+    pmid: str,
+    db: AsyncSession,
+    fetched_by: Optional[str] = "system",
+    *,
+    invalidate_aggregations: bool = True,
 ) -> dict:
     """Fetch publication metadata with database caching.
 
@@ -132,6 +137,10 @@ async def get_publication_metadata(
         pmid: PubMed ID (format: PMID:12345678 or 12345678)
         db: Database session
         fetched_by: User or system identifier for audit trail
+        invalidate_aggregations: Bump the published data version after
+            storing fetched metadata, so cached publication aggregations
+            (which join ``publication_metadata``) are recomputed. Batch syncs
+            pass False and bump once when the batch finishes.
 
     Returns:
         dict: Publication metadata with keys:
@@ -173,6 +182,8 @@ async def get_publication_metadata(
     # Store in cache
     await _store_in_cache(metadata, db, fetched_by)
     logger.info(f"Cached metadata for {pmid}", extra={"pmid": pmid})
+    if invalidate_aggregations:
+        await bump_published_data_version()
 
     return metadata
 
@@ -256,81 +267,76 @@ async def _fetch_from_pubmed(pmid: str) -> dict:
         params["api_key"] = settings.PUBMED_API_KEY
 
     try:
-        async with aiohttp.ClientSession() as session:
-            # Use timeout from config
-            timeout = aiohttp.ClientTimeout(total=pubmed_config.timeout_seconds)
-            async with session.get(
-                pubmed_config.base_url, params=params, timeout=timeout
-            ) as response:
-                # Handle rate limiting
-                if response.status == 429:
-                    retry_after = response.headers.get("Retry-After", "60")
-                    logger.error(
-                        f"Rate limit exceeded for {pmid}",
-                        extra={"pmid": pmid, "retry_after": retry_after},
-                    )
-                    raise PubMedRateLimitError(
-                        f"Rate limit exceeded. Retry after {retry_after} seconds"
-                    )
-
-                # Handle non-200 responses
-                if response.status != 200:
-                    logger.error(
-                        f"PubMed API returned {response.status} for {pmid}",
-                        extra={"pmid": pmid, "status": response.status},
-                    )
-                    raise PubMedAPIError(
-                        f"PubMed API returned status {response.status}"
-                    )
-
-                data = await response.json()
-
-                # Check if PMID exists in response
-                result = data.get("result", {})
-                if pmid_number not in result:
-                    logger.warning(
-                        f"PMID {pmid} not found in PubMed", extra={"pmid": pmid}
-                    )
-                    raise PubMedNotFoundError(f"PMID {pmid} not found in PubMed")
-
-                pub_data = result[pmid_number]
-
-                # Parse authors (preserve order with JSONB)
-                authors = []
-                for author in pub_data.get("authors", []):
-                    authors.append(
-                        {
-                            "name": author.get("name", ""),
-                            "affiliation": author.get("affinfo", ""),
-                        }
-                    )
-
-                # Extract metadata
-                metadata = {
-                    "pmid": pmid,
-                    "title": pub_data.get("title", "Unknown"),
-                    "authors": authors,
-                    "journal": pub_data.get("fulljournalname", ""),
-                    "year": int(pub_data.get("pubdate", "0")[:4])
-                    if pub_data.get("pubdate")
-                    else None,
-                    "doi": _extract_doi(pub_data),
-                    "abstract": _extract_abstract(pub_data),
-                    "data_source": "PubMed",
-                    "fetched_at": datetime.now(timezone.utc),
+        response = await http_clients.get("ncbi").get(
+            pubmed_config.base_url, params=params
+        )
+        # Handle rate limiting
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After", "60")
+            logger.error(
+                f"Rate limit exceeded for {pmid}",
+                extra={"pmid": pmid, "retry_after": retry_after},
+            )
+            raise PubMedRateLimitError(
+                f"Rate limit exceeded. Retry after {retry_after} seconds"
+            )
+
+        # Handle non-200 responses
+        if response.status_code != 200:
+            logger.error(
+                f"PubMed API returned {response.status_code} for {pmid}",
+                extra={"pmid": pmid, "status": response.status_code},
+            )
+            raise PubMedAPIError(f"PubMed API returned status {response.status_code}")
+
+        try:
+            data = response.json()
+        except ValueError as e:
+            raise PubMedAPIError(f"Invalid JSON from PubMed: {e}") from e
+
+        # Check if PMID exists in response
+        result = data.get("result", {})
+        if pmid_number not in result:
+            logger.warning(f"PMID {pmid} not found in PubMed", extra={"pmid": pmid})
+            raise PubMedNotFoundError(f"PMID {pmid} not found in PubMed")
+
+        pub_data = result[pmid_number]
+
+        # Parse authors (preserve order with JSONB)
+        authors = []
+        for author in pub_data.get("authors", []):
+            authors.append(
+                {
+                    "name": author.get("name", ""),
+                    "affiliation": author.get("affinfo", ""),
                 }
+            )
+
+        # Extract metadata
+        metadata = {
+            "pmid": pmid,
+            "title": pub_data.get("title", "Unknown"),
+            "authors": authors,
+            "journal": pub_data.get("fulljournalname", ""),
+            "year": int(pub_data.get("pubdate", "0")[:4])
+            if pub_data.get("pubdate")
+            else None,
+            "doi": _extract_doi(pub_data),
+            "abstract": _extract_abstract(pub_data),
+            "data_source": "PubMed",
+            "fetched_at": datetime.now(timezone.utc),
+        }
 
-                logger.info(
-                    f"Successfully fetched metadata for {pmid}",
-                    extra={"pmid": pmid, "title": metadata["title"][:50]},
-                )
-
-                return metadata
+        logger.info(
+            f"Successfully fetched metadata for {pmid}",
+            extra={"pmid": pmid, "title": metadata["title"][:50]},
+        )
 
-    except asyncio.TimeoutError:
+        return metadata
+    except httpx.TimeoutException:
         logger.error(f"Timeout fetching {pmid} from PubMed", extra={"pmid": pmid})
         raise PubMedTimeoutError(f"Timeout fetching {pmid}")
-    except aiohttp.ClientError as e:
+    except httpx.HTTPError as e:
         logger.error(
             f"Network error fetching {pmid}: {e}", extra={"pmid": pmid, "error": str(e)}
         )
@@ -16,6 +16,7 @@ import httpx
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.http_clients import http_clients
 from app.reference.models import Gene
 
 from .constants import (
@@ -43,16 +44,16 @@ async def fetch_genes_from_ensembl(
     url = f"{ENSEMBL_API_BASE}/overlap/region/human/{region}"
     params = {"feature": "gene", "content-type": "application/json"}
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        logger.info("Fetching genes from Ensembl: %s", region)
-        response = await client.get(url, params=params)
-        response.raise_for_status()
+    client = http_clients.get("ensembl")
+    logger.info("Fetching genes from Ensembl: %s", region)
+    response = await client.get(url, params=params, timeout=timeout)
+    response.raise_for_status()
 
-        await asyncio.sleep(ENSEMBL_RATE_LIMIT_DELAY)
+    await asyncio.sleep(ENSEMBL_RATE_LIMIT_DELAY)
 
-        data = response.json()
-        logger.info("Received %s features from Ensembl", len(data))
-        return data
+    data = response.json()
+    logger.info("Received %s features from Ensembl", len(data))
+    return data
 
 
 def parse_gene_from_ensembl(feature: dict) -> dict | None:
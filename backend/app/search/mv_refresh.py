@@ -2,19 +2,34 @@
 
 Provides functions for refreshing the global_search_index MV
 and scheduling refreshes based on staleness.
+
+Mutations should not refresh inline: :class:`MVRefreshMiddleware` records a
+dirty mark with :data:`search_refresh_coordinator`, which shares the mark
+across processes through the cache (Redis in production) and lets a single
+background worker coalesce bursts into one ``REFRESH ... CONCURRENTLY``. A
+PostgreSQL advisory lock ensures only one worker in the cluster runs a given
+refresh, so N uvicorn workers no longer rebuild the same view N times.
 """
 
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
 
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import CacheService
+from app.core.cache import cache as default_cache
+from app.core.mv_refresh import GenerationRefresher
+
 logger = logging.getLogger(__name__)
 
+GLOBAL_SEARCH_VIEW = "global_search_index"
+
 # In-memory timestamp of last refresh (per-process)
 _last_refresh_time: datetime | None = None
 
@@ -102,21 +117,143 @@ async def force_refresh(db: AsyncSession) -> None:
     await refresh_global_search_index(db, concurrently=False)
 
 
+class SearchIndexRefreshCoordinator(GenerationRefresher):
+    """Debounced, cluster-wide refresher for ``global_search_index``.
+
+    A :class:`~app.core.mv_refresh.GenerationRefresher` over the single
+    search view: marks from any worker are coalesced into one
+    ``REFRESH ... CONCURRENTLY`` under a cluster-wide advisory lock.
+    """
+
+    settings_section = "search_index_refresh"
+    worker_name = "search-index-refresh"
+
+    def __init__(
+        self,
+        cache: CacheService = default_cache,
+        session_factory: Optional[Callable[[], Any]] = None,
+        *,
+        debounce_seconds: Optional[float] = None,
+        max_delay_seconds: Optional[float] = None,
+        poll_interval_seconds: Optional[float] = None,
+    ) -> None:
+        """Initialize the coordinator.
+
+        Args:
+            cache: Shared cache holding the dirty/refreshed generations.
+            session_factory: Callable returning an ``AsyncSession`` context
+                manager; defaults to ``app.database.async_session_maker``.
+            debounce_seconds: Quiet period override (default: settings).
+            max_delay_seconds: Staleness ceiling override (default: settings).
+            poll_interval_seconds: Idle re-check override (default: settings).
+        """
+        super().__init__(
+            cache,
+            session_factory,
+            debounce_seconds=debounce_seconds,
+            max_delay_seconds=max_delay_seconds,
+            poll_interval_seconds=poll_interval_seconds,
+        )
+        self.refreshes = 0
+
+    # -- dirty marks ---------------------------------------------------
+
+    async def mark_dirty(self) -> int:
+        """Record that the index is stale and wake the local worker.
+
+        Returns:
+            The new dirty generation.
+        """
+        generation = await self._mark(GLOBAL_SEARCH_VIEW, time.time())
+        self._wake.set()
+        return generation
+
+    async def is_dirty(self) -> bool:
+        """Return True while marks exist that no refresh has covered yet."""
+        dirty, refreshed = await self._generations(GLOBAL_SEARCH_VIEW)
+        return dirty > refreshed
+
+    # -- refresh -------------------------------------------------------
+
+    async def refresh_if_due(self, *, force: bool = False) -> bool:
+        """Refresh the view if it is dirty and the debounce window has closed.
+
+        Args:
+            force: Skip the debounce window (still requires a dirty mark and
+                the advisory lock).
+
+        Returns:
+            True if this call performed a refresh.
+        """
+        if not await self.is_dirty():
+            return False
+        if not force and not await self._is_due(GLOBAL_SEARCH_VIEW, time.time()):
+            return False
+        return await self._refresh_view(GLOBAL_SEARCH_VIEW)
+
+    async def _refresh_sql(self, db: Any, view: str) -> str:
+        return f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"
+
+    def _on_refreshed(self, view: str, covered: bool) -> None:
+        global _last_refresh_time
+
+        _last_refresh_time = datetime.now(timezone.utc)
+        self.refreshes += 1
+
+    # -- metrics -------------------------------------------------------
+
+    async def get_status(self) -> dict[str, Any]:
+        """Return refresh lag and coordination metrics for monitoring.
+
+        ``refresh_lag_seconds`` is how long the oldest uncovered dirty mark
+        has been waiting (0 when the index is fresh).
+        """
+        status = await self._view_status(GLOBAL_SEARCH_VIEW, time.time())
+        return {
+            "view": GLOBAL_SEARCH_VIEW,
+            **status,
+            "worker_running": self.is_running,
+            "process_refreshes": self.refreshes,
+            "process_lock_contended": self.lock_contended,
+            "process_failures": self.failures,
+        }
+
+    # -- background worker --------------------------------------------
+
+    async def _refresh_pending(self) -> None:
+        await self.refresh_if_due()
+
+    async def _has_pending(self) -> bool:
+        return await self.is_dirty()
+
+
+# Process-wide coordinator; the app lifespan starts its worker.
+search_refresh_coordinator = SearchIndexRefreshCoordinator()
+
+
 class MVRefreshMiddleware:
     """Middleware-style class for triggering MV refresh after mutations.
 
+    Marking dirty no longer refreshes inline: on a clean exit the mark is
+    handed to :data:`search_refresh_coordinator`, which coalesces marks from
+    every worker into a single debounced refresh.
+
     Usage:
         async with MVRefreshMiddleware(db) as mv:
             # Do mutations
             await create_phenopacket(...)
             mv.mark_dirty()
-        # MV will be refreshed after context exits if marked dirty
+        # A coordinated refresh is scheduled if marked dirty
     """
 
-    def __init__(self, db: AsyncSession, max_age_seconds: int = 60) -> None:
-        """Initialize middleware with database session and staleness threshold."""
+    def __init__(
+        self,
+        db: AsyncSession,
+        coordinator: Optional[SearchIndexRefreshCoordinator] = None,
+    ) -> None:
+        """Initialize middleware with database session and refresh coordinator."""
         self.db = db
-        self.max_age_seconds = max_age_seconds
+        self.coordinator = coordinator or search_refresh_coordinator
         self._dirty = False
 
     async def __aenter__(self) -> "MVRefreshMiddleware":
@@ -124,9 +261,9 @@ class MVRefreshMiddleware:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Exit async context, triggering refresh if dirty and no exception."""
+        """Exit async context, recording a dirty mark if dirty and no exception."""
         if self._dirty and exc_type is None:
-            await schedule_refresh_if_stale(self.db, self.max_age_seconds)
+            await self.coordinator.mark_dirty()
 
     def mark_dirty(self) -> None:
         """Mark that data has changed and MV may need refresh."""
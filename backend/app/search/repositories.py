@@ -319,15 +319,12 @@ class PhenopacketSearchRepository:
         # copy ``p.phenopacket`` (which may hold an unpublished clone-to-draft edit).
         #
         # FTS draft-leak fix (Copilot HIGH): ``p.search_vector`` is derived from the
-        # mutable working copy, so the public branch matches/ranks against a tsvector
-        # computed from the head-published content at query time. The curator branch
-        # keeps using the precomputed ``p.search_vector``.
+        # mutable working copy, so the public branch matches/ranks against
+        # ``r.search_vector`` — stored once when the published revision is written
+        # and GIN-indexed — instead of re-serialising every revision per query. The
+        # curator branch keeps using the precomputed ``p.search_vector``.
         content_col = "p.phenopacket" if is_curator else "r.content_jsonb"
-        search_tsvector = (
-            "p.search_vector"
-            if is_curator
-            else "to_tsvector('simple', r.content_jsonb::text)"
-        )
+        search_tsvector = "p.search_vector" if is_curator else "r.search_vector"
         if is_curator:
             from_clause = "FROM phenopackets p"
             conditions = ["p.deleted_at IS NULL", "p.state != 'archived'"]
@@ -337,10 +334,13 @@ class PhenopacketSearchRepository:
                 " JOIN phenopacket_revisions r"
                 " ON r.id = p.head_published_revision_id"
             )
+            # ``r.state`` is implied by the head pointer; stating it lets the
+            # planner use the partial trigram index behind the ILIKE fallback.
             conditions = [
                 "p.deleted_at IS NULL",
                 "p.state = 'published'",
                 "p.head_published_revision_id IS NOT NULL",
+                "r.state = 'published'",
             ]
         select_extra = ""
 
@@ -464,14 +464,10 @@ class PhenopacketSearchRepository:
         # (Wave A): the public branch joins the head revision and matches on
         # ``r.content_jsonb`` so a mid-edit working copy never affects the count.
         #
-        # FTS draft-leak fix (Copilot HIGH): the public branch matches on a tsvector
-        # computed from the head-published content, not the mutable ``p.search_vector``.
+        # FTS draft-leak fix (Copilot HIGH): the public branch matches on the stored
+        # head-revision ``r.search_vector``, not the mutable ``p.search_vector``.
         content_col = "p.phenopacket" if is_curator else "r.content_jsonb"
-        search_tsvector = (
-            "p.search_vector"
-            if is_curator
-            else "to_tsvector('simple', r.content_jsonb::text)"
-        )
+        search_tsvector = "p.search_vector" if is_curator else "r.search_vector"
         if is_curator:
             from_clause = "FROM phenopackets p"
             conditions = ["p.deleted_at IS NULL", "p.state != 'archived'"]
@@ -481,10 +477,13 @@ class PhenopacketSearchRepository:
                 " JOIN phenopacket_revisions r"
                 " ON r.id = p.head_published_revision_id"
             )
+            # ``r.state`` is implied by the head pointer; stating it lets the
+            # planner use the partial trigram index behind the ILIKE fallback.
             conditions = [
                 "p.deleted_at IS NULL",
                 "p.state = 'published'",
                 "p.head_published_revision_id IS NOT NULL",
+                "r.state = 'published'",
             ]
 
         if query:
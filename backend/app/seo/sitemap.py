@@ -19,9 +19,14 @@ from urllib.parse import quote
 from fastapi import APIRouter, Depends, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.database import get_db
 from app.phenopackets.models import Phenopacket
+from app.phenopackets.repositories.visibility import (
+    public_filter,
+    resolve_public_contents,
+)
 
 router = APIRouter(tags=["seo"])
 
@@ -51,6 +56,25 @@ def format_lastmod(dt: datetime | None) -> str:
     return dt.strftime("%Y-%m-%d")
 
 
+async def _published_records(db: AsyncSession) -> list[Phenopacket]:
+    """Load the published phenopackets without their working-copy documents.
+
+    Only the columns needed to resolve head-published content in bulk are
+    loaded; the content itself comes from ``resolve_public_contents``.
+    """
+    query = public_filter(
+        select(Phenopacket).options(
+            load_only(
+                Phenopacket.id,
+                Phenopacket.head_published_revision_id,
+                Phenopacket.updated_at,
+            )
+        )
+    )
+    result = await db.execute(query)
+    return list(result.scalars().all())
+
+
 @router.get("/sitemap-index.xml", response_class=Response)
 async def sitemap_index() -> Response:
     """Generate sitemap index pointing to individual sitemaps.
@@ -131,24 +155,18 @@ async def sitemap_variants(db: AsyncSession = Depends(get_db)) -> Response:
     Returns:
         XML sitemap for variant pages
     """
-    # Get all unique variants from published phenopackets only (public filter I3+I7)
-    from app.phenopackets.repositories.visibility import public_filter
-
-    query = public_filter(
-        select(
-            Phenopacket.phenopacket,
-            Phenopacket.updated_at,
-        )
-    )
-
-    result = await db.execute(query)
-    records = result.all()
+    # Get all unique variants from published phenopackets only (public filter
+    # I3+I7), read from their head-published content (I1)
+    records = await _published_records(db)
+    contents = await resolve_public_contents(db, records)
 
     # Extract unique variants
     variants_seen: dict[str, datetime] = {}
 
     for record in records:
-        phenopacket = record.phenopacket
+        phenopacket = contents.get(record.id)
+        if phenopacket is None:
+            continue
         updated_at = record.updated_at
 
         # Navigate to variants in phenopacket structure
@@ -198,8 +216,6 @@ async def sitemap_phenopackets(db: AsyncSession = Depends(get_db)) -> Response:
     Returns:
         XML sitemap for phenopacket pages
     """
-    from app.phenopackets.repositories.visibility import public_filter
-
     query = public_filter(
         select(
             Phenopacket.phenopacket_id,
@@ -237,22 +253,17 @@ async def sitemap_publications(db: AsyncSession = Depends(get_db)) -> Response:
     Returns:
         XML sitemap for publication pages
     """
-    # Extract unique PMIDs from published phenopackets only (public filter I3+I7)
-    from app.phenopackets.repositories.visibility import public_filter
-
-    query = public_filter(
-        select(
-            Phenopacket.phenopacket,
-        )
-    )
-
-    result = await db.execute(query)
-    records = result.all()
+    # Extract unique PMIDs from published phenopackets only (public filter
+    # I3+I7), read from their head-published content (I1)
+    records = await _published_records(db)
+    contents = await resolve_public_contents(db, records)
 
     pmids_seen: set[str] = set()
 
     for record in records:
-        phenopacket = record.phenopacket
+        phenopacket = contents.get(record.id)
+        if phenopacket is None:
+            continue
         # Extract PMIDs from metaData.externalReferences
         metadata = phenopacket.get("metaData", {})
         external_refs = metadata.get("externalReferences", [])
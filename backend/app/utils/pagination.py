@@ -1,15 +1,16 @@
 """Pagination utilities for JSON:API v1.1 responses.
 
 This module provides offset-based pagination (page[number]/page[size]) for
-direct page access and navigation. All endpoints use offset pagination
-for consistency and best user experience.
+direct page access and navigation, which every list endpoint uses by default.
+The phenopacket and variant lists additionally accept ``page[after]`` /
+``page[before]`` cursors for keyset pagination of deep pages.
 
 Usage:
     from app.utils.pagination import (
         build_offset_links,
         build_offset_response,
         parse_sort_parameter,
-        # Legacy cursor functions (deprecated)
+        # Cursor (keyset) pagination
         encode_cursor,
         decode_cursor,
         build_cursor_links,
@@ -159,7 +160,7 @@ def build_offset_response(
 
 
 # =============================================================================
-# CURSOR-BASED PAGINATION (Legacy - Deprecated)
+# CURSOR-BASED PAGINATION (keyset: search, opt-in on list endpoints)
 # =============================================================================
 
 
@@ -242,6 +243,7 @@ def build_cursor_links(
     has_prev: bool,
     filters: Dict[str, Any],
     sort: Optional[str] = None,
+    cursor_opt_in: bool = False,
 ) -> CursorLinksObject:
     """Build cursor pagination links for JSON:API response.
 
@@ -254,6 +256,9 @@ def build_cursor_links(
         has_prev: Whether there's a previous page
         filters: Dictionary of filter parameters to preserve
         sort: Sort parameter to preserve
+        cursor_opt_in: Emit an empty ``page[after]`` on the self/first links,
+            for endpoints that default to offset pagination and only switch
+            to cursor pagination when a cursor parameter is present
 
     Returns:
         CursorLinksObject with navigation links
@@ -277,6 +282,8 @@ def build_cursor_links(
         params: Dict[str, Any] = {"page[size]": page_size}
         if cursor_param and cursor_value:
             params[cursor_param] = cursor_value
+        elif cursor_opt_in:
+            params["page[after]"] = ""
         # Add filters (exclude None values)
         for key, value in filters.items():
             if value is not None:
@@ -305,6 +312,7 @@ def build_cursor_response(
     filters: Dict[str, Any],
     sort: Optional[str] = None,
     total: Optional[int] = None,
+    cursor_opt_in: bool = False,
 ) -> JsonApiCursorResponse:
     """Build a complete JSON:API cursor pagination response.
 
@@ -319,6 +327,7 @@ def build_cursor_response(
         filters: Dictionary of filter parameters
         sort: Sort parameter string
         total: Total count of matching records (optional per JSON:API spec)
+        cursor_opt_in: See :func:`build_cursor_links`
 
     Returns:
         JsonApiCursorResponse with data, meta, and links
@@ -357,6 +366,7 @@ def build_cursor_response(
             has_prev,
             filters,
             sort,
+            cursor_opt_in=cursor_opt_in,
         ),
     )
 
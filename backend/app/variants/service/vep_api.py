@@ -17,6 +17,7 @@ from typing import Any, Dict, List, Optional
 import httpx
 
 from app.core.config import settings
+from app.core.http_clients import http_clients
 
 from .errors import (
     VEPAPIError,
@@ -64,7 +65,6 @@ async def _fetch_from_vep(variant_ids: List[str]) -> Dict[str, dict]:
         return {}
 
     vep_base_url = settings.external_apis.vep.base_url
-    vep_timeout = settings.external_apis.vep.timeout_seconds
     max_retries = settings.external_apis.vep.max_retries
     base_delay = settings.external_apis.vep.retry_backoff_factor
 
@@ -103,34 +103,32 @@ async def _fetch_from_vep(variant_ids: List[str]) -> Dict[str, dict]:
         )
 
     async def make_vep_request() -> Dict[str, dict]:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                endpoint,
-                json={"variants": vep_variants},
-                params=params,
-                headers={"Content-Type": "application/json"},
-                timeout=vep_timeout,
-            )
+        response = await http_clients.get("ensembl").post(
+            endpoint,
+            json={"variants": vep_variants},
+            params=params,
+            headers={"Content-Type": "application/json"},
+        )
 
-            if response.status_code == 200:
-                results = response.json()
-                return _parse_vep_response(results, variant_ids)
+        if response.status_code == 200:
+            results = response.json()
+            return _parse_vep_response(results, variant_ids)
 
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", 60))
-                logger.warning("VEP rate limited, retry after %ss", retry_after)
-                raise VEPRateLimitError(
-                    f"Rate limit exceeded. Retry after {retry_after} seconds"
-                )
+        if response.status_code == 429:
+            retry_after = int(response.headers.get("Retry-After", 60))
+            logger.warning("VEP rate limited, retry after %ss", retry_after)
+            raise VEPRateLimitError(
+                f"Rate limit exceeded. Retry after {retry_after} seconds"
+            )
 
-            if response.status_code == 400:
-                logger.error("Invalid variant format: %s", variant_ids)
-                raise VEPNotFoundError("Invalid variant format")
+        if response.status_code == 400:
+            logger.error("Invalid variant format: %s", variant_ids)
+            raise VEPNotFoundError("Invalid variant format")
 
-            if response.status_code in (500, 502, 503, 504):
-                raise VEPAPIError(f"VEP server error: {response.status_code}")
+        if response.status_code in (500, 502, 503, 504):
+            raise VEPAPIError(f"VEP server error: {response.status_code}")
 
-            raise VEPAPIError(f"Unexpected VEP error: {response.status_code}")
+        raise VEPAPIError(f"Unexpected VEP error: {response.status_code}")
 
     try:
         return await retry_async(
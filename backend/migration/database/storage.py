@@ -8,6 +8,8 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from tqdm import tqdm
 
+from app.core.aggregation_cache import bump_published_data_version
+from app.core.cache import CacheService
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -270,8 +272,25 @@ class PhenopacketStorage:
             if settings.materialized_views.auto_refresh_after_import:
                 await self._refresh_materialized_views(session)
 
+            await self._invalidate_aggregation_cache()
+
             return stored_count
 
+    async def _invalidate_aggregation_cache(self) -> None:
+        """Bump the published data version so API workers drop cached aggregations.
+
+        The importer runs out of process, so it connects to the shared cache
+        itself. Failure only delays invalidation until the cache TTL expires.
+        """
+        cache = CacheService()
+        try:
+            await cache.connect()
+            await bump_published_data_version(cache)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate cached aggregations: {e}")
+        finally:
+            await cache.close()
+
     async def _refresh_materialized_views(self, session: AsyncSession) -> None:
         """Refresh aggregation materialized views after data import.
 
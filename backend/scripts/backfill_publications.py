@@ -11,6 +11,11 @@ By default, publications whose full text was fetched within
 ``publications_rag.fulltext_staleness_days`` are skipped (override with
 ``--force``).
 
+Progress is checkpointed per PMID in ``publication_sync_jobs``: an interrupted
+run (Ctrl-C, crash, killed worker) is resumed by the next run, which skips the
+PMIDs already done, and publications whose content hash is unchanged are not
+rewritten. ``--force`` starts a fresh job and rewrites everything.
+
 Usage:
     python scripts/backfill_publications.py --dry-run
     python scripts/backfill_publications.py --limit 10
@@ -38,6 +43,7 @@ from sqlalchemy import text
 
 from app.core.config import settings
 from app.database import async_session_maker
+from app.publications.fulltext import sync_jobs
 from app.publications.fulltext.embeddings import get_embedding_provider
 from app.publications.fulltext.orchestrator import (
     backfill_embeddings,
@@ -124,20 +130,45 @@ async def main(
         async def _ensure_metadata(pmid: str) -> None:
             await get_publication_metadata(pmid, db, fetched_by="backfill")
 
-        async with aiohttp.ClientSession() as session:
-            counts = await sync_publications(
-                db,
-                to_process,
-                session=session,
-                allowed_licenses=rag.allowed_licenses,
-                chunk_max_tokens=rag.chunk_max_tokens,
-                chunk_overlap_tokens=rag.chunk_overlap_tokens,
-                abstract_api_key=settings.PUBMED_API_KEY,
-                ensure_metadata=_ensure_metadata,
+        job = await sync_jobs.open_sync_job(
+            db,
+            source="backfill",
+            total=len(to_process),
+            resume=not force,
+            stale_after_seconds=rag.sync_job_stale_seconds,
+            max_resume_age_seconds=rag.sync_job_resume_max_age_seconds,
+        )
+        if job.resumed:
+            print(
+                f"Resuming job {job.id} at {job.cursor_pmid} "
+                f"({len(job.finished)} PMIDs already done)"
             )
 
+        try:
+            async with aiohttp.ClientSession() as session:
+                counts = await sync_publications(
+                    db,
+                    to_process,
+                    session=session,
+                    allowed_licenses=rag.allowed_licenses,
+                    chunk_max_tokens=rag.chunk_max_tokens,
+                    chunk_overlap_tokens=rag.chunk_overlap_tokens,
+                    abstract_api_key=settings.PUBMED_API_KEY,
+                    ensure_metadata=_ensure_metadata,
+                    job=job,
+                    skip_unchanged=not force,
+                )
+        except BaseException as exc:
+            # Leave the job resumable by the next run, then re-raise.
+            await db.rollback()
+            await sync_jobs.finish_sync_job(db, job, error=repr(exc))
+            raise
+        await sync_jobs.finish_sync_job(db, job)
+
         print("-" * 80)
+        print(f"Resumed (skipped): {counts.resumed}")
         print(f"Processed:         {counts.processed}")
+        print(f"Unchanged:         {counts.unchanged}")
         print(f"Abstracts fetched: {counts.abstracts_fetched}")
         print(f"Full text fetched: {counts.full_text_fetched}")
         print(f"License-skipped:   {counts.license_skipped}")
@@ -158,10 +189,14 @@ async def main(
                 )
             else:
                 print(f"\nEmbedding passages with {provider.model_name}...")
-                embedded = await backfill_embeddings(
+                backfill = await backfill_embeddings(
                     db, provider, batch_size=rag.embedding_batch_size
                 )
-                print(f"Embedded {embedded} passages.")
+                print(
+                    f"Embedded {backfill.embedded} passages in "
+                    f"{backfill.elapsed_seconds:.1f}s "
+                    f"({backfill.passages_per_second:.1f} passages/s)."
+                )
 
         print("=" * 80)
 
@@ -173,7 +208,9 @@ if __name__ == "__main__":
     )
     parser.add_argument("--limit", type=int, help="Process at most N publications")
     parser.add_argument(
-        "--force", action="store_true", help="Ignore the staleness window"
+        "--force",
+        action="store_true",
+        help="Ignore the staleness window, checkpoints and content hashes",
     )
     parser.add_argument(
         "--embeddings",
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Benchmark HNSW recall@k and latency for the dense passage leg.
+
+Indexes a synthetic corpus of deterministic ``FakeEmbeddingProvider`` vectors
+in a temporary table (same ``vector_cosine_ops`` HNSW index as
+``publication_fulltext_embeddings``), then compares HNSW search at several
+``ef_search`` values with exact brute-force search. With ``--filter-groups``
+the same is measured for a selective filter, searched with the configured
+``publications_rag.hnsw_iterative_scan``. Everything is rolled back; no data
+is written.
+
+Usage:
+    python scripts/benchmark_dense_recall.py
+    python scripts/benchmark_dense_recall.py --corpus-size 20000 --ef-search 20 40 100 200
+    python scripts/benchmark_dense_recall.py --filter-groups 50
+
+Requirements:
+    - Database running (pgvector image) and a valid backend/.env (DATABASE_URL).
+"""
+# ruff: noqa: E501 - help strings read better unwrapped
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend to path so ``app`` imports resolve when run as a script.
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.database import async_session_maker
+from app.publications.fulltext.ann_benchmark import run_ann_benchmark
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the benchmark and print one row per configuration."""
+    rag = settings.publications_rag
+    print("=" * 80)
+    print("Dense passage leg: HNSW recall / latency benchmark")
+    print(
+        f"Corpus: {args.corpus_size}  Queries: {args.queries}  k: {args.k}  "
+        f"m: {args.m}  ef_construction: {args.ef_construction}  "
+        f"Filter groups: {args.filter_groups or 'none'}  "
+        f"Iterative scan: {rag.hnsw_iterative_scan}"
+    )
+    print("=" * 80)
+
+    async with async_session_maker() as db:
+        results = await run_ann_benchmark(
+            db,
+            corpus_size=args.corpus_size,
+            query_count=args.queries,
+            k=args.k,
+            ef_search_values=args.ef_search,
+            filter_groups=args.filter_groups,
+            iterative_scan=rag.hnsw_iterative_scan,
+            dim=rag.embedding_dim,
+            m=args.m,
+            ef_construction=args.ef_construction,
+        )
+
+    print(
+        f"{'search':<14}{'filtered':<10}{'recall@k':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    )
+    for row in results:
+        search = "exact" if row.ef_search is None else f"ef={row.ef_search}"
+        print(
+            f"{search:<14}{'yes' if row.filtered else 'no':<10}"
+            f"{row.recall_at_k:>10.3f}{row.p50_ms:>10.2f}"
+            f"{row.p95_ms:>10.2f}{row.p99_ms:>10.2f}"
+        )
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark dense-leg HNSW recall")
+    parser.add_argument(
+        "--corpus-size", type=int, default=5000, help="Synthetic vectors to index"
+    )
+    parser.add_argument(
+        "--queries", type=int, default=100, help="Queries per configuration"
+    )
+    parser.add_argument(
+        "--k", type=int, default=10, help="Neighbours per query (recall@k)"
+    )
+    parser.add_argument(
+        "--ef-search",
+        type=int,
+        nargs="+",
+        default=[40, settings.publications_rag.hnsw_ef_search, 200],
+        help="HNSW ef_search values to measure",
+    )
+    parser.add_argument(
+        "--filter-groups",
+        type=int,
+        default=0,
+        help="Also measure a filter matching 1/N of the corpus",
+    )
+    parser.add_argument("--m", type=int, default=16, help="HNSW m build parameter")
+    parser.add_argument(
+        "--ef-construction", type=int, default=64, help="HNSW ef_construction"
+    )
+
+    try:
+        asyncio.run(main(parser.parse_args()))
+    except KeyboardInterrupt:
+        print("\nInterrupted")
+        sys.exit(1)
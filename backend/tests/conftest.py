@@ -33,9 +33,12 @@ from sqlalchemy.pool import NullPool
 # test engine instead of the production-pool engine created at module load.
 import app.database as app_database  # noqa: E402
 from app.auth.password import get_password_hash
+from app.core.aggregation_cache import bump_published_data_version
 from app.core.config import settings
+from app.core.http_clients import http_clients
 from app.main import app
 from app.models.user import User
+from app.publications.fulltext.retrieval import invalidate_embeddings_probe
 
 # Suppress known harmless asyncpg warning that occurs during interpreter shutdown
 # This is a known issue: https://github.com/sqlalchemy/sqlalchemy/issues/8145
@@ -136,6 +139,8 @@ _MUTABLE_TABLES: tuple[str, ...] = (
     "phenopackets",
     "variant_annotations",
     # publication full-text RAG (children before parent for CASCADE order)
+    "publication_sync_items",
+    "publication_sync_jobs",
     "publication_fulltext_embeddings",
     "publication_fulltext",
     "publication_metadata",
@@ -157,6 +162,11 @@ async def _truncate_mutable_tables() -> None:
         # TRUNCATE clears pg_stat_user_tables timestamps; keep index/statistics
         # assertions deterministic after the isolation cleanup.
         await conn.execute(text("ANALYZE phenopackets"))
+    # Truncation changes published data behind the state machine's back, so
+    # cached aggregation responses from the previous test must not be served.
+    await bump_published_data_version()
+    # Likewise for the per-model embeddings-present probe of passage retrieval.
+    invalidate_embeddings_probe()
 
 
 @pytest_asyncio.fixture(scope="session", autouse=True)
@@ -173,6 +183,18 @@ async def _isolate_database_between_tests():
     await _truncate_mutable_tables()
 
 
+@pytest.fixture(autouse=True)
+def _fresh_http_clients(monkeypatch):
+    """Give each test its own outbound HTTP clients.
+
+    The shared clients are built lazily, so a test that patches
+    ``httpx.AsyncClient`` gets its mock rather than a client cached by an
+    earlier test (or bound to an earlier test's event loop).
+    """
+    monkeypatch.setattr(http_clients, "_clients", {})
+    monkeypatch.setattr(http_clients, "_stats", {})
+
+
 @pytest_asyncio.fixture
 async def db_session():
     """Provide a database session for testing.
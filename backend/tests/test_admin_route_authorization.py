@@ -70,6 +70,30 @@ ADMIN_ROUTES: list[tuple[str, str, str, Optional[dict]]] = [
     ("admin_status", "GET", "/api/v2/admin/status", None),
     ("admin_statistics", "GET", "/api/v2/admin/statistics", None),
     ("admin_reference_status", "GET", "/api/v2/admin/reference/status", None),
+    (
+        "admin_search_index_status",
+        "GET",
+        "/api/v2/admin/search-index/status",
+        None,
+    ),
+    (
+        "admin_aggregation_views_status",
+        "GET",
+        "/api/v2/admin/aggregation-views/status",
+        None,
+    ),
+    (
+        "admin_query_embedding_cache_status",
+        "GET",
+        "/api/v2/admin/query-embedding-cache/status",
+        None,
+    ),
+    (
+        "admin_http_clients_status",
+        "GET",
+        "/api/v2/admin/http-clients/status",
+        None,
+    ),
     # admin sub-router — sync_publications_routes.py
     ("admin_sync_publications", "POST", "/api/v2/admin/sync/publications", None),
     (
@@ -78,6 +102,12 @@ ADMIN_ROUTES: list[tuple[str, str, str, Optional[dict]]] = [
         "/api/v2/admin/sync/publications/status",
         None,
     ),
+    (
+        "admin_sync_publications_fulltext_status",
+        "GET",
+        "/api/v2/admin/sync/publications/fulltext/status",
+        None,
+    ),
     # admin sub-router — sync_variants_routes.py
     ("admin_sync_variants", "POST", "/api/v2/admin/sync/variants", None),
     (
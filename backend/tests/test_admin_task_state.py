@@ -10,6 +10,8 @@ is what ``app.core.cache.cache`` already does in the test environment
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
 import pytest_asyncio
 
@@ -198,6 +200,31 @@ class TestProgressUpdates:
         updated = await store.get(state.task_id)
         assert updated.errors == 5
 
+    @pytest.mark.asyncio
+    async def test_update_counts_reports_throughput_and_eta(self, store: SyncTaskStore):
+        """A running task derives its rate from this run's items, not skipped ones."""
+        state = await store.create(TaskKind.FULLTEXT, total=100)
+        await store.mark_running(state.task_id)
+        running = await store.get(state.task_id)
+        running.started_at = (
+            datetime.now(timezone.utc) - timedelta(seconds=10)
+        ).isoformat()
+        await store._save(running)
+
+        updated = await store.update_counts(
+            state.task_id, processed=60, skipped=40, errors=0
+        )
+        assert updated.items_per_second == pytest.approx(2.0, rel=0.05)
+        assert updated.eta_seconds == pytest.approx(20.0, rel=0.05)
+
+    @pytest.mark.asyncio
+    async def test_throughput_unset_before_task_runs(self, store: SyncTaskStore):
+        """A pending task has no start time, so no rate or ETA is reported."""
+        state = await store.create(TaskKind.FULLTEXT, total=10)
+        updated = await store.update_counts(state.task_id, processed=0)
+        assert updated.items_per_second is None
+        assert updated.eta_seconds is None
+
 
 class TestTerminalStates:
     """Cover ``complete`` and ``fail``."""
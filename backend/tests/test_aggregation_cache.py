@@ -0,0 +1,176 @@
+"""Published-data-versioned response cache for ``/aggregate/*``.
+
+Cached aggregations must be reused until published data changes and must be
+invalidated by the publish/archive/delete paths that change it.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.core.aggregation_cache import (
+    PUBLISHED_DATA_VERSION_KEY,
+    aggregation_cache_key,
+    bump_published_data_version,
+    get_or_compute,
+    get_published_data_epoch,
+    get_published_data_version,
+)
+from app.core.cache import CacheService
+
+SUMMARY_URL = "/api/v2/phenopackets/aggregate/summary"
+
+
+class TestAggregationCacheKeys:
+    """Keys embed the data version and a digest of the query parameters."""
+
+    def test_key_changes_with_version_and_params(self):
+        """Bumping the version or changing a parameter yields a new key."""
+        key = aggregation_cache_key("variants.types", 3, {"count_mode": "all"})
+        assert key.startswith("aggregations:response:v3:variants.types:")
+        assert key == aggregation_cache_key("variants.types", 3, {"count_mode": "all"})
+        assert key != aggregation_cache_key("variants.types", 4, {"count_mode": "all"})
+        assert key != aggregation_cache_key(
+            "variants.types", 3, {"count_mode": "unique"}
+        )
+
+
+class TestGetOrCompute:
+    """Results are computed once per version and parameter set."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_result_until_version_bump(self):
+        """A bump forces recomputation; a repeated call does not."""
+        cache = CacheService()
+        calls: list[int] = []
+
+        async def compute():
+            calls.append(1)
+            return {"total": len(calls)}
+
+        assert await get_or_compute("t", {}, compute, cache) == {"total": 1}
+        assert await get_or_compute("t", {}, compute, cache) == {"total": 1}
+        assert len(calls) == 1
+
+        version = await get_published_data_version(cache)
+        assert await bump_published_data_version(cache) == version + 1
+        assert await get_or_compute("t", {}, compute, cache) == {"total": 2}
+
+
+class TestPublishedDataEpoch:
+    """The epoch changes whenever the version counter is lost."""
+
+    @pytest.mark.asyncio
+    async def test_epoch_rotates_when_counter_is_lost(self):
+        """A flushed counter restarts the version under a new epoch."""
+        cache = CacheService()
+        epoch = await get_published_data_epoch(cache)
+        version = await get_published_data_version(cache)
+        assert await get_published_data_epoch(cache) == epoch
+        await bump_published_data_version(cache)
+        assert await get_published_data_epoch(cache) == epoch
+
+        # Simulate a cache flush: the counter restarts, the epoch must not
+        # repeat, so (epoch, version) cannot collide with the old lineage.
+        await cache.delete(PUBLISHED_DATA_VERSION_KEY)
+        assert await get_published_data_epoch(cache) != epoch
+        assert await get_published_data_version(cache) == version
+
+        # Separate workers with their own in-memory counters disagree.
+        assert await get_published_data_epoch(CacheService()) != epoch
+
+
+class TestAggregationEndpointCaching:
+    """Endpoints serve cached results until a publish-side change bumps."""
+
+    @pytest.mark.asyncio
+    async def test_summary_cached_until_published_data_version_bumps(
+        self, async_client, db_session, admin_user
+    ):
+        """Rows inserted behind the state machine stay invisible until a bump."""
+        from app.phenopackets.models import Phenopacket, PhenopacketRevision
+
+        first = await async_client.get(SUMMARY_URL)
+        assert first.status_code == 200
+        assert first.json()["total_phenopackets"] == 0
+
+        pp = Phenopacket(
+            phenopacket_id="cache-published-1",
+            phenopacket={"id": "cache-published-1"},
+            state="draft",
+            revision=1,
+            created_by_id=admin_user.id,
+        )
+        db_session.add(pp)
+        await db_session.flush()
+        rev = PhenopacketRevision(
+            record_id=pp.id,
+            revision_number=1,
+            state="published",
+            content_jsonb={"id": "cache-published-1"},
+            change_reason="init",
+            actor_id=admin_user.id,
+            to_state="published",
+            is_head_published=True,
+        )
+        db_session.add(rev)
+        await db_session.flush()
+        pp.state = "published"
+        pp.head_published_revision_id = rev.id
+        await db_session.commit()
+
+        assert (await async_client.get(SUMMARY_URL)).json()["total_phenopackets"] == 0
+
+        await bump_published_data_version()
+        assert (await async_client.get(SUMMARY_URL)).json()["total_phenopackets"] == 1
+
+    @pytest.mark.asyncio
+    async def test_archive_transition_invalidates_cached_summary(
+        self, async_client, published_record, admin_headers
+    ):
+        """Archiving a published record bumps the version it was cached at."""
+        assert (await async_client.get(SUMMARY_URL)).json()["total_phenopackets"] == 1
+        version = await get_published_data_version()
+
+        resp = await async_client.post(
+            f"/api/v2/phenopackets/{published_record.phenopacket_id}/transitions",
+            json={
+                "to_state": "archived",
+                "reason": "retired",
+                "revision": published_record.revision,
+            },
+            headers=admin_headers,
+        )
+        assert resp.status_code == 200, resp.text
+
+        assert await get_published_data_version() == version + 1
+        assert (await async_client.get(SUMMARY_URL)).json()["total_phenopackets"] == 0
+
+
+class TestPublicationMetadataInvalidation:
+    """Stored publication metadata invalidates the publication aggregations."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("invalidate", [True, False])
+    async def test_metadata_fetch_bumps_version(self, invalidate):
+        """A fetched PMID bumps the version unless the caller batches bumps."""
+        from unittest.mock import AsyncMock, patch
+
+        from app.publications import service
+
+        version = await get_published_data_version()
+        with (
+            patch.object(service, "_get_cached_metadata", AsyncMock(return_value=None)),
+            patch.object(
+                service,
+                "_fetch_from_pubmed",
+                AsyncMock(return_value={"pmid": "PMID:12345678"}),
+            ),
+            patch.object(service, "_store_in_cache", AsyncMock()),
+        ):
+            await service.get_publication_metadata(
+                "PMID:12345678", AsyncMock(), invalidate_aggregations=invalidate
+            )
+
+        expected = version + 1 if invalidate else version
+        assert await get_published_data_version() == expected
@@ -0,0 +1,226 @@
+"""Aggregation materialized view freshness and the refresh scheduler.
+
+The views are built over head-published revision content, so a fresh view
+must agree with the live published-head query and must never show the
+working copy of a record with a clone-to-draft edit in flight. Transitions
+mark only the views whose inputs they change; ``MaterializedViewCache`` routes
+a stale view to the live query until the scheduler has refreshed it.
+"""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+
+from app.core.aggregation_cache import bump_published_data_version
+from app.core.cache import CacheService
+from app.core.mv_cache import MaterializedViewCache
+from app.core.mv_refresh import (
+    AGGREGATION_VIEWS,
+    AggregationViewRefreshScheduler,
+    views_affected_by,
+)
+from app.phenopackets.services.state_service import PhenopacketStateService
+
+
+def _scheduler(view_cache: MaterializedViewCache) -> AggregationViewRefreshScheduler:
+    return AggregationViewRefreshScheduler(
+        CacheService(), view_cache=view_cache, debounce_seconds=0.0
+    )
+
+
+class TestViewsAffectedBy:
+    """Dependency map from published-content changes to views."""
+
+    def test_entering_or_leaving_published_set_affects_every_view(self):
+        """Publish and archive change every view's row set."""
+        content = {"subject": {"sex": "MALE"}}
+        assert views_affected_by(None, content) == set(AGGREGATION_VIEWS)
+        assert views_affected_by(content, None) == set(AGGREGATION_VIEWS)
+        assert views_affected_by(None, None) == set()
+
+    def test_content_change_affects_only_dependent_views(self):
+        """A feature edit leaves the disease and sex views alone."""
+        before = {"subject": {"sex": "MALE"}, "phenotypicFeatures": []}
+        after = {
+            "subject": {"sex": "MALE"},
+            "phenotypicFeatures": [{"type": {"id": "HP:0000107"}}],
+        }
+        assert views_affected_by(before, after) == {
+            "mv_feature_aggregation",
+            "mv_summary_statistics",
+        }
+        assert views_affected_by(before, dict(before)) == set()
+
+
+class TestMaterializedViewCacheFreshness:
+    """``is_available`` only routes to the live query while a view is stale."""
+
+    @pytest.mark.asyncio
+    async def test_stale_view_is_unavailable_until_marked_fresh(self, db_session):
+        """Stale marks hide a view; a refresh makes it available again."""
+        view_cache = MaterializedViewCache()
+        await view_cache.initialize(db_session)
+        view_cache.mark_fresh("mv_sex_distribution")
+        assert view_cache.is_available("mv_sex_distribution")
+
+        view_cache.mark_stale(["mv_sex_distribution"])
+        assert view_cache.is_stale("mv_sex_distribution")
+        assert not view_cache.is_available("mv_sex_distribution")
+        assert view_cache.get_status()["stale_views"] == ["mv_sex_distribution"]
+
+        view_cache.mark_fresh("mv_sex_distribution")
+        assert view_cache.is_available("mv_sex_distribution")
+
+
+class TestAggregationViewRefreshScheduler:
+    """Marks, dependency-aware refreshes, and published-head safety."""
+
+    @pytest.mark.asyncio
+    async def test_refreshes_only_marked_views(self, db_session):
+        """Only the views that were marked stale are refreshed."""
+        view_cache = MaterializedViewCache()
+        await view_cache.initialize(db_session)
+        scheduler = _scheduler(view_cache)
+
+        await scheduler.mark_stale(["mv_sex_distribution", "mv_summary_statistics"])
+        assert not view_cache.is_available("mv_sex_distribution")
+
+        refreshed = await scheduler.refresh_due()
+        assert refreshed == ["mv_sex_distribution", "mv_summary_statistics"]
+        assert view_cache.is_available("mv_sex_distribution")
+        assert not view_cache.is_available("mv_feature_aggregation")
+        assert await scheduler.refresh_due() == []
+
+        status = await scheduler.get_status()
+        assert status["views"]["mv_sex_distribution"]["stale"] is False
+        assert status["views"]["mv_sex_distribution"]["process_refreshes"] == 1
+        assert status["views"]["mv_feature_aggregation"]["process_refreshes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_debounce_keeps_view_on_live_path(self, db_session):
+        """A fresh mark waits out the debounce window unless forced."""
+        view_cache = MaterializedViewCache()
+        await view_cache.initialize(db_session)
+        scheduler = AggregationViewRefreshScheduler(
+            CacheService(),
+            view_cache=view_cache,
+            debounce_seconds=60.0,
+            max_delay_seconds=120.0,
+        )
+        await scheduler.mark_stale(["mv_disease_aggregation"])
+
+        assert await scheduler.refresh_due() == []
+        assert await scheduler.is_stale("mv_disease_aggregation")
+        assert await scheduler.refresh_due(force=True) == ["mv_disease_aggregation"]
+
+    @pytest.mark.asyncio
+    async def test_refreshed_views_read_published_heads(
+        self, db_session, clone_in_progress_record
+    ):
+        """A refreshed view shows the head snapshot, not the draft working copy."""
+        view_cache = MaterializedViewCache()
+        await view_cache.initialize(db_session)
+        scheduler = _scheduler(view_cache)
+        await db_session.commit()
+
+        await scheduler.mark_stale(AGGREGATION_VIEWS)
+        assert await scheduler.refresh_due() == list(AGGREGATION_VIEWS)
+
+        sexes = (
+            await db_session.execute(text("SELECT sex, count FROM mv_sex_distribution"))
+        ).all()
+        assert [(row.sex, row.count) for row in sexes] == [("FEMALE", 1)]
+
+        summary = (
+            (await db_session.execute(text("SELECT * FROM mv_summary_statistics")))
+            .mappings()
+            .one()
+        )
+        assert summary["total_phenopackets"] == 1
+        assert summary["female"] == 1
+        assert summary["unknown_sex"] == 0
+
+    @pytest.mark.asyncio
+    async def test_republish_marks_only_changed_sections(
+        self, db_session, published_record, curator_user, admin_user
+    ):
+        """A republished sex change stales the sex and summary views only."""
+        svc = PhenopacketStateService(db_session)
+        new_content = {
+            **published_record.phenopacket,
+            "subject": {"id": "published-subject", "sex": "MALE"},
+        }
+        pp = await svc.edit_record(
+            published_record.id,
+            new_content=new_content,
+            change_reason="sex correction",
+            expected_revision=published_record.revision,
+            actor=curator_user,
+        )
+        for to_state, actor in (
+            ("in_review", curator_user),
+            ("approved", admin_user),
+        ):
+            pp, _ = await svc.transition(
+                pp.id,
+                to_state=to_state,
+                reason="r",
+                expected_revision=pp.revision,
+                actor=actor,
+            )
+        assert svc.stale_views == set()
+
+        await svc.transition(
+            pp.id,
+            to_state="published",
+            reason="ship",
+            expected_revision=pp.revision,
+            actor=admin_user,
+        )
+        assert svc.stale_views == {"mv_sex_distribution", "mv_summary_statistics"}
+
+    @pytest.mark.asyncio
+    async def test_archive_of_published_record_marks_every_view(
+        self, db_session, published_record, admin_user
+    ):
+        """Archiving a public record removes it from every view."""
+        svc = PhenopacketStateService(db_session)
+        await svc.transition(
+            published_record.id,
+            to_state="archived",
+            reason="retired",
+            expected_revision=published_record.revision,
+            actor=admin_user,
+        )
+        assert svc.stale_views == set(AGGREGATION_VIEWS)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "path",
+        ["/summary", "/sex-distribution", "/by-feature", "/by-disease"],
+    )
+    async def test_fresh_view_matches_live_query(
+        self, async_client, db_session, published_record, monkeypatch, path
+    ):
+        """Endpoints answer identically from a fresh view and the live query."""
+        from app.phenopackets.routers.aggregations import common
+
+        view_cache = MaterializedViewCache()
+        await view_cache.initialize(db_session)
+        scheduler = _scheduler(view_cache)
+        monkeypatch.setattr(common, "mv_cache", view_cache)
+        monkeypatch.setattr(common, "aggregation_refresh_scheduler", scheduler)
+        url = f"/api/v2/phenopackets/aggregate{path}"
+
+        await scheduler.mark_stale(AGGREGATION_VIEWS)
+        live = await async_client.get(url)
+        assert live.status_code == 200, live.text
+
+        assert await scheduler.refresh_due() == list(AGGREGATION_VIEWS)
+        assert view_cache.is_available("mv_summary_statistics")
+        # Skip the response cache so the second request really reads the view.
+        await bump_published_data_version()
+        from_view = await async_client.get(url)
+        assert from_view.status_code == 200, from_view.text
+        assert from_view.json() == live.json()
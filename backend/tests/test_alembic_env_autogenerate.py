@@ -61,6 +61,8 @@ _RAW_SQL_TABLES = {
     "publication_metadata",
     "publication_fulltext",
     "publication_fulltext_embeddings",
+    "publication_sync_items",
+    "publication_sync_jobs",
     "publication_type_values",
     "segregation_values",
     "sex_values",
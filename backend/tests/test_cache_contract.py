@@ -77,3 +77,18 @@ async def test_production_redis_failure_raises_and_disables_fallback():
 
     assert cache.is_connected is False
     redis_client.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_fallback_counters_are_readable_like_redis_keys():
+    """``incr`` keys read back through ``get``/``exists`` as in Redis."""
+    cache = CacheService()
+
+    assert await cache.incr("counter:test") == 1
+    assert await cache.incr("counter:test") == 2
+    assert await cache.get("counter:test") == "2"
+    assert await cache.exists("counter:test") is True
+
+    await cache.delete("counter:test")
+    assert await cache.get("counter:test") is None
+    assert await cache.incr("counter:test") == 1
@@ -0,0 +1,274 @@
+"""Multi-group phenotype comparisons (``POST /compare/groups``).
+
+All pairs are read off one group x phenotype count matrix, so a pair of
+groups defined like a ``/compare/variant-types`` mode must reproduce that
+mode, and any change that does not alter the resolved criteria must reuse
+the cached matrix.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+import pytest
+
+from app.phenopackets.routers.comparisons.groups import (
+    definition_hash,
+    pairwise_statistics,
+)
+
+groups_module = importlib.import_module("app.phenopackets.routers.comparisons.groups")
+
+URL = "/api/v2/phenopackets/compare/groups"
+TRUNCATING_GROUPS = [
+    {"name": "Truncating", "variant_type": "truncating"},
+    {"name": "Non-truncating", "variant_type": "non_truncating"},
+]
+
+
+def _variant(impact: str, protein: str, status: str = "PATHOGENIC") -> dict:
+    return {
+        "interpretationStatus": status,
+        "variantInterpretation": {
+            "variationDescriptor": {
+                "id": f"var-{protein}",
+                "expressions": [{"syntax": "hgvs.p", "value": protein}],
+                "extensions": [{"name": "vep_annotation", "value": {"impact": impact}}],
+            }
+        },
+    }
+
+
+def _feature(hpo_id: str, excluded: bool = False) -> dict:
+    return {"type": {"id": hpo_id, "label": hpo_id}, "excluded": excluded}
+
+
+async def _seed(db_session, admin_user, phenopacket_id, variants, features):
+    from app.phenopackets.models import Phenopacket, PhenopacketRevision
+
+    content = {
+        "id": phenopacket_id,
+        "phenotypicFeatures": features,
+        "interpretations": [
+            {"diagnosis": {"genomicInterpretations": variants}},
+        ],
+    }
+    pp = Phenopacket(
+        phenopacket_id=phenopacket_id,
+        phenopacket=content,
+        state="published",
+        revision=1,
+        created_by_id=admin_user.id,
+    )
+    db_session.add(pp)
+    await db_session.flush()
+    rev = PhenopacketRevision(
+        record_id=pp.id,
+        revision_number=1,
+        state="published",
+        content_jsonb=content,
+        change_reason="init",
+        actor_id=admin_user.id,
+        from_state=None,
+        to_state="published",
+        is_head_published=True,
+    )
+    db_session.add(rev)
+    await db_session.flush()
+    pp.head_published_revision_id = rev.id
+
+
+@pytest.fixture
+async def cohort(db_session, admin_user):
+    """Six carriers with truncating or missense variants and two phenotypes."""
+    cyst, diabetes = "HP:0000107", "HP:0004904"
+    carriers = [
+        (
+            "grp-1",
+            _variant("HIGH", "p.Arg177Ter"),
+            [_feature(cyst), _feature(diabetes)],
+        ),
+        ("grp-2", _variant("HIGH", "p.Gln243fs"), [_feature(cyst)]),
+        ("grp-3", _variant("HIGH", "p.Trp10Ter"), [_feature(cyst, excluded=True)]),
+        ("grp-4", _variant("MODERATE", "p.Ser148Leu"), [_feature(diabetes)]),
+        ("grp-5", _variant("MODERATE", "p.Arg165His"), [_feature(cyst, excluded=True)]),
+        (
+            "grp-6",
+            _variant("MODERATE", "p.Pro328Leu", status="UNCERTAIN_SIGNIFICANCE"),
+            [_feature(cyst)],
+        ),
+    ]
+    for phenopacket_id, variant, features in carriers:
+        await _seed(db_session, admin_user, phenopacket_id, [variant], features)
+    await db_session.commit()
+
+
+class TestPairwiseStatistics:
+    """Pair tables read off the count matrix."""
+
+    def test_pairs_skip_phenotypes_missing_from_either_group(self):
+        """Each pair keeps phenotypes observed in both of its groups."""
+        phenotypes = {
+            "HP:1": {"hpo_label": "a", "counts": [[2, 1], [0, 3], [0, 0]]},
+            "HP:2": {"hpo_label": "b", "counts": [[1, 0], [0, 0], [1, 1]]},
+        }
+        pairs = pairwise_statistics(phenotypes, 3)
+
+        assert [(p["group1"], p["group2"]) for p in pairs] == [(0, 1), (0, 2), (1, 2)]
+        assert [[r["hpo_id"] for r in p["rows"]] for p in pairs] == [
+            ["HP:1"],
+            ["HP:2"],
+            [],
+        ]
+        row = pairs[0]["rows"][0]
+        assert (row["group1_total"], row["group2_total"]) == (3, 3)
+        assert row["odds_ratio"] is None and 0.0 < row["p_value"] <= 1.0
+
+    def test_definition_hash_is_stable_and_criteria_sensitive(self):
+        """Equal criteria hash equally; any criterion change alters the hash."""
+        criteria = [{"variant_type": "truncating", "pathogenicity": None}]
+        assert definition_hash(criteria) == definition_hash([dict(criteria[0])])
+        assert definition_hash(criteria) != definition_hash(
+            [{"variant_type": "non_truncating", "pathogenicity": None}]
+        )
+
+
+@pytest.mark.asyncio
+class TestCompareGroupsEndpoint:
+    """The endpoint over a small seeded cohort."""
+
+    async def test_matches_variant_types_comparison(self, async_client, cohort):
+        """Truncating vs non-truncating groups reproduce the built-in mode."""
+        params = {"min_prevalence": 0.0, "limit": 50}
+        response = await async_client.post(
+            URL, params=params, json={"groups": TRUNCATING_GROUPS}
+        )
+        assert response.status_code == 200, response.text
+        body = response.json()
+
+        builtin = await async_client.get(
+            "/api/v2/phenopackets/compare/variant-types",
+            params={**params, "comparison": "truncating_vs_non_truncating"},
+        )
+        assert builtin.status_code == 200
+        (pair,) = body["comparisons"]
+        assert pair["phenotypes"] == builtin.json()["phenotypes"]
+        assert [p["hpo_id"] for p in pair["phenotypes"]] == [
+            "HP:0000107",
+            "HP:0004904",
+        ]
+        # The VUS carrier is outside the default P/LP pathogenicity.
+        assert body["groups"] == [
+            {"name": "Truncating", "variant_count": 3},
+            {"name": "Non-truncating", "variant_count": 2},
+        ]
+
+    async def test_overlapping_groups_and_pathogenicity(self, async_client, cohort):
+        """Groups may overlap and widen the pathogenicity filter."""
+        response = await async_client.post(
+            URL,
+            params={"min_prevalence": 0.0},
+            json={
+                "groups": [
+                    {"name": "All P/LP"},
+                    {
+                        "name": "Any missense",
+                        "variant_type": "non_truncating",
+                        "pathogenicity": [
+                            "PATHOGENIC",
+                            "UNCERTAIN_SIGNIFICANCE",
+                        ],
+                    },
+                    {"name": "Truncating", "variant_type": "truncating"},
+                ]
+            },
+        )
+        assert response.status_code == 200, response.text
+        body = response.json()
+        assert [g["variant_count"] for g in body["groups"]] == [5, 3, 3]
+        assert [(c["group1_name"], c["group2_name"]) for c in body["comparisons"]] == [
+            ("All P/LP", "Any missense"),
+            ("All P/LP", "Truncating"),
+            ("Any missense", "Truncating"),
+        ]
+
+    async def test_renamed_groups_reuse_cached_matrix(
+        self, async_client, cohort, monkeypatch
+    ):
+        """Only a change of criteria triggers another cohort scan."""
+        calls = []
+        original = groups_module._load_group_matrix
+
+        async def counting_load(db, criteria):
+            calls.append(criteria)
+            return await original(db, criteria)
+
+        monkeypatch.setattr(groups_module, "_load_group_matrix", counting_load)
+        renamed = [{**g, "name": g["name"].upper()} for g in TRUNCATING_GROUPS]
+        for groups, params in (
+            (TRUNCATING_GROUPS, {}),
+            (renamed, {"sort_by": "effect_size", "limit": 1}),
+        ):
+            response = await async_client.post(
+                URL, params=params, json={"groups": groups}
+            )
+            assert response.status_code == 200
+        assert len(calls) == 1
+        assert response.json()["comparisons"][0]["group1_name"] == "TRUNCATING"
+
+        response = await async_client.post(
+            URL,
+            json={
+                "groups": [*TRUNCATING_GROUPS, {"name": "CNV", "variant_type": "cnv"}]
+            },
+        )
+        assert response.status_code == 200
+        assert len(calls) == 2
+
+    async def test_protein_domain_and_disease_subtype_criteria(
+        self, async_client, cohort, monkeypatch
+    ):
+        """Domains filter on the hgvs.p position; subtypes on the carrier."""
+
+        async def fake_domain(db, name, gene_symbol="HNF1B"):
+            return (1, 200) if name == "POU-S" else None
+
+        monkeypatch.setattr(groups_module, "resolve_protein_domain", fake_domain)
+        response = await async_client.post(
+            URL,
+            json={
+                "groups": [
+                    {
+                        "name": "Truncating in domain",
+                        "variant_type": "truncating",
+                        "protein_domain": "POU-S",
+                    },
+                    {"name": "MODY", "disease_subtype": ["MODY"]},
+                ]
+            },
+        )
+        assert response.status_code == 200, response.text
+        body = response.json()
+        # p.Trp10Ter and p.Arg177Ter lie in 1-200; p.Gln243fs does not.
+        # Only the diabetes carriers (grp-1, grp-4) are MODY.
+        assert [g["variant_count"] for g in body["groups"]] == [2, 2]
+        assert body["metadata"]["criteria"][0]["protein_range"] == [1, 200]
+
+    async def test_unknown_protein_domain_is_rejected(self, async_client):
+        """A domain that is not in the reference data is a 400."""
+        response = await async_client.post(
+            URL,
+            json={
+                "groups": [
+                    {"name": "A", "protein_domain": "no-such-domain"},
+                    {"name": "B"},
+                ]
+            },
+        )
+        assert response.status_code == 400
+        assert "protein domain" in response.json()["detail"]
+
+    async def test_requires_at_least_two_groups(self, async_client):
+        """A single group cannot be compared."""
+        response = await async_client.post(URL, json={"groups": [{"name": "A"}]})
+        assert response.status_code == 422
@@ -1,6 +1,7 @@
 """Tests for variant type comparison endpoints and statistical calculations."""
 
 import json
+import random
 
 import pytest
 from scipy import stats
@@ -10,6 +11,7 @@ from app.phenopackets.routers.comparisons import (
     calculate_cohens_h,
     calculate_fdr_correction,
     calculate_fisher_exact_test,
+    fisher_exact_batch,
 )
 
 
@@ -86,6 +88,32 @@ class TestStatisticalFunctions:
         assert p_value > 0.05  # Should not be significant
         assert abs(odds_ratio - 1.0) < 0.0001  # Odds ratio should be ~1
 
+    def test_fisher_exact_batch_matches_scipy(self):
+        """Batched p-values and odds ratios agree with one-at-a-time tests."""
+        rng = random.Random(42)
+        tables = [
+            tuple(rng.randint(0, rng.choice([4, 30, 400])) for _ in range(4))
+            for _ in range(600)
+        ]
+        p_values, odds_ratios = fisher_exact_batch(tables)
+
+        for table, p_value, odds_ratio in zip(tables, p_values, odds_ratios):
+            expected_p, expected_or = calculate_fisher_exact_test(*table)
+            assert p_value == pytest.approx(expected_p, rel=1e-9, abs=1e-300)
+            if expected_or is None:
+                assert odds_ratio is None
+            else:
+                assert odds_ratio == pytest.approx(expected_or, rel=1e-12)
+
+    def test_fisher_exact_batch_degenerate_tables(self):
+        """Empty rows or columns give p = 1 and no odds ratio."""
+        p_values, odds_ratios = fisher_exact_batch(
+            [(0, 0, 0, 0), (5, 0, 3, 0), (0, 4, 0, 6), (0, 0, 2, 3)]
+        )
+        assert p_values == [1.0, 1.0, 1.0, 1.0]
+        assert odds_ratios == [None, None, None, None]
+        assert fisher_exact_batch([]) == ([], [])
+
     def test_calculate_fdr_correction_basic(self):
         """Test FDR correction with known p-values."""
         # Test with a simple set of p-values
@@ -424,6 +452,94 @@ class TestComparisonEndpoint:
         # Should respect limit
         assert len(data["phenotypes"]) <= 5
 
+    async def test_compare_with_resampling(
+        self, async_client, db_session, admin_headers, monkeypatch
+    ):
+        """Resampling adds bootstrap odds ratio intervals to the metadata."""
+        from app.phenopackets.resampling import resampling_executor
+
+        monkeypatch.setattr(resampling_executor, "_max_workers", 0)
+        response = await async_client.get(
+            "/api/v2/phenopackets/compare/variant-types",
+            params={
+                "comparison": "truncating_vs_non_truncating",
+                "resampling": True,
+                "n_resamples": 200,
+                "seed": 3,
+            },
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        resampling = response.json()["metadata"]["resampling"]
+        assert resampling["method"] == "bootstrap_odds_ratio"
+        assert resampling["n_resamples"] == 200
+        assert resampling["seed"] == 3
+        returned = {p["hpo_id"] for p in response.json()["phenotypes"]}
+        assert set(resampling["odds_ratio_ci"]) == returned
+
+    async def test_compare_resampling_pins_budget_for_anonymous_callers(
+        self, async_client, db_session, monkeypatch
+    ):
+        """Anonymous callers get the configured default budget and seed."""
+        from app.core.config import settings
+        from app.phenopackets.resampling import resampling_executor
+
+        monkeypatch.setattr(resampling_executor, "_max_workers", 0)
+        response = await async_client.get(
+            "/api/v2/phenopackets/compare/variant-types",
+            params={
+                "comparison": "truncating_vs_non_truncating",
+                "resampling": True,
+                "n_resamples": 200,
+                "seed": 3,
+            },
+        )
+
+        assert response.status_code == 200
+        resampling = response.json()["metadata"]["resampling"]
+        assert resampling["n_resamples"] == settings.resampling.default_resamples
+        assert resampling["seed"] == settings.resampling.seed
+
+    async def test_compare_reuses_cached_statistics(
+        self, async_client, db_session, monkeypatch
+    ):
+        """Sort orders, limits and thresholds share one batched computation."""
+        import importlib
+
+        router_module = importlib.import_module(
+            "app.phenopackets.routers.comparisons.router"
+        )
+        calls = []
+        original = router_module.fisher_exact_batch
+
+        def counting_batch(tables):
+            calls.append(len(tables))
+            return original(tables)
+
+        monkeypatch.setattr(router_module, "fisher_exact_batch", counting_batch)
+        for params in (
+            {"sort_by": "p_value", "limit": 5},
+            {"sort_by": "effect_size", "limit": 50},
+            {"sort_by": "prevalence_diff", "min_prevalence": 0.5},
+        ):
+            response = await async_client.get(
+                "/api/v2/phenopackets/compare/variant-types",
+                params={"comparison": "truncating_vs_non_truncating", **params},
+            )
+            assert response.status_code == 200
+        assert len(calls) == 1
+
+        response = await async_client.get(
+            "/api/v2/phenopackets/compare/variant-types",
+            params={
+                "comparison": "truncating_vs_non_truncating",
+                "reporting_mode": "reported_only",
+            },
+        )
+        assert response.status_code == 200
+        assert len(calls) == 2
+
     async def test_compare_invalid_comparison_type(self, async_client, db_session):
         """Test with invalid comparison type."""
         response = await async_client.get(
@@ -1,7 +1,8 @@
 """Tests for pagination utilities.
 
 Tests the cursor encode/decode functions (used by search endpoint) and
-verifies CRUD endpoint uses offset pagination.
+verifies the CRUD list defaults to offset pagination, with keyset (cursor)
+pagination opt-in through ``page[after]`` / ``page[before]``.
 """
 
 import uuid
@@ -35,6 +36,47 @@ async def test_crud_endpoint_uses_offset_pagination(
     assert data["meta"]["page"]["pageSize"] == 5
 
 
+@pytest.mark.asyncio
+async def test_crud_endpoint_keyset_pagination_opt_in(
+    async_client: AsyncClient, published_record
+):
+    """An empty page[after] requests the first keyset page with a total."""
+    response = await async_client.get(
+        "/api/v2/phenopackets/",
+        params={"page[size]": 5, "page[after]": ""},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    page = data["meta"]["page"]
+    assert "currentPage" not in page
+    assert page["total"] == 1
+    assert page["hasNextPage"] is False
+    assert page["hasPreviousPage"] is False
+    assert [item["id"] for item in data["data"]] == ["wave7-published-1"]
+    # The first link stays in cursor mode.
+    assert "page%5Bafter%5D=" in data["links"]["first"]
+
+    # Walking back from the only row yields an empty page.
+    response = await async_client.get(
+        "/api/v2/phenopackets/",
+        params={"page[size]": 5, "page[before]": page["startCursor"]},
+    )
+    assert response.status_code == 200
+    assert response.json()["data"] == []
+
+
+@pytest.mark.asyncio
+async def test_crud_endpoint_keyset_rejects_custom_sort(async_client: AsyncClient):
+    """Keyset pages follow the default order only."""
+    response = await async_client.get(
+        "/api/v2/phenopackets/",
+        params={"page[after]": "", "sort": "subject_id"},
+    )
+
+    assert response.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_cursor_encode_decode_functions():
     """Test cursor encoding and decoding functions.
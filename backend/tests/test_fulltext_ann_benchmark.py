@@ -0,0 +1,58 @@
+"""Tests for the dense-leg HNSW recall/latency benchmark.
+
+The recall and percentile helpers are pure; the end-to-end run uses the
+pgvector test database with a small synthetic corpus in a temporary table.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from app.publications.fulltext.ann_benchmark import (
+    percentile,
+    recall_at_k,
+    run_ann_benchmark,
+)
+
+
+def test_recall_at_k_counts_exact_neighbours_found():
+    assert recall_at_k([1, 2, 3], [1, 2, 3], 3) == 1.0
+    assert recall_at_k([1, 9, 3, 2], [1, 2, 3, 4], 3) == pytest.approx(2 / 3)
+    assert recall_at_k([5], [], 10) == 1.0
+
+
+def test_percentile_nearest_rank():
+    samples = [float(v) for v in range(1, 101)]
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 95) == 95.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([], 50) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_run_ann_benchmark_reports_recall_against_exact(db_session):
+    results = await run_ann_benchmark(
+        db_session,
+        corpus_size=300,
+        query_count=10,
+        k=5,
+        ef_search_values=(200,),
+        filter_groups=3,
+        dim=16,
+    )
+
+    assert [(r.ef_search, r.filtered) for r in results] == [
+        (None, False),
+        (200, False),
+        (None, True),
+        (200, True),
+    ]
+    assert all(r.recall_at_k == 1.0 for r in results if r.ef_search is None)
+    # ef_search well above the corpus neighbourhood finds (nearly) everything.
+    assert all(r.recall_at_k >= 0.9 for r in results)
+    assert all(0 < r.p50_ms <= r.p95_ms <= r.p99_ms for r in results)
+
+    # Nothing is left behind.
+    leftover = await db_session.execute(
+        text("SELECT to_regclass('pg_temp.ann_benchmark_vectors') IS NOT NULL")
+    )
+    assert leftover.scalar() is False
@@ -5,8 +5,10 @@ import math
 import pytest
 
 from app.publications.fulltext.chunking import (
+    CachingTokenizer,
     _RegexTokenizer,
     chunk_section,
+    chunk_sections,
     get_tokenizer,
 )
 from app.publications.fulltext.types import Chunk
@@ -178,3 +180,53 @@ def test_default_tokenizer_used_when_none_passed() -> None:
     assert len(chunks) == 1
     assert chunks[0].text == "HNF1B gene"
     assert chunks[0].section == "title"
+
+
+class _CountingTokenizer(_RegexTokenizer):
+    """Regex tokenizer that records each batched call."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def offsets_batch(self, texts):
+        self.batches.append(list(texts))
+        return super().offsets_batch(texts)
+
+
+def test_chunk_sections_matches_per_section_chunking_in_one_batch() -> None:
+    sections = [
+        ("abstract", " ".join(f"a{i}" for i in range(30))),
+        ("methods", "   "),
+        ("results", "Renal cysts, diabetes; and hypomagnesaemia."),
+    ]
+    tok = _CountingTokenizer()
+    batched = chunk_sections(sections, max_tokens=10, overlap_tokens=3, tokenizer=tok)
+    expected = [
+        chunk_section(label, text, max_tokens=10, overlap_tokens=3, tokenizer=TOK)
+        for label, text in sections
+    ]
+    assert batched == expected
+    # Blank sections are not sent to the tokenizer.
+    assert tok.batches == [[sections[0][1], sections[2][1]]]
+
+
+def test_caching_tokenizer_reuses_offsets_by_text_hash() -> None:
+    inner = _CountingTokenizer()
+    cached = CachingTokenizer(inner, max_entries=2)
+    texts = ["Alpha, beta.", "Gamma delta"]
+    first = cached.offsets_batch(texts)
+    assert first == [TOK.offsets(t) for t in texts]
+    assert cached.offsets_batch(texts) == first
+    assert inner.batches == [texts]
+    assert cached.get_status() == {
+        "entries": 2,
+        "max_entries": 2,
+        "hits": 2,
+        "misses": 2,
+    }
+
+    # Only the miss is tokenized; the least recently used entry is evicted.
+    assert cached.offsets("Epsilon") == TOK.offsets("Epsilon")
+    assert inner.batches[-1] == ["Epsilon"]
+    cached.offsets("Alpha, beta.")
+    assert inner.batches[-1] == ["Alpha, beta."]
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from pathlib import Path
 
 import pytest
 
 from app.publications.fulltext.embeddings import (
+    CachedQueryEmbeddingProvider,
     EmbeddingProvider,
     FakeEmbeddingProvider,
+    MicroBatchingEmbeddingProvider,
+    QueryEmbeddingCache,
     SentenceTransformerEmbeddingProvider,
     get_embedding_provider,
     hash_text,
@@ -92,3 +97,160 @@ def test_sentence_transformer_provider_raises_clear_error_when_missing():
             model_name="BAAI/bge-small-en-v1.5",
             query_prefix="prefix: ",
         )
+
+
+class _CountingProvider(FakeEmbeddingProvider):
+    """Fake provider that records each batch sent to the model."""
+
+    def __init__(self, model_name: str = "counting", delay: float = 0.0) -> None:
+        super().__init__(dim=8, model_name=model_name)
+        self.batches: list[tuple[list[str], bool]] = []
+        self.delay = delay
+
+    async def embed(self, texts, *, is_query=False):
+        self.batches.append((list(texts), is_query))
+        await asyncio.sleep(self.delay)
+        return await super().embed(texts, is_query=is_query)
+
+
+async def test_query_cache_skips_model_for_repeated_queries():
+    inner = _CountingProvider()
+    cache = QueryEmbeddingCache(max_entries=8, ttl_seconds=60.0)
+    provider = CachedQueryEmbeddingProvider(inner, cache)
+    assert isinstance(provider, EmbeddingProvider)
+
+    first = await provider.embed(["a", "b", "a"], is_query=True)
+    second = await provider.embed(["b", "c"], is_query=True)
+
+    assert inner.batches == [(["a", "b"], True), (["c"], True)]
+    assert first[0] == first[2]
+    assert second[0] == first[1]
+    status = cache.get_status()
+    assert (status["hits"], status["misses"], status["entries"]) == (1, 3, 3)
+
+    # Passage embeds bypass the cache.
+    await provider.embed(["a"])
+    assert inner.batches[-1] == (["a"], False)
+
+
+async def test_query_cache_is_keyed_by_model_and_bounded():
+    cache = QueryEmbeddingCache(max_entries=2, ttl_seconds=60.0)
+    model_a, model_b = _CountingProvider("a"), _CountingProvider("b")
+    await cache.get_many(model_a, ["x"])
+    await cache.get_many(model_b, ["x"])
+    assert len(model_b.batches) == 1
+
+    await cache.get_many(model_a, ["y"])  # evicts the least recent ("a", "x")
+    await cache.get_many(model_a, ["x"])
+    assert [b for b, _ in model_a.batches] == [["x"], ["y"], ["x"]]
+
+
+async def test_query_cache_entries_expire(monkeypatch):
+    cache = QueryEmbeddingCache(max_entries=8, ttl_seconds=10.0)
+    inner = _CountingProvider()
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    await cache.get_many(inner, ["q"])
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11.0)
+    await cache.get_many(inner, ["q"])
+    assert len(inner.batches) == 2
+
+
+async def test_query_cache_coalesces_concurrent_encodes():
+    cache = QueryEmbeddingCache(max_entries=0, ttl_seconds=60.0)
+    inner = _CountingProvider(delay=0.05)
+    results = await asyncio.gather(
+        *(cache.get_many(inner, ["same query"]) for _ in range(5))
+    )
+    assert len(inner.batches) == 1
+    assert all(result == results[0] for result in results)
+    status = cache.get_status()
+    assert (status["misses"], status["coalesced"], status["entries"]) == (1, 4, 0)
+
+
+async def test_query_cache_failed_encode_propagates_to_waiters():
+    class _Failing(_CountingProvider):
+        async def embed(self, texts, *, is_query=False):
+            await asyncio.sleep(0.02)
+            raise RuntimeError("model crashed")
+
+    cache = QueryEmbeddingCache(max_entries=8, ttl_seconds=60.0)
+    results = await asyncio.gather(
+        cache.get_many(_Failing(), ["q"]),
+        cache.get_many(_Failing(), ["q"]),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert cache.get_status()["in_flight"] == 0
+    # The failure is not cached.
+    assert await cache.get_many(_CountingProvider(), ["q"])
+
+
+async def test_query_cache_cancelled_owner_does_not_fail_waiters():
+    cache = QueryEmbeddingCache(max_entries=8, ttl_seconds=60.0)
+    inner = _CountingProvider(delay=0.05)
+    owner = asyncio.create_task(cache.get_many(inner, ["q"]))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.get_many(inner, ["q"]))
+    await asyncio.sleep(0)
+    assert cache.get_status()["coalesced"] == 1
+
+    owner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+
+    [vector] = await waiter
+    assert vector == (await inner.embed(["q"], is_query=True))[0]
+    assert len(inner.batches) == 2  # the shared encode, then our reference
+    assert cache.get_status()["in_flight"] == 0
+
+
+async def test_micro_batching_merges_concurrent_queries():
+    inner = _CountingProvider()
+    provider = MicroBatchingEmbeddingProvider(
+        inner, window_seconds=0.02, max_batch_size=100
+    )
+    results = await asyncio.gather(
+        provider.embed(["a"], is_query=True),
+        provider.embed(["b", "a"], is_query=True),
+        provider.embed(["c"], is_query=True),
+    )
+
+    assert inner.batches == [(["a", "b", "c"], True)]
+    direct = await FakeEmbeddingProvider(dim=8, model_name="counting").embed(
+        ["a", "b", "c"]
+    )
+    assert results == [[direct[0]], [direct[1], direct[0]], [direct[2]]]
+    assert (provider.batches, provider.encoded) == (1, 3)
+
+
+async def test_micro_batching_flushes_at_max_size_and_passes_passages():
+    inner = _CountingProvider()
+    provider = MicroBatchingEmbeddingProvider(
+        inner, window_seconds=60.0, max_batch_size=2
+    )
+    # A full batch is flushed without waiting out the window.
+    await asyncio.wait_for(
+        asyncio.gather(
+            provider.embed(["a"], is_query=True), provider.embed(["b"], is_query=True)
+        ),
+        timeout=5.0,
+    )
+    await provider.embed(["passage"])
+    assert inner.batches == [(["a", "b"], True), (["passage"], False)]
+
+
+async def test_micro_batching_failure_reaches_every_caller():
+    class _Failing(_CountingProvider):
+        async def embed(self, texts, *, is_query=False):
+            raise RuntimeError("model crashed")
+
+    provider = MicroBatchingEmbeddingProvider(
+        _Failing(), window_seconds=0.01, max_batch_size=100
+    )
+    results = await asyncio.gather(
+        provider.embed(["a", "b"], is_query=True),
+        provider.embed(["c"], is_query=True),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
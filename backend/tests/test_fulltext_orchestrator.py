@@ -5,10 +5,12 @@ fetchers (no network), the batch sync aggregation/error-isolation, and the
 embedding backfill driver with the deterministic FakeEmbeddingProvider.
 """
 
+import asyncio
+
 import pytest
 from sqlalchemy import text
 
-from app.publications.fulltext import orchestrator, persistence
+from app.publications.fulltext import orchestrator, persistence, sync_jobs
 from app.publications.fulltext.embeddings import FakeEmbeddingProvider
 from app.publications.fulltext.orchestrator import (
     PublicationFetchers,
@@ -212,7 +214,6 @@ async def test_sync_publications_aggregates_and_degrades_fetch_failures(
         ["20", "21", "99"],
         session=None,
         allowed_licenses=ALLOWED,
-        rate_limit_delay=0,
     )
     assert counts.processed == 3  # all completed (99 degraded to title_only)
     assert counts.errors == 0  # fetch blips are degraded, not errored
@@ -222,14 +223,14 @@ async def test_sync_publications_aggregates_and_degrades_fetch_failures(
 
 @pytest.mark.asyncio
 async def test_sync_publications_isolates_hard_errors(db_session, monkeypatch):
-    # A hard failure inside process_publication is counted and the batch
+    # A hard failure while persisting a publication is counted and the batch
     # continues (the session is rolled back so later PMIDs still commit).
-    real = orchestrator.process_publication
+    real = orchestrator.persist_publication
 
-    async def flaky(db, pmid, **kwargs):
-        if pmid == "99":
+    async def flaky(db, prepared, **kwargs):
+        if prepared.outcome.pmid == "PMID:99":
             raise RuntimeError("hard failure")
-        return await real(db, pmid, **kwargs)
+        return await real(db, prepared, **kwargs)
 
     ft = FullTextResult("PMID:20", "PMC20", "cc by", True, _BODY, "pubtator_full_bioc")
 
@@ -237,18 +238,197 @@ async def test_sync_publications_isolates_hard_errors(db_session, monkeypatch):
         return _fetchers("abs", ft)
 
     monkeypatch.setattr(orchestrator, "build_fetchers", fake_build)
-    monkeypatch.setattr(orchestrator, "process_publication", flaky)
+    monkeypatch.setattr(orchestrator, "persist_publication", flaky)
     counts = await orchestrator.sync_publications(
         db_session,
         ["20", "99", "21"],
         session=None,
         allowed_licenses=ALLOWED,
-        rate_limit_delay=0,
     )
     assert counts.errors == 1
     assert counts.processed == 2
 
 
+@pytest.mark.asyncio
+async def test_sync_publications_pipelines_fetches_in_prefetched_windows(
+    db_session, monkeypatch
+):
+    """Fetches overlap up to the concurrency bound; writes keep input order."""
+    ft = FullTextResult("PMID:50", "PMC50", "cc by", True, _BODY, "pubtator_full_bioc")
+    windows, active, peak, persisted = [], [0], [0], []
+
+    def fake_build(session, *, abstract_api_key=None):
+        async def prefetch(pmids):
+            windows.append(list(pmids))
+
+        async def fa(pmid):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.02)
+            active[0] -= 1
+            return AbstractResult(f"PMID:{pmid}", "abs")
+
+        async def ff(pmid):
+            return ft if pmid == "50" else None
+
+        return PublicationFetchers(
+            fetch_abstract=fa, fetch_fulltext=ff, prefetch=prefetch
+        )
+
+    real = orchestrator.persist_publication
+
+    async def recording(db, prepared, **kwargs):
+        persisted.append(prepared.outcome.pmid)
+        return await real(db, prepared, **kwargs)
+
+    monkeypatch.setattr(orchestrator, "build_fetchers", fake_build)
+    monkeypatch.setattr(orchestrator, "persist_publication", recording)
+    pmids = [str(n) for n in range(50, 57)]
+    counts = await orchestrator.sync_publications(
+        db_session,
+        pmids,
+        session=None,
+        allowed_licenses=ALLOWED,
+        concurrency=3,
+        prefetch_batch_size=3,
+    )
+
+    assert windows == [["50", "51", "52"], ["53", "54", "55"], ["56"]]
+    assert 1 < peak[0] <= 3
+    assert persisted == [f"PMID:{p}" for p in pmids]
+    assert (counts.processed, counts.full_text_fetched, counts.errors) == (7, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_sync_job_resumes_and_skips_unchanged_content(db_session, monkeypatch):
+    """A resumed job skips finished PMIDs; a new job skips unchanged content."""
+    ft = FullTextResult("PMID:60", "PMC60", "cc by", True, _BODY, "pubtator_full_bioc")
+    fetched, persisted = [], []
+
+    def fake_build(session, *, abstract_api_key=None):
+        async def fa(pmid):
+            fetched.append(pmid)
+            return AbstractResult(f"PMID:{pmid}", "abs")
+
+        async def ff(pmid):
+            return ft if pmid == "60" else None
+
+        return PublicationFetchers(fetch_abstract=fa, fetch_fulltext=ff)
+
+    real = orchestrator.persist_publication
+
+    async def flaky(db, prepared, **kwargs):
+        persisted.append(prepared.outcome.pmid)
+        if prepared.outcome.pmid == "PMID:62" and len(persisted) == 3:
+            raise RuntimeError("worker lost its connection")
+        return await real(db, prepared, **kwargs)
+
+    monkeypatch.setattr(orchestrator, "build_fetchers", fake_build)
+    monkeypatch.setattr(orchestrator, "persist_publication", flaky)
+    pmids = ["60", "61", "62"]
+
+    job = await sync_jobs.open_sync_job(db_session, source="test", total=3)
+    first = await orchestrator.sync_publications(
+        db_session, pmids, session=None, allowed_licenses=ALLOWED, job=job
+    )
+    assert (first.processed, first.errors) == (2, 1)
+    await sync_jobs.finish_sync_job(db_session, job, error="interrupted")
+
+    fetched.clear()
+    resumed = await sync_jobs.open_sync_job(db_session, source="test", total=3)
+    assert resumed.id == job.id and resumed.resumed
+    second = await orchestrator.sync_publications(
+        db_session, pmids, session=None, allowed_licenses=ALLOWED, job=resumed
+    )
+    assert fetched == ["62"]
+    assert (second.resumed, second.processed, second.errors) == (2, 1, 0)
+    await sync_jobs.finish_sync_job(db_session, resumed)
+
+    persisted.clear()
+    fresh = await sync_jobs.open_sync_job(db_session, source="test", total=3)
+    assert fresh.id != job.id and not fresh.resumed
+    third = await orchestrator.sync_publications(
+        db_session, pmids, session=None, allowed_licenses=ALLOWED, job=fresh
+    )
+    assert (third.processed, third.unchanged) == (3, 3)
+    assert persisted == []
+
+    row = (
+        await db_session.execute(
+            text(
+                "SELECT processed, unchanged, cursor_pmid FROM publication_sync_jobs "
+                "WHERE id = :id"
+            ),
+            {"id": fresh.id},
+        )
+    ).first()
+    assert (row.processed, row.unchanged, row.cursor_pmid) == (3, 3, "PMID:62")
+
+
+@pytest.mark.asyncio
+async def test_sync_job_does_not_resume_jobs_past_max_age(db_session):
+    """A failed job untouched for longer than the resume window is abandoned."""
+    job = await sync_jobs.open_sync_job(db_session, source="old", total=1)
+    await sync_jobs.finish_sync_job(db_session, job, error="interrupted")
+    await db_session.execute(
+        text(
+            "UPDATE publication_sync_jobs "
+            "SET updated_at = NOW() - INTERVAL '2 days' WHERE id = :id"
+        ),
+        {"id": job.id},
+    )
+    await db_session.commit()
+
+    fresh = await sync_jobs.open_sync_job(
+        db_session, source="old", total=1, max_resume_age_seconds=86400.0
+    )
+    assert fresh.id != job.id and not fresh.resumed
+
+
+@pytest.mark.asyncio
+async def test_build_fetchers_consumes_batched_lookups(monkeypatch):
+    """Prefetched abstracts and PMCIDs replace per-PMID requests."""
+    calls = []
+
+    async def fake_abstracts(pmids, **kwargs):
+        calls.append(("efetch", list(pmids)))
+        return {f"PMID:{p}": AbstractResult(f"PMID:{p}", f"abs {p}") for p in pmids}
+
+    async def fake_pmcids(pmids, **kwargs):
+        calls.append(("idconv", list(pmids)))
+        return {p: f"PMC{p}" for p in pmids}
+
+    async def no_bioc(pmid, **kwargs):
+        return None
+
+    async def open_access(pmid, **kwargs):
+        return (True, "cc by")
+
+    async def jats(pmcid, source, **kwargs):
+        calls.append(("jats", pmcid))
+        return _BODY
+
+    for name, fake in (
+        ("fetch_abstracts", fake_abstracts),
+        ("resolve_pmcids", fake_pmcids),
+        ("fetch_bioc", no_bioc),
+        ("fetch_europepmc_core", open_access),
+        ("fetch_jats", jats),
+    ):
+        monkeypatch.setattr(orchestrator, name, fake)
+
+    fetchers = orchestrator.build_fetchers(None)
+    await fetchers.prefetch(["PMID:1", "2"])
+    assert (await fetchers.fetch_abstract("PMID:1")).text == "abs 1"
+    fulltext = await fetchers.fetch_fulltext("2")
+    assert fulltext.pmcid == "PMC2" and fulltext.source == "europe_pmc_jats"
+    assert calls == [("efetch", ["1", "2"]), ("idconv", ["1", "2"]), ("jats", "PMC2")]
+
+    # A PMID outside the prefetched window falls back to a single request.
+    await fetchers.fetch_abstract("3")
+    assert calls[-1] == ("efetch", ["3"])
+
+
 @pytest.mark.asyncio
 async def test_backfill_embeddings_idempotent(db_session):
     ft = FullTextResult("PMID:30", "PMC30", "cc by", True, _BODY, "pubtator_full_bioc")
@@ -256,12 +436,89 @@ async def test_backfill_embeddings_idempotent(db_session):
         db_session, "30", fetchers=_fetchers(None, ft), allowed_licenses=ALLOWED
     )
     provider = FakeEmbeddingProvider(dim=384)
-    embedded = await backfill_embeddings(db_session, provider, batch_size=8)
-    assert embedded >= 2
+    counts = await backfill_embeddings(db_session, provider, batch_size=8)
+    assert counts.embedded >= 2
+    assert counts.passages_per_second > 0
     stored = await persistence.count_embeddings(
         db_session, model_name=provider.model_name
     )
-    assert stored == embedded
+    assert stored == counts.embedded
     # Re-run: nothing stale -> zero new embeddings.
     again = await backfill_embeddings(db_session, provider, batch_size=8)
-    assert again == 0
+    assert again.embedded == 0
+
+
+async def _seed_embeddable_publications(db_session, count):
+    for n in range(count):
+        ft = FullTextResult(
+            f"PMID:4{n}", f"PMC4{n}", "cc by", True, _BODY, "pubtator_full_bioc"
+        )
+        await process_publication(
+            db_session, f"4{n}", fetchers=_fetchers("abs", ft), allowed_licenses=ALLOWED
+        )
+
+
+@pytest.mark.asyncio
+async def test_backfill_embeddings_pages_and_reembeds_only_stale(db_session):
+    """Keyset pages smaller than a batch still cover every passage once."""
+    await _seed_embeddable_publications(db_session, 3)
+    total = (
+        await db_session.execute(text("SELECT COUNT(*) FROM publication_fulltext"))
+    ).scalar()
+    provider = FakeEmbeddingProvider(dim=384)
+
+    capped = await backfill_embeddings(
+        db_session, provider, batch_size=2, max_passages=3, page_size=1
+    )
+    assert capped.embedded == 3
+    assert capped.batches == 2
+    rest = await backfill_embeddings(db_session, provider, batch_size=2, page_size=2)
+    assert rest.embedded == total - 3
+
+    await db_session.execute(
+        text(
+            "UPDATE publication_fulltext SET text = text || ' Revised.' "
+            "WHERE passage_id = (SELECT MIN(passage_id) FROM publication_fulltext)"
+        )
+    )
+    await db_session.commit()
+    stale = await backfill_embeddings(db_session, provider, batch_size=2)
+    assert stale.embedded == 1
+    assert (
+        await persistence.count_embeddings(db_session, model_name=provider.model_name)
+        == total
+    )
+
+
+@pytest.mark.asyncio
+async def test_backfill_embeddings_overlaps_encoding_with_writes(
+    db_session, monkeypatch
+):
+    """The next batch is already encoding while the current one is written."""
+    await _seed_embeddable_publications(db_session, 2)
+    events = []
+    fake = FakeEmbeddingProvider(dim=384)
+
+    class RecordingProvider:
+        dim = fake.dim
+        model_name = fake.model_name
+
+        async def embed(self, texts, *, is_query=False):
+            events.append("encode")
+            return await fake.embed(texts, is_query=is_query)
+
+    real_upsert = persistence.bulk_upsert_embeddings
+
+    async def recording_upsert(db, **kwargs):
+        events.append("write-start")
+        await asyncio.sleep(0)
+        written = await real_upsert(db, **kwargs)
+        events.append("write-end")
+        return written
+
+    monkeypatch.setattr(persistence, "bulk_upsert_embeddings", recording_upsert)
+    counts = await backfill_embeddings(db_session, RecordingProvider(), batch_size=2)
+
+    assert counts.batches >= 2
+    assert events.index("encode", 1) < events.index("write-end")
+    assert events.count("encode") == counts.batches
@@ -0,0 +1,37 @@
+"""Per-host token buckets shared by the publication fetch clients."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.publications.fulltext import rate_limit
+from app.publications.fulltext.rate_limit import TokenBucket, host_rate_limiter
+
+
+def test_bucket_spaces_requests_after_the_burst(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    bucket = TokenBucket(requests_per_second=4.0, burst=2.0)
+
+    waits = [bucket.reserve() for _ in range(4)]
+    assert waits == pytest.approx([0.0, 0.0, 0.25, 0.5])
+
+    # After a quiet second the burst is available again.
+    now[0] += 10.0
+    assert bucket.reserve() == 0.0
+
+
+def test_zero_rate_is_unlimited():
+    bucket = TokenBucket(requests_per_second=0.0)
+    assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
+
+
+def test_buckets_are_shared_per_host(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_BUCKETS", {})
+    efetch = host_rate_limiter("https://eutils.ncbi.nlm.nih.gov/efetch.fcgi", 3.0)
+    esummary = host_rate_limiter("https://EUTILS.ncbi.nlm.nih.gov/esummary.fcgi", 10.0)
+    other = host_rate_limiter("https://www.ebi.ac.uk/europepmc", 1.0)
+
+    assert efetch is esummary
+    assert efetch.requests_per_second == 10.0
+    assert other is not efetch
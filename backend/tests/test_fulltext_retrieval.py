@@ -266,6 +266,48 @@ async def test_rrf_uses_dense_leg_with_embeddings(db_session):
     assert result.passages[0].dense_rank == 1
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("exact_max_pmids", [0, 50])
+async def test_dense_leg_with_pmid_filter_uses_hnsw_or_exact_scan(
+    db_session, monkeypatch, exact_max_pmids
+):
+    """Narrow PMID filters scan exactly; wider ones use the tuned HNSW scan."""
+    from app.publications.fulltext import retrieval
+
+    await _seed(db_session, with_embeddings=True)
+    monkeypatch.setattr(
+        retrieval.settings.publications_rag, "dense_exact_max_pmids", exact_max_pmids
+    )
+    result = await search_passages(
+        db_session,
+        "renal cysts and maturity onset diabetes were observed",
+        pmids=["1"],
+        rerank="rrf",
+        provider=FakeEmbeddingProvider(dim=384),
+        section_boosts={},
+        ef_search=10,
+    )
+    assert result.rerank_used == "rrf"
+    assert result.dense_candidate_count == 4
+    assert result.passages[0].passage_id == "PMID:1:results:0"
+    assert result.passages[0].dense_rank == 1
+
+
+@pytest.mark.parametrize(
+    ("pmids", "expected"), [(None, False), ([], False), (["1"], True)]
+)
+def test_exact_dense_search_requires_non_empty_pmid_filter(
+    monkeypatch, pmids, expected
+):
+    """An empty PMID filter must not fall through to a full brute-force scan."""
+    from app.publications.fulltext import retrieval
+
+    monkeypatch.setattr(
+        retrieval.settings.publications_rag, "dense_exact_max_pmids", 50
+    )
+    assert retrieval._use_exact_dense_search(pmids) is expected
+
+
 @pytest.mark.asyncio
 async def test_rrf_falls_back_to_lexical_without_provider(db_session):
     await _seed(db_session)
@@ -419,3 +461,62 @@ async def test_invalid_rerank_and_mode_raise(db_session):
         await search_passages(db_session, "x", rerank="bogus")
     with pytest.raises(ValueError):
         await search_passages(db_session, "x", mode="bogus")
+
+
+@pytest.mark.asyncio
+async def test_dense_leg_runs_on_its_own_session(db_session):
+    """The dense query uses a separate session from the caller's."""
+    from app import database
+
+    await _seed(db_session, with_embeddings=True)
+    opened = []
+
+    def factory():
+        session = database.async_session_maker()
+        opened.append(session)
+        return session
+
+    result = await search_passages(
+        db_session,
+        "renal cysts and maturity onset diabetes were observed",
+        rerank="rrf",
+        mode="brief",
+        provider=FakeEmbeddingProvider(dim=384),
+        dense_session_factory=factory,
+        section_boosts={},
+    )
+    assert len(opened) == 1 and opened[0] is not db_session
+    assert result.rerank_used == "rrf"
+    # Dense-only passages are materialized from the dense rows themselves.
+    assert all(p.snippet is not None for p in result.passages)
+    assert result.passages[0].passage_id == "PMID:1:results:0"
+
+
+@pytest.mark.asyncio
+async def test_embeddings_probe_is_cached_per_model(db_session, monkeypatch):
+    """The presence probe is reused until invalidated or expired."""
+    from app.publications.fulltext import retrieval
+
+    await _seed(db_session, with_embeddings=False)
+    provider = FakeEmbeddingProvider(dim=384)
+    first = await search_passages(db_session, "kidney", provider=provider)
+    assert first.embeddings_available is False
+
+    # Embeddings written behind the cache's back stay invisible until the
+    # probe is invalidated (as the backfill does) ...
+    await _seed(db_session, with_embeddings=True)
+    cached = await search_passages(db_session, "kidney", provider=provider)
+    assert cached.embeddings_available is False
+    retrieval.invalidate_embeddings_probe(provider.model_name)
+    fresh = await search_passages(db_session, "kidney", provider=provider)
+    assert fresh.embeddings_available is True
+
+    # ... or until the TTL lapses.
+    retrieval.invalidate_embeddings_probe()
+    monkeypatch.setattr(
+        retrieval.settings.publications_rag, "embeddings_probe_ttl_seconds", 0.0
+    )
+    await db_session.execute(text("DELETE FROM publication_fulltext_embeddings"))
+    await db_session.commit()
+    expired = await search_passages(db_session, "kidney", provider=provider)
+    assert expired.embeddings_available is False
@@ -18,9 +18,11 @@ import pytest
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import CacheService
 from app.phenopackets.models import Phenopacket, PhenopacketRevision
 from app.search.mv_refresh import (
     MVRefreshMiddleware,
+    SearchIndexRefreshCoordinator,
     refresh_global_search_index,
     schedule_refresh_if_stale,
 )
@@ -731,41 +733,112 @@ class TestMVRefreshMiddleware:
 
     @pytest.mark.asyncio
     async def test_middleware_no_refresh_when_clean(self, db_session: AsyncSession):
-        """Test middleware doesn't refresh when not marked dirty."""
-        with patch(
-            "app.search.mv_refresh.schedule_refresh_if_stale", new_callable=AsyncMock
-        ) as mock_refresh:
-            async with MVRefreshMiddleware(db_session):
+        """Test middleware doesn't mark the index dirty when not marked dirty."""
+        coordinator = SearchIndexRefreshCoordinator(CacheService())
+        with patch.object(
+            coordinator, "mark_dirty", new_callable=AsyncMock
+        ) as mock_mark:
+            async with MVRefreshMiddleware(db_session, coordinator=coordinator):
                 # Don't mark dirty
                 pass
 
-            mock_refresh.assert_not_called()
+            mock_mark.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_middleware_refreshes_when_dirty(self, db_session: AsyncSession):
-        """Test middleware refreshes when marked dirty."""
+        """Test middleware hands a dirty mark to the coordinator."""
+        coordinator = SearchIndexRefreshCoordinator(CacheService())
         with patch(
             "app.search.mv_refresh.schedule_refresh_if_stale", new_callable=AsyncMock
         ) as mock_refresh:
-            async with MVRefreshMiddleware(db_session) as mv:
+            async with MVRefreshMiddleware(db_session, coordinator=coordinator) as mv:
                 mv.mark_dirty()
 
-            mock_refresh.assert_called_once()
+            # No inline refresh: the coordinator's worker owns refreshing.
+            mock_refresh.assert_not_called()
+        assert await coordinator.is_dirty()
 
     @pytest.mark.asyncio
     async def test_middleware_no_refresh_on_exception(self, db_session: AsyncSession):
-        """Test middleware doesn't refresh when exception occurs."""
-        with patch(
-            "app.search.mv_refresh.schedule_refresh_if_stale", new_callable=AsyncMock
-        ) as mock_refresh:
-            try:
-                async with MVRefreshMiddleware(db_session) as mv:
-                    mv.mark_dirty()
-                    raise ValueError("Test exception")
-            except ValueError:
-                pass
+        """Test middleware doesn't mark dirty when exception occurs."""
+        coordinator = SearchIndexRefreshCoordinator(CacheService())
+        try:
+            async with MVRefreshMiddleware(db_session, coordinator=coordinator) as mv:
+                mv.mark_dirty()
+                raise ValueError("Test exception")
+        except ValueError:
+            pass
 
-            mock_refresh.assert_not_called()
+        assert not await coordinator.is_dirty()
+
+
+class TestSearchIndexRefreshCoordinator:
+    """Tests for the debounced, cluster-wide refresh coordinator."""
+
+    @pytest.mark.asyncio
+    async def test_marks_coalesce_into_one_refresh(self):
+        """Several dirty marks are covered by a single refresh."""
+        coordinator = SearchIndexRefreshCoordinator(
+            CacheService(), debounce_seconds=0.0, max_delay_seconds=60.0
+        )
+        for _ in range(3):
+            await coordinator.mark_dirty()
+
+        status = await coordinator.get_status()
+        assert status["stale"] is True
+        assert status["pending_generations"] == 3
+        assert status["refresh_lag_seconds"] >= 0.0
+
+        assert await coordinator.refresh_if_due() is True
+        # Nothing left to do: the second call is a no-op.
+        assert await coordinator.refresh_if_due() is False
+
+        status = await coordinator.get_status()
+        assert status["stale"] is False
+        assert status["refresh_lag_seconds"] == 0.0
+        assert status["refreshed_generation"] == 3
+        assert status["last_refresh_at"] is not None
+        assert coordinator.refreshes == 1
+
+    @pytest.mark.asyncio
+    async def test_debounce_defers_refresh(self):
+        """A fresh mark waits out the debounce window unless forced."""
+        coordinator = SearchIndexRefreshCoordinator(
+            CacheService(), debounce_seconds=60.0, max_delay_seconds=120.0
+        )
+        await coordinator.mark_dirty()
+
+        assert await coordinator.refresh_if_due() is False
+        assert await coordinator.is_dirty()
+        assert await coordinator.refresh_if_due(force=True) is True
+
+    @pytest.mark.asyncio
+    async def test_clean_index_never_refreshes(self):
+        """Without a dirty mark there is nothing to refresh."""
+        coordinator = SearchIndexRefreshCoordinator(CacheService())
+        assert await coordinator.refresh_if_due(force=True) is False
+
+    @pytest.mark.asyncio
+    async def test_skips_when_another_worker_holds_lock(self):
+        """A worker that loses the advisory lock skips and stays dirty."""
+        import app.database as app_database
+
+        coordinator = SearchIndexRefreshCoordinator(
+            CacheService(), debounce_seconds=0.0
+        )
+        await coordinator.mark_dirty()
+
+        async with app_database.async_session_maker() as holder:
+            await holder.execute(
+                text("SELECT pg_advisory_xact_lock(hashtext(:name))"),
+                {"name": "mv_refresh:global_search_index:lock"},
+            )
+            assert await coordinator.refresh_if_due() is False
+            await holder.rollback()
+
+        assert coordinator.lock_contended == 1
+        assert await coordinator.is_dirty()
+        assert await coordinator.refresh_if_due() is True
 
 
 # ============================================================================
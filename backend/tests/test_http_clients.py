@@ -0,0 +1,98 @@
+"""Shared pooled HTTP clients for outbound integrations.
+
+One long-lived client per upstream must be reused across calls, closed by
+the app lifespan, and report per-upstream request and latency metrics.
+"""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from app.core.http_clients import (
+    HttpClientRegistry,
+    UpstreamStats,
+    _InstrumentedTransport,
+    http_clients,
+)
+
+
+def _ok(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"path": request.url.path})
+
+
+def _fail(request: httpx.Request) -> httpx.Response:
+    raise httpx.ConnectError("connection refused", request=request)
+
+
+class TestHttpClientRegistry:
+    """Clients are built once per upstream and reopened after close."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_client_per_upstream(self):
+        """Repeated lookups share one client; upstreams get separate pools."""
+        registry = HttpClientRegistry()
+        ensembl = registry.get("ensembl")
+        assert registry.get("ensembl") is ensembl
+        assert registry.get("ols") is not ensembl
+
+        await registry.aclose()
+        assert ensembl.is_closed
+        assert registry.get("ensembl") is not ensembl
+        await registry.aclose()
+
+    def test_status_reports_configured_pools(self):
+        """Every upstream is listed with its pool limits, open or not."""
+        registry = HttpClientRegistry()
+        registry.get("ncbi")
+        status = registry.get_status()
+
+        assert set(status) == {"ensembl", "ols", "ncbi"}
+        assert status["ncbi"]["open"] is True
+        assert status["ensembl"]["open"] is False
+        assert status["ncbi"]["max_connections"] == 4
+        assert status["ncbi"]["http2"] is False  # opt-in
+        assert status["ensembl"]["requests"] == 0
+        assert status["ensembl"]["latency_ms"]["p95"] is None
+
+
+class TestInstrumentedTransport:
+    """The transport counts requests, errors and latency per upstream."""
+
+    @pytest.mark.asyncio
+    async def test_records_requests_and_latency(self):
+        """Successful requests add a latency sample; failures count as errors."""
+        stats = UpstreamStats()
+        async with httpx.AsyncClient(
+            transport=_InstrumentedTransport(httpx.MockTransport(_ok), stats)
+        ) as client:
+            for _ in range(3):
+                response = await client.get("https://rest.ensembl.org/info/ping")
+                assert response.json() == {"path": "/info/ping"}
+
+        async with httpx.AsyncClient(
+            transport=_InstrumentedTransport(httpx.MockTransport(_fail), stats)
+        ) as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.get("https://rest.ensembl.org/info/ping")
+
+        snapshot = stats.snapshot()
+        assert snapshot["requests"] == 4
+        assert snapshot["errors"] == 1
+        assert snapshot["in_flight"] == 0
+        assert snapshot["peak_in_flight"] == 1
+        assert len(stats.latencies_ms) == 3
+        assert snapshot["latency_ms"]["p50"] is not None
+
+
+@pytest.mark.asyncio
+async def test_admin_http_clients_status(async_client, admin_headers):
+    """``GET /admin/http-clients/status`` returns the registry status."""
+    http_clients.get("ols")
+    response = await async_client.get(
+        "/api/v2/admin/http-clients/status", headers=admin_headers
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["ols"]["open"] is True
+    assert set(body) == {"ensembl", "ols", "ncbi"}
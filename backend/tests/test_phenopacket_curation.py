@@ -1,9 +1,12 @@
 """Tests for phenopacket curation endpoints (UPDATE/DELETE) with optimistic locking and audit trail."""
 
+from unittest.mock import AsyncMock, patch
+
 import pytest
 from sqlalchemy import select
 
 from app.phenopackets.models import Phenopacket, PhenopacketAudit
+from app.search.mv_refresh import search_refresh_coordinator
 
 
 @pytest.mark.asyncio
@@ -265,14 +268,22 @@ async def test_delete_phenopacket_soft_delete(
     await db_session.refresh(test_phenopacket)
 
     # Soft delete
-    response = await async_client.request(
-        "DELETE",
-        f"/api/v2/phenopackets/{test_phenopacket.phenopacket_id}",
-        headers=admin_headers,
-        json={"change_reason": "Test deletion", "revision": test_phenopacket.revision},
-    )
+    with patch.object(
+        search_refresh_coordinator, "mark_dirty", new_callable=AsyncMock
+    ) as mock_mark_dirty:
+        response = await async_client.request(
+            "DELETE",
+            f"/api/v2/phenopackets/{test_phenopacket.phenopacket_id}",
+            headers=admin_headers,
+            json={
+                "change_reason": "Test deletion",
+                "revision": test_phenopacket.revision,
+            },
+        )
 
     assert response.status_code == 200
+    # The deleted record must drop out of the public search index too.
+    mock_mark_dirty.assert_awaited_once()
     data = response.json()
     assert "deleted successfully" in data["message"]
     assert data["deleted_by"] == admin_user.username
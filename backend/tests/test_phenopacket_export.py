@@ -1,11 +1,21 @@
 """Export modes (spec §4.6)."""
 
+import gzip
+import json
 from datetime import datetime, timedelta, timezone
 
 import pytest
 from sqlalchemy import select
 
+from app.core.aggregation_cache import (
+    PUBLISHED_DATA_VERSION_KEY,
+    bump_published_data_version,
+    get_published_data_epoch,
+    get_published_data_version,
+)
+from app.core.cache import cache
 from app.phenopackets.models import Phenopacket, PhenopacketRevision
+from app.phenopackets.services.bulk_export import bulk_export_etag
 
 CURATION = {"cohort": "fetus", "detectionMethod": "mlpa"}
 
@@ -213,3 +223,120 @@ async def test_full_mode_requires_curator(async_client, published_record):
         f"/api/v2/phenopackets/{published_record.phenopacket_id}/export?mode=full"
     )
     assert response.status_code in (401, 403)
+
+
+# ---------------------------------------------------------------------------
+# Bulk export of the published cohort.
+# ---------------------------------------------------------------------------
+
+BULK_EXPORT_PATH = "/api/v2/phenopackets/export"
+
+
+def _ndjson(body: bytes) -> list[dict]:
+    return [json.loads(line) for line in body.decode().splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_bulk_export_streams_published_head_revisions(
+    async_client, clone_in_progress_record, draft_record
+):
+    """Only published heads are exported, each as its single-record export."""
+    response = await async_client.get(BULK_EXPORT_PATH)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    record = clone_in_progress_record["record"]
+    single = await async_client.get(
+        f"/api/v2/phenopackets/{record.phenopacket_id}/export"
+    )
+    # The draft is absent and the record being edited shows its published head.
+    assert _ndjson(response.content) == [single.json()]
+    assert b"LEAKED-DRAFT-SUBJECT" not in response.content
+
+
+@pytest.mark.asyncio
+async def test_bulk_export_gzip_matches_plain(async_client, published_record):
+    plain = await async_client.get(BULK_EXPORT_PATH)
+    compressed = await async_client.get(
+        BULK_EXPORT_PATH, params={"compression": "gzip"}
+    )
+    assert compressed.status_code == 200
+    assert compressed.headers["content-type"] == "application/gzip"
+    assert ".ndjson.gz" in compressed.headers["content-disposition"]
+    assert gzip.decompress(compressed.content) == plain.content
+    assert compressed.headers["ETag"] != plain.headers["ETag"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_export_revalidates_until_version_bumps(
+    async_client, published_record
+):
+    first = await async_client.get(BULK_EXPORT_PATH)
+    etag = first.headers["ETag"]
+    assert etag == bulk_export_etag(
+        await get_published_data_epoch(), await get_published_data_version(), "none"
+    )
+
+    revalidated = await async_client.get(
+        BULK_EXPORT_PATH, headers={"If-None-Match": etag}
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+    await bump_published_data_version()
+    changed = await async_client.get(BULK_EXPORT_PATH, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.content == first.content
+
+
+@pytest.mark.asyncio
+async def test_bulk_export_etag_changes_when_version_counter_resets(
+    async_client, published_record
+):
+    """A lost version counter starts a new epoch instead of reusing old ETags."""
+    first = await async_client.get(BULK_EXPORT_PATH)
+    etag = first.headers["ETag"]
+
+    await cache.delete(PUBLISHED_DATA_VERSION_KEY)
+    changed = await async_client.get(BULK_EXPORT_PATH, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_bulk_export_excludes_synthetic_records(
+    async_client, db_session, admin_user, published_record
+):
+    """Published ``e2e-`` records left by end-to-end tests are not exported."""
+    content = {**published_record.phenopacket, "id": "e2e-export-leak-1"}
+    synthetic = Phenopacket(
+        phenopacket_id="e2e-export-leak-1",
+        phenopacket=content,
+        state="draft",
+        revision=1,
+        created_by_id=admin_user.id,
+    )
+    db_session.add(synthetic)
+    await db_session.flush()
+    revision = PhenopacketRevision(
+        record_id=synthetic.id,
+        revision_number=1,
+        state="published",
+        content_jsonb=content,
+        change_reason="init",
+        actor_id=admin_user.id,
+        from_state=None,
+        to_state="published",
+        is_head_published=True,
+    )
+    db_session.add(revision)
+    await db_session.flush()
+    synthetic.state = "published"
+    synthetic.head_published_revision_id = revision.id
+    await db_session.commit()
+
+    response = await async_client.get(BULK_EXPORT_PATH)
+    assert response.status_code == 200
+    assert [doc["id"] for doc in _ndjson(response.content)] == [
+        published_record.phenopacket_id
+    ]
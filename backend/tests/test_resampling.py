@@ -0,0 +1,161 @@
+"""Permutation and bootstrap statistics and their off-loop executor.
+
+Resampled statistics must be reproducible for a seed, agree with the
+asymptotic statistics they complement, and run within a bounded budget
+without blocking the event loop.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from app.phenopackets.resampling import (
+    ResamplingExecutor,
+    ResamplingTimeout,
+    bootstrap_kaplan_meier_ci,
+    bootstrap_odds_ratio_ci,
+    permutation_log_rank_test,
+    resample_survival_groups,
+    resolve_budget,
+)
+from app.phenopackets.survival_analysis import (
+    calculate_kaplan_meier,
+    calculate_log_rank_test,
+)
+
+EARLY = [(float(t), t % 3 != 0) for t in range(1, 13)]
+LATE = [(float(t), t % 4 != 0) for t in range(20, 32)]
+
+
+def _sleep(seconds: float) -> float:
+    time.sleep(seconds)
+    return seconds
+
+
+class TestPermutationLogRank:
+    """Permutation p-values for the two-group log-rank test."""
+
+    def test_statistic_matches_asymptotic_test(self):
+        """The observed statistic is the usual log-rank chi-square."""
+        result = permutation_log_rank_test(EARLY, LATE, 500, seed=1)
+        assert result["statistic"] == calculate_log_rank_test(EARLY, LATE)["statistic"]
+        assert result["n_permutations"] == 500
+
+    def test_separated_groups_are_significant(self):
+        """Fully separated groups are rarely matched by a permutation."""
+        result = permutation_log_rank_test(EARLY, LATE, 1000, seed=1)
+        assert result["p_value_permutation"] < 0.01
+        assert result["p_value_permutation"] >= 1 / 1001
+
+    def test_identical_groups_are_not_significant(self):
+        """Exchangeable groups give a large permutation p-value."""
+        result = permutation_log_rank_test(EARLY, list(EARLY), 500, seed=1)
+        assert result["p_value_permutation"] > 0.5
+
+    def test_seed_makes_result_reproducible(self):
+        """The same seed always yields the same p-value."""
+        small = EARLY[:4]
+        assert permutation_log_rank_test(
+            small, LATE[:3], 300, seed=7
+        ) == permutation_log_rank_test(small, LATE[:3], 300, seed=7)
+
+    def test_empty_group(self):
+        """An empty group cannot be tested."""
+        result = permutation_log_rank_test([], LATE, 100, seed=1)
+        assert result["p_value_permutation"] == 1.0
+
+
+class TestBootstrapKaplanMeier:
+    """Percentile bootstrap bands for Kaplan-Meier curves."""
+
+    def test_band_is_aligned_with_curve_and_contains_estimate(self):
+        """One interval per unique time, bracketing the point estimate."""
+        curve = calculate_kaplan_meier(EARLY)[1:]
+        band = bootstrap_kaplan_meier_ci(EARLY, 1000, seed=3)
+
+        assert [b["time"] for b in band] == [c["time"] for c in curve]
+        for point, interval in zip(curve, band):
+            assert interval["ci_lower"] <= point["survival_probability"] + 1e-4
+            assert point["survival_probability"] <= interval["ci_upper"] + 1e-4
+
+    def test_empty_input(self):
+        """No observations give no band."""
+        assert bootstrap_kaplan_meier_ci([], 100, seed=1) == []
+
+
+class TestBootstrapOddsRatio:
+    """Percentile bootstrap intervals for 2x2 odds ratios."""
+
+    def test_interval_brackets_sample_odds_ratio(self):
+        """The interval contains the sample odds ratio (10*12)/(5*3) = 8."""
+        (interval,) = bootstrap_odds_ratio_ci([(10, 5, 3, 12)], 2000, seed=5)
+        assert interval["ci_lower"] < 8.0 < interval["ci_upper"]
+
+    def test_zero_cells_and_empty_groups(self):
+        """Zero cells are corrected; an empty group has no interval."""
+        zero_cell, empty = bootstrap_odds_ratio_ci(
+            [(0, 5, 3, 4), (0, 0, 1, 1)], 500, seed=5
+        )
+        assert zero_cell["ci_lower"] is not None
+        assert empty == {"ci_lower": None, "ci_upper": None}
+
+    def test_batch_is_deterministic(self):
+        """A table's interval is reproducible for a seed and batch."""
+        tables = [(10, 5, 3, 12), (4, 4, 6, 2)]
+        assert bootstrap_odds_ratio_ci(tables, 300, seed=9) == (
+            bootstrap_odds_ratio_ci(tables, 300, seed=9)
+        )
+
+
+class TestResampleSurvivalGroups:
+    """Composite survival job covering every group and pair."""
+
+    def test_covers_non_empty_groups_and_pairs(self):
+        """Each non-empty group gets a band and each pair a permutation test."""
+        result = resample_survival_groups(
+            {"a": EARLY, "b": LATE, "c": EARLY[:5], "empty": []}, 200, seed=11
+        )
+        assert set(result["bootstrap_ci"]) == {"a", "b", "c"}
+        assert [(t["group1"], t["group2"]) for t in result["permutation_tests"]] == [
+            ("a", "b"),
+            ("a", "c"),
+            ("b", "c"),
+        ]
+        assert result["seed"] == 11
+
+
+class TestResamplingExecutor:
+    """Jobs run off the event loop under a wall-clock budget."""
+
+    def test_budget_is_capped(self):
+        """Requests above the configured cap are clamped; defaults apply."""
+        from app.core.config import settings
+
+        config = settings.resampling
+        assert resolve_budget(None, None) == (config.default_resamples, config.seed)
+        assert resolve_budget(10**9, 3) == (config.max_resamples, 3)
+        assert resolve_budget(10**9, 3, pinned=True) == (
+            config.default_resamples,
+            config.seed,
+        )
+
+    @pytest.mark.asyncio
+    async def test_thread_mode_times_out(self):
+        """A job exceeding the budget raises ResamplingTimeout."""
+        executor = ResamplingExecutor(max_workers=0, timeout_seconds=0.05)
+        with pytest.raises(ResamplingTimeout):
+            await executor.run(_sleep, 0.5)
+
+    @pytest.mark.asyncio
+    async def test_process_pool_runs_job(self):
+        """The process pool returns the same result as an inline call."""
+        executor = ResamplingExecutor(max_workers=1, timeout_seconds=60.0)
+        try:
+            result = await executor.run(
+                bootstrap_odds_ratio_ci, [(10, 5, 3, 12)], 200, 5
+            )
+        finally:
+            executor.shutdown()
+        assert result == bootstrap_odds_ratio_ci([(10, 5, 3, 12)], 200, 5)
@@ -100,3 +100,39 @@ async def test_repository_count_does_not_match_draft_only_term(
     # Published term still counts the record.
     published_count = await repo.count(query="wave7-published-1", is_curator=False)
     assert published_count >= 1
+
+
+@pytest.mark.asyncio
+async def test_revision_search_vector_stored_only_for_published(
+    db_session, clone_in_progress_record
+):
+    """The stored revision vector is populated for published revisions only.
+
+    The public branch matches on ``r.search_vector`` instead of computing
+    ``to_tsvector`` per row, so the head-published revision must carry the
+    vector and the in-progress draft revision must not.
+    """
+    from sqlalchemy import text
+
+    record = clone_in_progress_record["record"]
+    rows = (
+        await db_session.execute(
+            text(
+                "SELECT id, state, search_vector IS NOT NULL AS has_vector, "
+                "search_vector @@ plainto_tsquery('simple', 'LEAKED-DRAFT-SUBJECT') "
+                "AS leaks "
+                "FROM phenopacket_revisions WHERE record_id = :rid"
+            ),
+            {"rid": record.id},
+        )
+    ).fetchall()
+
+    by_id = {row.id: row for row in rows}
+    head = by_id[record.head_published_revision_id]
+    assert head.state == "published"
+    assert head.has_vector is True
+    assert head.leaks is False
+
+    editing = by_id[record.editing_revision_id]
+    assert editing.state != "published"
+    assert editing.has_vector is False
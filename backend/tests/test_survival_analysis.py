@@ -4,17 +4,20 @@ Tests cover:
 - ISO8601 age parsing
 - Onset ontology parsing
 - Kaplan-Meier survival curve calculations
-- Log-rank test statistics
+- Log-rank test statistics (two-group and k-group)
 - Bonferroni correction
 
 These tests validate mathematical correctness against known results
 and ensure edge cases are handled properly.
 """
 
+import pytest
+
 from app.phenopackets.survival_analysis import (
     apply_bonferroni_correction,
     calculate_kaplan_meier,
     calculate_log_rank_test,
+    calculate_multigroup_log_rank_test,
     parse_iso8601_age,
     parse_onset_ontology,
 )
@@ -296,6 +299,97 @@ class TestCalculateLogRankTest:
         assert result["statistic"] >= 0.0
 
 
+class TestMultigroupLogRankTest:
+    """Tests for the k-group log-rank test."""
+
+    # R's ``aml`` dataset (survival package), split by maintenance arm.
+    MAINTAINED = [
+        (9.0, True),
+        (13.0, True),
+        (13.0, False),
+        (18.0, True),
+        (23.0, True),
+        (28.0, False),
+        (31.0, True),
+        (34.0, True),
+        (45.0, False),
+        (48.0, True),
+        (161.0, False),
+    ]
+    NONMAINTAINED = [
+        (5.0, True),
+        (5.0, True),
+        (8.0, True),
+        (8.0, True),
+        (12.0, True),
+        (16.0, False),
+        (23.0, True),
+        (27.0, True),
+        (30.0, True),
+        (33.0, True),
+        (43.0, True),
+        (45.0, True),
+    ]
+
+    def test_two_groups_match_r_survdiff(self):
+        """survdiff(Surv(time, status) ~ x, aml): Chisq = 3.4, p = 0.0653."""
+        result = calculate_multigroup_log_rank_test(
+            {"maintained": self.MAINTAINED, "nonmaintained": self.NONMAINTAINED}
+        )
+
+        assert result["df"] == 1
+        assert result["statistic"] == 3.3964
+        assert result["p_value"] == 0.0653
+        assert result["observed"] == {"maintained": 7, "nonmaintained": 11}
+        assert result["expected"] == {"maintained": 10.6893, "nonmaintained": 7.3107}
+
+    def test_two_groups_equal_pairwise_test(self):
+        """For k = 2 the statistic equals the two-group log-rank test."""
+        pairwise = calculate_log_rank_test(self.MAINTAINED, self.NONMAINTAINED)
+        overall = calculate_multigroup_log_rank_test(
+            {"a": self.MAINTAINED, "b": self.NONMAINTAINED}
+        )
+
+        assert overall["statistic"] == pairwise["statistic"]
+        assert overall["p_value"] == pairwise["p_value"]
+
+    def test_three_groups_use_two_degrees_of_freedom(self):
+        """All groups are tested in one pass on k - 1 degrees of freedom."""
+        early = [(1.0, True), (2.0, True), (3.0, True), (4.0, True)]
+        result = calculate_multigroup_log_rank_test(
+            {
+                "maintained": self.MAINTAINED,
+                "nonmaintained": self.NONMAINTAINED,
+                "early": early,
+            }
+        )
+
+        assert result["df"] == 2
+        assert result["significant"] is True
+        assert sum(result["observed"].values()) == pytest.approx(
+            sum(result["expected"].values()), abs=1e-3
+        )
+
+    def test_identical_groups_are_not_significant(self):
+        """Identical groups yield a zero statistic."""
+        group = [(10.0, True), (20.0, True), (30.0, False)]
+        result = calculate_multigroup_log_rank_test(
+            {"a": group, "b": list(group), "c": list(group)}
+        )
+
+        assert result["statistic"] == 0.0
+        assert result["p_value"] == 1.0
+
+    def test_group_without_expected_events_is_dropped(self):
+        """Like survdiff, a group with no expected events adds no df."""
+        result = calculate_multigroup_log_rank_test(
+            {"a": self.MAINTAINED, "b": self.NONMAINTAINED, "empty": []}
+        )
+
+        assert result["df"] == 1
+        assert result["statistic"] == 3.3964
+
+
 class TestApplyBonferroniCorrection:
     """Tests for Bonferroni correction."""
 
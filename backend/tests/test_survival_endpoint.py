@@ -18,8 +18,26 @@ docstring).
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import text
+
+from app.core.aggregation_cache import (
+    aggregation_cache_key,
+    bump_published_data_version,
+    get_published_data_epoch,
+    get_published_data_version,
+)
+from app.core.cache import cache
+from app.phenopackets.routers.aggregations.survival.precompute import (
+    PRECOMPUTE_LOCK_NAME,
+    SURVIVAL_CACHE_NAME,
+    SurvivalPrecomputer,
+    comparison_endpoint_pairs,
+    survival_etag,
+)
 
 COMPARISONS = ["variant_type", "pathogenicity", "disease_subtype", "protein_domain"]
 ENDPOINTS = ["ckd_stage_3_plus", "stage_5_ckd", "any_ckd", "current_age"]
@@ -86,3 +104,129 @@ class TestSurvivalEndpointSmoke:
         assert "detail" in body
         # The detail should name the valid options — useful for client debugging.
         assert "Valid options" in body["detail"] or "valid" in body["detail"].lower()
+
+
+@pytest.mark.asyncio
+class TestSurvivalPrecomputeAndEtag:
+    """Results are precomputed per data version and revalidated by ETag."""
+
+    async def test_precompute_caches_every_combination(self, db_session) -> None:
+        """One worker pass caches all 16 combinations at the current version."""
+
+        @asynccontextmanager
+        async def session_factory():
+            yield db_session
+
+        precomputer = SurvivalPrecomputer(session_factory=session_factory)
+        version = await precomputer.run_once()
+
+        pairs = comparison_endpoint_pairs()
+        assert len(pairs) == len(COMPARISONS) * len(ENDPOINTS)
+        for comparison, endpoint in pairs:
+            key = aggregation_cache_key(
+                SURVIVAL_CACHE_NAME,
+                version,
+                {"comparison": comparison, "endpoint": endpoint},
+            )
+            assert await cache.get(key) is not None, (comparison, endpoint)
+        assert precomputer.get_status()["last_version"] == version
+
+    async def test_precompute_skips_while_another_worker_holds_lock(
+        self, monkeypatch
+    ) -> None:
+        """Only the worker holding the advisory lock precomputes."""
+        import app.database as app_database
+        from app.phenopackets.routers.aggregations.survival import precompute
+
+        async def fake_precompute(db) -> int:
+            return await get_published_data_version()
+
+        monkeypatch.setattr(precompute, "precompute_survival_data", fake_precompute)
+        precomputer = SurvivalPrecomputer()
+        async with app_database.async_session_maker() as holder:
+            await holder.execute(
+                text("SELECT pg_advisory_xact_lock(hashtext(:name))"),
+                {"name": PRECOMPUTE_LOCK_NAME},
+            )
+            assert await precomputer.run_once() is None
+            await holder.rollback()
+
+        assert precomputer.get_status()["process_lock_contended"] == 1
+        assert await precomputer.run_once() == await get_published_data_version()
+
+    async def test_if_none_match_returns_304_until_version_bumps(
+        self, async_client: AsyncClient
+    ) -> None:
+        """A current ETag revalidates to 304; a publish-side bump changes it."""
+        params = {"comparison": "variant_type", "endpoint": "current_age"}
+        first = await async_client.get(SURVIVAL_PATH, params=params)
+        assert first.status_code == 200, first.text
+        etag = first.headers["ETag"]
+        epoch = await get_published_data_epoch()
+        version = await get_published_data_version()
+        assert etag == survival_etag(epoch, version, "variant_type", "current_age")
+
+        revalidated = await async_client.get(
+            SURVIVAL_PATH, params=params, headers={"If-None-Match": f"W/{etag}"}
+        )
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert revalidated.headers["ETag"] == etag
+
+        await bump_published_data_version()
+        changed = await async_client.get(
+            SURVIVAL_PATH, params=params, headers={"If-None-Match": etag}
+        )
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+        assert changed.json() == first.json()
+
+    async def test_resampling_adds_section_and_distinct_etag(
+        self, async_client: AsyncClient, monkeypatch
+    ) -> None:
+        """Resampled responses extend the asymptotic one under their own ETag."""
+        from app.core.config import settings
+        from app.phenopackets.resampling import resampling_executor
+
+        monkeypatch.setattr(resampling_executor, "_max_workers", 0)
+        params = {"comparison": "pathogenicity", "endpoint": "any_ckd"}
+        plain = await async_client.get(SURVIVAL_PATH, params=params)
+        resampled = await async_client.get(
+            SURVIVAL_PATH,
+            params={**params, "resampling": "true", "n_resamples": 10**9},
+        )
+        assert resampled.status_code == 200, resampled.text
+
+        body = resampled.json()
+        # Anonymous callers cannot choose the budget or seed.
+        assert (
+            body["resampling"]["n_resamples"] == settings.resampling.default_resamples
+        )
+        assert body["resampling"]["seed"] == settings.resampling.seed
+        assert {k: v for k, v in body.items() if k != "resampling"} == plain.json()
+        assert resampled.headers["ETag"] != plain.headers["ETag"]
+
+    async def test_resampling_budget_is_capped_for_authenticated_callers(
+        self, async_client: AsyncClient, admin_headers, monkeypatch
+    ) -> None:
+        """Authenticated callers may pick a budget and seed, within the cap."""
+        from app.core.config import settings
+        from app.phenopackets.resampling import resampling_executor
+
+        monkeypatch.setattr(resampling_executor, "_max_workers", 0)
+        response = await async_client.get(
+            SURVIVAL_PATH,
+            params={
+                "comparison": "pathogenicity",
+                "endpoint": "any_ckd",
+                "resampling": "true",
+                "n_resamples": 10**9,
+                "seed": 7,
+            },
+            headers=admin_headers,
+        )
+        assert response.status_code == 200, response.text
+
+        body = response.json()
+        assert body["resampling"]["n_resamples"] == settings.resampling.max_resamples
+        assert body["resampling"]["seed"] == 7
@@ -131,8 +131,6 @@ class TestVariantValidator:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response
-            mock_client_instance.__aenter__.return_value = mock_client_instance
-            mock_client_instance.__aexit__.return_value = AsyncMock()
             mock_client.return_value = mock_client_instance
 
             result = await validator.annotate_variant_with_vep("17-36459258-A-G")
@@ -162,8 +160,6 @@ class TestVariantValidator:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.get.return_value = mock_response
-            mock_client_instance.__aenter__.return_value = mock_client_instance
-            mock_client_instance.__aexit__.return_value = AsyncMock()
             mock_client.return_value = mock_client_instance
 
             result = await validator.annotate_variant_with_vep("NM_000458.4:c.544+1G>A")
@@ -191,8 +187,6 @@ class TestVariantValidator:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.get.return_value = mock_response
-            mock_client_instance.__aenter__.return_value = mock_client_instance
-            mock_client_instance.__aexit__.return_value = AsyncMock()
             mock_client.return_value = mock_client_instance
 
             result1 = await validator.annotate_variant_with_vep(
@@ -240,8 +234,6 @@ class TestVariantValidator:
                 mock_429_response,
                 mock_200_response,
             ]
-            mock_client_instance.__aenter__.return_value = mock_client_instance
-            mock_client_instance.__aexit__.return_value = AsyncMock()
             mock_client.return_value = mock_client_instance
 
             result = await validator.annotate_variant_with_vep("NM_000458.4:c.544+1G>A")
@@ -265,8 +257,6 @@ class TestVariantValidator:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.get.return_value = mock_response
-            mock_client_instance.__aenter__.return_value = mock_client_instance
-            mock_client_instance.__aexit__.return_value = AsyncMock()
             mock_client.return_value = mock_client_instance
 
             result = await validator.annotate_variant_with_vep("invalid-variant")
@@ -299,8 +289,6 @@ class TestVariantValidator:
                 mock_500_response,
                 mock_200_response,
             ]
-            mock_client_instance.__aenter__.return_value = mock_client_instance
-            mock_client_instance.__aexit__.return_value = AsyncMock()
             mock_client.return_value = mock_client_instance
 
             result = await validator.annotate_variant_with_vep("NM_000458.4:c.544+1G>A")
@@ -326,8 +314,6 @@ class TestVariantValidator:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.get.return_value = mock_response
-            mock_client_instance.__aenter__.return_value = mock_client_instance
-            mock_client_instance.__aexit__.return_value = AsyncMock()
             mock_client.return_value = mock_client_instance
 
             result = await validator.recode_variant_with_vep("rs56116432")
@@ -366,8 +352,6 @@ class TestVariantValidator:
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_annotation_response
             mock_client_instance.get.return_value = mock_recoder_response
-            mock_client_instance.__aenter__.return_value = mock_client_instance
-            mock_client_instance.__aexit__.return_value = AsyncMock()
             mock_client.return_value = mock_client_instance
 
             result = await validator.recode_variant_with_vep("17-36459258-A-G")
@@ -420,8 +404,6 @@ class TestBatchRecoding:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response
-            mock_client_instance.__aenter__.return_value = mock_client_instance
-            mock_client_instance.__aexit__.return_value = AsyncMock()
             mock_client.return_value = mock_client_instance
 
             results = await validator.recode_variants_batch(
@@ -467,8 +449,6 @@ class TestBatchRecoding:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response
-            mock_client_instance.__aenter__.return_value = mock_client_instance
-            mock_client_instance.__aexit__.return_value = AsyncMock()
             mock_client.return_value = mock_client_instance
 
             results = await validator.recode_variants_batch(
@@ -505,8 +485,6 @@ class TestBatchRecoding:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response
-            mock_client_instance.__aenter__.return_value = mock_client_instance
-            mock_client_instance.__aexit__.return_value = AsyncMock()
             mock_client.return_value = mock_client_instance
 
             results = await validator.recode_variants_batch(
@@ -548,8 +526,6 @@ class TestBatchRecoding:
                 mock_429_response,
                 mock_200_response,
             ]
-            mock_client_instance.__aenter__.return_value = mock_client_instance
-            mock_client_instance.__aexit__.return_value = AsyncMock()
             mock_client.return_value = mock_client_instance
 
             results = await validator.recode_variants_batch(["rs56116432"])
@@ -580,8 +556,6 @@ class TestRecoderUnexpectedError:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response
-            mock_client_instance.__aenter__.return_value = mock_client_instance
-            mock_client_instance.__aexit__.return_value = AsyncMock()
             mock_client.return_value = mock_client_instance
 
             results = await validator.recode_variants_batch(["rs56116432"])
@@ -0,0 +1,155 @@
+"""Tests for the materialized variant catalogue (``mv_variant_catalog``).
+
+``hnf1b_molecular_consequence()`` is a SQL port of
+``compute_molecular_consequence``; the parity cases below keep the two in step
+so the catalogue and the live fallback of ``/aggregate/all-variants`` always
+display the same consequence.
+"""
+
+import json
+
+import pytest
+from sqlalchemy import text
+
+from app.phenopackets.molecular_consequence import compute_molecular_consequence
+from app.phenopackets.routers.aggregations.variant_catalog import (
+    VARIANT_CATALOG_VIEW,
+    VariantCatalogQueryBuilder,
+)
+
+
+def _vep(consequence):
+    return [
+        {"name": "other", "value": {}},
+        {"name": "vep_annotation", "value": {"most_severe_consequence": consequence}},
+    ]
+
+
+CONSEQUENCE_CASES = [
+    # VEP first, mapped and unmapped terms
+    (None, None, None, _vep("stop_gained")),
+    (None, "NP_000449.3:p.Arg177Ter", None, _vep("missense_variant")),
+    (None, None, None, _vep("splice_donor_5th_base_variant")),
+    (None, None, None, _vep("5_prime_UTR_variant")),
+    (None, None, None, _vep("coding_sequence_variant")),
+    (None, None, "deletion", _vep("")),
+    (None, None, "deletion", [{"name": "vep_annotation", "value": {}}]),
+    # Protein-level
+    (None, "NP_000449.3:p.Gln243SerfsTer22", "deletion", None),
+    (None, "NP_000449.3:p.Arg177Ter", None, None),
+    (None, "NP_000449.3:p.Arg177*", None, None),
+    (None, "NP_000449.3:p.(Arg177Ter)", None, None),
+    (None, "NP_000449.3:p.Met1?", None, None),
+    (None, "NP_000449.3:p.Met1Val", None, None),
+    (None, "NP_000449.3:p.Ser148Leu", None, None),
+    (None, "NP_000449.3:p.Ser148=", None, None),
+    (None, "NP_000449.3:p.Ser148del", None, None),
+    (None, "NP_000449.3:p.Ser148_Leu150dup", None, None),
+    (None, "NP_000449.3:p.Ser148_Leu150delinsVal", None, None),
+    (None, "NP_000449.3:p.Leu150_Ser151insVal", None, None),
+    (None, "p.Ser148Leu", None, None),
+    (None, "", None, None),
+    # Transcript-level
+    ("NM_000458.4:c.544+1G>T", None, None, None),
+    ("NM_000458.4:c.544+2T>A", None, None, None),
+    ("NM_000458.4:c.544+5G>A", None, None, None),
+    ("NM_000458.4:c.1654-2A>T", None, None, None),
+    ("NM_000458.4:c.1654-1G>C", None, None, None),
+    ("NM_000458.4:c.1654-8C>T", None, None, None),
+    ("NM_000458.4:c.1654-40C>T", None, None, None),
+    ("NM_000458.4:c.-30C>T", None, None, None),
+    ("NM_000458.4:c.*12G>A", None, None, None),
+    ("NM_000458.4:c.544G>T", None, None, None),
+    # Structural fallback
+    (None, None, "deletion", None),
+    (None, None, "duplication", None),
+    (None, None, "SNV", None),
+    (None, None, None, None),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transcript,protein,variant_type,vep", CONSEQUENCE_CASES)
+async def test_sql_consequence_matches_python(
+    db_session, transcript, protein, variant_type, vep
+):
+    """The SQL port returns exactly what the Python helper returns."""
+    result = await db_session.execute(
+        text(
+            "SELECT hnf1b_molecular_consequence("
+            ":transcript, :protein, :variant_type, CAST(:vep AS jsonb))"
+        ),
+        {
+            "transcript": transcript,
+            "protein": protein,
+            "variant_type": variant_type,
+            "vep": json.dumps(vep) if vep is not None else None,
+        },
+    )
+    expected = compute_molecular_consequence(
+        transcript=transcript,
+        protein=protein,
+        variant_type=variant_type,
+        vep_extensions=vep,
+    )
+    assert result.scalar() == expected
+
+
+def test_catalog_builder_pushes_every_filter_into_sql():
+    """Consequence, classification and domain filters are all SQL predicates."""
+    sql, params = (
+        VariantCatalogQueryBuilder()
+        .with_text_search("Var12")
+        .with_variant_type("SNV")
+        .with_classification("PATHOGENIC")
+        .with_gene_filter("HNF1B")
+        .with_consequence("Missense")
+        .with_domain_filter(232, 305)
+        .build(limit=20, offset=40)
+    )
+
+    assert f"FROM {VARIANT_CATALOG_VIEW}" in sql
+    assert "molecular_consequence = :consequence" in sql
+    assert "interpretation_statuses @> ARRAY" in sql
+    assert "status_summary -> CAST(:classification AS text)" in sql
+    assert "simple_id_query" in params
+    assert params["consequence"] == "Missense"
+    assert (params["limit"], params["offset"]) == (20, 40)
+
+
+def test_catalog_builder_keyset_and_count():
+    """Keyset pages compare the cursor; the count query ignores it."""
+    builder = (
+        VariantCatalogQueryBuilder().with_variant_type("SNV").with_keyset(3, "var_010")
+    )
+    sql, params = builder.build(limit=21)
+    count_sql, count_params = builder.build_count()
+
+    assert "phenopacket_count < :cursor_count" in sql
+    assert "variant_id > :cursor_variant_id" in sql
+    assert (params["cursor_count"], params["cursor_variant_id"]) == (3, "var_010")
+    assert count_sql.startswith(f"SELECT COUNT(*) FROM {VARIANT_CATALOG_VIEW}")
+    assert "cursor_count" not in count_sql
+    assert count_params == {"variant_type": "SNV"}
+
+    backward_sql, _ = (
+        VariantCatalogQueryBuilder().with_keyset(3, "var_010", backward=True).build()
+    )
+    assert "phenopacket_count > :cursor_count" in backward_sql
+    assert "variant_id < :cursor_variant_id" in backward_sql
+
+
+@pytest.mark.asyncio
+async def test_catalog_query_runs_against_view(db_session):
+    """The built query is valid against the migrated view."""
+    sql, params = (
+        VariantCatalogQueryBuilder()
+        .with_text_search("c.544")
+        .with_classification("PATHOGENIC")
+        .with_consequence("Frameshift")
+        .with_domain_filter(8, 173)
+        .build()
+    )
+    await db_session.execute(text(f"REFRESH MATERIALIZED VIEW {VARIANT_CATALOG_VIEW}"))
+    result = await db_session.execute(text(sql), params)
+    assert result.fetchall() == []
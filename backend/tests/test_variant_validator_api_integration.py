@@ -72,7 +72,7 @@ class TestValidateEndpoint:
             mock_response.headers = {}
 
             mock_get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -98,7 +98,7 @@ class TestValidateEndpoint:
             mock_response.headers = {}
 
             mock_get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -139,7 +139,7 @@ class TestValidateEndpoint:
             mock_response.headers = {}
 
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -168,7 +168,7 @@ class TestAnnotateEndpoint:
             mock_response.headers = {}
 
             mock_get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -196,7 +196,7 @@ class TestAnnotateEndpoint:
             mock_response.headers = {}
 
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -221,7 +221,7 @@ class TestAnnotateEndpoint:
             mock_response.headers = {}
 
             mock_get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -249,7 +249,7 @@ class TestRecodeEndpoint:
             mock_response.headers = {}
 
             mock_get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -277,7 +277,7 @@ class TestRecodeEndpoint:
             mock_response.headers = {}
 
             mock_get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -316,8 +316,8 @@ class TestRecodeEndpoint:
             # First call is POST (annotation), second is GET (recoder)
             mock_post = AsyncMock(return_value=mock_annotation_response)
             mock_get = AsyncMock(return_value=mock_recoder_response_obj)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.post = mock_post
+            mock_client.return_value.get = mock_get
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -341,7 +341,7 @@ class TestRecodeEndpoint:
             mock_response.headers = {}
 
             mock_get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -432,7 +432,7 @@ class TestEndpointErrorHandling:
             mock_response.headers = {}
 
             mock_get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -459,7 +459,7 @@ class TestEndpointErrorHandling:
 
             # Mock timeout exception
             mock_get = AsyncMock(side_effect=httpx.TimeoutException("Request timeout"))
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
@@ -481,7 +481,7 @@ class TestEndpointErrorHandling:
 
             # Mock network exception
             mock_get = AsyncMock(side_effect=httpx.NetworkError("Connection failed"))
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             async with AsyncClient(
                 transport=ASGITransport(app=app), base_url="http://test"
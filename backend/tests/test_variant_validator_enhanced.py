@@ -166,7 +166,7 @@ class TestVEPAnnotation:
             mock_response.headers = {}
 
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             # Test annotation
             result = await validator.annotate_variant_with_vep("17-36459258-A-G")
@@ -206,7 +206,7 @@ class TestVEPAnnotation:
             mock_response.headers = {}
 
             mock_get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             # Test annotation
             result = await validator.annotate_variant_with_vep("NM_000458.4:c.544G>A")
@@ -227,9 +227,7 @@ class TestVEPAnnotation:
             mock_response.status_code = 400
             mock_response.headers = {}
 
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
 
             # Test annotation
             result = await validator.annotate_variant_with_vep("invalid-variant-format")
@@ -261,9 +259,7 @@ class TestVEPAnnotation:
             mock_response.status_code = 301
             mock_response.headers = {}
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             # Test annotation
             result = await validator.annotate_variant_with_vep("NM_000458.4:c.544G>A")
@@ -286,9 +282,7 @@ class TestVEPAnnotation:
                 "X-RateLimit-Limit": "100",  # out of 100 (5% remaining)
             }
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             # Capture print output
             with patch("builtins.print") as mock_print:
@@ -323,7 +317,7 @@ class TestVEPAnnotation:
             mock_response.headers = {}
 
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             result = await validator.annotate_variant_with_vep("17-36459258-A-G")
 
@@ -349,9 +343,7 @@ class TestRateLimiting:
             mock_response.json = MagicMock(return_value=[mock_response_data])
             mock_response.headers = {}
 
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
 
             # Try to make 20 requests (should be rate limited)
             start_time = time.time()
@@ -383,9 +375,7 @@ class TestRateLimiting:
             mock_response.json = MagicMock(return_value=[mock_response_data])
             mock_response.headers = {}
 
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
 
             # First 15 requests should complete immediately
             start_time = time.time()
@@ -451,7 +441,7 @@ class TestCaching:
             mock_response.headers = {}
 
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             # Test annotation (cache miss)
             result = await validator.annotate_variant_with_vep("17-36459258-A-G")
@@ -487,7 +477,7 @@ class TestCaching:
             mock_response.headers = {}
 
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             await validator.annotate_variant_with_vep("17-36459258-A-G")
 
@@ -536,7 +526,7 @@ class TestErrorHandling:
 
         with patch("httpx.AsyncClient") as mock_client:
             # Mock timeout exception
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 side_effect=httpx.TimeoutException("Request timed out")
             )
 
@@ -547,7 +537,7 @@ class TestErrorHandling:
             assert result is None
 
             # Should have attempted retries
-            assert mock_client.return_value.__aenter__.return_value.post.call_count == 2
+            assert mock_client.return_value.post.call_count == 2
 
     @pytest.mark.asyncio
     async def test_vep_api_429_rate_limit_error(self):
@@ -560,9 +550,7 @@ class TestErrorHandling:
             mock_response.status_code = 429
             mock_response.headers = {"Retry-After": "1"}  # Wait 1 second
 
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
 
             with patch("asyncio.sleep") as mock_sleep:
                 # Test annotation
@@ -585,9 +573,7 @@ class TestErrorHandling:
             mock_response.status_code = 500
             mock_response.headers = {}
 
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
 
             with patch("asyncio.sleep") as mock_sleep:
                 # Test annotation
@@ -607,7 +593,7 @@ class TestErrorHandling:
 
         with patch("httpx.AsyncClient") as mock_client:
             # Mock network error
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 side_effect=httpx.NetworkError("Network unreachable")
             )
 
@@ -638,7 +624,7 @@ class TestErrorHandling:
             mock_post = AsyncMock(
                 side_effect=[mock_fail_response, mock_success_response]
             )
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             with patch("asyncio.sleep"):
                 # Test annotation
@@ -685,8 +671,8 @@ class TestVariantRecoding:
             # First call is annotation (POST), second is recoder (GET)
             mock_post = AsyncMock(return_value=mock_annotation_response)
             mock_get = AsyncMock(return_value=mock_recoder_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.post = mock_post
+            mock_client.return_value.get = mock_get
 
             # Test recoding
             result = await validator.recode_variant_with_vep("17-36459258-A-G")
@@ -717,7 +703,7 @@ class TestVariantRecoding:
             mock_response.headers = {}
 
             mock_get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             # Test recoding HGVS (should skip annotation step)
             result = await validator.recode_variant_with_vep("NM_000458.4:c.544G>A")
@@ -738,7 +724,7 @@ class TestVariantRecoding:
             mock_response.headers = {"Retry-After": "1"}
 
             mock_get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             with patch("asyncio.sleep") as mock_sleep:
                 # Test recoding HGVS variant (no annotation step)
@@ -761,7 +747,7 @@ class TestVariantRecoding:
             mock_response.headers = {}
 
             mock_get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             # Test recoding with invalid variant
             result = await validator.recode_variant_with_vep("invalid_variant")
@@ -782,7 +768,7 @@ class TestVariantRecoding:
             mock_response.headers = {}
 
             mock_get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             with patch("asyncio.sleep") as mock_sleep:
                 # Test recoding
@@ -807,7 +793,7 @@ class TestVariantRecoding:
             mock_response.headers = {}
 
             mock_get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             with patch("asyncio.sleep"):
                 # Test recoding
@@ -825,7 +811,7 @@ class TestVariantRecoding:
         with patch("httpx.AsyncClient") as mock_client:
             # Mock timeout exception
             mock_get = AsyncMock(side_effect=httpx.TimeoutException("Request timeout"))
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             with patch("asyncio.sleep") as mock_sleep:
                 # Test recoding
@@ -846,7 +832,7 @@ class TestVariantRecoding:
         with patch("httpx.AsyncClient") as mock_client:
             # Mock network exception
             mock_get = AsyncMock(side_effect=httpx.NetworkError("Connection failed"))
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             with patch("asyncio.sleep") as mock_sleep:
                 # Test recoding
@@ -872,7 +858,7 @@ class TestVariantRecoding:
             # Mock a ValueError raised while the response is being processed
             # (e.g., unexpected payload shape causing .get()/index access to fail)
             mock_get = AsyncMock(side_effect=ValueError("Unexpected payload shape"))
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             # Test recoding
             result = await validator.recode_variant_with_vep("NM_000458.4:c.544G>A")
@@ -892,7 +878,7 @@ class TestVariantRecoding:
             mock_response.headers = {}
 
             mock_get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             # Test recoding
             result = await validator.recode_variant_with_vep("NM_000458.4:c.544G>A")
@@ -913,7 +899,7 @@ class TestVariantRecoding:
             mock_response.headers = {}
 
             mock_get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             # Test recoding
             result = await validator.recode_variant_with_vep("NM_000458.4:c.544G>A")
@@ -934,7 +920,7 @@ class TestVariantRecoding:
             mock_response.headers = {}
 
             mock_get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             # Test recoding
             result = await validator.recode_variant_with_vep("NM_000458.4:c.544G>A")
@@ -954,7 +940,7 @@ class TestVariantRecoding:
             mock_response.headers = {}
 
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             # Test recoding VCF format (which requires annotation first)
             result = await validator.recode_variant_with_vep("17-36459258-A-G")
@@ -976,7 +962,7 @@ class TestVariantRecoding:
             mock_annotation_response.headers = {}
 
             mock_post = AsyncMock(return_value=mock_annotation_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             # Test recoding VCF format
             result = await validator.recode_variant_with_vep("17-36459258-A-G")
@@ -1029,7 +1015,7 @@ class TestPhenopacketValidation:
             mock_response.json = MagicMock(return_value=[mock_vep_data])
 
             mock_get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             is_valid, vep_data, suggestions = await validator.validate_variant_with_vep(
                 "ENST00000269305:c.544G>A"
@@ -1049,7 +1035,7 @@ class TestPhenopacketValidation:
             mock_response.status_code = 400
 
             mock_get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             is_valid, vep_data, suggestions = await validator.validate_variant_with_vep(
                 "c123G>A"  # Invalid - missing dot
@@ -1069,7 +1055,7 @@ class TestPhenopacketValidation:
             mock_response.status_code = 503
 
             mock_get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             is_valid, vep_data, suggestions = await validator.validate_variant_with_vep(
                 "ENST00000269305:c.544G>A"
@@ -1092,7 +1078,7 @@ class TestPhenopacketValidation:
         with patch("httpx.AsyncClient") as mock_client:
             # Mock an httpx RequestError during the VEP call (realistic transport failure)
             mock_get = AsyncMock(side_effect=httpx.RequestError("Transport failure"))
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             # Test with valid HGVS notation (should pass fallback validation)
             is_valid, vep_data, suggestions = await validator.validate_variant_with_vep(
@@ -8,6 +8,7 @@ These tests exercise the four functions in
 - ``public_filter``  — filters per invariants I3 + I7
 - ``curator_filter`` — includes/excludes archived + deleted
 - ``resolve_public_content`` — dereferences head_published_revision_id (I1)
+- ``resolve_public_contents`` — bulk form of the above for list pages
 - ``resolve_curator_content`` — returns working copy directly
 
 Fixtures used: ``draft_record``, ``published_record``,
@@ -18,6 +19,7 @@ Fixtures used: ``draft_record``, ``published_record``,
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy import select
@@ -29,6 +31,7 @@ from app.phenopackets.repositories.visibility import (
     public_head_query,
     resolve_curator_content,
     resolve_public_content,
+    resolve_public_contents,
 )
 
 # ---------------------------------------------------------------------------
@@ -177,6 +180,38 @@ async def test_resolve_public_content_during_clone_uses_head_revision(
     assert public_content != new_content
 
 
+@pytest.mark.asyncio
+async def test_resolve_public_contents_uses_one_query_and_head_revision(
+    db_session, published_record, draft_record, curator_user
+):
+    """The bulk resolver serves a page from one query, keyed by record id,
+    with the same head-revision semantics as ``resolve_public_content``.
+    """
+    original_public_content = dict(published_record.phenopacket)
+
+    from app.phenopackets.services.state_service import PhenopacketStateService
+
+    svc = PhenopacketStateService(db_session)
+    await svc.edit_record(
+        published_record.id,
+        new_content={"id": "wave7-published-1", "changed": True},
+        change_reason="curator edit",
+        expected_revision=published_record.revision,
+        actor=curator_user,
+    )
+    await db_session.flush()
+    await db_session.refresh(published_record)
+
+    with patch.object(db_session, "execute", wraps=db_session.execute) as execute:
+        contents = await resolve_public_contents(
+            db_session, [published_record, draft_record]
+        )
+
+    assert execute.call_count == 1
+    assert contents == {published_record.id: original_public_content}
+    assert await resolve_public_contents(db_session, [draft_record]) == {}
+
+
 # ---------------------------------------------------------------------------
 # resolve_curator_content — always returns working copy
 # ---------------------------------------------------------------------------
@@ -73,6 +73,9 @@ _DENY = [
         r"^/version$",
         # Per-phenopacket workflow/audit/revision routes — curation internals.
         r"^/phenopackets/[^/]+/(audit|curation|reports|revisions|timeline|transitions)(/|$)",
+        # Bulk NDJSON download of the whole cohort — a file stream, not a JSON
+        # tool response; would otherwise fall through to the GET /{id} rule.
+        r"^/phenopackets/export$",
         # Statistical-comparison endpoint — not in the curated metric set.
         r"^/phenopackets/compare/",
         # SEO sitemaps — XML, not data.
@@ -1,9 +1,11 @@
-"""Read-only httpx client restricted to the endpoint allowlist, with a TTL cache."""
+"""Read-only httpx client restricted to the endpoint allowlist, with an LRU cache."""
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import json
-import time
+from collections.abc import Mapping
 from typing import Any
 
 import httpx
@@ -16,6 +18,7 @@ from ..contract import (
 )
 from ..services.errors import McpToolError
 from .allowlist import assert_allowed
+from .response_cache import ResponseCache
 
 #: Map of upstream query-parameter names → the contract enum that constrains
 #: them. Used to surface ``allowed`` values in 422 error envelopes so a calling
@@ -28,6 +31,12 @@ _FIELD_ALLOWED: dict[str, list[str]] = {
 }
 
 
+#: Whether the optional ``h2`` package (``httpx[http2]``) is installed. HTTP/2
+#: is only negotiated (via TLS ALPN) when it is; plain-HTTP upstreams such as
+#: the in-cluster API always speak HTTP/1.1.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
 def _build_422_error(resp: httpx.Response) -> McpToolError:
     """Translate an upstream 422 into an actionable ``invalid_input`` error.
 
@@ -97,25 +106,91 @@ class ApiClient:
         base_url: str,
         timeout: float = 30.0,
         cache_ttl: int = 300,
+        cache_max_entries: int = 1024,
+        cache_stale_ttl: int = 0,
+        *,
+        connect_timeout: float = 5.0,
+        endpoint_timeouts: Mapping[str, float] | None = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        max_concurrency: int = 32,
     ) -> None:
-        """Initialize the client with a base URL, request timeout, and cache TTL.
+        """Initialize the client with a base URL, timeouts, pool, and cache.
+
+        One client (and therefore one connection pool and one concurrency
+        limiter) is shared by every tool, so parallel agent sessions reuse
+        kept-alive upstream connections instead of opening new ones.
 
         Args:
             base_url: Base URL for the API (e.g. ``http://host/api/v2``).
-            timeout: HTTP request timeout in seconds.
+            timeout: Default read/write/pool timeout in seconds.
             cache_ttl: Time-to-live for cached responses in seconds.
+            cache_max_entries: Maximum cached responses before least-recently
+                used ones are evicted.
+            cache_stale_ttl: Seconds past ``cache_ttl`` a response may still be
+                served while it is refreshed in the background (``0`` = off).
+            connect_timeout: Timeout for establishing a connection in seconds.
+            endpoint_timeouts: Per-path-prefix read timeouts overriding
+                *timeout* (longest matching prefix wins), e.g.
+                ``{"/phenopackets/aggregate/": 60.0}``.
+            max_connections: Maximum open upstream connections.
+            max_keepalive_connections: Idle connections kept open for reuse.
+            keepalive_expiry: Seconds an idle connection is kept open.
+            http2: Negotiate HTTP/2 (multiplexing many requests over one
+                connection) when the ``h2`` package is installed; ignored
+                otherwise.
+            max_concurrency: Maximum upstream requests in flight at once
+                across all tools; further requests wait for a free slot.
         """
+        self._timeout = timeout
+        self._connect_timeout = connect_timeout
+        # Longest prefix first so the most specific override wins.
+        self._endpoint_timeouts = sorted(
+            (endpoint_timeouts or {}).items(), key=lambda kv: len(kv[0]), reverse=True
+        )
+        self._http2 = http2 and HTTP2_AVAILABLE
+        self._max_concurrency = max_concurrency
+        self._limiter = asyncio.Semaphore(max_concurrency)
+        self._in_flight = 0
+        self._waiting = 0
         self._client = httpx.AsyncClient(
             base_url=base_url,
-            timeout=timeout,
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=self._http2,
             headers={"Accept": "application/json"},
         )
-        self._cache_ttl = cache_ttl
-        self._cache: dict[str, tuple[float, Any]] = {}
+        self._cache = ResponseCache(
+            ttl=cache_ttl, max_entries=cache_max_entries, stale_ttl=cache_stale_ttl
+        )
+
+    def _timeout_for(self, path: str) -> httpx.Timeout:
+        """Return the request timeout for *path* (per-endpoint override or default).
+
+        Args:
+            path: The API path relative to ``base_url``.
+
+        Returns:
+            An :class:`httpx.Timeout` using the connect timeout and the read
+            timeout of the longest matching ``endpoint_timeouts`` prefix.
+        """
+        for prefix, seconds in self._endpoint_timeouts:
+            if path.startswith(prefix):
+                return httpx.Timeout(seconds, connect=self._connect_timeout)
+        return httpx.Timeout(self._timeout, connect=self._connect_timeout)
 
     async def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
         """GET an allowlisted path and return the parsed JSON body.
 
+        Successful responses are cached; concurrent identical requests share a
+        single upstream call, and errors are never cached.
+
         Args:
             path: The API path relative to ``base_url`` (must be allowlisted).
             params: Optional query parameters forwarded to the request.
@@ -130,12 +205,28 @@ class ApiClient:
         """
         assert_allowed(path)
         key = path + "?" + json.dumps(params or {}, sort_keys=True)
-        now = time.monotonic()
-        hit = self._cache.get(key)
-        if hit and hit[0] > now:
-            return hit[1]
+        return await self._cache.get_or_fetch(key, lambda: self._fetch(path, params))
+
+    async def _send(self, path: str, params: dict[str, Any] | None) -> httpx.Response:
+        """Issue the upstream GET once a shared concurrency slot is free."""
+        self._waiting += 1
         try:
-            resp = await self._client.get(path, params=params)
+            await self._limiter.acquire()
+        finally:
+            self._waiting -= 1
+        self._in_flight += 1
+        try:
+            return await self._client.get(
+                path, params=params, timeout=self._timeout_for(path)
+            )
+        finally:
+            self._in_flight -= 1
+            self._limiter.release()
+
+    async def _fetch(self, path: str, params: dict[str, Any] | None) -> Any:
+        """Perform one upstream GET, mapping failures to :class:`McpToolError`."""
+        try:
+            resp = await self._send(path, params)
         except httpx.TimeoutException as e:
             raise McpToolError(
                 "temporarily_unavailable", "upstream API timed out"
@@ -178,10 +269,22 @@ class ApiClient:
                 "the data API rejected the request",
             )
         resp.raise_for_status()
-        data = resp.json()
-        self._cache[key] = (now + self._cache_ttl, data)
-        return data
+        return resp.json()
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Return response-cache size and hit/miss/eviction counters."""
+        return self._cache.stats()
+
+    def pool_stats(self) -> dict[str, Any]:
+        """Return upstream connection settings and limiter occupancy."""
+        return {
+            "http2": self._http2,
+            "max_concurrency": self._max_concurrency,
+            "in_flight": self._in_flight,
+            "waiting": self._waiting,
+        }
 
     async def aclose(self) -> None:
-        """Close the underlying HTTP client."""
+        """Cancel background cache refreshes and close the HTTP client."""
+        await self._cache.aclose()
         await self._client.aclose()
@@ -0,0 +1,184 @@
+"""Bounded LRU response cache with single-flight and stale-while-revalidate."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import Any
+
+#: Coroutine factory that fetches a fresh value for one cache key.
+Fetch = Callable[[], Awaitable[Any]]
+
+
+class ResponseCache:
+    """Size-bounded TTL cache of upstream responses.
+
+    * Entries are evicted least-recently-used once ``max_entries`` is reached,
+      and expired entries are dropped when they are next looked up.
+    * Concurrent misses for one key share a single fetch (single-flight). The
+      fetch runs detached from the caller that started it, so cancelling that
+      caller does not cancel the callers waiting on the same fetch.
+    * With ``stale_ttl > 0``, an entry up to ``stale_ttl`` seconds past its
+      TTL is served immediately while one background fetch refreshes it. A
+      failed refresh keeps the stale value until the stale window closes.
+
+    Counters for hits, misses, stale hits, coalesced waits, evictions and
+    refresh errors are exposed through :meth:`stats`.
+    """
+
+    def __init__(
+        self, *, ttl: float, max_entries: int = 1024, stale_ttl: float = 0.0
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl: Seconds an entry is fresh.
+            max_entries: Maximum number of cached entries; ``0`` disables
+                caching (concurrent misses are still coalesced).
+            stale_ttl: Seconds past ``ttl`` an entry may still be served
+                while it is refreshed in the background; ``0`` disables it.
+        """
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._stale_ttl = stale_ttl
+        #: key -> (expires_at, value), least recently used first.
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Future[Any]] = {}
+        self._fetches: set[asyncio.Task[None]] = set()
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.refresh_errors = 0
+
+    async def get_or_fetch(self, key: str, fetch: Fetch) -> Any:
+        """Return the cached value for *key*, fetching it when needed.
+
+        Args:
+            key: The cache key.
+            fetch: Called (at most once across concurrent callers) to produce
+                a fresh value; its exceptions propagate to every waiter and
+                nothing is cached. Cancelling a caller cancels only its own
+                wait, never the shared fetch.
+
+        Returns:
+            The cached, stale-but-servable, or freshly fetched value.
+        """
+        now = monotonic()
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            if expires_at + self._stale_ttl > now:
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                if key not in self._in_flight:
+                    self._spawn(key, fetch, refresh=True)
+                return value
+            del self._entries[key]
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            self.coalesced += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        return await asyncio.shield(self._spawn(key, fetch))
+
+    def stats(self) -> dict[str, Any]:
+        """Return size, configuration and hit-ratio counters."""
+        lookups = self.hits + self.stale_hits + self.misses + self.coalesced
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "ttl_seconds": self._ttl,
+            "stale_ttl_seconds": self._stale_ttl,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "refresh_errors": self.refresh_errors,
+            "in_flight": len(self._in_flight),
+            "hit_ratio": (
+                (self.hits + self.stale_hits + self.coalesced) / lookups
+                if lookups
+                else 0.0
+            ),
+        }
+
+    def clear(self) -> None:
+        """Drop every cached entry (in-flight fetches are left to finish)."""
+        self._entries.clear()
+
+    async def aclose(self) -> None:
+        """Cancel fetches and background refreshes still running."""
+        for task in list(self._fetches):
+            task.cancel()
+        if self._fetches:
+            await asyncio.gather(*self._fetches, return_exceptions=True)
+
+    def _begin(self, key: str) -> asyncio.Future[Any]:
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        return future
+
+    def _finish(
+        self,
+        key: str,
+        future: asyncio.Future[Any],
+        *,
+        value: Any = None,
+        exc: BaseException | None = None,
+    ) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if exc is not None:
+            if not future.done():
+                future.set_exception(exc)
+            # Mark retrieved so an un-awaited failure is not logged by asyncio.
+            future.exception()
+            return
+        self._store(key, value)
+        if not future.done():
+            future.set_result(value)
+
+    def _store(self, key: str, value: Any) -> None:
+        if self._max_entries <= 0:
+            return
+        self._entries[key] = (monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _spawn(
+        self, key: str, fetch: Fetch, *, refresh: bool = False
+    ) -> asyncio.Future[Any]:
+        """Run *fetch* in a detached task that resolves the key's future."""
+        future = self._begin(key)
+
+        async def _run() -> None:
+            try:
+                value = await fetch()
+            except Exception as exc:  # noqa: BLE001 - delivered via the future
+                if refresh:
+                    # Keep serving the stale value until the window closes.
+                    self.refresh_errors += 1
+                self._finish(key, future, exc=exc)
+            except BaseException as exc:
+                self._finish(key, future, exc=exc)
+                raise
+            else:
+                self._finish(key, future, value=value)
+
+        task = asyncio.create_task(_run())
+        self._fetches.add(task)
+        task.add_done_callback(self._fetches.discard)
+        return future
@@ -15,7 +15,21 @@ class Settings(BaseSettings):
 
     api_base_url: str = "https://api.hnf1b.org/api/v2"
     request_timeout_seconds: float = 30.0
+    connect_timeout_seconds: float = 5.0
+    # Read timeouts per API path prefix (longest prefix wins); aggregate
+    # endpoints scan the whole cohort and legitimately take longer.
+    endpoint_timeouts_seconds: dict[str, float] = {
+        "/phenopackets/aggregate/": 60.0,
+    }
+    # Opt-in: HTTP/2 needs the optional h2 package (httpx[http2]).
+    http2: bool = False
+    pool_max_connections: int = 100
+    pool_max_keepalive_connections: int = 20
+    pool_keepalive_expiry_seconds: float = 30.0
+    upstream_max_concurrency: int = 32
     cache_ttl_default_seconds: int = 300
+    cache_max_entries: int = 1024
+    cache_stale_while_revalidate_seconds: int = 0
     host: str = "0.0.0.0"
     port: int = 8788
     protocol_version: str = "2025-11-25"
@@ -128,6 +128,9 @@ COMPARISON_VALUES: tuple[str, ...] = (
     "cnv_deletion_vs_duplication",
 )
 
+Compression = Literal["none", "gzip"]
+COMPRESSION_VALUES: tuple[str, ...] = ("none", "gzip")
+
 DiabetesType = Literal["Type 1", "Type 2", "MODY"]
 DIABETES_TYPE_VALUES: tuple[str, ...] = ("Type 1", "Type 2", "MODY")
 
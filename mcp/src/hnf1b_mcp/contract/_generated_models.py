@@ -255,6 +255,113 @@ class GenomicRegionResponse(BaseModel):
     total: Annotated[int, Field(description="Total number of genes", title="Total")]
 
 
+class DiseaseSubtype(RootModel[list[Literal["CAKUT", "CAKUT/MODY", "MODY", "Other"]]]):
+    root: Annotated[
+        list[Literal["CAKUT", "CAKUT/MODY", "MODY", "Other"]],
+        Field(
+            description="Phenotype-based disease subtypes of the carrier",
+            min_length=1,
+            title="Disease Subtype",
+        ),
+    ]
+
+
+class Pathogenicity(
+    RootModel[
+        list[
+            Literal[
+                "PATHOGENIC",
+                "LIKELY_PATHOGENIC",
+                "UNCERTAIN_SIGNIFICANCE",
+                "LIKELY_BENIGN",
+                "BENIGN",
+            ]
+        ]
+    ]
+):
+    root: Annotated[
+        list[
+            Literal[
+                "PATHOGENIC",
+                "LIKELY_PATHOGENIC",
+                "UNCERTAIN_SIGNIFICANCE",
+                "LIKELY_BENIGN",
+                "BENIGN",
+            ]
+        ],
+        Field(
+            description="Interpretation statuses to include (default: P and LP)",
+            min_length=1,
+            title="Pathogenicity",
+        ),
+    ]
+
+
+class ProteinDomain(RootModel[str]):
+    root: Annotated[
+        str,
+        Field(
+            description="HNF1B protein domain name or short name; matches variants whose hgvs.p position falls inside the domain",
+            min_length=1,
+            title="Protein Domain",
+        ),
+    ]
+
+
+class GroupDefinition(BaseModel):
+    disease_subtype: Annotated[
+        Optional[DiseaseSubtype],
+        Field(
+            description="Phenotype-based disease subtypes of the carrier",
+            title="Disease Subtype",
+        ),
+    ] = None
+    name: Annotated[
+        str, Field(description="Group name", max_length=100, min_length=1, title="Name")
+    ]
+    pathogenicity: Annotated[
+        Optional[Pathogenicity],
+        Field(
+            description="Interpretation statuses to include (default: P and LP)",
+            title="Pathogenicity",
+        ),
+    ] = None
+    protein_domain: Annotated[
+        Optional[ProteinDomain],
+        Field(
+            description="HNF1B protein domain name or short name; matches variants whose hgvs.p position falls inside the domain",
+            title="Protein Domain",
+        ),
+    ] = None
+    variant_type: Annotated[
+        Optional[
+            Literal[
+                "truncating",
+                "non_truncating",
+                "cnv",
+                "non_cnv",
+                "cnv_deletion",
+                "cnv_duplication",
+            ]
+        ],
+        Field(
+            description="Variant class, using the classification rules of /compare/variant-types (cnv = large CNVs >=50kb)",
+            title="Variant Type",
+        ),
+    ] = None
+
+
+class GroupSummary(BaseModel):
+    name: Annotated[str, Field(description="Group name", title="Name")]
+    variant_count: Annotated[
+        int,
+        Field(
+            description="Variant observations matching the group definition",
+            title="Variant Count",
+        ),
+    ]
+
+
 class FullName(RootModel[str]):
     root: Annotated[str, Field(max_length=255, title="Full Name")]
 
@@ -338,6 +445,18 @@ class MolecularConsequence(
     ]
 
 
+class MultiGroupComparisonRequest(BaseModel):
+    groups: Annotated[
+        list[GroupDefinition],
+        Field(
+            description="Groups to compare pairwise",
+            max_length=8,
+            min_length=2,
+            title="Groups",
+        ),
+    ]
+
+
 class ObservationOrigin(RootModel[Literal["imported", "manual"]]):
     root: Annotated[
         Literal["imported", "manual"],
@@ -639,7 +758,7 @@ class ProjectionPayload(BaseModel):
     phenopacket: Annotated[dict[str, Any], Field(title="Phenopacket")]
 
 
-class ProteinDomain(
+class ProteinDomain1(
     RootModel[
         Literal[
             "Dimerization Domain",
@@ -1439,6 +1558,25 @@ class ObservedValueStr(BaseModel):
     value: Annotated[Optional[str], Field(title="Value")] = None
 
 
+class PairwiseComparison(BaseModel):
+    group1_name: Annotated[
+        str, Field(description="Name of first group", title="Group1 Name")
+    ]
+    group2_name: Annotated[
+        str, Field(description="Name of second group", title="Group2 Name")
+    ]
+    phenotypes: Annotated[
+        list[PhenotypeComparison],
+        Field(description="List of phenotype comparisons", title="Phenotypes"),
+    ]
+    significant_count: Annotated[
+        int,
+        Field(
+            description="Returned phenotypes with FDR < 0.05", title="Significant Count"
+        ),
+    ]
+
+
 class PhenotypeAssessment(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
@@ -1567,6 +1705,23 @@ class JsonApiResponse(BaseModel):
     meta: MetaObject
 
 
+class MultiGroupComparisonResult(BaseModel):
+    comparisons: Annotated[
+        list[PairwiseComparison],
+        Field(
+            description="One comparison per pair of groups, in request order",
+            title="Comparisons",
+        ),
+    ]
+    groups: Annotated[
+        list[GroupSummary], Field(description="Compared groups", title="Groups")
+    ]
+    metadata: Annotated[
+        Optional[dict[str, Any]],
+        Field(description="Additional metadata", title="Metadata"),
+    ] = None
+
+
 class NotesObservation(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
@@ -8,12 +8,17 @@ Regenerate with ``scripts/gen_contract.py`` (``make contract``) from
 from __future__ import annotations
 
 
+ADMIN_AGGREGATION_VIEWS_STATUS = "/admin/aggregation-views/status"
+ADMIN_HTTP_CLIENTS_STATUS = "/admin/http-clients/status"
+ADMIN_QUERY_EMBEDDING_CACHE_STATUS = "/admin/query-embedding-cache/status"
 ADMIN_REFERENCE_STATUS = "/admin/reference/status"
+ADMIN_SEARCH_INDEX_STATUS = "/admin/search-index/status"
 ADMIN_STATISTICS = "/admin/statistics"
 ADMIN_STATUS = "/admin/status"
 ADMIN_SYNC_GENES = "/admin/sync/genes"
 ADMIN_SYNC_GENES_STATUS = "/admin/sync/genes/status"
 ADMIN_SYNC_PUBLICATIONS = "/admin/sync/publications"
+ADMIN_SYNC_PUBLICATIONS_FULLTEXT_STATUS = "/admin/sync/publications/fulltext/status"
 ADMIN_SYNC_PUBLICATIONS_STATUS = "/admin/sync/publications/status"
 ADMIN_SYNC_REFERENCE_INIT = "/admin/sync/reference/init"
 ADMIN_SYNC_VARIANTS = "/admin/sync/variants"
@@ -120,7 +125,9 @@ PHENOPACKETS_BY_PHENOPACKET_ID_TRANSITIONS = (
 )
 PHENOPACKETS_BY_PUBLICATION_BY_PMID = "/phenopackets/by-publication/{pmid}"
 PHENOPACKETS_BY_VARIANT_BY_VARIANT_ID = "/phenopackets/by-variant/{variant_id}"
+PHENOPACKETS_COMPARE_GROUPS = "/phenopackets/compare/groups"
 PHENOPACKETS_COMPARE_VARIANT_TYPES = "/phenopackets/compare/variant-types"
+PHENOPACKETS_EXPORT = "/phenopackets/export"
 PHENOPACKETS_SEARCH = "/phenopackets/search"
 PHENOPACKETS_SEARCH_FACETS = "/phenopackets/search/facets"
 PUBLICATIONS = "/publications/"
@@ -149,12 +156,17 @@ VARIANTS_VALIDATE = "/variants/validate"
 VERSION = "/version"
 
 ALL_PATHS: tuple[str, ...] = (
+    ADMIN_AGGREGATION_VIEWS_STATUS,
+    ADMIN_HTTP_CLIENTS_STATUS,
+    ADMIN_QUERY_EMBEDDING_CACHE_STATUS,
     ADMIN_REFERENCE_STATUS,
+    ADMIN_SEARCH_INDEX_STATUS,
     ADMIN_STATISTICS,
     ADMIN_STATUS,
     ADMIN_SYNC_GENES,
     ADMIN_SYNC_GENES_STATUS,
     ADMIN_SYNC_PUBLICATIONS,
+    ADMIN_SYNC_PUBLICATIONS_FULLTEXT_STATUS,
     ADMIN_SYNC_PUBLICATIONS_STATUS,
     ADMIN_SYNC_REFERENCE_INIT,
     ADMIN_SYNC_VARIANTS,
@@ -237,7 +249,9 @@ ALL_PATHS: tuple[str, ...] = (
     PHENOPACKETS_BY_PHENOPACKET_ID_TRANSITIONS,
     PHENOPACKETS_BY_PUBLICATION_BY_PMID,
     PHENOPACKETS_BY_VARIANT_BY_VARIANT_ID,
+    PHENOPACKETS_COMPARE_GROUPS,
     PHENOPACKETS_COMPARE_VARIANT_TYPES,
+    PHENOPACKETS_EXPORT,
     PHENOPACKETS_SEARCH,
     PHENOPACKETS_SEARCH_FACETS,
     PUBLICATIONS,
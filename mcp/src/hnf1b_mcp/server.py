@@ -275,7 +275,8 @@ def build_app(settings: Settings | None = None) -> FastMCP:
     """Build and configure the HNF1B FastMCP application.
 
     Creates the API client from settings, registers all tools and the static
-    documentation resources, and adds the ``/health`` route.
+    documentation resources, and adds the ``/health`` route (which also
+    reports response-cache and upstream-pool statistics).
 
     Args:
         settings: Optional settings override; loaded from the environment when
@@ -289,6 +290,15 @@ def build_app(settings: Settings | None = None) -> FastMCP:
         base_url=settings.api_base_url,
         timeout=settings.request_timeout_seconds,
         cache_ttl=settings.cache_ttl_default_seconds,
+        cache_max_entries=settings.cache_max_entries,
+        cache_stale_ttl=settings.cache_stale_while_revalidate_seconds,
+        connect_timeout=settings.connect_timeout_seconds,
+        endpoint_timeouts=settings.endpoint_timeouts_seconds,
+        max_connections=settings.pool_max_connections,
+        max_keepalive_connections=settings.pool_max_keepalive_connections,
+        keepalive_expiry=settings.pool_keepalive_expiry_seconds,
+        http2=settings.http2,
+        max_concurrency=settings.upstream_max_concurrency,
     )
 
     # Build rate limiter and register it as the module singleton.
@@ -314,7 +324,13 @@ def build_app(settings: Settings | None = None) -> FastMCP:
 
     @mcp.custom_route("/health", methods=["GET"])
     async def health(request: Request) -> Response:  # noqa: ARG001
-        return JSONResponse({"status": "ok"})
+        return JSONResponse(
+            {
+                "status": "ok",
+                "cache": client.cache_stats(),
+                "upstream": client.pool_stats(),
+            }
+        )
 
     return mcp
 
@@ -66,6 +66,53 @@ _EXCLUDED_FEATURES_NOTE = (
 )
 
 
+# Upper bound on ids per ``/phenopackets/batch`` call. The ids travel in one
+# comma-separated query parameter, so very large requests are split to keep
+# the URL well under common proxy/server line limits.
+_BATCH_CHUNK_SIZE = 100
+
+
+async def _fetch_batch(client: ApiClient, ids: list[str]) -> dict[str, dict[str, Any]]:
+    """Fetch phenopackets for *ids* via the batch endpoint, keyed by id.
+
+    One ``/phenopackets/batch`` call per :data:`_BATCH_CHUNK_SIZE` ids replaces
+    a per-record ``/phenopackets/{id}`` round trip. Records come back in the
+    endpoint's own order, so they are returned as a mapping for the caller to
+    re-emit in whatever order it needs; ids the endpoint did not return (absent
+    or not visible) are simply missing from the mapping.
+
+    Args:
+        client: Authenticated ApiClient instance.
+        ids: Phenopacket ids to fetch.
+
+    Returns:
+        ``{phenopacket_id: {"phenopacket_id": ..., "phenopacket": {...}}}``,
+        normalised to the shape :func:`_shape_individual` understands.
+    """
+    records: dict[str, dict[str, Any]] = {}
+    for start in range(0, len(ids), _BATCH_CHUNK_SIZE):
+        chunk = ids[start : start + _BATCH_CHUNK_SIZE]
+        # Batch endpoint: GET /phenopackets/batch?phenopacket_ids=a,b,c
+        # Response is a BARE LIST: [{phenopacket_id, phenopacket}, ...]
+        params: dict[str, Any] = {"phenopacket_ids": ",".join(chunk)}
+        batch_resp: Any = await client.get(PHENOPACKETS_BATCH, params=params)
+        batch_list: list[dict[str, Any]] = (
+            batch_resp
+            if isinstance(batch_resp, list)
+            else batch_resp.get("results", [])
+        )
+        for item in batch_list:
+            # Each batch item has phenopacket_id and phenopacket keys
+            pp_id: str = item.get("phenopacket_id", item.get("id", ""))
+            if not pp_id:
+                continue
+            records[pp_id] = {
+                "phenopacket_id": pp_id,
+                "phenopacket": item.get("phenopacket", item),
+            }
+    return records
+
+
 def _matches_filters(individual: dict[str, Any], filters: dict[str, Any]) -> bool:
     """Return whether a shaped individual satisfies the active ``sex``/``has_variants``.
 
@@ -376,8 +423,8 @@ async def get_individuals(
     """Retrieve a list of individuals, either by IDs (batch) or filtered list.
 
     When ``ids`` is provided the batch endpoint is used. Otherwise the
-    discovery list endpoint is queried and each individual is optionally
-    fetched in full when ``expand=True``.
+    discovery list endpoint is queried and, when ``expand=True``, the page is
+    fetched in full through the same batch endpoint (not one call per row).
 
     Args:
         client: Authenticated ApiClient instance.
@@ -386,7 +433,8 @@ async def get_individuals(
             preserved), so a caller may correlate by position.
         filters: Optional filter dict; keys become ``filter[key]`` params.
         page_size: Number of results per page (discovery endpoint only).
-        expand: If True and using discovery, fetch each record in full.
+        expand: If True and using discovery, fetch the page's records in full
+            via the batch endpoint.
         dedupe_publications: Hoist unique publications to a top-level list
             and replace per-record publications with publication_refs.
         response_mode: One of ``minimal``, ``compact``, ``standard``, ``full``;
@@ -407,35 +455,14 @@ async def get_individuals(
     not_found: list[str] = []
 
     if ids is not None:
-        # Batch endpoint: GET /phenopackets/batch?phenopacket_ids=a,b,c
-        # Response is a BARE LIST: [{phenopacket_id, phenopacket}, ...]
-        params: dict[str, Any] = {"phenopacket_ids": ",".join(ids)}
-        batch_resp: Any = await client.get(PHENOPACKETS_BATCH, params=params)
-        batch_list: list[dict[str, Any]] = (
-            batch_resp
-            if isinstance(batch_resp, list)
-            else batch_resp.get("results", [])
-        )
-        for item in batch_list:
-            # Each batch item has phenopacket_id and phenopacket keys
-            pp_id: str = item.get("phenopacket_id", item.get("id", ""))
-            if not pp_id:
-                continue
-            phenopacket_content: dict[str, Any] = item.get("phenopacket", item)
-            # Build a normalised record that _shape_individual understands
-            record: dict[str, Any] = {
-                "phenopacket_id": pp_id,
-                "phenopacket": phenopacket_content,
-            }
-            individuals.append(_shape_individual(record))
-        # B4: re-emit in the caller's requested `ids` order. The batch endpoint
+        # B4: emit in the caller's requested `ids` order. The batch endpoint
         # returns records in its own (DB) order, so [65, 99, 160] could come back
         # [160, 65, 99] — silently wrong for any caller correlating by position.
         # Each record self-identifies, so map by phenopacket_id and rebuild in
         # request order; ids the endpoint did not return are simply absent (and
         # captured in not_found below). Consistent with find_individuals_by_phenotype.
-        by_id = {ind.get("phenopacket_id"): ind for ind in individuals}
-        individuals = [by_id[i] for i in ids if i in by_id]
+        records = await _fetch_batch(client, ids)
+        individuals = [_shape_individual(records[i]) for i in ids if i in records]
         # Surface which requested IDs the batch endpoint did not return, so a
         # caller can distinguish "does not exist" from a silently-dropped id.
         # Computed BEFORE filtering: not_found means "absent", not "filtered out".
@@ -452,7 +479,7 @@ async def get_individuals(
         # Discovery list endpoint
         # Response: {data:[ITEM,...], meta:{page:{totalRecords:N}}, links:{}}
         # Each ITEM is a raw phenopacket object with top-level "id".
-        params = {"page[size]": page_size}
+        params: dict[str, Any] = {"page[size]": page_size}
         if filters:
             for key, val in filters.items():
                 params[f"filter[{key}]"] = val
@@ -463,6 +490,7 @@ async def get_individuals(
         page_meta: dict[str, Any] = meta.get("page", {})
         total = int(page_meta.get("totalRecords", meta.get("total", len(data_items))))
 
+        item_ids: list[str] = []
         for item in data_items:
             # Real API: item["id"] is the phenopacket id.
             # Defensive: also support legacy {attributes:{phenopacket_id:...}}.
@@ -474,14 +502,17 @@ async def get_individuals(
                 attrs: dict[str, Any] = item.get("attributes", item)
                 item_pp_id = attrs.get("phenopacket_id", attrs.get("id", ""))
 
-            if not item_pp_id:
-                continue
-
-            if expand:
-                full_record: dict[str, Any] = await client.get(
-                    PHENOPACKETS_BY_PHENOPACKET_ID.format(phenopacket_id=item_pp_id)
-                )
-                individuals.append(_shape_individual(full_record))
+            if item_pp_id:
+                item_ids.append(item_pp_id)
+
+        # Expand the whole page through the batch endpoint (one call per
+        # _BATCH_CHUNK_SIZE ids) rather than one detail fetch per row. A record
+        # the batch did not return (e.g. unpublished between the two calls)
+        # falls back to the minimal stub.
+        expanded = await _fetch_batch(client, item_ids) if expand else {}
+        for item_pp_id in item_ids:
+            if item_pp_id in expanded:
+                individuals.append(_shape_individual(expanded[item_pp_id]))
             else:
                 # Minimal stub without full phenopacket data
                 individuals.append(
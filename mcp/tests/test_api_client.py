@@ -1,3 +1,5 @@
+import asyncio
+
 import httpx
 import pytest
 import respx
@@ -151,3 +153,195 @@ async def test_get_maps_other_4xx_to_temporarily_unavailable():
         await c.get("/phenopackets/")
     await c.aclose()
     assert exc.value.code == "temporarily_unavailable"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_cache_evicts_least_recently_used():
+    """Beyond cache_max_entries the least recently used response is dropped."""
+    a = respx.get(f"{BASE}/phenopackets/A").mock(
+        return_value=httpx.Response(200, json={"id": "A"})
+    )
+    b = respx.get(f"{BASE}/phenopackets/B").mock(
+        return_value=httpx.Response(200, json={"id": "B"})
+    )
+    respx.get(f"{BASE}/phenopackets/C").mock(
+        return_value=httpx.Response(200, json={"id": "C"})
+    )
+    c = ApiClient(base_url=BASE, cache_max_entries=2)
+    await c.get("/phenopackets/A")
+    await c.get("/phenopackets/B")
+    await c.get("/phenopackets/A")  # A becomes most recently used
+    await c.get("/phenopackets/C")  # evicts B
+    await c.get("/phenopackets/A")
+    await c.get("/phenopackets/B")
+    assert a.call_count == 1
+    assert b.call_count == 2
+    stats = c.cache_stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 2
+    await c.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_concurrent_misses_share_one_upstream_call():
+    """Identical concurrent requests are coalesced into a single fetch."""
+    release = asyncio.Event()
+
+    async def slow(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200, json={"total_phenopackets": 1})
+
+    route = respx.get(f"{BASE}/phenopackets/aggregate/summary").mock(side_effect=slow)
+    c = ApiClient(base_url=BASE)
+    calls = [
+        asyncio.create_task(c.get("/phenopackets/aggregate/summary")) for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*calls)
+    assert route.call_count == 1
+    assert all(r == {"total_phenopackets": 1} for r in results)
+    stats = c.cache_stats()
+    assert stats["misses"] == 1
+    assert stats["coalesced"] == 4
+    await c.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_cancelled_owner_does_not_cancel_coalesced_waiters():
+    """Cancelling the caller that started a fetch leaves its waiters served."""
+    release = asyncio.Event()
+
+    async def slow(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200, json={"id": "X"})
+
+    route = respx.get(f"{BASE}/phenopackets/X").mock(side_effect=slow)
+    c = ApiClient(base_url=BASE)
+    owner = asyncio.create_task(c.get("/phenopackets/X"))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(c.get("/phenopackets/X"))
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+    release.set()
+    assert (await waiter)["id"] == "X"
+    assert route.call_count == 1
+    assert c.cache_stats()["coalesced"] == 1
+    await c.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_coalesced_failure_is_raised_to_all_and_not_cached():
+    """A failed shared fetch fails every waiter and is retried next time."""
+    release = asyncio.Event()
+
+    async def failing(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(503)
+
+    route = respx.get(f"{BASE}/phenopackets/X").mock(side_effect=failing)
+    c = ApiClient(base_url=BASE)
+    calls = [asyncio.create_task(c.get("/phenopackets/X")) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*calls, return_exceptions=True)
+    assert route.call_count == 1
+    assert all(
+        isinstance(r, McpToolError) and r.code == "temporarily_unavailable"
+        for r in results
+    )
+    route.mock(return_value=httpx.Response(200, json={"id": "X"}))
+    assert (await c.get("/phenopackets/X"))["id"] == "X"
+    assert route.call_count == 2
+    await c.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_stale_entry_served_while_revalidating(monkeypatch):
+    """An expired entry inside the stale window is returned and refreshed."""
+    clock = [1000.0]
+    monkeypatch.setattr("hnf1b_mcp.client.response_cache.monotonic", lambda: clock[0])
+    route = respx.get(f"{BASE}/phenopackets/X").mock(
+        side_effect=[
+            httpx.Response(200, json={"v": 1}),
+            httpx.Response(200, json={"v": 2}),
+        ]
+    )
+    c = ApiClient(base_url=BASE, cache_ttl=10, cache_stale_ttl=30)
+    assert await c.get("/phenopackets/X") == {"v": 1}
+
+    clock[0] += 15  # past the TTL, inside the stale window
+    assert await c.get("/phenopackets/X") == {"v": 1}
+    while c.cache_stats()["in_flight"]:
+        await asyncio.sleep(0)
+    assert route.call_count == 2
+    assert await c.get("/phenopackets/X") == {"v": 2}
+
+    stats = c.cache_stats()
+    assert stats["stale_hits"] == 1
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == pytest.approx(2 / 3)
+
+    clock[0] += 100  # past TTL and stale window: a blocking refetch
+    route.side_effect = [httpx.Response(200, json={"v": 3})]
+    assert await c.get("/phenopackets/X") == {"v": 3}
+    await c.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_concurrency_limiter_caps_in_flight_requests():
+    """At most max_concurrency upstream requests run at once across callers."""
+    active = 0
+    peak = 0
+
+    async def slow(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return httpx.Response(200, json={"id": request.url.path})
+
+    respx.get(url__regex=rf"{BASE}/phenopackets/P\d+$").mock(side_effect=slow)
+    c = ApiClient(base_url=BASE, max_concurrency=2)
+    await asyncio.gather(*(c.get(f"/phenopackets/P{i}") for i in range(6)))
+    assert peak == 2
+    assert c.pool_stats() == {
+        "http2": False,
+        "max_concurrency": 2,
+        "in_flight": 0,
+        "waiting": 0,
+    }
+    await c.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_endpoint_timeouts_use_longest_matching_prefix():
+    """A per-endpoint read timeout overrides the default for matching paths."""
+    summary = respx.get(f"{BASE}/phenopackets/aggregate/summary").mock(
+        return_value=httpx.Response(200, json={})
+    )
+    detail = respx.get(f"{BASE}/phenopackets/X").mock(
+        return_value=httpx.Response(200, json={})
+    )
+    c = ApiClient(
+        base_url=BASE,
+        timeout=10.0,
+        endpoint_timeouts={"/phenopackets/": 20.0, "/phenopackets/aggregate/": 60.0},
+    )
+    await c.get("/phenopackets/aggregate/summary")
+    await c.get("/phenopackets/X")
+    assert summary.calls[0].request.extensions["timeout"]["read"] == 60.0
+    assert detail.calls[0].request.extensions["timeout"]["read"] == 20.0
+    await c.aclose()
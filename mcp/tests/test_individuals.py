@@ -9,6 +9,7 @@ import pytest
 import respx
 
 from hnf1b_mcp.client.api_client import ApiClient
+from hnf1b_mcp.services import individuals as individuals_service
 from hnf1b_mcp.services.individuals import get_individual, get_individuals
 
 BASE = "http://api.test/api/v2"
@@ -471,20 +472,54 @@ async def test_get_individuals_list_endpoint():
     respx.get(f"{BASE}/phenopackets/").mock(
         return_value=httpx.Response(200, json=list_resp)
     )
-    # Each individual fetched separately when expand=True
-    respx.get(f"{BASE}/phenopackets/A").mock(
-        return_value=httpx.Response(200, json=_PHENOPACKET_A)
-    )
-    respx.get(f"{BASE}/phenopackets/B").mock(
-        return_value=httpx.Response(200, json=_PHENOPACKET_B)
+    # expand=True fetches the whole page through the batch endpoint, not one
+    # detail call per row.
+    batch = respx.get(f"{BASE}/phenopackets/batch").mock(
+        return_value=httpx.Response(200, json=[_BATCH_ITEM_B, _BATCH_ITEM_A])
     )
+    detail = respx.get(url__regex=rf"{BASE}/phenopackets/[AB]$")
     c = ApiClient(base_url=BASE)
     result = await get_individuals(c, page_size=10, expand=True)
     await c.aclose()
 
     assert result["total"] == 2
     assert result["page_size"] == 10
-    assert len(result["individuals"]) == 2
+    assert [i["phenopacket_id"] for i in result["individuals"]] == ["A", "B"]
+    assert "subject" in result["individuals"][0]
+    assert batch.call_count == 1
+    assert batch.calls[0].request.url.params["phenopacket_ids"] == "A,B"
+    assert detail.call_count == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_get_individuals_expand_chunks_batch_and_stubs_missing(monkeypatch):
+    """Large pages are expanded in batch chunks; unreturned ids become stubs."""
+    monkeypatch.setattr(individuals_service, "_BATCH_CHUNK_SIZE", 2)
+    list_resp = {
+        "data": [{"id": pid} for pid in ("A", "B", "C")],
+        "meta": {"page": {"totalRecords": 3}},
+    }
+    respx.get(f"{BASE}/phenopackets/").mock(
+        return_value=httpx.Response(200, json=list_resp)
+    )
+    batch = respx.get(f"{BASE}/phenopackets/batch").mock(
+        side_effect=[
+            httpx.Response(200, json=[_BATCH_ITEM_A, _BATCH_ITEM_B]),
+            httpx.Response(200, json=[]),
+        ]
+    )
+    c = ApiClient(base_url=BASE)
+    result = await get_individuals(c, page_size=3, expand=True)
+    await c.aclose()
+
+    assert batch.call_count == 2
+    assert [i["phenopacket_id"] for i in result["individuals"]] == ["A", "B", "C"]
+    assert "subject" in result["individuals"][0]
+    assert result["individuals"][2] == {
+        "phenopacket_id": "C",
+        "uri": "hnf1b://individual/C",
+    }
 
 
 @pytest.mark.asyncio